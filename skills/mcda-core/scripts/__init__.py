@@ -2,23 +2,54 @@
 MCDA Core - Multi-Criteria Decision Analysis Core Framework
 
 通用多准则决策分析核心框架，支持可插拔算法模型（WSM、AHP、TOPSIS 等）。
+
+子模块按需导入（PEP 562）：``mcda_core.core`` 等属性在首次访问时才加载，
+``import mcda_core`` 和 CLI 启动不再为未使用的模块及其依赖付出代价。
 """
 
+import importlib
+
 __version__ = "1.0.1"
 
-# 导入核心模块（供外部使用）
-from . import models  # noqa: F401
-from . import exceptions  # noqa: F401
-from . import algorithms  # noqa: F401
-from . import normalization  # noqa: F401
-from . import validation  # noqa: F401
-from . import reporter  # noqa: F401
-from . import sensitivity  # noqa: F401
-from . import utils  # noqa: F401
-from . import loaders  # noqa: F401
-from . import converters  # noqa: F401
-from . import core  # noqa: F401
-from . import cli  # noqa: F401
-from . import aggregation  # noqa: F401
-from . import group  # noqa: F401
-from .interval import Interval, IntervalError  # noqa: F401
+# 核心模块（供外部使用，首次访问时导入）
+_lazy_submodules = frozenset({
+    "models",
+    "exceptions",
+    "algorithms",
+    "normalization",
+    "validation",
+    "reporter",
+    "sensitivity",
+    "smaa",
+    "utils",
+    "loaders",
+    "converters",
+    "core",
+    "cli",
+    "aggregation",
+    "group",
+})
+
+# 延迟导出: 名称 → 定义模块
+_lazy_exports: dict[str, str] = {
+    "Interval": ".interval",
+    "IntervalError": ".interval",
+}
+
+
+def __getattr__(name: str):
+    """按需导入子模块和延迟导出"""
+    if name in _lazy_submodules:
+        return importlib.import_module(f".{name}", __name__)
+
+    module_name = _lazy_exports.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | _lazy_submodules | set(_lazy_exports))
@@ -2,11 +2,17 @@
 MCDA Core - 聚合方法抽象基类
 
 定义评分聚合方法的接口规范。
+
+除逐单元格的 ``aggregate`` 外，每个方法提供 ``aggregate_tensor``：对
+(n_dm, n_alt, n_crit) 评分张量一次完成聚合，决策者权重只验证一次。
+``aggregate_matrix`` 的内置实现先把嵌套字典转换为张量再调用它。
 """
 
 from abc import ABC, abstractmethod
 from typing import Protocol
 
+import numpy as np
+
 
 # =============================================================================
 # 聚合方法抽象基类
@@ -74,6 +80,191 @@ class AggregationMethod(ABC):
         """
         ...
 
+    def aggregate_tensor(
+        self,
+        tensor: np.ndarray,
+        weights: np.ndarray | None = None
+    ) -> np.ndarray:
+        """聚合评分张量
+
+        默认实现逐单元格调用 ``aggregate``（决策者以 "0", "1", ... 标识），
+        内置方法均覆盖为向量化实现。
+
+        Args:
+            tensor: 评分张量 (n_dm, n_alt, n_crit)
+            weights: 决策者权重向量 (n_dm,)（可选，默认等权重）
+
+        Returns:
+            聚合后的评分矩阵 (n_alt, n_crit)
+
+        Raises:
+            ValueError: 评分张量或权重无效
+        """
+        tensor, weights = validate_tensor(tensor, weights)
+        dm_ids = [str(k) for k in range(tensor.shape[0])]
+        weight_map = dict(zip(dm_ids, weights.tolist()))
+
+        result = np.empty(tensor.shape[1:])
+        for i in range(tensor.shape[1]):
+            for j in range(tensor.shape[2]):
+                scores = dict(zip(dm_ids, tensor[:, i, j].tolist()))
+                result[i, j] = self.aggregate(scores, weight_map)
+        return result
+
+    def _aggregate_matrix_via_tensor(
+        self,
+        score_matrix: dict[str, dict[str, dict[str, float]]],
+        weights: dict[str, float] | None = None
+    ) -> dict[str, dict[str, float]]:
+        """通过评分张量聚合嵌套字典评分矩阵
+
+        各单元格的决策者集合或各方案的准则集合不一致时，退回逐单元格
+        调用 ``aggregate``，保持原有的校验与报错行为。
+        """
+        converted = score_matrix_to_tensor(score_matrix)
+        if converted is None:
+            return {
+                alternative: {
+                    criterion: self.aggregate(dm_scores, weights)
+                    for criterion, dm_scores in criteria_scores.items()
+                }
+                for alternative, criteria_scores in score_matrix.items()
+            }
+
+        tensor, alternatives, criteria, dm_ids = converted
+        self._check_score_matrix(score_matrix, tensor, alternatives, criteria, dm_ids)
+        aggregated = self.aggregate_tensor(tensor, weight_vector(dm_ids, weights))
+
+        return {
+            alternative: dict(zip(criteria, row))
+            for alternative, row in zip(alternatives, aggregated.tolist())
+        }
+
+    def _check_score_matrix(
+        self,
+        score_matrix: dict[str, dict[str, dict[str, float]]],
+        tensor: np.ndarray,
+        alternatives: list[str],
+        criteria: list[str],
+        dm_ids: list[str]
+    ) -> None:
+        """在张量聚合前校验评分矩阵（默认不做额外校验）
+
+        ``aggregate_tensor`` 只能按下标报告错误；需要校验评分取值的方法
+        覆盖此方法，以决策者 ID 报错，与 ``aggregate`` 保持一致。
+        """
+
+
+
+# =============================================================================
+# 张量工具函数
+# =============================================================================
+
+def validate_tensor(
+    tensor: np.ndarray,
+    weights: np.ndarray | None = None
+) -> tuple[np.ndarray, np.ndarray]:
+    """验证评分张量和决策者权重（每次聚合只执行一次）
+
+    Args:
+        tensor: 评分张量 (n_dm, n_alt, n_crit)
+        weights: 决策者权重向量 (n_dm,)（可选，默认等权重）
+
+    Returns:
+        (float64 评分张量, float64 权重向量)
+
+    Raises:
+        ValueError: 张量维度不正确、为空，或权重长度不匹配、总和为 0
+    """
+    tensor = np.asarray(tensor, dtype=np.float64)
+    if tensor.ndim != 3:
+        raise ValueError(f"评分张量必须是三维 (n_dm, n_alt, n_crit)，当前维度为 {tensor.ndim}")
+    if tensor.shape[0] == 0:
+        raise ValueError("评分不能为空")
+
+    if weights is None:
+        weights = np.ones(tensor.shape[0])
+    weights = np.asarray(weights, dtype=np.float64)
+    if weights.shape != (tensor.shape[0],):
+        raise ValueError(
+            f"决策者权重数量 ({weights.size}) 与决策者数量 ({tensor.shape[0]}) 不匹配"
+        )
+    if weights.sum() == 0:
+        raise ValueError("权重总和不能为 0")
+
+    return tensor, weights
+
+
+def weight_vector(
+    dm_ids: list[str],
+    weights: dict[str, float] | None = None
+) -> np.ndarray | None:
+    """按决策者顺序将权重字典转换为向量
+
+    Raises:
+        ValueError: 权重与评分的决策者 ID 不一致
+    """
+    if weights is None:
+        return None
+
+    score_ids = set(dm_ids)
+    weight_ids = set(weights)
+    if score_ids != weight_ids:
+        extra = weight_ids - score_ids
+        missing = score_ids - weight_ids
+        if extra:
+            raise ValueError(f"权重中存在未评分的决策者: {extra}")
+        if missing:
+            raise ValueError(f"缺少决策者的权重: {missing}")
+
+    return np.array([weights[dm_id] for dm_id in dm_ids], dtype=np.float64)
+
+
+def score_matrix_to_tensor(
+    score_matrix: dict[str, dict[str, dict[str, float]]]
+) -> tuple[np.ndarray, list[str], list[str], list[str]] | None:
+    """将嵌套字典评分矩阵转换为 (n_dm, n_alt, n_crit) 张量
+
+    Args:
+        score_matrix: {alternative: {criterion: {decision_maker_id: score}}}
+
+    Returns:
+        (张量, 方案列表, 准则列表, 决策者列表)；评分矩阵为空或结构不规则
+        （各方案准则不同、各单元格决策者不同）时返回 None
+    """
+    alternatives = list(score_matrix)
+    if not alternatives:
+        return None
+
+    criteria = list(score_matrix[alternatives[0]])
+    if not criteria:
+        return None
+    dm_ids = list(score_matrix[alternatives[0]][criteria[0]])
+    if not dm_ids:
+        return None
+
+    criteria_keys = score_matrix[alternatives[0]].keys()
+    dm_keys = score_matrix[alternatives[0]][criteria[0]].keys()
+
+    rows = []
+    for alternative in alternatives:
+        criteria_scores = score_matrix[alternative]
+        if criteria_scores.keys() != criteria_keys:
+            return None
+        for criterion in criteria:
+            dm_scores = criteria_scores[criterion]
+            if dm_scores.keys() != dm_keys:
+                return None
+            rows.append([dm_scores[dm_id] for dm_id in dm_ids])
+
+    try:
+        flat = np.array(rows, dtype=np.float64)
+    except (TypeError, ValueError):
+        return None
+
+    tensor = flat.T.reshape(len(dm_ids), len(alternatives), len(criteria))
+    return tensor, alternatives, criteria, dm_ids
+
 
 # =============================================================================
 # 聚合方法注册表
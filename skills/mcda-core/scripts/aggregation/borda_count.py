@@ -6,7 +6,13 @@ MCDA Core - Borda 计数法聚合方法
 
 from typing import Any
 
-from .base import AggregationMethod
+import numpy as np
+
+from .base import AggregationMethod, validate_tensor
+
+# 模块级常量
+TIE_TOLERANCE = 1e-9
+"""评分差小于该值视为并列"""
 
 
 # =============================================================================
@@ -62,7 +68,7 @@ class BordaCountAggregation(AggregationMethod):
         while i < n:
             j = i
             # 找到所有相同评分的决策者
-            while j < n and abs(sorted_items[j][1] - sorted_items[i][1]) < 1e-9:
+            while j < n and abs(sorted_items[j][1] - sorted_items[i][1]) < TIE_TOLERANCE:
                 j += 1
 
             # 计算这组相同评分的平均 Borda 分数
@@ -145,11 +151,61 @@ class BordaCountAggregation(AggregationMethod):
         Returns:
             聚合后的评分矩阵 {alternative: {criterion: aggregated_score}}
         """
-        result: dict[str, dict[str, float]] = {}
+        return self._aggregate_matrix_via_tensor(score_matrix, weights)
+
+    def aggregate_tensor(
+        self,
+        tensor: np.ndarray,
+        weights: np.ndarray | None = None
+    ) -> np.ndarray:
+        """聚合评分张量
+
+        一次排序得到所有单元格的 Borda 分数，再加权平均。
+        有序评分中相邻差小于 TIE_TOLERANCE 的决策者归为一组，取平均排名。
+
+        Args:
+            tensor: 评分张量 (n_dm, n_alt, n_crit)
+            weights: 决策者权重向量 (n_dm,)（可选，默认等权重）
+
+        Returns:
+            聚合后的评分矩阵 (n_alt, n_crit)
+        """
+        tensor, weights = validate_tensor(tensor, weights)
+
+        # 决策者轴移到最后并连续存储，沿最后一轴排序远快于沿第一轴
+        cells = np.ascontiguousarray(np.moveaxis(tensor, 0, -1))
+        order, sorted_borda = self._sorted_borda_scores(cells)
+
+        # 在排序后的空间直接加权求和，无需把 Borda 分数散射回原顺序
+        weighted_sum = np.einsum("...k,...k->...", weights[order], sorted_borda)
+        return weighted_sum / weights.sum()
 
-        for alternative, criteria_scores in score_matrix.items():
-            result[alternative] = {}
-            for criterion, dm_scores in criteria_scores.items():
-                result[alternative][criterion] = self.aggregate(dm_scores, weights)
+    def _sorted_borda_scores(self, cells: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """沿最后一轴（决策者）计算 Borda 分数
 
-        return result
+        Args:
+            cells: 评分数组 (..., n_dm)
+
+        Returns:
+            (降序排序下标, 排序后各位置的 Borda 分数)，形状均为 (..., n_dm)
+        """
+        n = cells.shape[-1]
+
+        # 按评分降序排序（并列取平均排名，排序稳定性不影响结果）
+        order = np.argsort(-cells, axis=-1)
+        sorted_scores = np.take_along_axis(cells, order, axis=-1)
+
+        # 并列组：展平后每行开头必为新组，组内所有位置共享平均排名
+        gaps = np.abs(np.diff(sorted_scores, axis=-1)) >= TIE_TOLERANCE
+        edge = np.ones(gaps.shape[:-1] + (1,), dtype=bool)
+        is_start = np.concatenate([edge, gaps], axis=-1).ravel()
+        is_end = np.concatenate([gaps, edge], axis=-1).ravel()
+
+        group_start = np.flatnonzero(is_start) % n
+        group_end = np.flatnonzero(is_end) % n
+        group_id = np.cumsum(is_start) - 1
+
+        # 平均排名 (1-based) = (start + end) / 2 + 1，Borda 分数 = n - 平均排名
+        group_borda = (n - 1) - (group_start + group_end) / 2.0
+        sorted_borda = group_borda[group_id].reshape(cells.shape)
+        return order, sorted_borda
@@ -6,7 +6,9 @@ MCDA Core - Copeland 方法聚合
 
 from typing import Any
 
-from .base import AggregationMethod
+import numpy as np
+
+from .base import AggregationMethod, validate_tensor
 
 
 # =============================================================================
@@ -101,31 +103,26 @@ class CopelandAggregation(AggregationMethod):
         Returns:
             聚合后的评分矩阵 {alternative: {criterion: aggregated_score}}
         """
-        result: dict[str, dict[str, float]] = {}
-
-        # 如果没有方案，返回空字典
-        if not score_matrix:
-            return result
+        return self._aggregate_matrix_via_tensor(score_matrix, weights)
 
-        # 获取所有方案和准则
-        alternatives = list(score_matrix.keys())
-
-        # 获取准则集合（假设所有方案有相同的准则）
-        criteria = set()
-        for alt_scores in score_matrix.values():
-            criteria.update(alt_scores.keys())
+    def aggregate_tensor(
+        self,
+        tensor: np.ndarray,
+        weights: np.ndarray | None = None
+    ) -> np.ndarray:
+        """聚合评分张量
 
-        # 为每个方案和准则计算聚合评分
-        for alternative in alternatives:
-            result[alternative] = {}
-            for criterion in criteria:
-                if criterion not in score_matrix[alternative]:
-                    continue
+        单元格内的评分聚合退化为加权平均。
 
-                dm_scores = score_matrix[alternative][criterion]
-                result[alternative][criterion] = self.aggregate(dm_scores, weights)
+        Args:
+            tensor: 评分张量 (n_dm, n_alt, n_crit)
+            weights: 决策者权重向量 (n_dm,)（可选，默认等权重）
 
-        return result
+        Returns:
+            聚合后的评分矩阵 (n_alt, n_crit)
+        """
+        tensor, weights = validate_tensor(tensor, weights)
+        return np.tensordot(weights, tensor, axes=1) / weights.sum()
 
     def compute_copeland_scores(
         self,
@@ -4,7 +4,9 @@ MCDA Core - 加权平均聚合方法
 实现加权平均聚合算法。
 """
 
-from .base import AggregationMethod
+import numpy as np
+
+from .base import AggregationMethod, validate_tensor
 
 
 # =============================================================================
@@ -92,11 +94,21 @@ class WeightedAverageAggregation(AggregationMethod):
         Returns:
             聚合后的评分矩阵 {alternative: {criterion: aggregated_score}}
         """
-        result: dict[str, dict[str, float]] = {}
+        return self._aggregate_matrix_via_tensor(score_matrix, weights)
+
+    def aggregate_tensor(
+        self,
+        tensor: np.ndarray,
+        weights: np.ndarray | None = None
+    ) -> np.ndarray:
+        """聚合评分张量
 
-        for alternative, criteria_scores in score_matrix.items():
-            result[alternative] = {}
-            for criterion, dm_scores in criteria_scores.items():
-                result[alternative][criterion] = self.aggregate(dm_scores, weights)
+        Args:
+            tensor: 评分张量 (n_dm, n_alt, n_crit)
+            weights: 决策者权重向量 (n_dm,)（可选，默认等权重）
 
-        return result
+        Returns:
+            聚合后的评分矩阵 (n_alt, n_crit)
+        """
+        tensor, weights = validate_tensor(tensor, weights)
+        return np.tensordot(weights, tensor, axes=1) / weights.sum()
@@ -7,7 +7,9 @@ MCDA Core - 加权几何平均聚合方法
 import math
 from typing import Any
 
-from .base import AggregationMethod
+import numpy as np
+
+from .base import AggregationMethod, validate_tensor
 
 
 # =============================================================================
@@ -114,11 +116,53 @@ class WeightedGeometricAggregation(AggregationMethod):
         Returns:
             聚合后的评分矩阵 {alternative: {criterion: aggregated_score}}
         """
-        result: dict[str, dict[str, float]] = {}
+        return self._aggregate_matrix_via_tensor(score_matrix, weights)
+
+    def _check_score_matrix(
+        self,
+        score_matrix: dict[str, dict[str, dict[str, float]]],
+        tensor: np.ndarray,
+        alternatives: list[str],
+        criteria: list[str],
+        dm_ids: list[str]
+    ) -> None:
+        """验证所有评分必须为正数，按逐单元格聚合的顺序报告首个无效评分"""
+        # 轴顺序调整为 (方案, 准则, 决策者)，与 aggregate 的检查顺序一致
+        non_positive = np.argwhere(np.moveaxis(tensor <= 0, 0, -1))
+        if non_positive.size:
+            alt, crit, dm = non_positive[0]
+            dm_id = dm_ids[dm]
+            score = score_matrix[alternatives[alt]][criteria[crit]][dm_id]
+            raise ValueError(
+                f"几何平均不能处理零值或负值: 决策者 '{dm_id}' 的评分为 {score}"
+            )
+
+    def aggregate_tensor(
+        self,
+        tensor: np.ndarray,
+        weights: np.ndarray | None = None
+    ) -> np.ndarray:
+        """聚合评分张量（对数域加权平均）
 
-        for alternative, criteria_scores in score_matrix.items():
-            result[alternative] = {}
-            for criterion, dm_scores in criteria_scores.items():
-                result[alternative][criterion] = self.aggregate(dm_scores, weights)
+        Args:
+            tensor: 评分张量 (n_dm, n_alt, n_crit)
+            weights: 决策者权重向量 (n_dm,)（可选，默认等权重）
+
+        Returns:
+            聚合后的评分矩阵 (n_alt, n_crit)
 
-        return result
+        Raises:
+            ValueError: 评分包含零值或负值
+        """
+        tensor, weights = validate_tensor(tensor, weights)
+
+        non_positive = np.argwhere(tensor <= 0)
+        if non_positive.size:
+            dm, alt, crit = non_positive[0]
+            raise ValueError(
+                f"几何平均不能处理零值或负值: 第 {dm} 个决策者的评分为 "
+                f"{tensor[dm, alt, crit]} (方案 {alt}, 准则 {crit})"
+            )
+
+        log_score = np.tensordot(weights, np.log(tensor), axes=1) / weights.sum()
+        return np.exp(log_score)
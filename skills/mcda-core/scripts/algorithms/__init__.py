@@ -2,8 +2,15 @@
 MCDA Core - 汇总算法模块
 
 提供多种 MCDA 汇总算法实现。
+
+具体算法按需导入（PEP 562）：访问导出名称或调用 get_algorithm() 时
+才加载对应模块及其依赖（如 NumPy）。
 """
 
+import importlib
+import sys
+import types
+
 from .base import (
     MCDAAlgorithm,
     register_algorithm,
@@ -11,22 +18,60 @@ from .base import (
     list_algorithms,
 )
 
-# 导入具体算法（导入时自动注册）
-from .wsm import WSMAlgorithm
-from .wpm import WPMAlgorithm
-from .topsis import TOPSISAlgorithm
-from .topsis_interval import IntervalTOPSISAlgorithm
-from .vikor import VIKORAlgorithm
-from .vikor_interval import IntervalVIKORAlgorithm
-from .todim_interval import IntervalTODIMAlgorithm
-from .electre1_interval import ELECTRE1IntervalAlgorithm
-from .promethee2_interval import PROMETHEE2IntervalAlgorithm
-from .promethee2_service import (
-    PROMETHEEService,
-    PROMETHEEValidationError
-)
-from .todim import todim, TODIMError
-from .electre1 import electre1, ELECTRE1Error
+# 延迟导出: 名称 → 定义模块
+_lazy_exports: dict[str, str] = {
+    "WSMAlgorithm": ".wsm",
+    "WPMAlgorithm": ".wpm",
+    "TOPSISAlgorithm": ".topsis",
+    "IntervalTOPSISAlgorithm": ".topsis_interval",
+    "VIKORAlgorithm": ".vikor",
+    "IntervalVIKORAlgorithm": ".vikor_interval",
+    "IntervalTODIMAlgorithm": ".todim_interval",
+    "ELECTRE1IntervalAlgorithm": ".electre1_interval",
+    "PROMETHEE2IntervalAlgorithm": ".promethee2_interval",
+    "PROMETHEEService": ".promethee2_service",
+    "PROMETHEEValidationError": ".promethee2_service",
+    "todim": ".todim",
+    "TODIMError": ".todim",
+    "electre1": ".electre1",
+    "ELECTRE1Error": ".electre1",
+}
+
+# 与子模块同名的函数导出
+_function_exports = frozenset({"todim", "electre1"})
+
+
+class _AlgorithmsModule(types.ModuleType):
+    """算法包模块类型
+
+    导入 todim / electre1 子模块时，导入系统会把子模块设置为包属性；
+    这里改为设置同名函数，保持 ``from mcda_core.algorithms import todim``
+    得到的是函数而非模块。
+    """
+
+    def __setattr__(self, name: str, value) -> None:
+        if name in _function_exports and isinstance(value, types.ModuleType):
+            value = getattr(value, name)
+        super().__setattr__(name, value)
+
+
+sys.modules[__name__].__class__ = _AlgorithmsModule
+
+
+def __getattr__(name: str):
+    """按需导入延迟导出的算法"""
+    module_name = _lazy_exports.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_lazy_exports))
+
 
 __all__ = [
     # 基类和注册
@@ -5,10 +5,12 @@ MCDA Core - 算法抽象基类和注册机制
 """
 
 from abc import ABC, abstractmethod
-from typing import Any, TYPE_CHECKING
+from dataclasses import dataclass
+from typing import Any, Callable, TYPE_CHECKING
 
 # 类型注解导入（避免循环导入）
 if TYPE_CHECKING:
+    import numpy as np
     from ..models import DecisionProblem, DecisionResult
 
 
@@ -18,6 +20,21 @@ if TYPE_CHECKING:
 
 _algorithms: dict[str, type["MCDAAlgorithm"]] = {}
 
+# 内置算法延迟注册表: 算法名称 → 定义该算法的模块（相对 algorithms 包）
+# 首次通过 get_algorithm() 请求时才导入对应模块（导入时自动注册），
+# 避免仅使用部分算法或不使用算法的入口（如 CLI validate）加载全部依赖
+_builtin_algorithms: dict[str, str] = {
+    "wsm": ".wsm",
+    "wpm": ".wpm",
+    "topsis": ".topsis",
+    "topsis_interval": ".topsis_interval",
+    "vikor": ".vikor",
+    "vikor_interval": ".vikor_interval",
+    "todim_interval": ".todim_interval",
+    "electre1_interval": ".electre1_interval",
+    "promethee2_interval": ".promethee2_interval",
+}
+
 
 def register_algorithm(name: str):
     """算法注册装饰器
@@ -51,19 +68,95 @@ def get_algorithm(name: str) -> "MCDAAlgorithm":
     Raises:
         ValueError: 未知的算法
     """
+    if name not in _algorithms and name in _builtin_algorithms:
+        import importlib
+        importlib.import_module(_builtin_algorithms[name], __package__)
+
     if name not in _algorithms:
-        available = ", ".join(_algorithms.keys())
+        available = ", ".join(list_algorithms())
         raise ValueError(f"未知的算法: '{name}'. 可用: {available}")
     return _algorithms[name]()
 
 
 def list_algorithms() -> list[str]:
-    """列出所有已注册的算法
+    """列出所有可用的算法（内置算法无需已导入）
 
     Returns:
         算法名称列表
     """
-    return list(_algorithms.keys())
+    extra = [name for name in _algorithms if name not in _builtin_algorithms]
+    return list(_builtin_algorithms) + extra
+
+
+# =============================================================================
+# 排名工具
+# =============================================================================
+
+def rank_scores(scores: "np.ndarray", *, descending: bool = True) -> "np.ndarray":
+    """按得分计算排名（支持批量）
+
+    沿最后一个轴排序，得分相同时保持方案原始顺序，与各算法
+    calculate() 中基于 sorted() 的稳定排序一致。
+
+    Args:
+        scores: 得分数组 (n_alt,) 或 (k, n_alt)
+        descending: True 表示得分越大排名越靠前
+
+    Returns:
+        与 scores 同形状的整数排名数组，1 表示最优
+    """
+    import numpy as np
+
+    scores = np.asarray(scores)
+    order = np.argsort(-scores if descending else scores, axis=-1, kind="stable")
+    positions = np.broadcast_to(np.arange(1, scores.shape[-1] + 1), order.shape)
+
+    ranks = np.empty(order.shape, dtype=np.int64)
+    np.put_along_axis(ranks, order, positions, axis=-1)
+    return ranks
+
+
+# =============================================================================
+# 权重线性模型
+# =============================================================================
+
+@dataclass(frozen=True)
+class LinearWeightModel:
+    """权重线性评分模型
+
+    描述"得分可由权重的线性组合得到"的算法，使权重扰动、批量权重
+    评估等场景无需重新执行完整计算:
+
+        sums_t = terms[t] @ (w ** power)       对每个 t
+        scores = finalize(*sums)
+
+    由于 sums 对 w ** power 线性，修改单个权重或整体缩放权重只需对
+    已有 sums 做秩一修正（O(n_alt)），无需重新计算 O(n_alt · n_crit)。
+
+    Attributes:
+        terms: 与权重无关的项矩阵元组，每个形状为 (n_alt, n_crit)
+        finalize: 由各项加权和计算最终得分的函数（得分越大越好）
+        power: 权重的幂次（WSM/WPM 为 1，TOPSIS 距离平方为 2）
+    """
+    terms: tuple["np.ndarray", ...]
+    finalize: Callable[..., "np.ndarray"]
+    power: int = 1
+
+    def weighted_sums(self, weights: "np.ndarray") -> tuple["np.ndarray", ...]:
+        """计算各项的加权和
+
+        Args:
+            weights: 权重向量 (n_crit,) 或权重矩阵 (k, n_crit)
+
+        Returns:
+            每项一个数组，形状 (n_alt,) 或 (k, n_alt)
+        """
+        powered = weights ** self.power
+        return tuple(powered @ term.T for term in self.terms)
+
+    def scores(self, weights: "np.ndarray") -> "np.ndarray":
+        """计算给定权重下的得分"""
+        return self.finalize(*self.weighted_sums(weights))
 
 
 # =============================================================================
@@ -104,9 +197,128 @@ class MCDAAlgorithm(ABC):
         """算法描述（可选覆盖）"""
         return f"{self.name} 算法"
 
+    def calculate_batch(
+        self,
+        problem: "DecisionProblem",
+        weights: "np.ndarray",
+        **kwargs: Any
+    ) -> tuple["np.ndarray", "np.ndarray"]:
+        """批量评估多组权重（同一评分矩阵）
+
+        提供 LinearWeightModel 的算法用一次矩阵乘法完成全部评估；
+        其他算法逐组权重调用 calculate()（共享已缓存的评分矩阵）。
+
+        Args:
+            problem: 决策问题（其评分矩阵和准则方向用于所有权重组）
+            weights: 权重矩阵 (k, n_crit)，每行一组权重，列顺序与 criteria 一致；
+                每行按其和归一化，线性快速路径与逐组回退路径使用相同的权重
+            **kwargs: 算法特定参数（传递给 calculate()）
+
+        Returns:
+            (scores, ranks) 元组:
+            - scores: (k, n_alt) 得分矩阵，含义与 calculate() 的 raw_scores 相同
+            - ranks: (k, n_alt) 排名矩阵，1 表示最优
+
+        Raises:
+            ValueError: 权重矩阵形状无效、包含负数/非有限值或某行和为 0
+            ValidationError: 决策问题验证失败
+        """
+        import numpy as np
+
+        self.validate(problem)
+        weights = self._check_batch_weights(problem, weights)
+
+        model = self.linear_weight_model(problem)
+        if model is not None:
+            scores = model.scores(weights)
+            return scores, rank_scores(scores)
+
+        # 通用回退：逐组权重完整计算
+        index = {alt: i for i, alt in enumerate(problem.alternatives)}
+        scores = np.empty((len(weights), len(index)))
+        ranks = np.empty((len(weights), len(index)), dtype=np.int64)
+
+        for k, row in enumerate(weights):
+            result = self.calculate(problem.with_weights(row), **kwargs)
+            for alt, score in result.raw_scores.items():
+                scores[k, index[alt]] = score
+            for item in result.rankings:
+                ranks[k, index[item.alternative]] = item.rank
+
+        return scores, ranks
+
+    def _check_batch_weights(
+        self,
+        problem: "DecisionProblem",
+        weights: "np.ndarray"
+    ) -> "np.ndarray":
+        """验证并规整批量权重矩阵为 (k, n_crit) float64，每行归一化为和 1
+
+        准则权重必须在 [0, 1] 内（见 Criterion），统一归一化后两条计算路径
+        接受同样的输入并得到同样的结果。
+        """
+        import numpy as np
+
+        weights = np.asarray(weights, dtype=np.float64)
+        if weights.ndim == 1:
+            weights = weights[None, :]
+
+        n_crit = len(problem.criteria)
+        if weights.ndim != 2 or weights.shape[1] != n_crit:
+            raise ValueError(
+                f"权重矩阵形状必须为 (k, {n_crit})，当前: {weights.shape}"
+            )
+        if not np.all(np.isfinite(weights)) or np.any(weights < 0):
+            raise ValueError("权重矩阵必须为非负有限值")
+
+        totals = weights.sum(axis=1, keepdims=True)
+        if np.any(totals == 0):
+            raise ValueError("权重矩阵每行之和必须大于 0")
+
+        return weights / totals
+
+    def linear_weight_model(
+        self,
+        problem: "DecisionProblem"
+    ) -> "LinearWeightModel | None":
+        """获取权重线性评分模型（可选覆盖）
+
+        得分对权重线性（或对权重幂次线性）的算法可覆盖此方法，
+        供敏感性分析等场景做增量计算。模型得分的排序须与
+        calculate() 的排名一致（得分越大排名越靠前）。
+
+        Args:
+            problem: 决策问题
+
+        Returns:
+            LinearWeightModel，默认 None 表示不支持
+        """
+        return None
+
+    def _oriented_matrix(self, problem: "DecisionProblem") -> "np.ndarray":
+        """获取方向统一后的评分矩阵
+
+        基于 problem.score_matrix 构建新数组，lower_better 准则按
+        MAX_SCORE - x 反转，使所有列都是"越大越好"。
+
+        Args:
+            problem: 决策问题
+
+        Returns:
+            形状为 (n_alt, n_crit) 的 float64 数组（可写副本）
+        """
+        import numpy as np
+        from ..models import MAX_SCORE
+
+        matrix = problem.score_matrix
+        return np.where(problem.direction_mask, MAX_SCORE - matrix, matrix)
+
     def validate(self, problem: "DecisionProblem") -> None:
         """验证输入数据（可选覆盖）
 
+        评分矩阵已在 DecisionProblem 构建时验证（或为可信构建）时跳过逐格
+        完整性检查，敏感性分析等派生问题不会重复验证。
+
         Args:
             problem: 决策问题
 
@@ -128,6 +340,9 @@ class MCDAAlgorithm(ABC):
                 details={"criterion_count": len(problem.criteria)}
             )
 
+        if problem.is_validated:
+            return
+
         # 验证评分完整性
         for alt in problem.alternatives:
             if alt not in problem.scores:
@@ -154,6 +369,9 @@ class MCDAAlgorithm(ABC):
 __all__ = [
     # 基类
     "MCDAAlgorithm",
+    "LinearWeightModel",
+    # 工具
+    "rank_scores",
     # 注册
     "register_algorithm",
     "get_algorithm",
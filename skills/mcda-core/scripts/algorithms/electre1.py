@@ -17,7 +17,8 @@ class ELECTRE1Error(Exception):
 def electre1(
     problem: DecisionProblem,
     alpha: float = 0.6,
-    beta: float = 0.3
+    beta: float = 0.3,
+    block_size: int | None = None
 ) -> DecisionResult:
     """ELECTRE-I 算法实现
 
@@ -37,6 +38,8 @@ def electre1(
         problem: 决策问题
         alpha: 和谐度阈值 (0 < α ≤ 1, 推荐 0.5-0.7)
         beta: 不和谐度阈值 (0 ≤ β ≤ 1, 推荐 0.2-0.4)
+        block_size: 行分块大小（可选）。指定后按 block_size 行一块计算
+            成对矩阵，临时内存为 O(block_size · n_alt)；默认一次处理全部行
 
     Returns:
         决策结果
@@ -51,9 +54,11 @@ def electre1(
     if beta < 0 or beta > 1:
         raise ELECTRE1Error(f"beta 必须在 [0, 1] 范围内, 当前值: {beta}")
 
+    if block_size is not None and block_size < 1:
+        raise ELECTRE1Error(f"block_size 必须 >= 1, 当前值: {block_size}")
+
     alternatives = problem.alternatives
     criteria = problem.criteria
-    scores = problem.scores
 
     n_alt = len(alternatives)
     n_crit = len(criteria)
@@ -65,30 +70,29 @@ def electre1(
         raise ELECTRE1Error("至少需要 1 个准则")
 
     # 1. 提取权重
-    weights = np.array([c.weight for c in criteria])
+    weights = problem.weight_vector
     total_weight = weights.sum()
 
     if total_weight <= 0:
         raise ELECTRE1Error("准则权重总和必须 > 0")
 
-    # 2. 构建得分矩阵
-    scores_matrix = np.zeros((n_alt, n_crit))
-    for i, alt in enumerate(alternatives):
-        for k, crit in enumerate(criteria):
-            scores_matrix[i, k] = scores[alt][crit.name]
+    # 2. 获取得分矩阵（DecisionProblem 缓存的稠密矩阵）
+    scores_matrix = problem.score_matrix
 
     # 3. 计算和谐矩阵
     concordance = _compute_concordance_matrix(
         scores_matrix,
         weights,
         criteria,
-        total_weight
+        total_weight,
+        block_size
     )
 
     # 4. 计算不和谐矩阵
     discordance = _compute_discordance_matrix(
         scores_matrix,
-        criteria
+        criteria,
+        block_size
     )
 
     # 5. 计算可信度矩阵
@@ -121,10 +125,9 @@ def electre1(
 
     # 9. 构建原始得分
     # ELECTRE-I 没有明确的得分，使用可信度总和作为得分
-    raw_scores = {}
-    for i, alt in enumerate(alternatives):
-        # 可信度总和作为优势度
-        raw_scores[alt] = float(np.sum(credibility[i, :]))
+    # 可信度总和作为优势度
+    dominance = credibility.sum(axis=1)
+    raw_scores = {alt: float(dominance[i]) for i, alt in enumerate(alternatives)}
 
     return DecisionResult(
         rankings=rankings,
@@ -133,19 +136,39 @@ def electre1(
     )
 
 
+def _row_blocks(n_alt: int, block_size: int | None):
+    """生成行分块区间 [start, stop)
+
+    Args:
+        n_alt: 方案数
+        block_size: 分块大小（None 表示不分块）
+
+    Yields:
+        (start, stop) 行区间
+    """
+    step = n_alt if block_size is None else block_size
+    for start in range(0, n_alt, step):
+        yield start, min(start + step, n_alt)
+
+
 def _compute_concordance_matrix(
     scores_matrix: NDArray,
     weights: NDArray,
     criteria: tuple,
-    total_weight: float
+    total_weight: float,
+    block_size: int | None = None
 ) -> NDArray:
     """计算和谐矩阵
 
+    按准则逐个累加和谐权重（与逐对求和的累加顺序一致），
+    每次只生成 (block, n_alt) 的布尔指示矩阵。
+
     Args:
         scores_matrix: 得分矩阵 (n_alt, n_crit)
         weights: 权重向量 (n_crit,)
         criteria: 准则元组
         total_weight: 权重总和
+        block_size: 行分块大小（可选）
 
     Returns:
         和谐矩阵 (n_alt, n_alt)
@@ -155,43 +178,43 @@ def _compute_concordance_matrix(
     # 初始化和谐矩阵
     concordance = np.zeros((n_alt, n_alt))
 
-    # 计算每对方案的和谐指数
-    for i in range(n_alt):
-        for j in range(n_alt):
-            if i == j:
-                continue
+    for start, stop in _row_blocks(n_alt, block_size):
+        block = concordance[start:stop]
+        rows = scores_matrix[start:stop]
 
-            concordant_weight = 0.0
+        for k in range(n_crit):
+            col = scores_matrix[:, k]
 
-            for k in range(n_crit):
-                score_i = scores_matrix[i, k]
-                score_j = scores_matrix[j, k]
+            # 指示函数: 检查 A_i 是否不劣于 A_j 在准则 k 上
+            if criteria[k].direction == "higher_better":
+                # 效益型: A_i ≥ A_j
+                concordant = rows[:, k, None] >= col[None, :]
+            else:
+                # 成本型: A_i ≤ A_j
+                concordant = rows[:, k, None] <= col[None, :]
 
-                # 指示函数: 检查 A_i 是否不劣于 A_j 在准则 k 上
-                if criteria[k].direction == "higher_better":
-                    # 效益型: A_i ≥ A_j
-                    if score_i >= score_j:
-                        concordant_weight += weights[k]
-                else:
-                    # 成本型: A_i ≤ A_j
-                    if score_i <= score_j:
-                        concordant_weight += weights[k]
+            np.add(block, weights[k], out=block, where=concordant)
 
-            # 归一化和谐指数
-            concordance[i, j] = concordant_weight / total_weight
+    # 归一化和谐指数，对角线置零
+    concordance /= total_weight
+    np.fill_diagonal(concordance, 0.0)
 
     return concordance
 
 
 def _compute_discordance_matrix(
     scores_matrix: NDArray,
-    criteria: tuple
+    criteria: tuple,
+    block_size: int | None = None
 ) -> NDArray:
     """计算不和谐矩阵
 
+    按准则逐个取最大值，每次只生成 (block, n_alt) 的差值矩阵。
+
     Args:
         scores_matrix: 得分矩阵 (n_alt, n_crit)
         criteria: 准则元组
+        block_size: 行分块大小（可选）
 
     Returns:
         不和谐矩阵 (n_alt, n_alt)
@@ -202,45 +225,30 @@ def _compute_discordance_matrix(
     discordance = np.zeros((n_alt, n_alt))
 
     # 计算每个准则的范围
-    criterion_ranges = []
-    for k in range(n_crit):
-        col = scores_matrix[:, k]
-        min_val = np.min(col)
-        max_val = np.max(col)
-        range_val = max_val - min_val
-
-        if range_val < 1e-10:
-            range_val = 1.0  # 避免除零
-
-        criterion_ranges.append(range_val)
-
-    # 计算每对方案的全局不和谐指数
-    for i in range(n_alt):
-        for j in range(n_alt):
-            if i == j:
-                continue
-
-            max_discordance = 0.0
-
-            for k in range(n_crit):
-                score_i = scores_matrix[i, k]
-                score_j = scores_matrix[j, k]
-
-                # 根据准则方向调整
-                if criteria[k].direction == "higher_better":
-                    # 效益型: A_i < A_j 时才有不和谐
-                    if score_i < score_j:
-                        diff = score_j - score_i
-                        discordance_k = diff / criterion_ranges[k]
-                        max_discordance = max(max_discordance, discordance_k)
-                else:
-                    # 成本型: A_i > A_j 时才有不和谐
-                    if score_i > score_j:
-                        diff = score_i - score_j
-                        discordance_k = diff / criterion_ranges[k]
-                        max_discordance = max(max_discordance, discordance_k)
-
-            discordance[i, j] = max_discordance
+    criterion_ranges = np.max(scores_matrix, axis=0) - np.min(scores_matrix, axis=0)
+    criterion_ranges[criterion_ranges < 1e-10] = 1.0  # 避免除零
+
+    for start, stop in _row_blocks(n_alt, block_size):
+        block = discordance[start:stop]
+        rows = scores_matrix[start:stop]
+
+        for k in range(n_crit):
+            col = scores_matrix[:, k]
+
+            # 根据准则方向调整
+            if criteria[k].direction == "higher_better":
+                # 效益型: A_i < A_j 时才有不和谐
+                diff = col[None, :] - rows[:, k, None]
+            else:
+                # 成本型: A_i > A_j 时才有不和谐
+                diff = rows[:, k, None] - col[None, :]
+
+            # diff <= 0 的位置保持 0（不产生不和谐）
+            np.maximum(diff, 0.0, out=diff)
+            diff /= criterion_ranges[k]
+            np.maximum(block, diff, out=block)
+
+    np.fill_diagonal(discordance, 0.0)
 
     return discordance
 
@@ -266,22 +274,11 @@ def _compute_credibility_matrix(
     Returns:
         可信度矩阵 (n_alt, n_alt)
     """
-    n_alt = concordance.shape[0]
-
-    # 初始化可信度矩阵
-    credibility = np.zeros((n_alt, n_alt))
+    # 检查和谐度和不和谐度条件
+    credibility = ((concordance >= alpha) & (discordance <= beta)).astype(np.float64)
 
-    # 计算可信度
-    for i in range(n_alt):
-        for j in range(n_alt):
-            if i == j:
-                credibility[i, j] = 0.0
-            else:
-                # 检查和谐度和不和谐度条件
-                if concordance[i, j] >= alpha and discordance[i, j] <= beta:
-                    credibility[i, j] = 1.0
-                else:
-                    credibility[i, j] = 0.0
+    # 方案不与自身比较
+    np.fill_diagonal(credibility, 0.0)
 
     return credibility
 
@@ -301,23 +298,10 @@ def _extract_kernel(
     Returns:
         核中的方案列表
     """
-    n_alt = credibility.shape[0]
-
-    # 找出非被优方案
-    kernel = []
-    for i in range(n_alt):
-        is_dominated = False
-
-        for j in range(n_alt):
-            if credibility[j, i] == 1.0:
-                # 存在 A_j 优于 A_i
-                is_dominated = True
-                break
-
-        if not is_dominated:
-            kernel.append(alternatives[i])
+    # 第 i 列存在 1 表示 A_i 被某个方案优于
+    is_dominated = (credibility == 1.0).any(axis=0)
 
-    return kernel
+    return [alternatives[i] for i in np.flatnonzero(~is_dominated)]
 
 
 def _build_rankings(
@@ -343,11 +327,12 @@ def _build_rankings(
     rankings = []
 
     # 计算所有方案的原始得分总和
+    kernel_set = set(kernel)
     all_scores = []
     for i, alt in enumerate(alternatives):
         # 使用原始得分总和,不是可信度总和
         raw_score = np.sum(scores_matrix[i, :])
-        in_kernel = alt in kernel
+        in_kernel = alt in kernel_set
         all_scores.append((alt, raw_score, in_kernel))
 
     # 排序: 先按是否在核中 (核内优先),再按原始得分降序
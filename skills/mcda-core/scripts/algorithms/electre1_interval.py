@@ -10,11 +10,12 @@ import numpy as np
 from numpy.typing import NDArray
 
 from .base import MCDAAlgorithm, register_algorithm
+from ..profiling import stage
 
 # 类型注解导入
 if TYPE_CHECKING:
-    from ..models import DecisionProblem, DecisionResult, Criterion
-    from ..interval import Interval
+    from ..models import DecisionProblem, DecisionResult, RankingItem
+    from ..interval import IntervalMatrix
 
 
 @register_algorithm("electre1_interval")
@@ -98,8 +99,8 @@ class ELECTRE1IntervalAlgorithm(MCDAAlgorithm):
             决策结果
         """
         # 运行时导入（避免循环导入）
-        from ..models import DecisionResult, RankingItem, ResultMetadata
-        from ..interval import Interval
+        from ..models import DecisionResult, ResultMetadata
+        from ..interval import IntervalMatrix
 
         # 验证输入
         self.validate(problem)
@@ -129,45 +130,45 @@ class ELECTRE1IntervalAlgorithm(MCDAAlgorithm):
             raise ValueError("至少需要 1 个准则")
 
         # 1. 提取权重
-        weights = np.array([c.weight for c in criteria])
+        weights = problem.weight_vector
         total_weight = weights.sum()
 
         if total_weight <= 0:
             raise ValueError("准则权重总和必须 > 0")
 
-        # 2. 构建得分矩阵（处理区间数）
-        scores_matrix = np.zeros((n_alt, n_crit), dtype=object)
-        for i, alt in enumerate(alternatives):
-            for k, crit in enumerate(criteria):
-                scores_matrix[i, k] = problem.scores[alt][crit.name]
-
-        # 3. 计算和谐矩阵（基于可能度）
-        concordance = self._compute_concordance_matrix(
-            scores_matrix,
-            weights,
-            criteria,
-            total_weight
-        )
+        with stage("matrix"):
+            # 2. 构建区间得分矩阵（精确数为退化区间）
+            scores_matrix = IntervalMatrix.from_problem(problem)
+
+        with stage("pairwise"):
+            # 3. 计算和谐矩阵（基于区间中点）
+            concordance = self._compute_concordance_matrix(
+                scores_matrix,
+                weights,
+                problem.direction_mask,
+                total_weight
+            )
 
-        # 4. 计算不和谐矩阵（基于区间差）
-        discordance = self._compute_discordance_matrix(
-            scores_matrix,
-            criteria
-        )
+            # 4. 计算不和谐矩阵（基于区间差）
+            discordance = self._compute_discordance_matrix(
+                scores_matrix,
+                problem.direction_mask
+            )
 
-        # 5. 计算可信度矩阵
-        credibility = self._compute_credibility_matrix(
-            concordance,
-            discordance,
-            alpha,
-            beta
-        )
+            # 5. 计算可信度矩阵
+            credibility = self._compute_credibility_matrix(
+                concordance,
+                discordance,
+                alpha,
+                beta
+            )
 
-        # 6. 提取核
-        kernel = self._extract_kernel(credibility, alternatives)
+        with stage("ranking"):
+            # 6. 提取核
+            kernel = self._extract_kernel(credibility, alternatives)
 
-        # 7. 构建排名（核内方案排名靠前）
-        rankings = self._build_rankings(kernel, alternatives, credibility)
+            # 7. 构建排名（核内方案排名靠前）
+            rankings = self._build_rankings(kernel, alternatives, credibility)
 
         # 8. 构建元数据
         metadata = ResultMetadata(
@@ -196,157 +197,76 @@ class ELECTRE1IntervalAlgorithm(MCDAAlgorithm):
 
     def _compute_concordance_matrix(
         self,
-        scores_matrix: NDArray,
+        scores_matrix: "IntervalMatrix",
         weights: NDArray,
-        criteria: tuple["Criterion", ...],
+        direction_mask: NDArray,
         total_weight: float
     ) -> NDArray:
         """计算和谐矩阵
 
-        对于区间数版本，使用区间中点进行比较，并结合区间重叠信息。
+        对于区间数版本，使用区间中点判断 A_i 是否不劣于 A_j。
 
         Args:
-            scores_matrix: 得分矩阵 (n_alt, n_crit)，元素可能是区间数
+            scores_matrix: 区间得分矩阵 (n_alt, n_crit)
             weights: 权重向量 (n_crit,)
-            criteria: 准则元组
+            direction_mask: 方向掩码（True 表示成本型）
             total_weight: 权重总和
 
         Returns:
-            和谐矩阵 (n_alt, n_alt)
+            和谐矩阵 (n_alt, n_alt)，对角线为 0
         """
-        from ..interval import Interval
-
-        n_alt, n_crit = scores_matrix.shape
-
-        # 初始化和谐矩阵
-        concordance = np.zeros((n_alt, n_alt))
-
-        # 计算每对方案的和谐指数
-        for i in range(n_alt):
-            for j in range(n_alt):
-                if i == j:
-                    continue
-
-                concordant_weight = 0.0
-
-                for k in range(n_crit):
-                    score_i = scores_matrix[i, k]
-                    score_j = scores_matrix[j, k]
-
-                    # 获取中点用于比较
-                    if isinstance(score_i, Interval):
-                        midpoint_i = score_i.midpoint
-                    else:
-                        midpoint_i = float(score_i)
-
-                    if isinstance(score_j, Interval):
-                        midpoint_j = score_j.midpoint
-                    else:
-                        midpoint_j = float(score_j)
-
-                    # 指示函数: 检查 A_i 是否不劣于 A_j 在准则 k 上
-                    if criteria[k].direction == "higher_better":
-                        # 效益型: A_i ≥ A_j
-                        if midpoint_i >= midpoint_j:
-                            concordant_weight += weights[k]
-                    else:
-                        # 成本型: A_i ≤ A_j
-                        if midpoint_i <= midpoint_j:
-                            concordant_weight += weights[k]
-
-                # 归一化和谐指数
-                concordance[i, j] = concordant_weight / total_weight
+        midpoint = scores_matrix.midpoint
+        n_alt, n_crit = midpoint.shape
 
+        # 按准则累加（不构建 (n_alt, n_alt, n_crit) 张量）
+        concordant_weight = np.zeros((n_alt, n_alt))
+        for k in range(n_crit):
+            diff = midpoint[:, k, None] - midpoint[None, :, k]
+            # 指示函数: 效益型 mid_i ≥ mid_j，成本型 mid_i ≤ mid_j
+            concordant = diff <= 0 if direction_mask[k] else diff >= 0
+            concordant_weight += weights[k] * concordant
+
+        # 归一化和谐指数
+        concordance = concordant_weight / total_weight
+        np.fill_diagonal(concordance, 0.0)
         return concordance
 
     def _compute_discordance_matrix(
         self,
-        scores_matrix: NDArray,
-        criteria: tuple["Criterion", ...]
+        scores_matrix: "IntervalMatrix",
+        direction_mask: NDArray
     ) -> NDArray:
         """计算不和谐矩阵
 
-        对于区间数版本，使用区间上界和下界计算最大不和谐度。
+        对于区间数版本，使用区间上界和下界计算最大不和谐度（最不利情况）。
 
         Args:
-            scores_matrix: 得分矩阵 (n_alt, n_crit)，元素可能是区间数
-            criteria: 准则元组
+            scores_matrix: 区间得分矩阵 (n_alt, n_crit)
+            direction_mask: 方向掩码（True 表示成本型）
 
         Returns:
-            不和谐矩阵 (n_alt, n_alt)
+            不和谐矩阵 (n_alt, n_alt)，对角线为 0
         """
-        from ..interval import Interval
+        lower = scores_matrix.lower
+        upper = scores_matrix.upper
 
-        n_alt, n_crit = scores_matrix.shape
+        # 每个准则的范围（基于区间端点）
+        criterion_ranges = upper.max(axis=0) - lower.min(axis=0)
+        criterion_ranges[criterion_ranges < 1e-10] = 1.0  # 避免除零
 
-        # 初始化不和谐矩阵
+        # 按准则取最大不和谐度（不构建 (n_alt, n_alt, n_crit) 张量）
+        n_alt, n_crit = lower.shape
         discordance = np.zeros((n_alt, n_alt))
-
-        # 计算每个准则的范围（基于区间端点）
-        criterion_ranges = []
         for k in range(n_crit):
-            min_val = float('inf')
-            max_val = float('-inf')
-
-            for i in range(n_alt):
-                val = scores_matrix[i, k]
-                if isinstance(val, Interval):
-                    min_val = min(min_val, val.lower)
-                    max_val = max(max_val, val.upper)
-                else:
-                    min_val = min(min_val, float(val))
-                    max_val = max(max_val, float(val))
-
-            range_val = max_val - min_val
-
-            if range_val < 1e-10:
-                range_val = 1.0  # 避免除零
-
-            criterion_ranges.append(range_val)
-
-        # 计算每对方案的全局不和谐指数
-        for i in range(n_alt):
-            for j in range(n_alt):
-                if i == j:
-                    continue
-
-                max_discordance = 0.0
-
-                for k in range(n_crit):
-                    score_i = scores_matrix[i, k]
-                    score_j = scores_matrix[j, k]
-
-                    # 获取比较值（对于区间，使用最不利情况）
-                    if isinstance(score_i, Interval):
-                        val_i_lower = score_i.lower
-                        val_i_upper = score_i.upper
-                    else:
-                        val_i_lower = float(score_i)
-                        val_i_upper = float(score_i)
-
-                    if isinstance(score_j, Interval):
-                        val_j_lower = score_j.lower
-                        val_j_upper = score_j.upper
-                    else:
-                        val_j_lower = float(score_j)
-                        val_j_upper = float(score_j)
-
-                    # 根据准则方向调整
-                    if criteria[k].direction == "higher_better":
-                        # 效益型: 最坏情况是 i 的下界 < j 的上界
-                        if val_i_lower < val_j_upper:
-                            diff = val_j_upper - val_i_lower
-                            discordance_k = diff / criterion_ranges[k]
-                            max_discordance = max(max_discordance, discordance_k)
-                    else:
-                        # 成本型: 最坏情况是 i 的上界 > j 的下界
-                        if val_i_upper > val_j_lower:
-                            diff = val_i_upper - val_j_lower
-                            discordance_k = diff / criterion_ranges[k]
-                            max_discordance = max(max_discordance, discordance_k)
-
-                discordance[i, j] = max_discordance
-
+            if direction_mask[k]:
+                # 成本型: 最坏情况是 i 的上界超过 j 的下界
+                gap = upper[:, k, None] - lower[None, :, k]
+            else:
+                # 效益型: 最坏情况是 j 的上界超过 i 的下界
+                gap = upper[None, :, k] - lower[:, k, None]
+            np.maximum(discordance, gap / criterion_ranges[k], out=discordance)
+
+        np.fill_diagonal(discordance, 0.0)
         return discordance
 
     def _compute_credibility_matrix(
@@ -371,23 +291,8 @@ class ELECTRE1IntervalAlgorithm(MCDAAlgorithm):
         Returns:
             可信度矩阵 (n_alt, n_alt)
         """
-        n_alt = concordance.shape[0]
-
-        # 初始化可信度矩阵
-        credibility = np.zeros((n_alt, n_alt))
-
-        # 计算可信度
-        for i in range(n_alt):
-            for j in range(n_alt):
-                if i == j:
-                    credibility[i, j] = 0.0
-                else:
-                    # 检查和谐度和不和谐度条件
-                    if concordance[i, j] >= alpha and discordance[i, j] <= beta:
-                        credibility[i, j] = 1.0
-                    else:
-                        credibility[i, j] = 0.0
-
+        credibility = ((concordance >= alpha) & (discordance <= beta)).astype(np.float64)
+        np.fill_diagonal(credibility, 0.0)
         return credibility
 
     def _extract_kernel(
@@ -406,24 +311,9 @@ class ELECTRE1IntervalAlgorithm(MCDAAlgorithm):
         Returns:
             核中的方案名称列表
         """
-        n_alt = len(alternatives)
-
-        # 核：不被任何其他方案优的方案
-        kernel = []
-
-        for i in range(n_alt):
-            is_dominated = False
-
-            # 检查是否有方案 j 优于方案 i
-            for j in range(n_alt):
-                if i != j and credibility[j, i] == 1.0:
-                    is_dominated = True
-                    break
-
-            if not is_dominated:
-                kernel.append(alternatives[i])
-
-        return kernel
+        # 核：不被任何其他方案优的方案（对角线恒为 0）
+        dominated = (credibility == 1.0).any(axis=0)
+        return [alt for alt, is_dominated in zip(alternatives, dominated) if not is_dominated]
 
     def _build_rankings(
         self,
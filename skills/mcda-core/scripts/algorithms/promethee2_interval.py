@@ -10,11 +10,12 @@ import numpy as np
 from numpy.typing import NDArray
 
 from .base import MCDAAlgorithm, register_algorithm
+from ..profiling import stage
 
 # 类型注解导入
 if TYPE_CHECKING:
-    from ..models import DecisionProblem, DecisionResult, Criterion
-    from ..interval import Interval
+    from ..models import DecisionProblem, DecisionResult, RankingItem
+    from ..interval import IntervalMatrix
 
 
 @register_algorithm("promethee2_interval")
@@ -109,8 +110,8 @@ class PROMETHEE2IntervalAlgorithm(MCDAAlgorithm):
             决策结果
         """
         # 运行时导入（避免循环导入）
-        from ..models import DecisionResult, RankingItem, ResultMetadata
-        from ..interval import Interval
+        from ..models import DecisionResult, ResultMetadata
+        from ..interval import IntervalMatrix
 
         # 验证输入
         self.validate(problem)
@@ -137,31 +138,32 @@ class PROMETHEE2IntervalAlgorithm(MCDAAlgorithm):
         n_crit = len(criteria)
 
         # 1. 提取权重
-        weights = np.array([c.weight for c in criteria])
-
-        # 2. 构建得分矩阵（处理区间数）
-        scores_matrix = np.zeros((n_alt, n_crit), dtype=object)
-        for i, alt in enumerate(alternatives):
-            for k, crit in enumerate(criteria):
-                scores_matrix[i, k] = problem.scores[alt][crit.name]
-
-        # 3. 计算偏好矩阵
-        preference_matrix = self._compute_preference_matrix(
-            scores_matrix,
-            criteria,
-            preference_function,
-            threshold
-        )
+        weights = problem.weight_vector
+
+        with stage("matrix"):
+            # 2. 构建区间得分矩阵（精确数为退化区间）
+            scores_matrix = IntervalMatrix.from_problem(problem)
+
+        with stage("pairwise"):
+            # 3. 计算加权偏好指数矩阵
+            preference_index = self._compute_preference_index(
+                scores_matrix,
+                weights,
+                problem.direction_mask,
+                preference_function,
+                threshold
+            )
 
-        # 4. 计算正流量、负流量和净流量
-        positive_flow, negative_flow, net_flow = self._compute_flows(
-            preference_matrix,
-            weights,
-            alternatives
-        )
+        with stage("scoring"):
+            # 4. 计算正流量、负流量和净流量
+            positive_flow, negative_flow, net_flow = self._compute_flows(
+                preference_index,
+                alternatives
+            )
 
-        # 5. 构建排名（按净流量降序）
-        rankings = self._build_rankings(net_flow, alternatives)
+        with stage("ranking"):
+            # 5. 构建排名（按净流量降序）
+            rankings = self._build_rankings(net_flow, alternatives)
 
         # 6. 构建元数据
         metadata = ResultMetadata(
@@ -185,182 +187,122 @@ class PROMETHEE2IntervalAlgorithm(MCDAAlgorithm):
             metadata=metadata
         )
 
-    def _compute_preference_matrix(
+    def _compute_preference_index(
         self,
-        scores_matrix: NDArray,
-        criteria: tuple["Criterion", ...],
+        scores_matrix: "IntervalMatrix",
+        weights: NDArray,
+        direction_mask: NDArray,
         preference_function: str,
         threshold: float
     ) -> NDArray:
-        """计算偏好矩阵
+        """计算加权偏好指数矩阵
 
-        对于每对方案 (a, b)，计算在每个准则上的偏好度。
+        π(a, b) = Σ_k w_k · p_k(a, b)，其中 p_k 基于区间中点之差计算。
+        按准则逐个累加，不构建 (n_alt, n_alt, n_crit) 偏好张量。
 
         Args:
-            scores_matrix: 得分矩阵 (n_alt, n_crit)，元素可能是区间数
-            criteria: 准则元组
+            scores_matrix: 区间得分矩阵 (n_alt, n_crit)
+            weights: 权重向量 (n_crit,)
+            direction_mask: 方向掩码（True 表示成本型）
             preference_function: 偏好函数类型
             threshold: 阈值参数
 
         Returns:
-            偏好矩阵 (n_alt, n_alt, n_crit)
+            偏好指数矩阵 (n_alt, n_alt)，对角线为 0
         """
-        from ..interval import Interval
-
-        n_alt, n_crit = scores_matrix.shape
-
-        # 初始化偏好矩阵
-        preference = np.zeros((n_alt, n_alt, n_crit))
-
-        # 计算每对方案在每个准则上的偏好度
-        for i in range(n_alt):
-            for j in range(n_alt):
-                if i == j:
-                    continue
-
-                for k in range(n_crit):
-                    score_i = scores_matrix[i, k]
-                    score_j = scores_matrix[j, k]
-
-                    # 获取中点用于比较
-                    if isinstance(score_i, Interval):
-                        val_i = score_i.midpoint
-                    else:
-                        val_i = float(score_i)
-
-                    if isinstance(score_j, Interval):
-                        val_j = score_j.midpoint
-                    else:
-                        val_j = float(score_j)
-
-                    # 根据准则方向调整差值
-                    if criteria[k].direction == "higher_better":
-                        diff = val_i - val_j
-                    else:
-                        diff = val_j - val_i  # 成本型反转
-
-                    # 计算偏好度
-                    preference[i, j, k] = self._apply_preference_function(
-                        diff, preference_function, threshold
-                    )
-
-        return preference
+        midpoint = scores_matrix.midpoint
+        n_alt, n_crit = midpoint.shape
+
+        preference_index = np.zeros((n_alt, n_alt))
+        for k in range(n_crit):
+            # diff[i, j] = mid_ik - mid_jk，成本型反转
+            diff = midpoint[:, k, None] - midpoint[None, :, k]
+            if direction_mask[k]:
+                diff = -diff
+            preference = self._apply_preference_function(diff, preference_function, threshold)
+            preference_index += weights[k] * preference
+
+        # 方案与自身不比较
+        np.fill_diagonal(preference_index, 0.0)
+        return preference_index
 
     def _apply_preference_function(
         self,
-        diff: float,
+        diff: NDArray,
         preference_function: str,
         threshold: float
-    ) -> float:
-        """应用偏好函数
+    ) -> NDArray:
+        """应用偏好函数（逐元素）
 
         Args:
-            diff: 差值
+            diff: 差值数组
             preference_function: 偏好函数类型
             threshold: 阈值参数
 
         Returns:
-            偏好度（0-1 之间）
+            偏好度数组（0-1 之间），形状与 diff 相同
         """
-        if preference_function == "usual":
-            # 通常型：P(d) = 1 if d > 0, else 0
-            return 1.0 if diff > 0 else 0.0
+        diff = np.asarray(diff, dtype=np.float64)
 
-        elif preference_function == "u_shape":
+        if preference_function == "u_shape":
             # U 型：P(d) = 0 if d <= q, else 1
             if threshold <= 0:
                 threshold = 1e-6
-            return 0.0 if diff <= threshold else 1.0
+            return np.where(diff <= threshold, 0.0, 1.0)
 
         elif preference_function == "v_shape":
             # V 型：P(d) = 0 if d <= 0, else d/p if 0 < d < p, else 1
             if threshold <= 0:
                 threshold = 1.0
-            if diff <= 0:
-                return 0.0
-            elif diff >= threshold:
-                return 1.0
-            else:
-                return diff / threshold
+            return np.clip(diff / threshold, 0.0, 1.0)
 
         elif preference_function == "level":
             # 水平型：P(d) = 0 if d <= q, else 0.5 if q < d < p, else 1
             q = threshold
             p = threshold * 2 if threshold > 0 else 1.0
-            if diff <= q:
-                return 0.0
-            elif diff >= p:
-                return 1.0
-            else:
-                return 0.5
+            return np.where(diff <= q, 0.0, np.where(diff >= p, 1.0, 0.5))
 
         elif preference_function == "linear":
             # 线性型：P(d) = 0 if d <= q, else (d-q)/(p-q) if q < d < p, else 1
             q = threshold
             p = threshold * 2 if threshold > 0 else 1.0
-            if diff <= q:
-                return 0.0
-            elif diff >= p:
-                return 1.0
-            else:
-                return (diff - q) / (p - q)
+            return np.clip((diff - q) / (p - q), 0.0, 1.0)
 
         else:
-            # 默认使用通常型
-            return 1.0 if diff > 0 else 0.0
+            # 通常型（默认）：P(d) = 1 if d > 0, else 0
+            return np.where(diff > 0, 1.0, 0.0)
 
     def _compute_flows(
         self,
-        preference_matrix: NDArray,
-        weights: NDArray,
+        preference_index: NDArray,
         alternatives: tuple
     ) -> tuple[dict, dict, dict]:
         """计算正流量、负流量和净流量
 
         Args:
-            preference_matrix: 偏好矩阵 (n_alt, n_alt, n_crit)
-            weights: 权重向量 (n_crit,)
+            preference_index: 加权偏好指数矩阵 (n_alt, n_alt)
             alternatives: 备选方案元组
 
         Returns:
             (正流量字典, 负流量字典, 净流量字典)
         """
         n_alt = len(alternatives)
-        n_crit = len(weights)
-
-        # 初始化流量字典
-        positive_flow = {}
-        negative_flow = {}
-        net_flow = {}
-
-        for i, alt in enumerate(alternatives):
-            # 计算正流量：方案 i 优于其他方案的程度
-            phi_plus = 0.0
-            for j in range(n_alt):
-                if i == j:
-                    continue
-                for k in range(n_crit):
-                    phi_plus += weights[k] * preference_matrix[i, j, k]
-
-            # 计算负流量：其他方案优于方案 i 的程度
-            phi_minus = 0.0
-            for j in range(n_alt):
-                if i == j:
-                    continue
-                for k in range(n_crit):
-                    phi_minus += weights[k] * preference_matrix[j, i, k]
-
-            # 归一化（除以方案数 - 1）
-            if n_alt > 1:
-                phi_plus /= (n_alt - 1)
-                phi_minus /= (n_alt - 1)
-
-            # 计算净流量
-            phi = phi_plus - phi_minus
-
-            positive_flow[alt] = float(phi_plus)
-            negative_flow[alt] = float(phi_minus)
-            net_flow[alt] = float(phi)
+
+        # 正流量：方案优于其他方案的程度；负流量：其他方案优于该方案的程度
+        phi_plus = preference_index.sum(axis=1)
+        phi_minus = preference_index.sum(axis=0)
+
+        # 归一化（除以方案数 - 1）
+        if n_alt > 1:
+            phi_plus /= (n_alt - 1)
+            phi_minus /= (n_alt - 1)
+
+        # 计算净流量
+        phi = phi_plus - phi_minus
+
+        positive_flow = dict(zip(alternatives, phi_plus.tolist()))
+        negative_flow = dict(zip(alternatives, phi_minus.tolist()))
+        net_flow = dict(zip(alternatives, phi.tolist()))
 
         return positive_flow, negative_flow, net_flow
 
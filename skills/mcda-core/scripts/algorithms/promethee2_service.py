@@ -211,6 +211,79 @@ class PROMETHEEService:
 
         return functions[func_type]
 
+    # =========================================================================
+    # 偏好函数（数组内核）
+    # =========================================================================
+
+    def _usual_kernel(self, d: np.ndarray) -> np.ndarray:
+        """通常准则（数组版），与 _usual_criterion 逐元素一致"""
+        return (d > 0).astype(np.float64)
+
+    def _u_shape_kernel(self, d: np.ndarray, q: float) -> np.ndarray:
+        """U型准则（数组版），与 _u_shape_criterion 逐元素一致"""
+        return (np.abs(d) > q).astype(np.float64)
+
+    def _v_shape_kernel(self, d: np.ndarray, p: float) -> np.ndarray:
+        """V型准则（数组版），与 _v_shape_criterion 逐元素一致"""
+        with np.errstate(divide="ignore", invalid="ignore"):
+            linear = d / p
+        return np.where(d <= 0, 0.0, np.where(d <= p, linear, 1.0))
+
+    def _level_kernel(self, d: np.ndarray, q: float, p: float) -> np.ndarray:
+        """水平准则（数组版），与 _level_criterion 逐元素一致"""
+        abs_d = np.abs(d)
+        return np.where(abs_d <= q, 0.0, np.where(abs_d <= p, 0.5, 1.0))
+
+    def _v_shape_indifference_kernel(
+        self,
+        d: np.ndarray,
+        q: float,
+        p: float
+    ) -> np.ndarray:
+        """V型无差异准则（数组版），与 _v_shape_indifference 逐元素一致"""
+        abs_d = np.abs(d)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            linear = (abs_d - q) / (p - q)
+        return np.where(abs_d <= q, 0.0, np.where(abs_d <= p, linear, 1.0))
+
+    def _gaussian_kernel(self, d: np.ndarray, s: float) -> np.ndarray:
+        """高斯准则（数组版），与 _gaussian_criterion 逐元素一致"""
+        return 1.0 - np.exp(-(d ** 2) / (2 * s ** 2))
+
+    def _get_preference_kernel(self, func_config: dict):
+        """获取绑定参数后的偏好函数数组内核
+
+        Args:
+            func_config: 偏好函数配置（type 及 q/p/s 参数）
+
+        Returns:
+            接受差异矩阵并返回偏好度矩阵的函数
+
+        Raises:
+            ValueError: 无效的函数类型
+        """
+        func_type = func_config["type"]
+
+        # 复用标量版的类型检查和错误信息
+        self._get_preference_function(func_type)
+
+        if func_type == "usual":
+            return self._usual_kernel
+        if func_type == "u_shape":
+            q = func_config["q"]
+            return lambda d: self._u_shape_kernel(d, q)
+        if func_type == "v_shape":
+            p = func_config["p"]
+            return lambda d: self._v_shape_kernel(d, p)
+        if func_type == "level":
+            q, p = func_config["q"], func_config["p"]
+            return lambda d: self._level_kernel(d, q, p)
+        if func_type == "v_shape_indifference":
+            q, p = func_config["q"], func_config["p"]
+            return lambda d: self._v_shape_indifference_kernel(d, q, p)
+        s = func_config["s"]
+        return lambda d: self._gaussian_kernel(d, s)
+
     # =========================================================================
     # 偏好指数计算
     # =========================================================================
@@ -223,6 +296,9 @@ class PROMETHEEService:
     ) -> np.ndarray:
         """计算偏好指数矩阵
 
+        偏好函数在循环前一次性解析；每个准则对完整的成对差异矩阵
+        d[a, b] = x_aj - x_bj 调用数组内核，并直接加权累加。
+
         Args:
             decision_matrix: 决策矩阵 (n_alternatives x n_criteria)
             weights: 准则权重 (n_criteria,)
@@ -233,43 +309,24 @@ class PROMETHEEService:
         """
         n_alternatives, n_criteria = decision_matrix.shape
 
+        kernels = [
+            self._get_preference_kernel(func_config)
+            for func_config in preference_functions[:n_criteria]
+        ]
+
         # 初始化偏好指数矩阵
         preference_index = np.zeros((n_alternatives, n_alternatives))
 
-        # 计算每对方案的偏好度
-        for a in range(n_alternatives):
-            for b in range(n_alternatives):
-                if a == b:
-                    preference_index[a, b] = 0.0
-                    continue
-
-                # 对每个准则计算偏好度
-                for j in range(n_criteria):
-                    func_config = preference_functions[j]
-                    func_type = func_config["type"]
-                    func = self._get_preference_function(func_type)
-
-                    # 计算差异 d = a_j - b_j
-                    d = decision_matrix[a, j] - decision_matrix[b, j]
-
-                    # 根据函数类型调用
-                    if func_type == "usual":
-                        p_j = func(d)
-                    elif func_type == "u_shape":
-                        p_j = func(d, func_config["q"])
-                    elif func_type == "v_shape":
-                        p_j = func(d, func_config["p"])
-                    elif func_type == "level":
-                        p_j = func(d, func_config["q"], func_config["p"])
-                    elif func_type == "v_shape_indifference":
-                        p_j = func(d, func_config["q"], func_config["p"])
-                    elif func_type == "gaussian":
-                        p_j = func(d, func_config["s"])
-                    else:
-                        p_j = 0.0
-
-                    # 加权累加
-                    preference_index[a, b] += weights[j] * p_j
+        for j, kernel in enumerate(kernels):
+            # 计算差异 d = a_j - b_j
+            column = decision_matrix[:, j]
+            d = column[:, None] - column[None, :]
+
+            # 加权累加
+            preference_index += weights[j] * kernel(d)
+
+        # 方案不与自身比较
+        np.fill_diagonal(preference_index, 0.0)
 
         return preference_index
 
@@ -16,7 +16,8 @@ class TODIMError(Exception):
 
 def todim(
     problem: DecisionProblem,
-    theta: float = 1.0
+    theta: float = 1.0,
+    keep_phi: bool = False
 ) -> DecisionResult:
     """TODIM 算法实现
 
@@ -33,6 +34,9 @@ def todim(
     Args:
         problem: 决策问题
         theta: 衰减系数 (推荐 1.0-2.5)
+        keep_phi: 是否保留完整的相对测度张量 φ (n_alt, n_alt, n_crit)。
+            默认按准则逐个累加优势度，不构建三维张量（内存 O(n²)）；
+            为 True 时额外构建 φ 并在 metrics 中记录 phi_matrix_shape
 
     Returns:
         决策结果
@@ -46,7 +50,6 @@ def todim(
 
     alternatives = problem.alternatives
     criteria = problem.criteria
-    scores = problem.scores
 
     n_alt = len(alternatives)
     n_crit = len(criteria)
@@ -58,57 +61,49 @@ def todim(
         raise TODIMError("至少需要 1 个准则")
 
     # 1. 提取权重
-    weights = np.array([c.weight for c in criteria])
+    weights = problem.weight_vector
     total_weight = weights.sum()
 
     if total_weight <= 0:
         raise TODIMError("准则权重总和必须 > 0")
 
-    # 2. 构建得分矩阵
-    scores_matrix = np.zeros((n_alt, n_crit))
-    for i, alt in enumerate(alternatives):
-        for k, crit in enumerate(criteria):
-            scores_matrix[i, k] = scores[alt][crit.name]
-
-    # 3. 计算相对测度矩阵 φ
-    phi = _compute_phi_matrix(
-        scores_matrix,
-        weights,
-        criteria,
-        theta,
-        total_weight
-    )
+    # 2. 获取得分矩阵（DecisionProblem 缓存的稠密矩阵）
+    scores_matrix = problem.score_matrix
+
+    # 3-4. 按准则累加优势度矩阵 δ = Σ_k φ_k（不构建三维张量）
+    phi = np.zeros((n_alt, n_alt, n_crit)) if keep_phi else None
+    dominance = np.zeros((n_alt, n_alt))
+    for k in range(n_crit):
+        # 跳过零权重准则
+        if weights[k] <= 0:
+            continue
 
-    # 4. 计算优势度矩阵
-    dominance = np.sum(phi, axis=2)  # (n_alt, n_alt)
-
-    # 5. 计算全局优势度
-    global_dominance = np.zeros(n_alt)
-    for i in range(n_alt):
-        global_dominance[i] = dominance[i, :].sum() - dominance[:, i].sum()
-
-    # 6. 排序 (降序)
-    sorted_indices = np.argsort(-global_dominance)
-
-    # 构建排名 (使用密集排名 dense ranking，确保排名连续 1, 2, 3, ...)
-    rankings = []
-    current_rank = 1  # 当前排名
-
-    for i, idx in enumerate(sorted_indices):
-        # 检查是否与前一个元素并列（分数相同）
-        if i > 0:
-            prev_idx = sorted_indices[i - 1]
-            # 使用近似比较处理浮点数精度
-            if not np.isclose(global_dominance[idx], global_dominance[prev_idx]):
-                # 分数不同，排名递增 1
-                current_rank += 1
-            # 如果分数相同，保持 current_rank 不变（并列）
-
-        rankings.append(RankingItem(
-            rank=current_rank,
+        phi_k = _compute_phi_slice(
+            scores_matrix[:, k],
+            weights[k],
+            criteria[k].direction == "lower_better",
+            theta,
+            total_weight
+        )
+        dominance += phi_k
+        if phi is not None:
+            phi[:, :, k] = phi_k
+
+    # 5. 计算全局优势度: ξ(A_i) = Σ_j δ(A_i, A_j) - Σ_j δ(A_j, A_i)
+    global_dominance = dominance.sum(axis=1) - dominance.sum(axis=0)
+
+    # 6. 排序 (降序，得分相同时保持方案原始顺序)
+    sorted_indices = np.argsort(-global_dominance, kind="stable")
+
+    # 构建排名 (连续排名 1, 2, 3, ...，与其他算法及 DecisionResult 约束一致)
+    rankings = [
+        RankingItem(
+            rank=rank,
             alternative=alternatives[idx],
             score=float(global_dominance[idx])
-        ))
+        )
+        for rank, idx in enumerate(sorted_indices, 1)
+    ]
 
     # 构建元数据
     metadata = ResultMetadata(
@@ -117,9 +112,10 @@ def todim(
         metrics={
             "theta": theta,
             "global_dominance": global_dominance.tolist(),
-            "phi_matrix_shape": phi.shape,
         }
     )
+    if phi is not None:
+        metadata.metrics["phi_matrix_shape"] = phi.shape
 
     # 构建原始得分
     raw_scores = {alt: float(global_dominance[i]) for i, alt in enumerate(alternatives)}
@@ -131,6 +127,42 @@ def todim(
     )
 
 
+def _compute_phi_slice(
+    values: NDArray,
+    weight: float,
+    is_cost: bool,
+    theta: float,
+    total_weight: float
+) -> NDArray:
+    """计算单个准则的相对测度矩阵 φ_k
+
+    Args:
+        values: 该准则下所有方案的得分 (n_alt,)
+        weight: 准则权重（> 0）
+        is_cost: 是否为成本型准则（lower_better）
+        theta: 衰减系数
+        total_weight: 权重总和
+
+    Returns:
+        相对测度矩阵 (n_alt, n_alt)，φ_k[i, j] 为 A_i 相对 A_j 的测度
+    """
+    # 根据准则方向调整: 成本型反转比较
+    if is_cost:
+        diff = values[None, :] - values[:, None]
+    else:
+        diff = values[:, None] - values[None, :]
+
+    magnitude = np.abs(diff)
+
+    # 收益: 使用权重增益
+    gain = np.sqrt(weight * magnitude / total_weight)
+    # 损失: 使用衰减系数 (前景理论)
+    loss = -np.sqrt(total_weight / weight * magnitude / (theta * total_weight))
+
+    # 差异为零（含对角线）时测度为 0
+    return np.where(diff > 0, gain, np.where(diff < 0, loss, 0.0))
+
+
 def _compute_phi_matrix(
     scores_matrix: NDArray,
     weights: NDArray,
@@ -155,41 +187,17 @@ def _compute_phi_matrix(
     # 初始化相对测度矩阵
     phi = np.zeros((n_alt, n_alt, n_crit))
 
-    # 计算相对测度
     for k in range(n_crit):
         # 跳过零权重准则
         if weights[k] <= 0:
             continue
 
-        for i in range(n_alt):
-            for j in range(n_alt):
-                if i == j:
-                    continue
-
-                score_i = scores_matrix[i, k]
-                score_j = scores_matrix[j, k]
-
-                # 根据准则方向调整
-                if criteria[k].direction == "lower_better":
-                    # 成本型: 反转比较
-                    diff = score_j - score_i
-                else:
-                    # 效益型: 正常比较
-                    diff = score_i - score_j
-
-                # 计算相对测度
-                if diff > 0:
-                    # 收益: 使用权重增益
-                    phi[i, j, k] = np.sqrt(
-                        weights[k] * abs(diff) / total_weight
-                    )
-                elif diff < 0:
-                    # 损失: 使用衰减系数 (前景理论)
-                    phi[i, j, k] = -np.sqrt(
-                        total_weight / weights[k] * abs(diff) / (theta * total_weight)
-                    )
-                else:
-                    # 差异为零
-                    phi[i, j, k] = 0.0
+        phi[:, :, k] = _compute_phi_slice(
+            scores_matrix[:, k],
+            weights[k],
+            criteria[k].direction == "lower_better",
+            theta,
+            total_weight
+        )
 
     return phi
@@ -6,15 +6,16 @@ TODIM（Tomada de Escolha por Interação e Tradeoff Off）的区间数版本。
 """
 
 from typing import Any, TYPE_CHECKING
-import math
+
+import numpy as np
 
 from .base import MCDAAlgorithm, register_algorithm
+from ..profiling import stage
 from ..models import MAX_SCORE
 
 # 类型注解导入
 if TYPE_CHECKING:
     from ..models import DecisionProblem, DecisionResult
-    from ..interval import Interval
 
 
 @register_algorithm("todim_interval")
@@ -97,8 +98,7 @@ class IntervalTODIMAlgorithm(MCDAAlgorithm):
         """
         # 运行时导入（避免循环导入）
         from ..models import DecisionResult, RankingItem, ResultMetadata
-        from ..interval import Interval
-        from ..ranking import PossibilityDegree
+        from ..interval import IntervalMatrix
 
         # 验证输入
         self.validate(problem)
@@ -111,131 +111,65 @@ class IntervalTODIMAlgorithm(MCDAAlgorithm):
         # 获取备选方案和准则
         alternatives = problem.alternatives
         criteria = problem.criteria
+        direction_mask = problem.direction_mask
+
+        with stage("matrix"):
+            # 区间得分矩阵（精确数为退化区间）
+            values = IntervalMatrix.from_problem(problem)
+
+        with stage("scoring"):
+            # 确定参考点（基于中点）
+            # 收益准则：参考点是最小值；成本准则：参考点是反转后的最小值
+            midpoint = values.midpoint
+            reference_points = np.where(
+                direction_mask,
+                MAX_SCORE - midpoint.max(axis=0),
+                midpoint.min(axis=0)
+            )
 
-        # 确定参考点（每个准则的最小值）
-        reference_points = {}
-        for crit in criteria:
-            values = [
-                problem.scores[alt][crit.name]
-                for alt in alternatives
-            ]
+            # 处理 lower_better（方向反转）: [a, b] → [MAX_SCORE-b, MAX_SCORE-a]
+            values = IntervalMatrix.where(direction_mask, MAX_SCORE - values, values)
+
+            # 计算差距 d_ij
+            gaps = values - reference_points
+
+            # 前景价值函数（单调递增，逐元素作用于区间端点）
+            def prospect(d):
+                magnitude = np.abs(d)
+                return np.where(d >= 0, magnitude ** a, -t * magnitude ** b)
 
-            # 获取中点用于比较
-            def get_midpoint(x):
-                if isinstance(x, Interval):
-                    return x.midpoint
-                return float(x)
-
-            if crit.direction == "higher_better":
-                # 收益准则：参考点是最小值
-                reference_points[crit.name] = min(get_midpoint(v) for v in values)
-            else:
-                # 成本准则：参考点是最大值（需要反转）
-                max_val = max(get_midpoint(v) for v in values)
-                reference_points[crit.name] = 100.0 - max_val
-
-        # 计算最大权重（用于标准化）
-        max_weight = max(crit.weight for crit in criteria)
-
-        # 计算全局优势度
-        global_dominance = {}
-        for alt_i in alternatives:
-            phi_sum = 0.0
-
-            for crit in criteria:
-                # 计算差距 d_ij
-                value_ij = problem.scores[alt_i][crit.name]
-                ref_point = reference_points[crit.name]
-
-                # 处理 lower_better（方向反转）
-                if crit.direction == "lower_better":
-                    # 反转值：[a, b] → [MAX_SCORE-b, MAX_SCORE-a]
-                    if isinstance(value_ij, Interval):
-                        value_ij = Interval(MAX_SCORE - value_ij.upper, MAX_SCORE - value_ij.lower)
-
-                # 计算差距（区间减法或标量减法）
-                if isinstance(value_ij, Interval) and isinstance(ref_point, (int, float)):
-                    d_ij = Interval(value_ij.lower - ref_point, value_ij.upper - ref_point)
-                elif isinstance(value_ij, Interval):
-                    # 两者都是区间（这种情况很少，因为 ref_point 是标量）
-                    pass
-                else:
-                    # value_ij 是标量
-                    d_ij = value_ij - ref_point
-
-                # 计算前景价值
-                if isinstance(d_ij, Interval):
-                    # 区间版本
-                    if d_ij.lower >= 0:
-                        # 收益区间
-                        v_ij = Interval(d_ij.lower ** a, d_ij.upper ** a)
-                    elif d_ij.upper <= 0:
-                        # 损失区间
-                        v_ij = Interval(
-                            -t * ((-d_ij.lower) ** b),
-                            -t * ((-d_ij.upper) ** b)
-                        )
-                    else:
-                        # 混合区间（跨越 0）
-                        # 简化处理：使用中点
-                        mid = d_ij.midpoint
-                        if mid >= 0:
-                            v_ij = mid ** a
-                        else:
-                            v_ij = -t * ((-mid) ** b)
-                else:
-                    # 标量版本
-                    if d_ij >= 0:
-                        v_ij = d_ij ** a
-                    else:
-                        v_ij = -t * ((-d_ij) ** b)
-
-                # 计算优势度
-                normalized_weight = crit.weight / max_weight
-                if isinstance(v_ij, Interval):
-                    phi_ij = v_ij * normalized_weight
-                    # 使用中点求和
-                    phi_sum += phi_ij.midpoint
-                else:
-                    phi_sum += v_ij * normalized_weight
-
-            global_dominance[alt_i] = phi_sum
-
-        # 排序（δ 值越大越好）
-        # 检查是否有区间值
-        has_intervals = any(isinstance(v, Interval) for v in global_dominance.values())
-
-        if has_intervals:
-            # 使用可能度排序
-            ranker = PossibilityDegree()
-
-            # 将全局优势度转换为区间（如果有）
-            intervals = {
-                alt: (val if isinstance(val, Interval) else Interval(val, val))
-                for alt, val in global_dominance.items()
-            }
-
-            # 使用可能度排序（δ 值越大越好）
-            sorted_alts = ranker.rank(intervals)
-        else:
-            # 所有值都是标量，直接排序
+            # 收益区间和损失区间逐端点计算；跨越 0 的混合区间简化为使用中点
+            straddles = (gaps.lower < 0) & (gaps.upper > 0)
+            mid_value = prospect(gaps.midpoint)
+            prospect_values = IntervalMatrix.where(
+                straddles,
+                IntervalMatrix(mid_value, mid_value),
+                IntervalMatrix(prospect(gaps.lower), prospect(gaps.upper))
+            )
+
+            # 计算全局优势度（权重按最大权重标准化，使用中点求和）
+            weights = problem.weight_vector
+            normalized_weights = weights / weights.max()
+            phi = (prospect_values * normalized_weights).midpoint.sum(axis=1)
+            global_dominance = dict(zip(alternatives, phi.tolist()))
+
+        with stage("ranking"):
+            # 排序（δ 值越大越好）
             sorted_alts = sorted(
                 global_dominance.items(),
                 key=lambda x: x[1],
                 reverse=True
             )
 
-        # 构建排名
-        rankings = [
-            RankingItem(
-                rank=i,
-                alternative=alt,
-                score=round(score, 4) if isinstance(score, (int, float)) else round(
-                    score.midpoint if isinstance(score, Interval) else score, 4
+            # 构建排名
+            rankings = [
+                RankingItem(
+                    rank=i,
+                    alternative=alt,
+                    score=round(score, 4)
                 )
-            )
-            for i, (alt, score) in enumerate(sorted_alts, 1)
-        ]
+                for i, (alt, score) in enumerate(sorted_alts, 1)
+            ]
 
         # 构建元数据
         metadata = ResultMetadata(
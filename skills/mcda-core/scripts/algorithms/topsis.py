@@ -5,11 +5,9 @@ MCDA Core - TOPSIS 算法实现
 """
 
 from typing import Any, TYPE_CHECKING
-import math
-
-from .base import MCDAAlgorithm, register_algorithm
-from ..models import MAX_SCORE
 
+from .base import LinearWeightModel, MCDAAlgorithm, register_algorithm
+from ..profiling import stage
 # 类型注解导入
 if TYPE_CHECKING:
     from ..models import DecisionProblem, DecisionResult
@@ -49,6 +47,42 @@ class TOPSISAlgorithm(MCDAAlgorithm):
         """算法描述"""
         return "逼近理想解排序法（TOPSIS）"
 
+    def linear_weight_model(self, problem: "DecisionProblem") -> LinearWeightModel:
+        """TOPSIS 距离平方对权重平方线性
+
+        权重非负时 v_j⁺ = w_j · max_i r_ij，因此
+        (D_i⁺)² = Σ w_j² (r_ij - max_i r_ij)²，D_i⁻ 同理。
+        """
+        import numpy as np
+
+        R = self._normalized_matrix(problem)
+        plus_terms = (R - R.max(axis=0)) ** 2
+        minus_terms = (R - R.min(axis=0)) ** 2
+
+        def closeness(sq_plus: np.ndarray, sq_minus: np.ndarray) -> np.ndarray:
+            d_plus = np.sqrt(sq_plus)
+            d_minus = np.sqrt(sq_minus)
+            denominator = d_plus + d_minus
+            with np.errstate(divide="ignore", invalid="ignore"):
+                C = d_minus / denominator
+            return np.where(denominator == 0, 0.0, C)
+
+        return LinearWeightModel(
+            terms=(plus_terms, minus_terms),
+            finalize=closeness,
+            power=2,
+        )
+
+    def _normalized_matrix(self, problem: "DecisionProblem") -> "np.ndarray":
+        """Vector 标准化: r_ij = x_ij / sqrt(Σ x_ij²)（lower_better 已反转）"""
+        import numpy as np
+
+        X = self._oriented_matrix(problem)
+        norms = np.sqrt(np.sum(X ** 2, axis=0))
+        # 避免除以零
+        norms[norms == 0] = 1.0
+        return X / norms
+
     def calculate(
         self,
         problem: "DecisionProblem",
@@ -69,72 +103,58 @@ class TOPSISAlgorithm(MCDAAlgorithm):
         # 验证输入
         self.validate(problem)
 
+        import numpy as np
+
         # 获取备选方案和准则列表
         alternatives = problem.alternatives
         criteria = problem.criteria
-        n_alts = len(alternatives)
-        n_crits = len(criteria)
-
-        # 构建决策矩阵（行为备选方案，列为准则）
-        import numpy as np
 
-        X = np.zeros((n_alts, n_crits))
-        for i, alt in enumerate(alternatives):
-            for j, crit in enumerate(criteria):
-                value = problem.scores[alt][crit.name]
-
-                # 处理 lower_better（方向反转）
-                if crit.direction == "lower_better":
-                    value = MAX_SCORE - value
-
-                X[i, j] = value
-
-        # 1. Vector 标准化
-        norms = np.sqrt(np.sum(X ** 2, axis=0))
-        # 避免除以零
-        norms[norms == 0] = 1.0
-        R = X / norms
-
-        # 2. 加权标准化
-        weights = np.array([crit.weight for crit in criteria])
-        V = R * weights
-
-        # 3. 确定理想解和负理想解
-        v_plus = np.max(V, axis=0)  # 正理想解
-        v_minus = np.min(V, axis=0)  # 负理想解
-
-        # 4. 计算距离
-        D_plus = np.sqrt(np.sum((V - v_plus) ** 2, axis=1))
-        D_minus = np.sqrt(np.sum((V - v_minus) ** 2, axis=1))
-
-        # 5. 计算相对接近度
-        C = D_minus / (D_plus + D_minus)
-
-        # 处理分母为零的情况
-        denominator = D_plus + D_minus
-        C[denominator == 0] = 0.0
-
-        # 构建结果字典
-        closeness = {alt: float(C[i]) for i, alt in enumerate(alternatives)}
-        d_plus = {alt: float(D_plus[i]) for i, alt in enumerate(alternatives)}
-        d_minus = {alt: float(D_minus[i]) for i, alt in enumerate(alternatives)}
-
-        # 排序（接近度从高到低）
-        sorted_alts = sorted(
-            closeness.items(),
-            key=lambda x: x[1],
-            reverse=True
-        )
-
-        # 构建排名
-        rankings = [
-            RankingItem(
-                rank=i,
-                alternative=alt,
-                score=round(score, 4)
+        with stage("normalization"):
+            # 1. Vector 标准化（行为备选方案，列为准则，lower_better 已反转）
+            R = self._normalized_matrix(problem)
+
+        with stage("scoring"):
+            # 2. 加权标准化
+            weights = problem.weight_vector
+            V = R * weights
+
+            # 3. 确定理想解和负理想解
+            v_plus = np.max(V, axis=0)  # 正理想解
+            v_minus = np.min(V, axis=0)  # 负理想解
+
+            # 4. 计算距离
+            D_plus = np.sqrt(np.sum((V - v_plus) ** 2, axis=1))
+            D_minus = np.sqrt(np.sum((V - v_minus) ** 2, axis=1))
+
+            # 5. 计算相对接近度
+            C = D_minus / (D_plus + D_minus)
+
+            # 处理分母为零的情况
+            denominator = D_plus + D_minus
+            C[denominator == 0] = 0.0
+
+            # 构建结果字典
+            closeness = {alt: float(C[i]) for i, alt in enumerate(alternatives)}
+            d_plus = {alt: float(D_plus[i]) for i, alt in enumerate(alternatives)}
+            d_minus = {alt: float(D_minus[i]) for i, alt in enumerate(alternatives)}
+
+        with stage("ranking"):
+            # 排序（接近度从高到低）
+            sorted_alts = sorted(
+                closeness.items(),
+                key=lambda x: x[1],
+                reverse=True
             )
-            for i, (alt, score) in enumerate(sorted_alts, 1)
-        ]
+
+            # 构建排名
+            rankings = [
+                RankingItem(
+                    rank=i,
+                    alternative=alt,
+                    score=round(score, 4)
+                )
+                for i, (alt, score) in enumerate(sorted_alts, 1)
+            ]
 
         # 构建元数据（包含 metrics）
         metadata = ResultMetadata(
@@ -5,11 +5,11 @@ TOPSIS 区间版本算法实现
 """
 
 from typing import Any, TYPE_CHECKING
-import math
 
 import numpy as np
 
 from .base import MCDAAlgorithm, register_algorithm
+from ..profiling import stage
 
 # 模块级常量
 NUMERICAL_EPSILON = 1e-10
@@ -17,8 +17,8 @@ NUMERICAL_EPSILON = 1e-10
 
 # 类型注解导入
 if TYPE_CHECKING:
-    from ..models import DecisionProblem, DecisionResult, Criterion
-    from ..interval import Interval
+    from ..models import DecisionProblem, DecisionResult
+    from ..interval import IntervalMatrix
 
 
 @register_algorithm("topsis_interval")
@@ -86,61 +86,58 @@ class IntervalTOPSISAlgorithm(MCDAAlgorithm):
             决策结果
         """
         # 运行时导入（避免循环导入）
-        from ..models import DecisionResult, RankingItem, ResultMetadata
-        from ..interval import Interval
+        from ..models import DecisionResult, ResultMetadata
+        from ..interval import IntervalMatrix
 
         # 验证输入
         self.validate(problem)
 
         # 获取备选方案和准则
         alternatives = problem.alternatives
-        criteria = problem.criteria
-
         n_alt = len(alternatives)
-        n_crit = len(criteria)
+        n_crit = len(problem.criteria)
 
-        # 1. 提取权重
-        weights = np.array([c.weight for c in criteria])
+        with stage("matrix"):
+            # 1-2. 构建区间得分矩阵（精确数为退化区间）
+            scores_matrix = IntervalMatrix.from_problem(problem)
 
-        # 2. 构建得分矩阵（处理区间数）
-        scores_matrix = np.zeros((n_alt, n_crit), dtype=object)
-        for i, alt in enumerate(alternatives):
-            for k, crit in enumerate(criteria):
-                scores_matrix[i, k] = problem.scores[alt][crit.name]
+        with stage("normalization"):
+            # 3. Vector 标准化
+            normalized = self._vector_normalize(scores_matrix)
 
-        # 3. Vector 标准化
-        normalized = self._vector_normalize(scores_matrix, criteria)
+        with stage("scoring"):
+            # 4. 加权标准化
+            weighted = self._apply_weights(normalized, problem.weight_vector)
 
-        # 4. 加权标准化
-        weighted = self._apply_weights(normalized, weights)
+            # 5. 确定理想解和负理想解
+            ideal, negative_ideal = self._find_ideal_solutions(weighted, problem.direction_mask)
 
-        # 5. 确定理想解和负理想解
-        ideal, negative_ideal = self._find_ideal_solutions(weighted, criteria)
+            # 6. 计算距离
+            distance_to_ideal, distance_to_negative_ideal = self._calculate_distances(
+                weighted, ideal, negative_ideal
+            )
 
-        # 6. 计算距离
-        distance_to_ideal, distance_to_negative_ideal = self._calculate_distances(
-            weighted, ideal, negative_ideal, alternatives
-        )
+            # 7. 计算相对接近度
+            closeness = self._calculate_closeness(distance_to_ideal, distance_to_negative_ideal)
+            closeness = dict(zip(alternatives, closeness.tolist()))
 
-        # 7. 计算相对接近度
-        closeness = self._calculate_closeness(
-            distance_to_ideal, distance_to_negative_ideal, alternatives
-        )
-
-        # 8. 构建排名（按相对接近度降序）
-        rankings = self._build_rankings(closeness, alternatives)
+        with stage("ranking"):
+            # 8. 构建排名（按相对接近度降序）
+            rankings = self._build_rankings(closeness, alternatives)
 
         # 9. 构建元数据
         metadata = ResultMetadata(
             algorithm_name="topsis_interval",
             problem_size=(n_alt, n_crit),
             metrics={
-                "normalized": normalized.tolist(),
-                "weighted": weighted.tolist(),
-                "ideal": ideal,
-                "negative_ideal": negative_ideal,
-                "distance_to_ideal": distance_to_ideal,
-                "distance_to_negative_ideal": distance_to_negative_ideal,
+                "normalized": normalized.to_intervals(),
+                "weighted": weighted.to_intervals(),
+                "ideal": ideal.tolist(),
+                "negative_ideal": negative_ideal.tolist(),
+                "distance_to_ideal": dict(zip(alternatives, distance_to_ideal.tolist())),
+                "distance_to_negative_ideal": dict(
+                    zip(alternatives, distance_to_negative_ideal.tolist())
+                ),
             }
         )
 
@@ -153,94 +150,43 @@ class IntervalTOPSISAlgorithm(MCDAAlgorithm):
             metadata=metadata
         )
 
-    def _vector_normalize(
-        self,
-        scores_matrix,
-        criteria: tuple
-    ):
+    def _vector_normalize(self, scores_matrix: "IntervalMatrix") -> "IntervalMatrix":
         """Vector 标准化
 
-        r_ij = x_ij / sqrt(Σ x_ik²)
+        r_ij = x_ij / sqrt(Σ x_ik²)，范数使用区间中点计算
 
         Args:
-            scores_matrix: 得分矩阵 (n_alt, n_crit)
-            criteria: 准则元组
+            scores_matrix: 区间得分矩阵 (n_alt, n_crit)
 
         Returns:
-            标准化后的矩阵
+            标准化后的区间矩阵
         """
-        import numpy as np
-        from ..interval import Interval
-
-        n_alt, n_crit = scores_matrix.shape
-
-        # 初始化标准化矩阵
-        normalized = np.zeros((n_alt, n_crit), dtype=object)
-
-        # 对每个准则进行标准化
-        for k in range(n_crit):
-            # 计算该准则的平方和
-            sum_squares = 0.0
-            for i in range(n_alt):
-                val = scores_matrix[i, k]
-                if isinstance(val, Interval):
-                    # 使用区间中点计算范数
-                    sum_squares += val.midpoint ** 2
-                else:
-                    sum_squares += float(val) ** 2
-
-            norm = math.sqrt(sum_squares)
-
-            if norm < NUMERICAL_EPSILON:
-                norm = 1.0  # 避免除零
-
-            # 标准化
-            for i in range(n_alt):
-                val = scores_matrix[i, k]
-                if isinstance(val, Interval):
-                    # 区间标准化
-                    normalized[i, k] = Interval(
-                        val.lower / norm,
-                        val.upper / norm
-                    )
-                else:
-                    # 标量标准化
-                    normalized[i, k] = float(val) / norm
-
-        return normalized
-
-    def _apply_weights(self, normalized, weights):
+        return scores_matrix.normalize("vector", epsilon=NUMERICAL_EPSILON)
+
+    def _apply_weights(
+        self,
+        normalized: "IntervalMatrix",
+        weights: np.ndarray
+    ) -> "IntervalMatrix":
         """应用权重
 
         v_ij = w_j · r_ij
 
         Args:
-            normalized: 标准化后的矩阵
+            normalized: 标准化后的区间矩阵
             weights: 权重向量 (n_crit,)
 
         Returns:
-            加权标准化后的矩阵
+            加权标准化后的区间矩阵
         """
-        import numpy as np
-        from ..interval import Interval
-
-        n_alt, n_crit = normalized.shape
-
-        # 初始化加权矩阵
-        weighted = np.zeros((n_alt, n_crit), dtype=object)
+        return normalized * weights
 
-        for i in range(n_alt):
-            for k in range(n_crit):
-                val = normalized[i, k]
-                if isinstance(val, Interval):
-                    weighted[i, k] = val * weights[k]
-                else:
-                    weighted[i, k] = val * weights[k]
-
-        return weighted
-
-    def _find_ideal_solutions(self, weighted, criteria):
-        """确定理想解和负理想解
+    def _find_ideal_solutions(
+        self,
+        weighted: "IntervalMatrix",
+        direction_mask: np.ndarray
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """确定理想解和负理想解（基于区间中点）
 
         对于效益型准则：
         - 理想解：最大值
@@ -251,120 +197,66 @@ class IntervalTOPSISAlgorithm(MCDAAlgorithm):
         - 负理想解：最大值
 
         Args:
-            weighted: 加权标准化后的矩阵
-            criteria: 准则元组
+            weighted: 加权标准化后的区间矩阵
+            direction_mask: 方向掩码（True 表示成本型）
 
         Returns:
-            (理想解列表, 负理想解列表)
+            (理想解数组, 负理想解数组)，形状均为 (n_crit,)
         """
-        import numpy as np
-        from ..interval import Interval
-
-        n_alt, n_crit = weighted.shape
-
-        ideal = []
-        negative_ideal = []
-
-        for k in range(n_crit):
-            # 提取该准则的所有值
-            values = []
-            for i in range(n_alt):
-                val = weighted[i, k]
-                if isinstance(val, Interval):
-                    values.append(val.midpoint)
-                else:
-                    values.append(float(val))
-
-            # 根据准则方向确定理想解和负理想解
-            if criteria[k].direction == "higher_better":
-                # 效益型：最大值为理想解
-                max_val = max(values)
-                min_val = min(values)
-            else:
-                # 成本型：最小值为理想解
-                max_val = min(values)
-                min_val = max(values)
-
-            ideal.append(max_val)
-            negative_ideal.append(min_val)
+        midpoint = weighted.midpoint
+        col_max = midpoint.max(axis=0)
+        col_min = midpoint.min(axis=0)
 
+        ideal = np.where(direction_mask, col_min, col_max)
+        negative_ideal = np.where(direction_mask, col_max, col_min)
         return ideal, negative_ideal
 
-    def _calculate_distances(self, weighted, ideal, negative_ideal, alternatives):
+    def _calculate_distances(
+        self,
+        weighted: "IntervalMatrix",
+        ideal: np.ndarray,
+        negative_ideal: np.ndarray
+    ) -> tuple[np.ndarray, np.ndarray]:
         """计算到理想解和负理想解的距离
 
         D_i⁺ = sqrt(Σ (v_ij - v_j⁺)²)
         D_i⁻ = sqrt(Σ (v_ij - v_j⁻)²)
 
         Args:
-            weighted: 加权标准化后的矩阵
-            ideal: 理想解列表
-            negative_ideal: 负理想解列表
-            alternatives: 备选方案元组
+            weighted: 加权标准化后的区间矩阵
+            ideal: 理想解数组
+            negative_ideal: 负理想解数组
 
         Returns:
-            (到理想解的距离字典, 到负理想解的距离字典)
+            (到理想解的距离数组, 到负理想解的距离数组)，形状均为 (n_alt,)
         """
-        import numpy as np
-        from ..interval import Interval
-
-        n_alt, n_crit = weighted.shape
-
-        distance_to_ideal = {}
-        distance_to_negative_ideal = {}
-
-        for i, alt in enumerate(alternatives):
-            # 计算到理想解的距离
-            sum_squared_ideal = 0.0
-            sum_squared_negative = 0.0
-
-            for k in range(n_crit):
-                val = weighted[i, k]
-                if isinstance(val, Interval):
-                    midpoint = val.midpoint
-                else:
-                    midpoint = float(val)
-
-                # 到理想解的距离平方
-                diff_ideal = midpoint - ideal[k]
-                sum_squared_ideal += diff_ideal ** 2
-
-                # 到负理想解的距离平方
-                diff_negative = midpoint - negative_ideal[k]
-                sum_squared_negative += diff_negative ** 2
-
-            # 计算欧氏距离
-            distance_to_ideal[alt] = math.sqrt(sum_squared_ideal)
-            distance_to_negative_ideal[alt] = math.sqrt(sum_squared_negative)
-
+        midpoint = weighted.midpoint
+        distance_to_ideal = np.sqrt(np.sum((midpoint - ideal) ** 2, axis=1))
+        distance_to_negative_ideal = np.sqrt(np.sum((midpoint - negative_ideal) ** 2, axis=1))
         return distance_to_ideal, distance_to_negative_ideal
 
-    def _calculate_closeness(self, distance_to_ideal, distance_to_negative_ideal, alternatives):
+    def _calculate_closeness(
+        self,
+        distance_to_ideal: np.ndarray,
+        distance_to_negative_ideal: np.ndarray
+    ) -> np.ndarray:
         """计算相对接近度
 
         C_i = D_i⁻ / (D_i⁺ + D_i⁻)
 
         Args:
-            distance_to_ideal: 到理想解的距离字典
-            distance_to_negative_ideal: 到负理想解的距离字典
-            alternatives: 备选方案元组
+            distance_to_ideal: 到理想解的距离数组
+            distance_to_negative_ideal: 到负理想解的距离数组
 
         Returns:
-            相对接近度字典
+            相对接近度数组 (n_alt,)
         """
-        closeness = {}
-
-        for alt in alternatives:
-            d_plus = distance_to_ideal[alt]
-            d_minus = distance_to_negative_ideal[alt]
-
-            # 避免除零
-            total = d_plus + d_minus
-            if total < NUMERICAL_EPSILON:
-                closeness[alt] = 0.0
-            else:
-                closeness[alt] = d_minus / total
+        total = distance_to_ideal + distance_to_negative_ideal
 
+        # 避免除零
+        degenerate = total < NUMERICAL_EPSILON
+        closeness = distance_to_negative_ideal / np.where(degenerate, 1.0, total)
+        closeness[degenerate] = 0.0
         return closeness
 
     def _build_rankings(self, closeness, alternatives):
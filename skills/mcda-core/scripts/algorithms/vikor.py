@@ -5,13 +5,12 @@ MCDA Core - VIKOR 算法实现
 """
 
 from typing import Any, TYPE_CHECKING
-import math
 
 from .base import MCDAAlgorithm, register_algorithm
-from ..models import MAX_SCORE
-
+from ..profiling import stage
 # 类型注解导入
 if TYPE_CHECKING:
+    import numpy as np
     from ..models import DecisionProblem, DecisionResult
 
 
@@ -69,6 +68,82 @@ class VIKORAlgorithm(MCDAAlgorithm):
         """算法描述"""
         return "折衷排序法（VIKOR）"
 
+    def _utility_matrix(self, problem: "DecisionProblem") -> "np.ndarray":
+        """标准化到 [0, 1] 的效用矩阵 f_ij（所有值相同的列为 1）"""
+        import numpy as np
+
+        X = self._oriented_matrix(problem)
+        col_min = X.min(axis=0)
+        col_range = X.max(axis=0) - col_min
+
+        constant = col_range == 0
+        F = (X - col_min) / np.where(constant, 1.0, col_range)
+        F[:, constant] = 1.0
+        return F
+
+    def _compromise(
+        self,
+        S: "np.ndarray",
+        R: "np.ndarray",
+        v: float
+    ) -> "np.ndarray":
+        """沿最后一个轴计算折衷值 Q（支持批量）
+
+        S 或 R 的极差为零时对应项取 0（处理分母为零的情况）。
+        """
+        import numpy as np
+
+        Q = np.zeros(S.shape)
+        for values, coef in ((S, v), (R, 1 - v)):
+            v_min = values.min(axis=-1, keepdims=True)
+            span = values.max(axis=-1, keepdims=True) - v_min
+            with np.errstate(divide="ignore", invalid="ignore"):
+                term = coef * (values - v_min) / span
+            Q += np.where(span != 0, term, 0.0)
+        return Q
+
+    def calculate_batch(
+        self,
+        problem: "DecisionProblem",
+        weights: "np.ndarray",
+        v: float | None = None,
+        **kwargs: Any
+    ) -> tuple["np.ndarray", "np.ndarray"]:
+        """批量评估多组权重
+
+        效用矩阵只计算一次；S = W · Fᵀ 为一次矩阵乘法，
+        R 按准则逐列取最大值，不构建 (k, n_alt, n_crit) 张量。
+
+        Args:
+            problem: 决策问题
+            weights: 权重矩阵 (k, n_crit)，每行按和归一化（见 MCDAAlgorithm.calculate_batch）
+            v: 决策策略系数（可选，覆盖构造函数的值）
+            **kwargs: 未使用的其他参数
+
+        Returns:
+            (Q, ranks) 元组，形状均为 (k, n_alt)；Q 越小排名越靠前
+        """
+        import numpy as np
+        from .base import rank_scores
+
+        self.validate(problem)
+        weights = self._check_batch_weights(problem, weights)
+
+        if v is None:
+            v = self.v
+        elif not 0 <= v <= 1:
+            raise ValueError(f"决策策略系数 v 必须在 [0, 1] 范围内，当前: {v}")
+
+        F = self._utility_matrix(problem)
+        S = weights @ F.T
+
+        R = np.zeros_like(S)
+        for j in range(F.shape[1]):
+            np.maximum(R, weights[:, j, None] * F[None, :, j], out=R)
+
+        Q = self._compromise(S, R, v)
+        return Q, rank_scores(Q, descending=False)
+
     def calculate(
         self,
         problem: "DecisionProblem",
@@ -101,83 +176,37 @@ class VIKORAlgorithm(MCDAAlgorithm):
         alternatives = problem.alternatives
         criteria = problem.criteria
 
-        # 1. 标准化到 [0, 1]
-        normalized = {}
-        for crit in criteria:
-            # 获取该准则的所有评分
-            values = [
-                problem.scores[alt][crit.name]
-                for alt in alternatives
+        with stage("normalization"):
+            # 1. 标准化到 [0, 1]（lower_better 已按 MAX_SCORE - x 反转）
+            F = self._utility_matrix(problem)
+
+        with stage("scoring"):
+            # 2. 计算群体效用 S_i 和个别遗憾 R_i
+            weighted_F = F * problem.weight_vector
+            S_arr = weighted_F.sum(axis=1)
+            R_arr = weighted_F.max(axis=1)
+
+            # 3. 计算 Q_i
+            Q_arr = self._compromise(S_arr, R_arr, v)
+
+            S = {alt: float(S_arr[i]) for i, alt in enumerate(alternatives)}
+            R = {alt: float(R_arr[i]) for i, alt in enumerate(alternatives)}
+            Q = {alt: float(Q_arr[i]) for i, alt in enumerate(alternatives)}
+
+        with stage("ranking"):
+            # 排序（Q 值越小越好）
+            sorted_alts = sorted(Q.items(), key=lambda x: x[1])
+
+            # 构建排名
+            rankings = [
+                RankingItem(
+                    rank=i,
+                    alternative=alt,
+                    score=round(score, 4)
+                )
+                for i, (alt, score) in enumerate(sorted_alts, 1)
             ]
 
-            # 处理 lower_better（方向反转）
-            if crit.direction == "lower_better":
-                values = [MAX_SCORE - v for v in values]
-
-            min_val = min(values)
-            max_val = max(values)
-
-            # 标准化到 [0, 1]
-            for i, alt in enumerate(alternatives):
-                if alt not in normalized:
-                    normalized[alt] = {}
-
-                if max_val == min_val:
-                    # 所有值相同，标准化为 1
-                    normalized[alt][crit.name] = 1.0
-                else:
-                    # 线性标准化
-                    normalized[alt][crit.name] = (values[i] - min_val) / (max_val - min_val)
-
-        # 2. 计算群体效用 S_i 和个别遗憾 R_i
-        S = {}  # 群体效用
-        R = {}  # 个别遗憾
-        for alt in alternatives:
-            s_i = 0.0
-            r_i = 0.0
-            for crit in criteria:
-                f = normalized[alt][crit.name]
-                weighted_f = crit.weight * f
-                s_i += weighted_f
-                r_i = max(r_i, weighted_f)
-
-            S[alt] = s_i
-            R[alt] = r_i
-
-        # 3. 计算 Q_i
-        S_min = min(S.values())
-        S_max = max(S.values())
-        R_min = min(R.values())
-        R_max = max(R.values())
-
-        Q = {}
-        for alt in alternatives:
-            # 处理分母为零的情况
-            if S_max == S_min and R_max == R_min:
-                q = 0.0
-            elif S_max == S_min:
-                q = (1 - v) * (R[alt] - R_min) / (R_max - R_min)
-            elif R_max == R_min:
-                q = v * (S[alt] - S_min) / (S_max - S_min)
-            else:
-                q = v * (S[alt] - S_min) / (S_max - S_min) + \
-                    (1 - v) * (R[alt] - R_min) / (R_max - R_min)
-
-            Q[alt] = q
-
-        # 排序（Q 值越小越好）
-        sorted_alts = sorted(Q.items(), key=lambda x: x[1])
-
-        # 构建排名
-        rankings = [
-            RankingItem(
-                rank=i,
-                alternative=alt,
-                score=round(score, 4)
-            )
-            for i, (alt, score) in enumerate(sorted_alts, 1)
-        ]
-
         # 构建元数据（包含 metrics）
         metadata = ResultMetadata(
             algorithm_name=self.name,
@@ -6,9 +6,8 @@ MCDA Core - WPM 算法实现
 
 from typing import Any, TYPE_CHECKING
 
-from .base import MCDAAlgorithm, register_algorithm
-from ..models import MAX_SCORE
-
+from .base import LinearWeightModel, MCDAAlgorithm, register_algorithm
+from ..profiling import stage
 # 类型注解导入
 if TYPE_CHECKING:
     from ..models import DecisionProblem, DecisionResult
@@ -44,6 +43,13 @@ class WPMAlgorithm(MCDAAlgorithm):
         """算法描述"""
         return "加权几何平均模型（Weighted Product Model）"
 
+    def linear_weight_model(self, problem: "DecisionProblem") -> LinearWeightModel:
+        """WPM 在对数空间中线性: log P = log(X) · w"""
+        import numpy as np
+
+        log_matrix = np.log(np.maximum(self._oriented_matrix(problem), self.EPSILON))
+        return LinearWeightModel(terms=(log_matrix,), finalize=np.exp)
+
     def calculate(
         self,
         problem: "DecisionProblem",
@@ -64,42 +70,39 @@ class WPMAlgorithm(MCDAAlgorithm):
         # 验证输入
         self.validate(problem)
 
-        # 计算每个方案的加权乘积
-        products = {}
-        for alt in problem.alternatives:
-            product = 1.0
-            for crit in problem.criteria:
-                value = problem.scores[alt][crit.name]
-
-                # 处理 lower_better（方向反转）
-                if crit.direction == "lower_better":
-                    # 假设评分在 0-100 范围内
-                    value = MAX_SCORE - value
+        import numpy as np
 
-                # 避免零值（加小常数）
-                value = max(value, self.EPSILON)
+        # 计算每个方案的加权乘积（lower_better 已按 MAX_SCORE - x 反转）
+        with stage("matrix"):
+            X = self._oriented_matrix(problem)
 
-                # 加权乘积：value^weight
-                product *= value ** crit.weight
+            # 避免零值（加小常数）
+            X = np.maximum(X, self.EPSILON)
 
-            products[alt] = product
+        with stage("scoring"):
+            # 加权乘积：Π value^weight
+            prods = np.prod(X ** problem.weight_vector, axis=1)
+            products = {
+                alt: float(prods[i]) for i, alt in enumerate(problem.alternatives)
+            }
 
-        # 排序（得分从高到低）
-        sorted_alts = sorted(
-            products.items(),
-            key=lambda x: x[1],
-            reverse=True
-        )
-
-        # 构建排名
-        rankings = [
-            RankingItem(
-                rank=i,
-                alternative=alt,
-                score=round(score, 4)
+        with stage("ranking"):
+            # 排序（得分从高到低）
+            sorted_alts = sorted(
+                products.items(),
+                key=lambda x: x[1],
+                reverse=True
             )
-            for i, (alt, score) in enumerate(sorted_alts, 1)
-        ]
+
+            # 构建排名
+            rankings = [
+                RankingItem(
+                    rank=i,
+                    alternative=alt,
+                    score=round(score, 4)
+                )
+                for i, (alt, score) in enumerate(sorted_alts, 1)
+            ]
 
         # 构建元数据（包含 metrics）
         metadata = ResultMetadata(
@@ -6,9 +6,8 @@ MCDA Core - WSM 算法实现
 
 from typing import Any, TYPE_CHECKING
 
-from .base import MCDAAlgorithm, register_algorithm
-from ..models import MAX_SCORE
-
+from .base import LinearWeightModel, MCDAAlgorithm, register_algorithm
+from ..profiling import stage
 # 类型注解导入
 if TYPE_CHECKING:
     from ..models import DecisionProblem, DecisionResult
@@ -41,6 +40,13 @@ class WSMAlgorithm(MCDAAlgorithm):
         """算法描述"""
         return "加权算术平均模型（Weighted Sum Model）"
 
+    def linear_weight_model(self, problem: "DecisionProblem") -> LinearWeightModel:
+        """WSM 得分 S = X · w，对权重线性"""
+        return LinearWeightModel(
+            terms=(self._oriented_matrix(problem),),
+            finalize=lambda sums: sums,
+        )
+
     def calculate(
         self,
         problem: "DecisionProblem",
@@ -61,38 +67,32 @@ class WSMAlgorithm(MCDAAlgorithm):
         # 验证输入
         self.validate(problem)
 
-        # 计算每个方案的加权得分
-        weighted_sums = {}
-        for alt in problem.alternatives:
-            weighted_sum = 0.0
-            for crit in problem.criteria:
-                value = problem.scores[alt][crit.name]
-
-                # 处理 lower_better（方向反转）
-                if crit.direction == "lower_better":
-                    # 假设评分在 0-100 范围内
-                    value = MAX_SCORE - value
-
-                weighted_sum += crit.weight * value
-
-            weighted_sums[alt] = weighted_sum
-
-        # 排序（得分从高到低）
-        sorted_alts = sorted(
-            weighted_sums.items(),
-            key=lambda x: x[1],
-            reverse=True
-        )
-
-        # 构建排名
-        rankings = [
-            RankingItem(
-                rank=i,
-                alternative=alt,
-                score=round(score, 4)
+        # 计算每个方案的加权得分（lower_better 已按 MAX_SCORE - x 反转）
+        with stage("matrix"):
+            X = self._oriented_matrix(problem)
+        with stage("scoring"):
+            sums = X @ problem.weight_vector
+            weighted_sums = {
+                alt: float(sums[i]) for i, alt in enumerate(problem.alternatives)
+            }
+
+        with stage("ranking"):
+            # 排序（得分从高到低）
+            sorted_alts = sorted(
+                weighted_sums.items(),
+                key=lambda x: x[1],
+                reverse=True
             )
-            for i, (alt, score) in enumerate(sorted_alts, 1)
-        ]
+
+            # 构建排名
+            rankings = [
+                RankingItem(
+                    rank=i,
+                    alternative=alt,
+                    score=round(score, 4)
+                )
+                for i, (alt, score) in enumerate(sorted_alts, 1)
+            ]
 
         # 构建元数据（包含 metrics）
         metadata = ResultMetadata(
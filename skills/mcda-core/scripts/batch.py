@@ -0,0 +1,393 @@
+"""
+MCDA Core - 批量分析
+
+在一次进程调用中分析大量配置文件，避免每个配置都重复支付解释器启动、
+模块导入和 NumPy 初始化的开销。
+
+- 配置来源可以是目录、glob 模式、清单文件（每行一个路径）或单个配置文件
+- 配置按块分发到进程池（或线程池），在途任务数有上限，内存占用与配置总数无关
+- 每个配置产生一条结果记录（成功或失败），按完成顺序流式输出为 JSON Lines；
+  单个配置失败不会中断整个批次
+- 工作进程崩溃（OOM、段错误等）导致进程池损坏时重建进程池，受影响的配置
+  逐个隔离重试，确实导致崩溃的配置记为错误记录
+"""
+
+import glob
+import json
+import time
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    BrokenExecutor,
+    Executor,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    wait,
+)
+from dataclasses import dataclass
+from functools import partial
+from itertools import islice
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Iterable, Iterator, Literal, TextIO
+
+from .exceptions import MCDAError
+
+if TYPE_CHECKING:
+    from .core import MCDAOrchestrator
+    from .models import DecisionResult
+
+# 目录来源中识别的配置文件扩展名
+CONFIG_SUFFIXES = (".yaml", ".yml", ".json")
+
+# 清单文件扩展名（每行一个配置路径，# 开头为注释）
+MANIFEST_SUFFIXES = (".txt", ".lst")
+
+# 每个任务块包含的配置数（进程池时减少进程间通信次数）
+DEFAULT_CHUNK_SIZE = 8
+
+BatchSource = Path | str | Iterable[Path | str]
+
+
+# =============================================================================
+# 批量结果摘要
+# =============================================================================
+
+@dataclass(frozen=True)
+class BatchSummary:
+    """批量分析摘要
+
+    Attributes:
+        total: 处理的配置数
+        succeeded: 成功数
+        failed: 失败数
+        elapsed_seconds: 总耗时（秒）
+    """
+    total: int
+    succeeded: int
+    failed: int
+    elapsed_seconds: float
+
+    @property
+    def throughput(self) -> float:
+        """吞吐量（配置数 / 秒）"""
+        if self.elapsed_seconds <= 0:
+            return 0.0
+        return self.total / self.elapsed_seconds
+
+    def format(self) -> str:
+        """格式化为一行统计信息"""
+        return (
+            f"共 {self.total} 个配置: 成功 {self.succeeded}, 失败 {self.failed}, "
+            f"耗时 {self.elapsed_seconds:.2f}s, 吞吐 {self.throughput:.1f} 个/秒"
+        )
+
+
+# =============================================================================
+# 配置来源
+# =============================================================================
+
+def iter_config_paths(sources: BatchSource) -> Iterator[Path]:
+    """展开配置来源为配置文件路径
+
+    Args:
+        sources: 单个来源或来源列表，每个来源可以是:
+            - 目录: 目录下（不递归）所有 .yaml/.yml/.json 文件，按文件名排序
+            - 清单文件 (.txt/.lst): 每行一个路径，相对路径相对于清单所在目录
+            - 配置文件: 原样返回
+            - glob 模式: 支持 ``**`` 递归匹配，按路径排序
+
+    Yields:
+        配置文件路径。不存在的非 glob 路径原样返回，由分析阶段报告错误
+    """
+    if isinstance(sources, (str, Path)):
+        sources = [sources]
+
+    for source in sources:
+        path = Path(source)
+
+        if path.is_dir():
+            yield from sorted(
+                child for child in path.iterdir()
+                if child.is_file() and child.suffix.lower() in CONFIG_SUFFIXES
+            )
+        elif path.is_file() and path.suffix.lower() in MANIFEST_SUFFIXES:
+            yield from _read_manifest(path)
+        elif path.exists() or not glob.has_magic(str(source)):
+            yield path
+        else:
+            yield from (Path(match) for match in sorted(glob.glob(str(source), recursive=True)))
+
+
+def _read_manifest(manifest: Path) -> Iterator[Path]:
+    """读取清单文件"""
+    with open(manifest, encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+            path = Path(line)
+            yield path if path.is_absolute() else manifest.parent / path
+
+
+# =============================================================================
+# 单个配置分析
+# =============================================================================
+
+def analyze_config(
+    orchestrator: "MCDAOrchestrator",
+    index: int,
+    path: Path | str,
+    algorithm_name: str | None = None,
+    apply_constraints: bool = False
+) -> dict[str, Any]:
+    """分析单个配置并生成结果记录（不抛出异常）
+
+    Args:
+        orchestrator: 核心编排器
+        index: 配置在批次中的序号
+        path: 配置文件路径
+        algorithm_name: 算法名称（默认使用配置中的算法）
+        apply_constraints: 是否应用一票否决约束
+
+    Returns:
+        结果记录。成功时 status 为 "ok" 并包含排名；失败时 status 为
+        "error" 并包含错误类型和信息
+    """
+    start = time.perf_counter()
+    record: dict[str, Any] = {"index": index, "config": str(path)}
+
+    try:
+        problem = orchestrator.load_from_file(path)
+        _, result = orchestrator.validate_and_analyze(
+            problem,
+            algorithm_name=algorithm_name,
+            apply_constraints=apply_constraints
+        )
+    except Exception as e:
+        record.update(error_fields(e))
+    else:
+        record.update(result_fields(result))
+
+    record["elapsed_ms"] = round((time.perf_counter() - start) * 1000, 3)
+    return record
+
+
+def result_fields(result: "DecisionResult") -> dict[str, Any]:
+    """成功记录字段（可 JSON 序列化的算法名称与排名）"""
+    return {
+        "status": "ok",
+        "algorithm": result.metadata.algorithm_name,
+        "rankings": [
+            {
+                "alternative": item.alternative,
+                "rank": int(item.rank),
+                "score": float(item.score),
+            }
+            for item in result.rankings
+        ],
+    }
+
+
+def error_fields(error: BaseException) -> dict[str, Any]:
+    """错误记录字段"""
+    message = error.message if isinstance(error, MCDAError) else str(error)
+    return {"status": "error", "error_type": type(error).__name__, "error": message}
+
+
+def _analyze_items(
+    orchestrator: "MCDAOrchestrator",
+    items: list[tuple[int, str]],
+    algorithm_name: str | None,
+    apply_constraints: bool
+) -> list[dict[str, Any]]:
+    """分析一个任务块"""
+    return [
+        analyze_config(orchestrator, index, path, algorithm_name, apply_constraints)
+        for index, path in items
+    ]
+
+
+# 进程池中每个工作进程复用的编排器
+_worker_orchestrator: "MCDAOrchestrator | None" = None
+
+
+def _analyze_items_in_worker(
+    items: list[tuple[int, str]],
+    algorithm_name: str | None,
+    apply_constraints: bool
+) -> list[dict[str, Any]]:
+    """进程池任务：使用本进程的编排器分析一个任务块（模块级函数，可序列化）"""
+    global _worker_orchestrator
+    if _worker_orchestrator is None:
+        from .core import MCDAOrchestrator
+        _worker_orchestrator = MCDAOrchestrator()
+
+    return _analyze_items(_worker_orchestrator, items, algorithm_name, apply_constraints)
+
+
+# =============================================================================
+# 批量执行
+# =============================================================================
+
+def iter_batch(
+    orchestrator: "MCDAOrchestrator",
+    sources: BatchSource,
+    *,
+    algorithm_name: str | None = None,
+    apply_constraints: bool = False,
+    workers: int | None = None,
+    executor: Literal["process", "thread"] = "process",
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    max_pending: int | None = None
+) -> Iterator[dict[str, Any]]:
+    """批量分析配置，按完成顺序逐条产出结果记录
+
+    Args:
+        orchestrator: 核心编排器（串行和线程池模式使用）
+        sources: 配置来源，见 iter_config_paths
+        algorithm_name: 算法名称（默认使用各配置中的算法）
+        apply_constraints: 是否应用一票否决约束
+        workers: 并行工作者数量（None 或 1 表示在当前进程串行执行）
+        executor: 并行执行器类型，"process"（默认）或 "thread"
+        chunk_size: 每个任务包含的配置数
+        max_pending: 在途任务块数上限（默认 2 × workers）
+
+    Yields:
+        结果记录，见 analyze_config
+
+    Raises:
+        ValueError: 并行参数无效
+    """
+    if workers is not None and workers < 1:
+        raise ValueError(f"workers 必须 >= 1，当前值为 {workers}")
+    if chunk_size < 1:
+        raise ValueError(f"chunk_size 必须 >= 1，当前值为 {chunk_size}")
+    if executor not in ("process", "thread"):
+        raise ValueError(f"executor 必须是 'process' 或 'thread'，当前值为 {executor!r}")
+
+    items = ((index, str(path)) for index, path in enumerate(iter_config_paths(sources)))
+
+    if workers is None or workers == 1:
+        for index, path in items:
+            yield analyze_config(orchestrator, index, path, algorithm_name, apply_constraints)
+        return
+
+    if max_pending is None:
+        max_pending = 2 * workers
+    if max_pending < 1:
+        raise ValueError(f"max_pending 必须 >= 1，当前值为 {max_pending}")
+
+    if executor == "process":
+        make_pool = partial(ProcessPoolExecutor, max_workers=workers)
+        task = partial(
+            _analyze_items_in_worker,
+            algorithm_name=algorithm_name,
+            apply_constraints=apply_constraints
+        )
+    else:
+        make_pool = partial(ThreadPoolExecutor, max_workers=workers)
+        task = partial(
+            _analyze_items,
+            orchestrator,
+            algorithm_name=algorithm_name,
+            apply_constraints=apply_constraints
+        )
+
+    pool: Executor = make_pool()
+    pending: dict[Future, list[tuple[int, str]]] = {}
+    # 进程池损坏时在途的配置（无法判断是哪一个导致崩溃）
+    suspects: list[tuple[int, str]] = []
+    # 提交时发现进程池已损坏、尚未执行的任务块
+    deferred: list[list[tuple[int, str]]] = []
+    broken = False
+
+    try:
+        while True:
+            # 补充任务直到在途任务达到上限
+            while not broken and len(pending) < max_pending:
+                chunk = deferred.pop() if deferred else list(islice(items, chunk_size))
+                if not chunk:
+                    break
+                try:
+                    pending[pool.submit(task, chunk)] = chunk
+                except BrokenExecutor:
+                    deferred.append(chunk)
+                    broken = True
+
+            if not pending:
+                if not broken:
+                    return
+
+                # 在途任务均已结束：重建进程池，逐个隔离重试受影响的配置
+                pool.shutdown()
+                pool = make_pool()
+                for item in suspects:
+                    future = pool.submit(task, [item])
+                    wait([future])
+                    yield from _chunk_records(future, [item])
+                    if isinstance(future.exception(), BrokenExecutor):
+                        pool.shutdown()
+                        pool = make_pool()
+                suspects.clear()
+                broken = False
+                continue
+
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                chunk = pending.pop(future)
+                if isinstance(future.exception(), BrokenExecutor):
+                    suspects.extend(chunk)
+                    broken = True
+                else:
+                    yield from _chunk_records(future, chunk)
+    finally:
+        pool.shutdown()
+
+
+def _chunk_records(
+    future: Future, chunk: list[tuple[int, str]]
+) -> list[dict[str, Any]]:
+    """取出任务块结果；任务本身失败（如隔离重试时工作进程崩溃）时为块内每个配置生成错误记录"""
+    error = future.exception()
+    if error is None:
+        return future.result()
+
+    return [
+        {"index": index, "config": path, **error_fields(error)}
+        for index, path in chunk
+    ]
+
+
+def run_batch(
+    orchestrator: "MCDAOrchestrator",
+    sources: BatchSource,
+    output: TextIO | None = None,
+    **options: Any
+) -> BatchSummary:
+    """批量分析配置，将结果以 JSON Lines 写入输出流并返回摘要
+
+    Args:
+        orchestrator: 核心编排器
+        sources: 配置来源，见 iter_config_paths
+        output: 输出流（每条结果一行 JSON，写入后立即 flush）
+        **options: 传递给 iter_batch 的参数
+
+    Returns:
+        批量分析摘要
+    """
+    start = time.perf_counter()
+    total = failed = 0
+
+    for record in iter_batch(orchestrator, sources, **options):
+        total += 1
+        failed += record["status"] != "ok"
+        if output is not None:
+            output.write(json.dumps(record, ensure_ascii=False) + "\n")
+            output.flush()
+
+    return BatchSummary(
+        total=total,
+        succeeded=total - failed,
+        failed=failed,
+        elapsed_seconds=time.perf_counter() - start
+    )
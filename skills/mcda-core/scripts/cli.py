@@ -4,14 +4,19 @@ MCDA Core - 命令行接口
 提供命令行工具用于决策分析。
 """
 
+import os
 import sys
 import argparse
+from functools import cached_property
 from pathlib import Path
-from typing import Any
+from typing import Any, TYPE_CHECKING
 
-from .core import MCDAOrchestrator
 from .exceptions import MCDAError, YAMLParseError
-from .converters import ConfigConverter
+
+# 编排器和转换器在首次执行命令时才导入，--version / --help 无需加载算法等依赖
+if TYPE_CHECKING:
+    from .core import MCDAOrchestrator
+    from .converters import ConfigConverter
 
 
 # =============================================================================
@@ -23,6 +28,8 @@ class MCDACommandLineInterface:
 
     支持的命令:
     - analyze: 分析决策问题
+    - batch: 批量分析多个配置文件（JSON Lines 输出）
+    - serve: 启动常驻分析服务（HTTP/JSON）
     - validate: 验证配置文件
     - convert: 转换配置格式（YAML ↔ JSON）
     - version: 显示版本信息
@@ -31,10 +38,20 @@ class MCDACommandLineInterface:
 
     def __init__(self):
         """初始化 CLI"""
-        self.orchestrator = MCDAOrchestrator()
-        self.converter = ConfigConverter()
         self.parser = self._create_parser()
 
+    @cached_property
+    def orchestrator(self) -> "MCDAOrchestrator":
+        """核心编排器（首次使用时创建）"""
+        from .core import MCDAOrchestrator
+        return MCDAOrchestrator()
+
+    @cached_property
+    def converter(self) -> "ConfigConverter":
+        """配置转换器（首次使用时创建）"""
+        from .converters import ConfigConverter
+        return ConfigConverter()
+
     def _create_parser(self) -> argparse.ArgumentParser:
         """创建命令行参数解析器"""
         parser = argparse.ArgumentParser(
@@ -46,6 +63,10 @@ class MCDACommandLineInterface:
   mcda analyze config.yaml
   mcda analyze config.yaml -o report.md
   mcda analyze config.yaml --algorithm topsis
+  mcda analyze config.yaml --profile
+  mcda batch configs/ -o results.jsonl --workers 8
+  mcda batch "configs/**/*.yaml" manifest.txt
+  mcda serve --port 8765 --workers 4
   mcda validate config.yaml
   mcda convert config.yaml config.json
   mcda convert config.yaml config.json --format json
@@ -103,6 +124,99 @@ class MCDACommandLineInterface:
             action="store_true",
             help="应用一票否决约束（过滤和惩罚）"
         )
+        analyze_parser.add_argument(
+            "--profile",
+            action="store_true",
+            help="在 stderr 输出各阶段的墙钟时间、CPU 时间和峰值内存"
+        )
+        analyze_parser.add_argument(
+            "--no-profile-memory",
+            dest="profile_memory",
+            action="store_false",
+            help="--profile 时不跟踪峰值内存（避免 tracemalloc 开销影响计时）"
+        )
+
+        # batch 命令
+        batch_parser = subparsers.add_parser(
+            "batch",
+            help="批量分析多个配置文件（每个结果输出一行 JSON）"
+        )
+        batch_parser.add_argument(
+            "sources",
+            nargs="+",
+            help="配置来源：目录、glob 模式、清单文件（.txt/.lst，每行一个路径）或配置文件"
+        )
+        batch_parser.add_argument(
+            "-o", "--output",
+            type=Path,
+            help="JSON Lines 输出文件路径（默认: stdout）"
+        )
+        batch_parser.add_argument(
+            "-a", "--algorithm",
+            help="指定算法（默认使用各配置中的算法）"
+        )
+        batch_parser.add_argument(
+            "-w", "--workers",
+            type=int,
+            default=os.cpu_count() or 1,
+            help="并行工作进程数（默认: CPU 核数，1 表示串行）"
+        )
+        batch_parser.add_argument(
+            "--executor",
+            choices=["process", "thread"],
+            default="process",
+            help="并行执行器类型（默认: process）"
+        )
+        batch_parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=8,
+            help="每个任务包含的配置数（默认: 8）"
+        )
+        batch_parser.add_argument(
+            "--max-pending",
+            type=int,
+            help="在途任务数上限（默认: 2 × workers）"
+        )
+        batch_parser.add_argument(
+            "--apply-constraints",
+            action="store_true",
+            help="应用一票否决约束（过滤和惩罚）"
+        )
+
+        # serve 命令
+        serve_parser = subparsers.add_parser(
+            "serve",
+            help="启动常驻分析服务（HTTP/JSON，保持编排器、算法和缓存常驻）"
+        )
+        serve_parser.add_argument(
+            "--host",
+            default="127.0.0.1",
+            help="监听地址（默认: 127.0.0.1）"
+        )
+        serve_parser.add_argument(
+            "-p", "--port",
+            type=int,
+            default=8765,
+            help="监听端口（默认: 8765，0 表示由系统分配）"
+        )
+        serve_parser.add_argument(
+            "-w", "--workers",
+            type=int,
+            default=4,
+            help="请求处理线程数（默认: 4）"
+        )
+        serve_parser.add_argument(
+            "--cache-size",
+            type=int,
+            default=256,
+            help="分析结果缓存条目数（默认: 256，0 表示不缓存）"
+        )
+        serve_parser.add_argument(
+            "-v", "--verbose",
+            action="store_true",
+            help="输出访问日志"
+        )
 
         # validate 命令
         validate_parser = subparsers.add_parser(
@@ -158,6 +272,10 @@ class MCDACommandLineInterface:
             # 执行对应命令
             if parsed_args.command == "analyze":
                 self._cmd_analyze(parsed_args)
+            elif parsed_args.command == "batch":
+                self._cmd_batch(parsed_args)
+            elif parsed_args.command == "serve":
+                self._cmd_serve(parsed_args)
             elif parsed_args.command == "validate":
                 self._cmd_validate(parsed_args)
             elif parsed_args.command == "convert":
@@ -194,7 +312,9 @@ class MCDACommandLineInterface:
             run_sensitivity=args.sensitivity,
             apply_constraints=args.apply_constraints,
             format=args.format,
-            include_chart=args.include_chart
+            include_chart=args.include_chart,
+            profile=args.profile,
+            profile_memory=args.profile_memory
         )
 
         # 如果没有指定输出文件，打印到 stdout
@@ -214,6 +334,67 @@ class MCDACommandLineInterface:
 
         print(f"✓ 分析完成: {args.config}", file=sys.stderr)
 
+        if args.profile:
+            from .profiling import format_timings
+            print(format_timings(result.metadata.metrics["timings"]), file=sys.stderr)
+
+    def _cmd_batch(self, args: argparse.Namespace) -> None:
+        """处理 batch 命令
+
+        每个配置的结果（或错误）输出一行 JSON，单个配置失败不中断批次；
+        结束时在 stderr 打印吞吐统计，存在失败配置时退出码为 1。
+
+        Args:
+            args: 解析后的命令行参数
+        """
+        options = {
+            "algorithm_name": args.algorithm,
+            "apply_constraints": args.apply_constraints,
+            "workers": args.workers,
+            "executor": args.executor,
+            "chunk_size": args.chunk_size,
+            "max_pending": args.max_pending,
+        }
+
+        if args.output is None:
+            summary = self.orchestrator.run_many(args.sources, sys.stdout, **options)
+        else:
+            args.output.parent.mkdir(parents=True, exist_ok=True)
+            with open(args.output, "w", encoding="utf-8") as f:
+                summary = self.orchestrator.run_many(args.sources, f, **options)
+
+        print(f"✓ 批量分析完成: {summary.format()}", file=sys.stderr)
+
+        if summary.failed:
+            sys.exit(1)
+
+    def _cmd_serve(self, args: argparse.Namespace) -> None:
+        """处理 serve 命令
+
+        阻塞运行常驻分析服务，直到收到 Ctrl+C。
+
+        Args:
+            args: 解析后的命令行参数
+        """
+        from .server import MCDAServer
+
+        server = MCDAServer(
+            host=args.host,
+            port=args.port,
+            workers=args.workers,
+            cache_size=args.cache_size,
+            verbose=args.verbose
+        )
+        print(f"✓ MCDA 服务已启动: {server.url}（Ctrl+C 停止）", file=sys.stderr)
+
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            server.shutdown()
+            print("✓ MCDA 服务已停止", file=sys.stderr)
+
     def _cmd_validate(self, args: argparse.Namespace) -> None:
         """处理 validate 命令
 
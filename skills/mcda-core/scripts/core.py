@@ -4,9 +4,11 @@ MCDA Core - 核心编排器模块
 提供决策问题的完整工作流程：加载、验证、分析、报告生成。
 """
 
+from contextlib import nullcontext
+from dataclasses import replace
 from pathlib import Path
 from datetime import datetime
-from typing import Any
+from typing import Any, Iterator, TextIO, TYPE_CHECKING
 
 from .models import (
     DecisionProblem,
@@ -23,6 +25,7 @@ from .algorithms import get_algorithm
 from .validation import ValidationService, ValidationResult
 from .reporter import ReportService
 from .sensitivity import SensitivityService
+from .profiling import attach_timings, profile as profile_stages, stage
 from .exceptions import (
     MCDAError,
     YAMLParseError,
@@ -30,6 +33,10 @@ from .exceptions import (
 )
 from .loaders import JSONLoader, YAMLLoader, LoaderFactory
 
+if TYPE_CHECKING:
+    from .batch import BatchSource, BatchSummary
+    from .utils.cache import ResultCache
+
 
 # =============================================================================
 # MCDAOrchestrator - 核心编排器
@@ -46,11 +53,17 @@ class MCDAOrchestrator:
     5. 敏感性分析
     """
 
-    def __init__(self):
-        """初始化编排器"""
+    def __init__(self, result_cache: "ResultCache | None" = None):
+        """初始化编排器
+
+        Args:
+            result_cache: 分析结果缓存（可选）。相同评分、权重、方向、
+                算法及参数的分析直接返回缓存结果
+        """
         self.validation_service = ValidationService()
         self.reporter_service = ReportService()
         self.sensitivity_service = SensitivityService()
+        self.result_cache = result_cache
 
     # -------------------------------------------------------------------------
     # 加载决策问题
@@ -131,6 +144,30 @@ class MCDAOrchestrator:
         # 构建决策问题
         return self._build_problem_from_data(data, auto_normalize_weights)
 
+    def load_from_dict(
+        self,
+        data: dict[str, Any],
+        auto_normalize_weights: bool = True
+    ) -> DecisionProblem:
+        """从已解析的配置数据（与 YAML/JSON 配置结构相同）加载决策问题
+
+        Args:
+            data: 配置数据
+            auto_normalize_weights: 是否自动归一化权重（默认 True）
+
+        Returns:
+            决策问题对象
+
+        Raises:
+            MCDAValidationError: 数据验证失败
+        """
+        if not isinstance(data, dict):
+            raise MCDAValidationError(
+                f"配置数据必须是字典，当前类型: {type(data).__name__}"
+            )
+
+        return self._build_problem_from_data(data, auto_normalize_weights)
+
     def _build_problem_from_data(
         self,
         data: dict[str, Any],
@@ -630,16 +667,26 @@ class MCDAOrchestrator:
         # 2. 获取算法实例
         algorithm = get_algorithm(algorithm_name)
 
-        # 3. 执行分析
-        result = algorithm.calculate(problem, **algorithm_params)
+        # 3. 执行分析（启用缓存时按内容指纹复用结果）
+        with stage("analyze"):
+            if self.result_cache is None:
+                result = algorithm.calculate(problem, **algorithm_params)
+            else:
+                from .utils.cache import problem_fingerprint
+
+                key = problem_fingerprint(problem, algorithm_name, algorithm_params)
+                result = self.result_cache.get_or_compute(
+                    key, lambda: algorithm.calculate(problem, **algorithm_params)
+                )
 
         # 4. 运行敏感性分析（可选）
         if run_sensitivity:
-            sensitivity_result = self.sensitivity_service.analyze(
-                problem=problem,
-                algorithm=algorithm,
-                perturbation=0.1
-            )
+            with stage("sensitivity"):
+                sensitivity_result = self.sensitivity_service.analyze(
+                    problem=problem,
+                    algorithm=algorithm,
+                    perturbation=0.1
+                )
             # 更新结果的敏感性分析数据
             # 这里取决于 DecisionResult 的具体实现
 
@@ -796,6 +843,8 @@ class MCDAOrchestrator:
         algorithm_name: str | None = None,
         run_sensitivity: bool = False,
         apply_constraints: bool = False,
+        profile: bool = False,
+        profile_memory: bool = True,
         **kwargs
     ) -> DecisionResult:
         """运行完整的决策分析工作流程
@@ -806,16 +855,62 @@ class MCDAOrchestrator:
             algorithm_name: 算法名称（可选）
             run_sensitivity: 是否运行敏感性分析
             apply_constraints: 是否应用一票否决约束
+            profile: 是否记录各阶段的墙钟时间、CPU 时间和峰值内存，
+                结果写入 result.metadata.metrics["timings"]
+            profile_memory: 记录阶段计时时是否跟踪峰值内存（tracemalloc 有额外开销）
             **kwargs: 额外参数
 
         Returns:
             决策结果
         """
-        # 1. 加载问题
-        problem = self.load_from_yaml(file_path)
+        stages = profile_stages(trace_memory=profile_memory) if profile else nullcontext()
+        with stages as profiler:
+            # 1. 加载问题
+            with stage("load"):
+                problem = self.load_from_yaml(file_path)
+
+            # 2-3. 验证、应用约束并分析
+            problem, result = self.validate_and_analyze(
+                problem,
+                algorithm_name=algorithm_name,
+                run_sensitivity=run_sensitivity,
+                apply_constraints=apply_constraints
+            )
+
+            # 4. 生成和保存报告（可选）
+            if output_path is not None:
+                with stage("report"):
+                    self.save_report(problem, result, output_path, **kwargs)
 
-        # 2. 验证问题
-        validation_result = self.validate(problem)
+        if profiler is not None:
+            result = attach_timings(result, profiler)
+
+        return result
+
+    def validate_and_analyze(
+        self,
+        problem: DecisionProblem,
+        algorithm_name: str | None = None,
+        run_sensitivity: bool = False,
+        apply_constraints: bool = False
+    ) -> tuple[DecisionProblem, DecisionResult]:
+        """验证决策问题、应用约束（可选）并分析
+
+        Args:
+            problem: 决策问题
+            algorithm_name: 算法名称（可选）
+            run_sensitivity: 是否运行敏感性分析
+            apply_constraints: 是否应用一票否决约束
+
+        Returns:
+            (应用约束后的决策问题, 决策结果)
+
+        Raises:
+            MCDAError: 决策问题验证失败
+        """
+        # 1. 验证问题
+        with stage("validate"):
+            validation_result = self.validate(problem)
 
         if not validation_result.is_valid:
             errors = ", ".join(validation_result.errors)
@@ -824,17 +919,18 @@ class MCDAOrchestrator:
                 details={"errors": validation_result.errors}
             )
 
-        # 2.5. 应用约束（如果启用）
+        # 2. 应用约束（如果启用）
         veto_results = None
         if apply_constraints:
             from .services.constraint_service import ConstraintService
             service = ConstraintService()
 
-            # 过滤问题
-            problem, veto_results = service.filter_problem(problem)
+            with stage("constraints"):
+                # 过滤问题
+                problem, veto_results = service.filter_problem(problem)
 
-            # 应用惩罚
-            problem = service.apply_penalties(problem)
+                # 应用惩罚
+                problem = service.apply_penalties(problem)
 
         # 3. 分析问题
         result = self.analyze(
@@ -843,13 +939,59 @@ class MCDAOrchestrator:
             run_sensitivity=run_sensitivity
         )
 
-        # 将否决结果添加到决策结果中
+        # 将否决结果添加到决策结果中（结果可能来自结果缓存，复制后再设置）
         if veto_results is not None:
-            # 直接设置属性（DecisionResult 不是 frozen dataclass）
-            result.veto_results = veto_results
+            result = replace(result, veto_results=veto_results)
 
-        # 4. 生成和保存报告（可选）
-        if output_path is not None:
-            self.save_report(problem, result, output_path, **kwargs)
+        return problem, result
 
-        return result
+    # -------------------------------------------------------------------------
+    # 批量分析
+    # -------------------------------------------------------------------------
+
+    def iter_many(
+        self,
+        sources: "BatchSource",
+        **options: Any
+    ) -> "Iterator[dict[str, Any]]":
+        """批量分析多个配置文件，按完成顺序逐条产出结果记录
+
+        Args:
+            sources: 目录、glob 模式、清单文件、配置文件或它们的列表
+            **options: algorithm_name、apply_constraints、workers、executor、
+                chunk_size、max_pending，见 batch.iter_batch
+
+        Yields:
+            结果记录 {"index", "config", "status", ...}；单个配置失败时产出
+            status 为 "error" 的记录，不中断批次
+        """
+        from .batch import iter_batch
+        return iter_batch(self, sources, **options)
+
+    def run_many(
+        self,
+        sources: "BatchSource",
+        output: TextIO | None = None,
+        **options: Any
+    ) -> "BatchSummary":
+        """批量分析多个配置文件，结果以 JSON Lines 流式写入 output
+
+        Args:
+            sources: 目录、glob 模式、清单文件、配置文件或它们的列表
+            output: 输出流（可选），每个结果或错误一行 JSON
+            **options: algorithm_name、apply_constraints、workers、executor、
+                chunk_size、max_pending，见 batch.iter_batch
+
+        Returns:
+            批量分析摘要（总数、成功数、失败数、耗时、吞吐量）
+
+        Example:
+            ```python
+            orchestrator = MCDAOrchestrator()
+            with open("results.jsonl", "w", encoding="utf-8") as f:
+                summary = orchestrator.run_many("configs/", output=f, workers=8)
+            print(summary.format())
+            ```
+        """
+        from .batch import run_batch
+        return run_batch(self, sources, output, **options)
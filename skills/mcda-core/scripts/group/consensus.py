@@ -2,12 +2,21 @@
 MCDA Core - 共识度测量
 
 提供群决策中共识度的计算方法。
+
+``ConsensusMeasure.compute_consensus_tensor`` 直接在 (n_dm, n_alt, n_crit)
+评分张量上计算：各准则共识度跨准则向量化，决策者两两距离由一次
+pdist 式计算得到（每对只算一次）。
 """
 
-from dataclasses import dataclass
-from typing import Any
+from dataclasses import dataclass, field
+from typing import Any, Literal
 import math
 
+import numpy as np
+
+# 支持的决策者距离度量
+DISTANCE_METRICS = ("euclidean", "manhattan", "cosine")
+
 
 # =============================================================================
 # 共识度测量结果
@@ -24,12 +33,15 @@ class ConsensusResult:
         criterion_consensus: 各准则的共识度 {criterion: consensus}
         decision_maker_distances: 决策者距离矩阵
             {dm_id: {dm_id: distance}}
-       达到了共识阈值
+        threshold_reached: 是否达到了共识阈值
+        distance_matrix: 决策者距离矩阵 (n_dm, n_dm)，顺序与
+            decision_maker_distances 的键一致（可选，不参与比较）
     """
     overall_consensus: float
     criterion_consensus: dict[str, float]
     decision_maker_distances: dict[str, dict[str, float]]
     threshold_reached: bool
+    distance_matrix: np.ndarray | None = field(default=None, compare=False, repr=False)
 
     def __post_init__(self):
         """验证数据有效性"""
@@ -213,7 +225,8 @@ class ConsensusMeasure:
         alternatives: tuple[str, ...],
         criteria: tuple,
         threshold: float = 0.7,
-        method: str = "standard_deviation"
+        method: str = "standard_deviation",
+        distance: Literal["euclidean", "manhattan", "cosine"] = "euclidean"
     ) -> ConsensusResult:
         """计算群决策的整体共识度
 
@@ -224,64 +237,84 @@ class ConsensusMeasure:
             criteria: 评价准则列表
             threshold: 共识阈值
             method: 共识度计算方法
+            distance: 决策者距离度量（euclidean/manhattan/cosine）
 
         Returns:
             共识度测量结果
         """
-        criterion_consensus: dict[str, float] = {}
-        decision_maker_distances: dict[str, dict[str, float]] = {}
-
         # 获取准则名称
         if criteria:
             crit_names = [c.name if hasattr(c, 'name') else str(c) for c in criteria]
         else:
             crit_names = []
 
-        # 计算各准则的共识度（对所有备选方案取平均）
-        if crit_names:
-            for crit in crit_names:
-                crit_scores: dict[str, float] = {}
-
-                # 收集所有决策者对该准则的评分（跨所有备选方案）
-                for dm_id, alt_scores in individual_scores.items():
-                    dm_crit_scores = []
-                    for alt in alternatives:
-                        if alt in alt_scores and crit in alt_scores[alt]:
-                            dm_crit_scores.append(alt_scores[alt][crit])
-
-                    # 使用该决策者的平均评分
-                    if dm_crit_scores:
-                        crit_scores[dm_id] = sum(dm_crit_scores) / len(dm_crit_scores)
-
-                # 计算该准则的共识度
-                criterion_consensus[crit] = cls.compute_criterion_consensus(
-                    crit_scores, method
-                )
-
-        # 计算决策者之间的距离
+        # 转换为稠密评分张量，缺失评分记为 NaN
         dm_ids = list(individual_scores.keys())
-        for dm_id1 in dm_ids:
-            decision_maker_distances[dm_id1] = {}
-            for dm_id2 in dm_ids:
-                if dm_id1 == dm_id2:
-                    decision_maker_distances[dm_id1][dm_id2] = 0.0
-                else:
-                    # 计算两个决策者评分的欧氏距离
-                    scores1: dict[str, float] = {}
-                    scores2: dict[str, float] = {}
-
-                    for alt in alternatives:
-                        for crit in crit_names:
-                            key = f"{alt}_{crit}"
-                            scores1[key] = individual_scores[dm_id1].get(alt, {}).get(crit, 0)
-                            scores2[key] = individual_scores[dm_id2].get(alt, {}).get(crit, 0)
-
-                    distance = cls.compute_euclidean_distance(scores1, scores2)
-                    decision_maker_distances[dm_id1][dm_id2] = distance
+        nan = float("nan")
+        rows = []
+        for dm_id in dm_ids:
+            alt_scores = individual_scores[dm_id]
+            for alt in alternatives:
+                crit_scores = alt_scores.get(alt, {})
+                rows.append([crit_scores.get(crit, nan) for crit in crit_names])
+
+        tensor = np.array(rows, dtype=np.float64).reshape(
+            len(dm_ids), len(alternatives), len(crit_names)
+        )
+
+        return cls.compute_consensus_tensor(
+            tensor, dm_ids, crit_names, threshold, method, distance
+        )
+
+    @classmethod
+    def compute_consensus_tensor(
+        cls,
+        tensor: np.ndarray,
+        dm_ids: list[str],
+        criterion_names: list[str],
+        threshold: float = 0.7,
+        method: str = "standard_deviation",
+        distance: Literal["euclidean", "manhattan", "cosine"] = "euclidean"
+    ) -> ConsensusResult:
+        """在评分张量上计算群决策的整体共识度
+
+        Args:
+            tensor: 评分张量 (n_dm, n_alt, n_crit)，缺失评分为 NaN
+            dm_ids: 决策者 ID，顺序与张量第一轴一致
+            criterion_names: 准则名称，顺序与张量第三轴一致
+            threshold: 共识阈值
+            method: 共识度计算方法
+            distance: 决策者距离度量（euclidean/manhattan/cosine）
+
+        Returns:
+            共识度测量结果
+
+        Raises:
+            ValueError: 共识度计算方法或距离度量未知
+        """
+        if distance not in DISTANCE_METRICS:
+            raise ValueError(
+                f"未知的距离度量: {distance}，支持的度量: {', '.join(DISTANCE_METRICS)}"
+            )
+        tensor = np.asarray(tensor, dtype=np.float64)
+
+        # 各准则共识度：先取每个决策者跨方案的平均评分 (n_dm, n_crit)
+        criterion_values = cls.compute_criterion_consensus_vector(
+            _nanmean(tensor, axis=1), method
+        )
+        criterion_consensus = dict(zip(criterion_names, criterion_values.tolist()))
+
+        # 决策者两两距离（缺失评分按 0 计）
+        vectors = np.nan_to_num(tensor.reshape(len(dm_ids), -1), nan=0.0)
+        distance_matrix = cls.compute_distance_matrix(vectors, distance)
+        decision_maker_distances = {
+            dm_id: dict(zip(dm_ids, row))
+            for dm_id, row in zip(dm_ids, distance_matrix.tolist())
+        }
 
         # 计算整体共识度（各准则共识度的平均）
         if criterion_consensus:
-            overall_consensus = sum(criterion_consensus.values()) / len(criterion_consensus)
+            overall_consensus = float(criterion_values.mean())
         else:
             overall_consensus = 1.0
 
@@ -292,5 +325,114 @@ class ConsensusMeasure:
             overall_consensus=overall_consensus,
             criterion_consensus=criterion_consensus,
             decision_maker_distances=decision_maker_distances,
-            threshold_reached=threshold_reached
+            threshold_reached=threshold_reached,
+            distance_matrix=distance_matrix
         )
+
+    @classmethod
+    def compute_criterion_consensus_vector(
+        cls,
+        scores: np.ndarray,
+        method: str = "standard_deviation",
+        tolerance: float = 10.0
+    ) -> np.ndarray:
+        """向量化计算所有准则的共识度
+
+        与 ``compute_criterion_consensus`` 逐准则的结果一致。
+
+        Args:
+            scores: 决策者评分 (n_dm, n_crit)，NaN 表示该决策者未评分
+            method: 计算方法（同 compute_criterion_consensus）
+            tolerance: 同意率法的容差
+
+        Returns:
+            各准则共识度 (n_crit,)
+
+        Raises:
+            ValueError: 未知的计算方法
+        """
+        if method not in ("standard_deviation", "coefficient_of_variation", "agreement_rate"):
+            raise ValueError(f"未知的共识度计算方法: {method}")
+
+        scores = np.asarray(scores, dtype=np.float64)
+        present = ~np.isnan(scores)
+        count = present.sum(axis=0)
+
+        mean = _nanmean(scores, axis=0)
+        deviation = np.where(present, scores - mean, 0.0)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            std = np.sqrt((deviation ** 2).sum(axis=0) / count)
+
+            if method == "standard_deviation":
+                # 将标准差转换为共识度：std=0 -> consensus=1, std>=50 -> consensus=0
+                consensus = np.maximum(0.0, 1 - std / 50)
+            elif method == "coefficient_of_variation":
+                cv = np.where(
+                    mean == 0, np.where(std == 0, 0.0, 1.0), np.minimum(std / np.abs(mean), 1.0)
+                )
+                consensus = 1 - cv
+            else:
+                agreed = (present & (np.abs(deviation) <= tolerance)).sum(axis=0)
+                consensus = agreed / count
+
+        consensus = np.where(count == 1, 1.0, consensus)
+        return np.where(count == 0, 0.0, consensus)
+
+    @staticmethod
+    def compute_distance_matrix(
+        vectors: np.ndarray,
+        metric: Literal["euclidean", "manhattan", "cosine"] = "euclidean"
+    ) -> np.ndarray:
+        """计算决策者两两距离矩阵
+
+        只计算上三角（每对一次），再对称填充。
+
+        Args:
+            vectors: 决策者评分向量 (n_dm, n_features)
+            metric: 距离度量（euclidean/manhattan/cosine）
+
+        Returns:
+            对称距离矩阵 (n_dm, n_dm)，对角线为 0
+        """
+        vectors = np.asarray(vectors, dtype=np.float64)
+        n = len(vectors)
+
+        try:
+            from scipy.spatial.distance import pdist
+            condensed = pdist(vectors, metric="cityblock" if metric == "manhattan" else metric)
+        except ImportError:
+            # 如果 scipy 不可用，按行计算上三角
+            condensed = np.concatenate(
+                [_row_distances(vectors[i], vectors[i + 1:], metric) for i in range(n - 1)]
+                + [np.empty(0)]
+            )
+
+        # 零向量的余弦距离无定义，按 0 处理
+        matrix = np.zeros((n, n))
+        matrix[np.triu_indices(n, k=1)] = np.nan_to_num(condensed, nan=0.0)
+        return matrix + matrix.T
+
+
+# =============================================================================
+# 内部工具函数
+# =============================================================================
+
+def _nanmean(values: np.ndarray, axis: int) -> np.ndarray:
+    """忽略 NaN 的均值；全部为 NaN 时返回 NaN 且不发出警告"""
+    present = ~np.isnan(values)
+    total = np.where(present, values, 0.0).sum(axis=axis)
+    count = present.sum(axis=axis)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        return total / count
+
+
+def _row_distances(row: np.ndarray, others: np.ndarray, metric: str) -> np.ndarray:
+    """计算一个向量到其余向量的距离"""
+    if metric == "euclidean":
+        return np.sqrt(((others - row) ** 2).sum(axis=1))
+    if metric == "manhattan":
+        return np.abs(others - row).sum(axis=1)
+
+    norms = np.linalg.norm(others, axis=1) * np.linalg.norm(row)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        return 1.0 - (others @ row) / norms
@@ -2,11 +2,20 @@
 MCDA Core - 德尔菲法（简化版）
 
 提供群决策德尔菲法的实现，用于通过多轮专家咨询达成共识。
+
+每轮评分在加入时转换为一次稠密的 (n_dm, n_alt, n_crit) 数组（缺失为 NaN），
+统计量、收敛分数和逐单元格收敛图都是对该数组的向量化运算，
+每轮开销与已进行的轮数无关。
 """
 
 from dataclasses import dataclass, field
 from typing import Any
-import statistics as stats
+
+import numpy as np
+
+# 模块级常量
+MAX_REASONABLE_CHANGE = 50.0
+"""收敛分数归一化时假设的最大合理评分变化"""
 
 
 # =============================================================================
@@ -27,6 +36,9 @@ class DelphiRound:
             {alternative: {criterion: {stat_name: value}}}
             stat_name 包括: mean, median, std, q1, q3
         convergence_score: 收敛分数（0-1，越小表示越收敛）
+        cell_convergence: 各方案-准则的收敛分数
+            {alternative: {criterion: score}}，只包含能与上一轮比较的单元格
+            （第一轮为空），可用于确定下一轮需要重点追问的单元格
 
     Example:
         ```python
@@ -43,6 +55,7 @@ class DelphiRound:
     scores: dict[str, dict[str, dict[str, float]]]
     statistics: dict[str, dict[str, dict[str, float]]]
     convergence_score: float
+    cell_convergence: dict[str, dict[str, float]] = field(default_factory=dict)
 
     def __post_init__(self):
         """验证数据有效性"""
@@ -112,6 +125,7 @@ class DelphiProcess:
         self.max_rounds = max_rounds
         self.convergence_threshold = convergence_threshold
         self._rounds: list[DelphiRound] = []
+        self._round_scores: list[_RoundScores] = []
 
         # 验证参数
         if self.max_rounds < 1:
@@ -156,11 +170,15 @@ class DelphiProcess:
                 f"DelphiProcess: 已达到最大轮次数 ({self.max_rounds})"
             )
 
+        # 转换为稠密数组（每轮只转换一次）
+        round_scores = _RoundScores.from_dict(scores)
+
         # 计算统计摘要
-        statistics = self.compute_statistics(scores)
+        statistics = self._statistics_from_array(round_scores)
 
         # 计算收敛分数
-        convergence_score = self._compute_convergence_score(scores)
+        convergence_score, cell_scores = self._compute_convergence(round_scores)
+        cell_convergence = round_scores.cell_dict(cell_scores) if cell_scores is not None else {}
 
         # 创建轮次记录
         round_number = len(self._rounds) + 1
@@ -168,11 +186,13 @@ class DelphiProcess:
             round_number=round_number,
             scores=scores,
             statistics=statistics,
-            convergence_score=convergence_score
+            convergence_score=convergence_score,
+            cell_convergence=cell_convergence
         )
 
         # 添加到内部列表
         self._rounds.append(round_record)
+        self._round_scores.append(round_scores)
 
         return round_record
 
@@ -185,7 +205,7 @@ class DelphiProcess:
         对每个方案的每个准则计算：
         - 均值 (mean)
         - 中位数 (median)
-        - 标准差 (std)
+        - 标准差 (std，样本标准差)
         - 第一四分位数 (q1)
         - 第三四分位数 (q3)
 
@@ -197,59 +217,51 @@ class DelphiProcess:
             统计摘要
             {alternative: {criterion: {stat_name: value}}}
         """
-        statistics: dict[str, dict[str, dict[str, float]]] = {}
-
         if not scores:
-            return statistics
+            return {}
 
-        # 收集所有决策者对每个方案-准则的评分
-        alternative_criterion_scores: dict[str, dict[str, list[float]]] = {}
+        return self._statistics_from_array(_RoundScores.from_dict(scores))
 
-        for dm_scores in scores.values():
-            for alt, alt_scores in dm_scores.items():
-                if alt not in alternative_criterion_scores:
-                    alternative_criterion_scores[alt] = {}
-
-                for crit, score in alt_scores.items():
-                    if crit not in alternative_criterion_scores[alt]:
-                        alternative_criterion_scores[alt][crit] = []
-                    alternative_criterion_scores[alt][crit].append(score)
-
-        # 计算每个方案-准则的统计量
-        for alt, crit_scores_dict in alternative_criterion_scores.items():
-            statistics[alt] = {}
-
-            for crit, values in crit_scores_dict.items():
-                # 排序以便计算四分位数
-                sorted_values = sorted(values)
-
-                stat_values: dict[str, float] = {
-                    "mean": stats.mean(sorted_values),
-                    "median": stats.median(sorted_values),
-                    "std": stats.stdev(sorted_values) if len(sorted_values) > 1 else 0.0,
-                }
-
-                # 计算四分位数
-                n = len(sorted_values)
-                if n >= 4:
-                    # Q1 = 25th percentile, Q3 = 75th percentile
-                    q1_idx = int(n * 0.25)
-                    q3_idx = int(n * 0.75)
-                    stat_values["q1"] = sorted_values[q1_idx]
-                    stat_values["q3"] = sorted_values[q3_idx]
-                elif n == 3:
-                    stat_values["q1"] = sorted_values[0]
-                    stat_values["q3"] = sorted_values[2]
-                elif n == 2:
-                    stat_values["q1"] = sorted_values[0]
-                    stat_values["q3"] = sorted_values[1]
-                else:  # n == 1
-                    stat_values["q1"] = sorted_values[0]
-                    stat_values["q3"] = sorted_values[0]
-
-                statistics[alt][crit] = stat_values
-
-        return statistics
+    def _statistics_from_array(
+        self,
+        round_scores: "_RoundScores"
+    ) -> dict[str, dict[str, dict[str, float]]]:
+        """在评分数组上向量化计算所有单元格的统计量
+
+        四分位数取排序后第 floor(n·0.25) / floor(n·0.75) 个评分（与逐单元格
+        排序的定义一致），由一次沿决策者轴的排序得到。
+        """
+        values = round_scores.values
+        present = ~np.isnan(values)
+        count = present.sum(axis=0)
+
+        with np.errstate(invalid="ignore", divide="ignore"):
+            mean = np.where(present, values, 0.0).sum(axis=0) / count
+            deviation = np.where(present, values - mean, 0.0)
+            std = np.sqrt((deviation ** 2).sum(axis=0) / (count - 1))
+        std = np.where(count > 1, std, 0.0)
+
+        # NaN 排在末尾，有效评分位于每个单元格的前 count 个位置
+        sorted_values = np.sort(values, axis=0)
+        safe_count = np.maximum(count, 1)
+        upper_mid = np.take_along_axis(sorted_values, (safe_count // 2)[None], axis=0)[0]
+        lower_mid = np.take_along_axis(sorted_values, ((safe_count - 1) // 2)[None], axis=0)[0]
+        median = (lower_mid + upper_mid) / 2
+        q1 = np.take_along_axis(sorted_values, (safe_count // 4)[None], axis=0)[0]
+        q3 = np.take_along_axis(sorted_values, (safe_count * 3 // 4)[None], axis=0)[0]
+
+        stat_arrays = {"mean": mean, "median": median, "std": std, "q1": q1, "q3": q3}
+        stat_lists = {name: array.tolist() for name, array in stat_arrays.items()}
+        has_scores = (count > 0).tolist()
+
+        return {
+            alt: {
+                crit: {name: stat_lists[name][i][j] for name in stat_arrays}
+                for j, crit in enumerate(round_scores.criteria)
+                if has_scores[i][j]
+            }
+            for i, alt in enumerate(round_scores.alternatives)
+        }
 
     def _compute_convergence_score(
         self,
@@ -266,40 +278,67 @@ class DelphiProcess:
         Returns:
             收敛分数（0-1，1 表示完全未收敛，0 表示完全收敛）
         """
+        convergence_score, _ = self._compute_convergence(_RoundScores.from_dict(scores))
+        return convergence_score
+
+    def _compute_convergence(
+        self,
+        round_scores: "_RoundScores"
+    ) -> tuple[float, np.ndarray | None]:
+        """与上一轮做一次数组差分，得到整体和逐单元格的收敛分数
+
+        Returns:
+            (整体收敛分数, 各单元格收敛分数 (n_alt, n_crit))；没有上一轮时
+            返回 (1.0, None)。无可比较评分的单元格为 NaN
+        """
         # 如果没有上一轮，返回 1.0（完全未收敛）
-        if not self._rounds:
-            return 1.0
+        if not self._round_scores:
+            return 1.0, None
 
-        previous_scores = self._rounds[-1].scores
+        previous = self._round_scores[-1].aligned_to(round_scores)
+        change = np.abs(round_scores.values - previous)
+        comparable = ~np.isnan(change)
+        change = np.where(comparable, change, 0.0)
 
-        # 计算评分变化
-        total_change = 0.0
-        count = 0
+        # 平均变化量，归一化到 0-1
+        cell_count = comparable.sum(axis=0)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            cell_scores = np.minimum(change.sum(axis=0) / cell_count / MAX_REASONABLE_CHANGE, 1.0)
 
-        for dm_id, alt_scores in scores.items():
-            if dm_id not in previous_scores:
-                continue
+        count = int(cell_count.sum())
+        if count == 0:
+            return 1.0, cell_scores
 
-            for alt, crit_scores in alt_scores.items():
-                if alt not in previous_scores[dm_id]:
-                    continue
+        avg_change = float(change.sum()) / count
+        return min(avg_change / MAX_REASONABLE_CHANGE, 1.0), cell_scores
 
-                for crit, score in crit_scores.items():
-                    if crit in previous_scores[dm_id][alt]:
-                        prev_score = previous_scores[dm_id][alt][crit]
-                        change = abs(score - prev_score)
-                        total_change += change
-                        count += 1
+    def unconverged_cells(
+        self,
+        threshold: float | None = None
+    ) -> list[tuple[str, str, float]]:
+        """列出最新一轮中未收敛的方案-准则单元格，用于确定追问对象
 
-        if count == 0:
-            return 1.0
+        Args:
+            threshold: 单元格收敛阈值（默认使用 convergence_threshold）
 
-        # 平均变化量，归一化到 0-1
-        # 假设最大合理变化为 50 分
-        avg_change = total_change / count
-        convergence_score = min(avg_change / 50.0, 1.0)
+        Returns:
+            [(alternative, criterion, convergence_score), ...]，按收敛分数降序；
+            只有一轮时返回空列表
+        """
+        if not self._rounds:
+            return []
 
-        return convergence_score
+        if threshold is None:
+            threshold = self.convergence_threshold
+
+        cells = [
+            (alt, crit, score)
+            for alt, crit_scores in self._rounds[-1].cell_convergence.items()
+            for crit, score in crit_scores.items()
+            if score >= threshold
+        ]
+        cells.sort(key=lambda cell: cell[2], reverse=True)
+        return cells
 
     def has_converged(self) -> bool:
         """检查是否已收敛
@@ -320,3 +359,83 @@ class DelphiProcess:
             如果未达到最大轮次数，返回 True
         """
         return len(self._rounds) < self.max_rounds
+
+
+# =============================================================================
+# 轮次评分数组（内部）
+# =============================================================================
+
+@dataclass(frozen=True)
+class _RoundScores:
+    """一轮评分的稠密数组表示
+
+    Attributes:
+        dm_ids: 决策者 ID（第一轴）
+        alternatives: 方案（第二轴）
+        criteria: 准则（第三轴）
+        values: 评分数组 (n_dm, n_alt, n_crit)，缺失为 NaN
+    """
+
+    dm_ids: tuple[str, ...]
+    alternatives: tuple[str, ...]
+    criteria: tuple[str, ...]
+    values: np.ndarray
+
+    @classmethod
+    def from_dict(
+        cls,
+        scores: dict[str, dict[str, dict[str, float]]]
+    ) -> "_RoundScores":
+        """从嵌套字典构建，方案和准则按首次出现的顺序排列"""
+        alternatives: dict[str, None] = {}
+        criteria: dict[str, None] = {}
+        for dm_scores in scores.values():
+            for alt, alt_scores in dm_scores.items():
+                alternatives.setdefault(alt)
+                for crit in alt_scores:
+                    criteria.setdefault(crit)
+
+        nan = float("nan")
+        rows = [
+            [dm_scores.get(alt, {}).get(crit, nan) for crit in criteria]
+            for dm_scores in scores.values()
+            for alt in alternatives
+        ]
+        values = np.array(rows, dtype=np.float64).reshape(
+            len(scores), len(alternatives), len(criteria)
+        )
+        return cls(tuple(scores), tuple(alternatives), tuple(criteria), values)
+
+    def aligned_to(self, other: "_RoundScores") -> np.ndarray:
+        """按另一轮的轴标签重排本轮评分，对方有而本轮没有的位置为 NaN"""
+        if (self.dm_ids, self.alternatives, self.criteria) == (
+            other.dm_ids, other.alternatives, other.criteria
+        ):
+            return self.values
+
+        axes = []
+        for own, target in (
+            (self.dm_ids, other.dm_ids),
+            (self.alternatives, other.alternatives),
+            (self.criteria, other.criteria),
+        ):
+            index = {label: i for i, label in enumerate(own)}
+            positions = np.array([index.get(label, -1) for label in target], dtype=np.int64)
+            axes.append(positions)
+
+        aligned = np.full(other.values.shape, np.nan)
+        found = [np.flatnonzero(positions >= 0) for positions in axes]
+        aligned[np.ix_(*found)] = self.values[np.ix_(*(p[f] for p, f in zip(axes, found)))]
+        return aligned
+
+    def cell_dict(self, cell_values: np.ndarray) -> dict[str, dict[str, float]]:
+        """将 (n_alt, n_crit) 数组转换为字典，跳过 NaN 单元格"""
+        rows = cell_values.tolist()
+        result: dict[str, dict[str, float]] = {}
+        for alt, row in zip(self.alternatives, rows):
+            crit_values = {
+                crit: value for crit, value in zip(self.criteria, row) if value == value
+            }
+            if crit_values:
+                result[alt] = crit_values
+        return result
@@ -5,6 +5,8 @@ MCDA Core - 群决策数据模型
 """
 
 from dataclasses import dataclass, field
+from functools import cached_property
+from operator import itemgetter
 from typing import Literal
 
 
@@ -283,3 +285,66 @@ class GroupDecisionProblem:
             {decision_maker_id: weight}
         """
         return {dm.id: dm.weight for dm in self.decision_makers}
+
+    @cached_property
+    def criterion_names(self) -> tuple[str, ...]:
+        """准则名称（缓存），顺序与 criteria 一致"""
+        return tuple(c.name if hasattr(c, 'name') else str(c) for c in self.criteria)
+
+    @cached_property
+    def score_tensor(self):
+        """个人评分张量（只读，缓存）
+
+        形状为 (n_dm, n_alt, n_crit) 的 float64 数组，各轴顺序分别与
+        decision_makers、alternatives、criteria 一致；缺失的准则评分记为 0。
+        首次访问时构建，聚合计算共享。
+        """
+        import numpy as np
+
+        sparse = self.sparse_score_tensor
+        if not np.isnan(sparse).any():
+            return sparse
+
+        tensor = np.nan_to_num(sparse, nan=0.0)
+        tensor.setflags(write=False)
+        return tensor
+
+    @cached_property
+    def sparse_score_tensor(self):
+        """保留缺失评分的个人评分张量（只读，缓存）
+
+        形状与 score_tensor 相同，缺失的准则评分记为 NaN，供共识度计算
+        排除未评分的决策者；评分完整时与 score_tensor 为同一数组。
+        """
+        import numpy as np
+
+        criterion_names = self.criterion_names
+        getter = itemgetter(*criterion_names)
+        single = len(criterion_names) == 1
+        nan = float("nan")
+
+        rows = []
+        for dm in self.decision_makers:
+            alt_scores = self.individual_scores[dm.id]
+            for alt in self.alternatives:
+                crit_scores = alt_scores[alt]
+                try:
+                    values = getter(crit_scores)
+                except KeyError:
+                    values = tuple(crit_scores.get(crit, nan) for crit in criterion_names)
+                rows.append((values,) if single and not isinstance(values, tuple) else values)
+
+        tensor = np.array(rows, dtype=np.float64).reshape(
+            len(self.decision_makers), len(self.alternatives), len(criterion_names)
+        )
+        tensor.setflags(write=False)
+        return tensor
+
+    @cached_property
+    def decision_maker_weight_vector(self):
+        """决策者权重向量（只读，缓存），形状 (n_dm,)"""
+        import numpy as np
+
+        weights = np.array([dm.weight for dm in self.decision_makers], dtype=np.float64)
+        weights.setflags(write=False)
+        return weights
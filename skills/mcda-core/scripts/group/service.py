@@ -37,6 +37,30 @@ class GroupDecisionService:
         Returns:
             聚合后的评分矩阵 {alternative: {criterion: score}}
         """
+        aggregated = self.aggregate_tensor(problem, method)
+        criterion_names = problem.criterion_names
+
+        return {
+            alt: dict(zip(criterion_names, row))
+            for alt, row in zip(problem.alternatives, aggregated.tolist())
+        }
+
+    def aggregate_tensor(
+        self,
+        problem: GroupDecisionProblem,
+        method: str | None = None
+    ):
+        """聚合个人评分张量为群决策评分矩阵
+
+        直接在 (n_dm, n_alt, n_crit) 评分张量上聚合，不构建嵌套字典。
+
+        Args:
+            problem: 群决策问题
+            method: 聚合方法名称（默认使用配置中的方法）
+
+        Returns:
+            聚合后的评分矩阵 (n_alt, n_crit)，行列顺序与 alternatives、criteria 一致
+        """
         # 确定使用的聚合方法
         if method is None:
             config = problem.aggregation_config
@@ -48,28 +72,17 @@ class GroupDecisionService:
         # 获取聚合方法实例
         aggregation_method = AggregationRegistry.create(method)
 
-        # 获取决策者权重
-        dm_weights = problem.get_decision_maker_weights()
-
-        # 转换评分格式
-        score_matrix: dict[str, dict[str, dict[str, float]]] = {}
-        for alt in problem.alternatives:
-            score_matrix[alt] = {}
-            crit_names = [c.name if hasattr(c, 'name') else str(c) for c in problem.criteria]
-            for crit in crit_names:
-                score_matrix[alt][crit] = {}
-                for dm in problem.decision_makers:
-                    score = problem.individual_scores.get(dm.id, {}).get(alt, {}).get(crit, 0)
-                    score_matrix[alt][crit][dm.id] = score
-
         # 执行聚合
-        return aggregation_method.aggregate_matrix(score_matrix, dm_weights)
+        return aggregation_method.aggregate_tensor(
+            problem.score_tensor, problem.decision_maker_weight_vector
+        )
 
     def compute_consensus(
         self,
         problem: GroupDecisionProblem,
         threshold: float | None = None,
-        method: str = "standard_deviation"
+        method: str = "standard_deviation",
+        distance: str = "euclidean"
     ) -> ConsensusResult:
         """计算群决策共识度
 
@@ -77,6 +90,7 @@ class GroupDecisionService:
             problem: 群决策问题
             threshold: 共识阈值（默认使用配置中的阈值）
             method: 共识度计算方法
+            distance: 决策者距离度量（euclidean/manhattan/cosine）
 
         Returns:
             共识度测量结果
@@ -89,12 +103,14 @@ class GroupDecisionService:
             else:
                 threshold = 0.7
 
-        return self.consensus_measure.compute_consensus(
-            individual_scores=problem.individual_scores,
-            alternatives=problem.alternatives,
-            criteria=problem.criteria,
+        # 使用问题上缓存的评分张量；缺失的准则评分为 NaN，不计入共识度
+        return self.consensus_measure.compute_consensus_tensor(
+            problem.sparse_score_tensor,
+            dm_ids=[dm.id for dm in problem.decision_makers],
+            criterion_names=list(problem.criterion_names),
             threshold=threshold,
-            method=method
+            method=method,
+            distance=distance
         )
 
     def to_decision_problem(
@@ -2,6 +2,7 @@
 区间数（Interval）数据类型
 
 用于处理不确定性和模糊性的 MCDA 分析。
+IntervalMatrix 以上下界两个 float64 数组存放整个区间评分矩阵，供区间算法向量化计算。
 """
 
 from dataclasses import dataclass
@@ -308,3 +309,246 @@ class Interval:
             退化区间对象
         """
         return cls(value, value)
+
+
+@dataclass(frozen=True, eq=False)
+class IntervalMatrix:
+    """区间数矩阵（结构数组）
+
+    用两个连续的 float64 数组分别存放下界和上界，替代逐元素的
+    ``Interval`` 对象数组，区间运算整体向量化完成。精确数视为退化区间
+    （下界等于上界），混合评分无需逐单元格分支。
+
+    Attributes:
+        lower: 下界数组
+        upper: 上界数组（与 lower 形状相同）
+
+    Example:
+        ```python
+        matrix = IntervalMatrix.from_problem(problem)
+
+        weighted = matrix.normalize("vector") * problem.weight_vector
+        closeness = weighted.midpoint  # (n_alt, n_crit) 中点数组
+        ```
+    """
+
+    lower: np.ndarray
+    upper: np.ndarray
+
+    def __post_init__(self):
+        """规整为 float64 数组并验证上下界（使用浮点数容差）"""
+        lower = np.array(self.lower, dtype=np.float64)
+        upper = np.array(self.upper, dtype=np.float64)
+        if lower.shape != upper.shape:
+            raise IntervalError(
+                f"下界与上界形状不一致: lower={lower.shape}, upper={upper.shape}"
+            )
+        if np.any(lower > upper + EPSILON):
+            raise IntervalError("区间下界必须小于等于上界")
+        # 与 Interval 一致：容差范围内 lower 略大于 upper 时调整为相等
+        np.maximum(upper, lower, out=upper)
+
+        object.__setattr__(self, 'lower', lower)
+        object.__setattr__(self, 'upper', upper)
+
+    @classmethod
+    def from_problem(cls, problem) -> "IntervalMatrix":
+        """从决策问题构建 (n_alt, n_crit) 区间矩阵
+
+        复用 DecisionProblem 缓存的评分上下界数组，精确数评分即退化区间。
+
+        Args:
+            problem: 决策问题
+
+        Returns:
+            区间矩阵
+        """
+        lower, upper, _ = problem._score_bounds
+        return cls(lower, upper)
+
+    @classmethod
+    def from_values(cls, values) -> "IntervalMatrix":
+        """从嵌套序列构建区间矩阵
+
+        Args:
+            values: 元素为 Interval 或精确数的嵌套序列
+
+        Returns:
+            区间矩阵
+        """
+        values = np.asarray(values, dtype=object)
+        lower = np.empty(values.shape, dtype=np.float64)
+        upper = np.empty(values.shape, dtype=np.float64)
+        for index, value in np.ndenumerate(values):
+            if isinstance(value, Interval):
+                lower[index], upper[index] = value.lower, value.upper
+            else:
+                lower[index] = upper[index] = float(value)
+        return cls(lower, upper)
+
+    @property
+    def shape(self) -> tuple[int, ...]:
+        """矩阵形状"""
+        return self.lower.shape
+
+    @property
+    def midpoint(self) -> np.ndarray:
+        """逐元素区间中点"""
+        return (self.lower + self.upper) / 2.0
+
+    @property
+    def width(self) -> np.ndarray:
+        """逐元素区间宽度"""
+        return self.upper - self.lower
+
+    def __len__(self) -> int:
+        return len(self.lower)
+
+    def __getitem__(self, index) -> "IntervalMatrix | Interval":
+        """按 NumPy 索引取子矩阵，取到单个元素时返回 Interval"""
+        lower = self.lower[index]
+        upper = self.upper[index]
+        if np.ndim(lower) == 0:
+            return Interval(float(lower), float(upper))
+        return IntervalMatrix(lower, upper)
+
+    def __add__(self, other: "IntervalMatrix | float | np.ndarray") -> "IntervalMatrix":
+        """区间加法，other 可为区间矩阵或可广播的精确数"""
+        if isinstance(other, IntervalMatrix):
+            return IntervalMatrix(self.lower + other.lower, self.upper + other.upper)
+        other = self._as_scalars(other)
+        return IntervalMatrix(self.lower + other, self.upper + other)
+
+    __radd__ = __add__
+
+    def __sub__(self, other: "IntervalMatrix | float | np.ndarray") -> "IntervalMatrix":
+        """区间减法: [a, b] - [c, d] = [a - d, b - c]"""
+        if isinstance(other, IntervalMatrix):
+            return IntervalMatrix(self.lower - other.upper, self.upper - other.lower)
+        other = self._as_scalars(other)
+        return IntervalMatrix(self.lower - other, self.upper - other)
+
+    def __rsub__(self, other: "float | np.ndarray") -> "IntervalMatrix":
+        """精确数减区间: c - [a, b] = [c - b, c - a]（用于成本型方向反转）"""
+        other = self._as_scalars(other)
+        return IntervalMatrix(other - self.upper, other - self.lower)
+
+    def __mul__(self, other: "IntervalMatrix | float | np.ndarray") -> "IntervalMatrix":
+        """区间乘法，other 可为区间矩阵或可广播的精确数（如按列的权重向量）"""
+        if isinstance(other, IntervalMatrix):
+            products = np.stack([
+                self.lower * other.lower,
+                self.lower * other.upper,
+                self.upper * other.lower,
+                self.upper * other.upper,
+            ])
+            return IntervalMatrix(products.min(axis=0), products.max(axis=0))
+
+        other = self._as_scalars(other)
+        low = self.lower * other
+        high = self.upper * other
+        # 负数乘子交换上下界
+        return IntervalMatrix(np.minimum(low, high), np.maximum(low, high))
+
+    __rmul__ = __mul__
+
+    def __truediv__(self, other: "IntervalMatrix | float | np.ndarray") -> "IntervalMatrix":
+        """区间除法
+
+        Raises:
+            IntervalError: 除数为零或除数区间包含零
+        """
+        if isinstance(other, IntervalMatrix):
+            if np.any((other.lower <= 0) & (other.upper >= 0)):
+                raise IntervalError("除数区间不能包含零")
+            return self * IntervalMatrix(1.0 / other.upper, 1.0 / other.lower)
+
+        other = self._as_scalars(other)
+        if np.any(other == 0):
+            raise IntervalError("除数不能为零")
+        low = self.lower / other
+        high = self.upper / other
+        # 负数除数交换上下界
+        return IntervalMatrix(np.minimum(low, high), np.maximum(low, high))
+
+    @staticmethod
+    def where(condition, x: "IntervalMatrix", y: "IntervalMatrix") -> "IntervalMatrix":
+        """按条件逐元素选择（同 np.where）
+
+        Args:
+            condition: 可广播的布尔数组，True 处取 x，否则取 y
+            x: 区间矩阵
+            y: 区间矩阵
+
+        Returns:
+            选择后的区间矩阵
+        """
+        return IntervalMatrix(
+            np.where(condition, x.lower, y.lower),
+            np.where(condition, x.upper, y.upper)
+        )
+
+    @staticmethod
+    def _as_scalars(value) -> np.ndarray:
+        """精确数操作数转换为 float64 数组"""
+        if isinstance(value, Interval):
+            raise TypeError("Interval 操作数需先转换为 IntervalMatrix")
+        return np.asarray(value, dtype=np.float64)
+
+    def sum(self, axis: int | None = None) -> "IntervalMatrix | Interval":
+        """沿轴求和（上下界分别求和），axis 为 None 时返回单个区间"""
+        lower = self.lower.sum(axis=axis)
+        upper = self.upper.sum(axis=axis)
+        if axis is None:
+            return Interval(float(lower), float(upper))
+        return IntervalMatrix(lower, upper)
+
+    def normalize(self, method: str = "vector", epsilon: float = 1e-10) -> "IntervalMatrix":
+        """按列标准化（基于中点确定尺度）
+
+        - ``"vector"``: r_ij = x_ij / sqrt(Σ_i mid(x_ij)²)，范数小于 epsilon 时不缩放
+        - ``"minmax"``: r_ij = (x_ij - min_i mid) / (max_i mid - min_i mid)，
+          列内中点全部相同时标准化为退化区间 [1, 1]
+
+        Args:
+            method: 标准化方法，"vector" 或 "minmax"
+            epsilon: vector 方法的最小范数
+
+        Returns:
+            标准化后的区间矩阵
+
+        Raises:
+            ValueError: 未知的标准化方法
+        """
+        midpoint = self.midpoint
+
+        if method == "vector":
+            norm = np.sqrt(np.sum(midpoint ** 2, axis=0))
+            norm[norm < epsilon] = 1.0  # 避免除零
+            return IntervalMatrix(self.lower / norm, self.upper / norm)
+
+        if method == "minmax":
+            low = midpoint.min(axis=0)
+            span = midpoint.max(axis=0) - low
+            constant = span == 0
+            span[constant] = 1.0
+            lower = (self.lower - low) / span
+            upper = (self.upper - low) / span
+            lower[:, constant] = 1.0
+            upper[:, constant] = 1.0
+            return IntervalMatrix(lower, upper)
+
+        raise ValueError(f"未知的标准化方法: {method}，可选: vector, minmax")
+
+    def to_intervals(self) -> list:
+        """转换为 Interval 对象的嵌套列表（用于元数据输出）"""
+        if self.lower.ndim == 1:
+            return [
+                Interval(lo, hi)
+                for lo, hi in zip(self.lower.tolist(), self.upper.tolist())
+            ]
+        return [self[i].to_intervals() for i in range(len(self))]
+
+    def __repr__(self) -> str:
+        """对象表示"""
+        return f"IntervalMatrix(shape={self.shape})"
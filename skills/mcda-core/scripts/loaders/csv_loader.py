@@ -18,14 +18,35 @@ CSV 格式约定：
 区间数支持两种格式：
 - 逗号分隔：80,90
 - 方括号格式：[80,90]
+
+大文件可使用 load_stream()：逐行解析到预分配的 float64 数组，
+区间数单元格另存于稀疏表中，并可报告读取进度。
 """
 
+import codecs
 import csv
+import io
 from pathlib import Path
-from typing import Any, Union
+from typing import TYPE_CHECKING, Any, Callable, Union
 
 from . import ConfigLoader
 
+if TYPE_CHECKING:
+    from ..interval import Interval
+
+
+ENCODINGS = ('utf-8', 'gbk', 'utf-8-sig')
+"""支持的编码，按尝试顺序"""
+
+ENCODING_SNIFF_BYTES = 64 * 1024
+"""编码检测读取的首块字节数"""
+
+PROGRESS_CELLS = 1 << 16
+"""流式加载时每解析多少个得分单元格报告一次进度"""
+
+ProgressCallback = Callable[[int, int], None]
+"""进度回调: (已读取字节数, 文件总字节数)"""
+
 
 class CSVLoader(ConfigLoader):
     """CSV 配置文件加载器"""
@@ -65,12 +86,11 @@ class CSVLoader(ConfigLoader):
         if not source_path.exists():
             raise FileNotFoundError(f"CSV 文件不存在: {source}")
 
-        # 尝试不同编码
-        encodings = ['utf-8', 'gbk', 'utf-8-sig']
+        # 尝试不同编码（整个文件解码成功才采用）
         content = None
         used_encoding = None
 
-        for encoding in encodings:
+        for encoding in self._candidate_encodings(source_path):
             try:
                 with open(source_path, 'r', encoding=encoding, newline='') as f:
                     content = list(csv.reader(f))
@@ -84,77 +104,26 @@ class CSVLoader(ConfigLoader):
                 f"无法读取 CSV 文件，请确保文件编码为 UTF-8 或 GBK: {source}"
             )
 
-        # 验证基本格式
-        if len(content) < 2:
-            raise ValueError(
-                f"CSV 文件格式错误：至少需要 2 行数据（方案名称行 + 至少 1 个准则行）"
-            )
-
-        # 解析备选方案
-        self.alternatives = content[0]
-        if not self.alternatives:
-            raise ValueError("CSV 文件格式错误：第一行必须包含备选方案名称")
-
-        # 解析准则数据
         self.criteria = []
         self.matrix = []
 
-        for row_idx, row in enumerate(content[1:], start=2):
-            if len(row) < 4:
-                raise ValueError(
-                    f"CSV 文件格式错误：第 {row_idx} 行数据不完整，"
-                    f"期望至少 4 列（准则名称, 权重, 方向, 得分），实际 {len(row)} 列"
-                )
+        rows = iter(content)
+        self.alternatives = self._read_alternatives(rows)
 
-            criterion_name = row[0]
-            weight_str = row[1]
-            direction_str = row[2].lower()
-            scores = row[3:]
-
-            # 验证权重
-            try:
-                weight = float(weight_str)
-                if weight < 0:
-                    raise ValueError(f"权重不能为负数: {weight}")
-            except ValueError as e:
-                raise ValueError(
-                    f"CSV 文件格式错误：第 {row_idx} 行权重值无效 '{weight_str}'"
-                ) from e
-
-            # 解析方向
-            if direction_str not in self.DIRECTION_ALIASES:
-                raise ValueError(
-                    f"CSV 文件格式错误：第 {row_idx} 行方向值无效 '{row[2]}'，"
-                    f"支持的值：higher, lower (或 h, l)"
-                )
-            direction = self.DIRECTION_ALIASES[direction_str]
-
-            # 验证得分数量
-            if len(scores) != len(self.alternatives):
-                raise ValueError(
-                    f"CSV 文件格式错误：第 {row_idx} 行得分数量与备选方案数量不匹配，"
-                    f"期望 {len(self.alternatives)} 个得分，实际 {len(scores)} 个"
-                )
+        for row_idx, row in enumerate(rows, start=2):
+            criterion, scores = self._parse_criterion_row(row, row_idx)
 
             # 解析得分（支持区间数）
             parsed_scores = []
             for alt_idx, score in enumerate(scores, start=1):
-                try:
-                    parsed_score = self._parse_score(score, row_idx, alt_idx)
-                    parsed_scores.append(parsed_score)
-                except ValueError as e:
-                    raise ValueError(
-                        f"CSV 文件格式错误：第 {row_idx} 行第 {alt_idx} 个得分值无效 '{score}'"
-                    ) from e
+                parsed_scores.append(self._parse_score_cell(score, row_idx, alt_idx))
 
             # 添加到结果
-            self.criteria.append({
-                'name': criterion_name,
-                'weight': weight,
-                'direction': direction,
-            })
+            self.criteria.append(criterion)
             self.matrix.append(parsed_scores)
 
+        self._check_has_criteria()
+
         # 构建配置字典
         config = {
             'alternatives': self.alternatives,
@@ -169,6 +138,257 @@ class CSVLoader(ConfigLoader):
 
         return config
 
+    def load_stream(
+        self,
+        source: Union[str, Path],
+        progress: ProgressCallback | None = None,
+    ) -> dict[str, Any]:
+        """
+        流式加载大型 CSV 配置文件
+
+        逐行解析，不保留整个文件内容；纯数值行一次性转换为 float64，
+        含区间数的行逐个单元格解析。内存占用接近得分数组本身大小。
+
+        与 load() 的区别：
+        - 'matrix' 为 (准则数, 方案数) 的 float64 数组，区间数单元格为 NaN
+        - 'intervals' 为区间数稀疏表 {(准则下标, 方案下标): Interval}
+
+        编码先按文件首块检测；读取过程中遇到无法解码的内容时改用下一个
+        候选编码从头重新读取（进度随之重新计数）。
+
+        Args:
+            source: CSV 文件路径
+            progress: 进度回调 progress(已读取字节数, 文件总字节数)
+
+        Returns:
+            解析后的配置字典
+
+        Raises:
+            FileNotFoundError: 文件不存在
+            ValueError: 文件格式错误
+        """
+        source_path = Path(source)
+        if not source_path.exists():
+            raise FileNotFoundError(f"CSV 文件不存在: {source}")
+
+        # 行数上界（换行符计数，减去方案名称行），用于预分配
+        capacity = max(self._count_lines(source_path) - 1, 1)
+
+        for encoding in self._candidate_encodings(source_path):
+            try:
+                return self._load_stream_encoded(source_path, encoding, capacity, progress)
+            except UnicodeDecodeError:
+                continue
+
+        raise ValueError(
+            f"无法读取 CSV 文件，请确保文件编码为 UTF-8 或 GBK: {source}"
+        )
+
+    def _load_stream_encoded(
+        self,
+        source_path: Path,
+        encoding: str,
+        capacity: int,
+        progress: ProgressCallback | None,
+    ) -> dict[str, Any]:
+        """按指定编码流式加载
+
+        Raises:
+            UnicodeDecodeError: 文件内容无法按该编码解码
+            ValueError: 文件格式错误
+        """
+        import numpy as np
+
+        total_bytes = source_path.stat().st_size
+
+        self.criteria = []
+        intervals: dict[tuple[int, int], "Interval"] = {}
+
+        with open(source_path, 'rb') as raw:
+            text = io.TextIOWrapper(raw, encoding=encoding, newline='')
+            reader = csv.reader(text)
+            self.alternatives = self._read_alternatives(reader)
+
+            matrix = np.empty((capacity, len(self.alternatives)), dtype=np.float64)
+            n_rows = 0
+            pending_cells = 0
+
+            for row_idx, row in enumerate(reader, start=2):
+                criterion, scores = self._parse_criterion_row(row, row_idx)
+
+                if n_rows == capacity:
+                    capacity *= 2
+                    matrix = np.resize(matrix, (capacity, len(self.alternatives)))
+
+                self._fill_score_row(matrix[n_rows], intervals, n_rows, scores, row_idx)
+                self.criteria.append(criterion)
+                n_rows += 1
+
+                pending_cells += len(scores)
+                if progress is not None and pending_cells >= PROGRESS_CELLS:
+                    progress(raw.tell(), total_bytes)
+                    pending_cells = 0
+
+        self._check_has_criteria()
+        if progress is not None:
+            progress(total_bytes, total_bytes)
+
+        self.matrix = matrix[:n_rows]
+
+        return {
+            'alternatives': self.alternatives,
+            'criteria': self.criteria,
+            'matrix': self.matrix,
+            'intervals': intervals,
+            'metadata': {
+                'source': str(source_path),
+                'format': 'csv',
+                'encoding': encoding,
+            }
+        }
+
+    def _candidate_encodings(self, source_path: Path) -> list[str]:
+        """按文件首块检测结果排列候选编码
+
+        带 UTF-8 BOM 时 utf-8-sig 优先；否则首块可解码的第一个编码优先。
+        首块只是猜测（非 ASCII 内容可能出现在首块之后），其余编码按
+        ENCODINGS 顺序保留为后备。
+        """
+        with open(source_path, 'rb') as f:
+            head = f.read(ENCODING_SNIFF_BYTES)
+
+        guess = None
+        if head.startswith(codecs.BOM_UTF8):
+            guess = 'utf-8-sig'
+        else:
+            for encoding in ENCODINGS:
+                try:
+                    # 增量解码：首块末尾被截断的多字节字符不视为错误
+                    codecs.getincrementaldecoder(encoding)().decode(head, final=False)
+                    guess = encoding
+                    break
+                except UnicodeDecodeError:
+                    continue
+
+        if guess is None:
+            return list(ENCODINGS)
+        return [guess] + [encoding for encoding in ENCODINGS if encoding != guess]
+
+    def _count_lines(self, source_path: Path) -> int:
+        """按块统计行数（换行符数，末行无换行符时加一）"""
+        count = 0
+        last = b'\n'
+        with open(source_path, 'rb') as f:
+            while block := f.read(1 << 20):
+                count += block.count(b'\n')
+                last = block[-1:]
+        return count + (last != b'\n')
+
+    def _read_alternatives(self, rows) -> list[str]:
+        """读取第一行备选方案名称"""
+        alternatives = next(rows, None)
+        if alternatives is None:
+            raise ValueError(
+                f"CSV 文件格式错误：至少需要 2 行数据（方案名称行 + 至少 1 个准则行）"
+            )
+        if not alternatives:
+            raise ValueError("CSV 文件格式错误：第一行必须包含备选方案名称")
+        return alternatives
+
+    def _check_has_criteria(self) -> None:
+        """验证至少有一个准则行"""
+        if not self.criteria:
+            raise ValueError(
+                f"CSV 文件格式错误：至少需要 2 行数据（方案名称行 + 至少 1 个准则行）"
+            )
+
+    def _parse_criterion_row(
+        self,
+        row: list[str],
+        row_idx: int,
+    ) -> tuple[dict[str, Any], list[str]]:
+        """解析准则行的名称、权重和方向，返回 (准则字典, 得分字符串列表)"""
+        if len(row) < 4:
+            raise ValueError(
+                f"CSV 文件格式错误：第 {row_idx} 行数据不完整，"
+                f"期望至少 4 列（准则名称, 权重, 方向, 得分），实际 {len(row)} 列"
+            )
+
+        criterion_name = row[0]
+        weight_str = row[1]
+        direction_str = row[2].lower()
+        scores = row[3:]
+
+        # 验证权重
+        try:
+            weight = float(weight_str)
+            if weight < 0:
+                raise ValueError(f"权重不能为负数: {weight}")
+        except ValueError as e:
+            raise ValueError(
+                f"CSV 文件格式错误：第 {row_idx} 行权重值无效 '{weight_str}'"
+            ) from e
+
+        # 解析方向
+        if direction_str not in self.DIRECTION_ALIASES:
+            raise ValueError(
+                f"CSV 文件格式错误：第 {row_idx} 行方向值无效 '{row[2]}'，"
+                f"支持的值：higher, lower (或 h, l)"
+            )
+        direction = self.DIRECTION_ALIASES[direction_str]
+
+        # 验证得分数量
+        if len(scores) != len(self.alternatives):
+            raise ValueError(
+                f"CSV 文件格式错误：第 {row_idx} 行得分数量与备选方案数量不匹配，"
+                f"期望 {len(self.alternatives)} 个得分，实际 {len(scores)} 个"
+            )
+
+        criterion = {
+            'name': criterion_name,
+            'weight': weight,
+            'direction': direction,
+        }
+        return criterion, scores
+
+    def _parse_score_cell(self, score: str, row_idx: int, alt_idx: int) -> Any:
+        """解析单个得分单元格，统一错误信息"""
+        try:
+            return self._parse_score(score, row_idx, alt_idx)
+        except ValueError as e:
+            raise ValueError(
+                f"CSV 文件格式错误：第 {row_idx} 行第 {alt_idx} 个得分值无效 '{score}'"
+            ) from e
+
+    def _fill_score_row(
+        self,
+        target,
+        intervals: dict[tuple[int, int], "Interval"],
+        crit_idx: int,
+        scores: list[str],
+        row_idx: int,
+    ) -> None:
+        """将一行得分写入预分配数组的对应行
+
+        快速路径：整行由 NumPy 一次转换为 float64。'+' 开头的值需经过
+        _parse_score 的注入检查，因此含 '+' 或无法整行转换时逐单元格解析，
+        区间数写为 NaN 并记入 intervals。
+        """
+        if '+' not in ''.join(scores):
+            try:
+                target[:] = scores
+                return
+            except ValueError:
+                pass
+
+        for alt_idx, score in enumerate(scores):
+            parsed = self._parse_score_cell(score, row_idx, alt_idx + 1)
+            if isinstance(parsed, float):
+                target[alt_idx] = parsed
+            else:
+                target[alt_idx] = float('nan')
+                intervals[(crit_idx, alt_idx)] = parsed
+
     def _parse_score(self, score_str: str, row_idx: int, col_idx: int) -> Any:
         """
         解析得分值（支持区间数）
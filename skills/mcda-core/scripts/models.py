@@ -5,8 +5,10 @@ MCDA Core - 数据模型定义
 评分范围: 0-100（百分制）
 """
 
+from collections.abc import Iterator, Mapping
 from dataclasses import dataclass, field
 from datetime import datetime
+from functools import cached_property
 from typing import Literal, Any, TYPE_CHECKING
 
 # 类型注解导入
@@ -256,6 +258,55 @@ class AlgorithmConfig:
             raise ValueError("AlgorithmConfig: name 不能为空")
 
 
+@dataclass(frozen=True)
+class ScoreValidation:
+    """评分矩阵验证结果（不可变）
+
+    DecisionProblem 构建时单次向量化验证（完整性、类型、NaN/Inf、范围）的记录，
+    缓存在问题对象上，ValidationService 和算法据此跳过重复验证。
+
+    Attributes:
+        n_alternatives: 备选方案数
+        n_criteria: 准则数
+        lowest: 评分（区间下界）最小值
+        highest: 评分（区间上界）最大值
+        has_interval_scores: 是否包含区间数
+    """
+    n_alternatives: int
+    n_criteria: int
+    lowest: float
+    highest: float
+    has_interval_scores: bool
+
+    def within(self, min_score: float, max_score: float) -> bool:
+        """全部评分是否落在 [min_score, max_score] 内"""
+        return min_score <= self.lowest and self.highest <= max_score
+
+
+class _MatrixScores(Mapping):
+    """由稠密评分矩阵按需构建行字典的只读评分映射
+
+    with_score_matrix() 使用：抽样得到的问题通常只经由 score_matrix 计算，
+    不再为每个样本预先构建完整的 {方案: {准则: 评分}} 嵌套字典。
+    """
+
+    __slots__ = ("_matrix", "_index", "_crit_names")
+
+    def __init__(self, matrix, index: dict[str, int], crit_names: tuple[str, ...]):
+        self._matrix = matrix
+        self._index = index
+        self._crit_names = crit_names
+
+    def __getitem__(self, alt: str) -> dict[str, float]:
+        return dict(zip(self._crit_names, self._matrix[self._index[alt]].tolist()))
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._index)
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+
 @dataclass(frozen=True)
 class DecisionProblem:
     """决策问题（不可变）
@@ -270,6 +321,8 @@ class DecisionProblem:
         data_source: 数据源配置（可选）
         raw_data: 原始数据（可选，用于评分计算）
         score_range: 评分范围，默认 (0.0, 100.0)
+        trusted: 可信构建（默认 False）。内部由已验证问题派生时传入 True，
+            跳过评分矩阵验证，仅保留数量与评分范围等结构检查
 
     Example:
         ```python
@@ -295,6 +348,7 @@ class DecisionProblem:
     data_source: DataSource | None = None
     raw_data: dict | None = None
     score_range: ScoreRange = (0.0, 100.0)
+    trusted: bool = field(default=False, repr=False, compare=False)
 
     def __post_init__(self):
         """验证数据一致性"""
@@ -308,61 +362,295 @@ class DecisionProblem:
         if min_score >= max_score:
             raise ValueError(f"DecisionProblem: score_range 无效 ({min_score}, {max_score})")
 
-        # 验证评分矩阵（如果提供）
-        if self.scores:
-            self._validate_score_matrix()
+        # 验证评分矩阵（如果提供），结果缓存在 validation 上
+        if self.scores and not self.trusted:
+            _ = self.validation
+
+    @cached_property
+    def validation(self) -> ScoreValidation:
+        """评分矩阵验证结果（缓存）
+
+        构建时已验证的问题直接返回缓存结果；可信构建的问题在首次访问时验证。
+
+        Raises:
+            ValueError: 评分缺失、类型无效、非有限值或超出评分范围
+        """
+        self._validate_score_matrix()
+        lower, upper, interval_mask = self._score_bounds
+        return ScoreValidation(
+            n_alternatives=len(self.alternatives),
+            n_criteria=len(self.criteria),
+            lowest=float(lower.min()),
+            highest=float(upper.max()),
+            has_interval_scores=bool(interval_mask.any()),
+        )
+
+    @property
+    def is_validated(self) -> bool:
+        """评分矩阵是否已验证（或为可信构建），下游可据此跳过重复验证"""
+        return self.trusted or "validation" in self.__dict__
+
+    def find_score_outside(self, min_score: float, max_score: float) -> tuple[str, str] | None:
+        """查找第一个超出 [min_score, max_score] 或非有限的评分单元格
+
+        在缓存的上下界数组上向量化判断，按行优先顺序返回第一个越界单元格。
+
+        Args:
+            min_score: 下限
+            max_score: 上限
+
+        Returns:
+            (方案, 准则名) 元组，全部在范围内时为 None
+
+        Raises:
+            ValueError: 评分缺失或类型无效
+        """
+        import numpy as np
+
+        lower, upper, _ = self._score_bounds
+
+        # 区间满足 lower <= upper，因此只需检查下界不低于 min、上界不高于 max
+        # NaN 参与比较恒为 False，同样会被判定为越界
+        outside = ~(
+            (lower >= min_score) & (upper <= max_score)
+            & np.isfinite(lower) & np.isfinite(upper)
+        )
+        if not outside.any():
+            return None
+
+        i, j = divmod(int(np.flatnonzero(outside)[0]), len(self.criteria))
+        return self.alternatives[i], self.criteria[j].name
 
     def _validate_score_matrix(self):
-        """验证评分矩阵的完整性和有效性"""
+        """验证评分矩阵的完整性和有效性
+
+        完整性与类型在构建上下界数组时逐格检查（仅遍历一次嵌套字典），
+        NaN/Inf 与范围检查在数组上向量化完成。构建好的数组会被缓存供算法复用，
+        验证结果记录在 validation 上。
+        """
+        import math
+
         min_score, max_score = self.score_range
+        cell = self.find_score_outside(min_score, max_score)
+        if cell is None:
+            return
+
+        alt, crit_name = cell
+        score = self.scores[alt][crit_name]
+
+        def reason(value: float) -> str:
+            if not math.isfinite(value):
+                return "不是有限数值"
+            return f"超出范围 [{min_score}, {max_score}]"
+
+        if isinstance(score, (int, float)):
+            raise ValueError(
+                f"DecisionProblem: 方案 '{alt}' 在准则 '{crit_name}' 的评分 {score} {reason(score)}"
+            )
+        if not (math.isfinite(score.lower) and min_score <= score.lower <= max_score):
+            raise ValueError(
+                f"DecisionProblem: 方案 '{alt}' 在准则 '{crit_name}' 的区间下界 "
+                f"{score.lower} {reason(score.lower)}"
+            )
+        raise ValueError(
+            f"DecisionProblem: 方案 '{alt}' 在准则 '{crit_name}' 的区间上界 "
+            f"{score.upper} {reason(score.upper)}"
+        )
+
+    @cached_property
+    def _score_bounds(self):
+        """评分上下界数组（内部缓存）
+
+        单次遍历 scores 字典，构建 (n_alt, n_crit) 的 float64 下界/上界数组。
+        精确数的上下界相同；区间数分别取 lower/upper。
+
+        Returns:
+            (lower, upper, interval_mask) 三元组，均为只读数组
+
+        Raises:
+            ValueError: 评分缺失或类型无效
+        """
+        import numpy as np
 
         # 延迟导入 Interval（避免循环导入）
         try:
-            # 尝试相对导入
             from .interval import Interval
-            IntervalType = (int, float, Interval)
         except ImportError:
-            # 回退到仅数值类型
-            IntervalType = (int, float)
+            Interval = None
+
+        if not self.scores:
+            raise ValueError("DecisionProblem: 未提供评分矩阵")
 
-        for alt in self.alternatives:
+        crisp_types = (int, float)
+        crit_names = [crit.name for crit in self.criteria]
+        n_alt, n_crit = len(self.alternatives), len(crit_names)
+
+        lower = np.empty((n_alt, n_crit), dtype=np.float64)
+        upper = np.empty((n_alt, n_crit), dtype=np.float64)
+        interval_mask = np.zeros((n_alt, n_crit), dtype=bool)
+
+        for i, alt in enumerate(self.alternatives):
             if alt not in self.scores:
                 raise ValueError(f"DecisionProblem: 缺少方案 '{alt}' 的评分")
-            if not isinstance(self.scores[alt], dict):
+            alt_scores = self.scores[alt]
+            if not isinstance(alt_scores, dict):
                 raise ValueError(f"DecisionProblem: 方案 '{alt}' 的评分必须是字典")
 
-            for crit in self.criteria:
-                if crit.name not in self.scores[alt]:
-                    raise ValueError(f"DecisionProblem: 缺少方案 '{alt}' 在准则 '{crit.name}' 的评分")
-
-                score = self.scores[alt][crit.name]
-
-                # 验证评分类型（支持精确数和区间数）
-                if not isinstance(score, IntervalType):
+            try:
+                row = [alt_scores[name] for name in crit_names]
+            except KeyError as e:
+                raise ValueError(
+                    f"DecisionProblem: 缺少方案 '{alt}' 在准则 '{e.args[0]}' 的评分"
+                ) from None
+
+            # 快速路径：整行都是精确数
+            if all(isinstance(score, crisp_types) for score in row):
+                lower[i] = row
+                continue
+
+            for j, score in enumerate(row):
+                if isinstance(score, crisp_types):
+                    lower[i, j] = score
+                elif Interval is not None and isinstance(score, Interval):
+                    lower[i, j] = score.lower
+                    upper[i, j] = score.upper
+                    interval_mask[i, j] = True
+                else:
                     raise ValueError(
                         f"DecisionProblem: 评分必须是数值类型或区间类型，当前: {type(score)}"
                     )
 
-                # 验证评分范围
-                if isinstance(score, (int, float)):
-                    # 精确数验证
-                    if not (min_score <= score <= max_score):
-                        raise ValueError(
-                            f"DecisionProblem: 方案 '{alt}' 在准则 '{crit.name}' 的评分 {score} "
-                            f"超出范围 [{min_score}, {max_score}]"
-                        )
-                elif isinstance(score, Interval):
-                    # 区间数验证
-                    if not (min_score <= score.lower <= max_score):
-                        raise ValueError(
-                            f"DecisionProblem: 方案 '{alt}' 在准则 '{crit.name}' 的区间下界 {score.lower} "
-                            f"超出范围 [{min_score}, {max_score}]"
-                        )
-                    if not (min_score <= score.upper <= max_score):
-                        raise ValueError(
-                            f"DecisionProblem: 方案 '{alt}' 在准则 '{crit.name}' 的区间上界 {score.upper} "
-                            f"超出范围 [{min_score}, {max_score}]"
-                        )
+        # 精确数单元格的上界等于下界
+        np.copyto(upper, lower, where=~interval_mask)
+
+        for arr in (lower, upper, interval_mask):
+            arr.setflags(write=False)
+        return lower, upper, interval_mask
+
+    @property
+    def has_interval_scores(self) -> bool:
+        """评分矩阵中是否包含区间数"""
+        return bool(self._score_bounds[2].any())
+
+    @cached_property
+    def score_matrix(self):
+        """稠密评分矩阵（只读，缓存）
+
+        形状为 (n_alt, n_crit) 的 float64 数组，行顺序与 alternatives 一致，
+        列顺序与 criteria 一致。首次访问时构建，之后所有算法共享。
+
+        Raises:
+            ValueError: 未提供评分，或评分中包含区间数
+        """
+        lower, _, interval_mask = self._score_bounds
+        if interval_mask.any():
+            raise ValueError("DecisionProblem: 评分矩阵包含区间数，无法构建精确数矩阵")
+        return lower
+
+    @cached_property
+    def _score_labels(self) -> tuple[dict[str, int], tuple[str, ...]]:
+        """({方案: 行下标}, 准则名元组)（内部缓存）"""
+        alt_index = {alt: i for i, alt in enumerate(self.alternatives)}
+        return alt_index, tuple(crit.name for crit in self.criteria)
+
+    @cached_property
+    def weight_vector(self):
+        """权重向量（只读，缓存），形状 (n_crit,)"""
+        import numpy as np
+
+        weights = np.array([crit.weight for crit in self.criteria], dtype=np.float64)
+        weights.setflags(write=False)
+        return weights
+
+    @cached_property
+    def direction_mask(self):
+        """方向掩码（只读，缓存），形状 (n_crit,)
+
+        True 表示 lower_better（成本型），False 表示 higher_better（效益型）。
+        """
+        import numpy as np
+
+        mask = np.array(
+            [crit.direction == "lower_better" for crit in self.criteria],
+            dtype=bool
+        )
+        mask.setflags(write=False)
+        return mask
+
+    def with_weights(self, weights) -> "DecisionProblem":
+        """创建仅权重不同的决策问题副本
+
+        新问题的准则按给定权重替换（准则本身仍会校验权重范围），
+        评分矩阵不会重新校验，已缓存的稠密数组和验证结果直接共享。
+
+        Args:
+            weights: 新权重序列，长度与 criteria 一致
+
+        Returns:
+            新的 DecisionProblem
+
+        Raises:
+            ValueError: 权重数量与准则数量不一致，或权重超出范围
+        """
+        import copy
+        from dataclasses import replace
+
+        if len(weights) != len(self.criteria):
+            raise ValueError(
+                f"DecisionProblem: 权重数量 ({len(weights)}) 与准则数量 ({len(self.criteria)}) 不一致"
+            )
+
+        criteria = tuple(
+            replace(crit, weight=float(weight))
+            for crit, weight in zip(self.criteria, weights)
+        )
+
+        # 浅拷贝保留 __dict__ 中已缓存的评分数组，且不触发 __post_init__
+        clone = copy.copy(self)
+        object.__setattr__(clone, "criteria", criteria)
+        clone.__dict__.pop("weight_vector", None)
+        return clone
+
+    def with_score_matrix(self, matrix) -> "DecisionProblem":
+        """创建仅评分不同的精确数决策问题副本
+
+        用于从区间评分中抽样得到的精确数矩阵（调用方保证取值在评分范围内），
+        新副本为可信构建，不重新校验评分，直接缓存该矩阵作为 score_matrix；
+        其 scores 为只读映射，访问某一方案时才由矩阵行构建评分字典。
+
+        Args:
+            matrix: (n_alt, n_crit) 评分矩阵，行列顺序与 alternatives/criteria 一致
+
+        Returns:
+            新的 DecisionProblem
+
+        Raises:
+            ValueError: 矩阵形状与方案/准则数量不一致
+        """
+        import copy
+        import numpy as np
+
+        matrix = np.array(matrix, dtype=np.float64)
+        expected = (len(self.alternatives), len(self.criteria))
+        if matrix.shape != expected:
+            raise ValueError(
+                f"DecisionProblem: 评分矩阵形状 {matrix.shape} 与方案/准则数量 {expected} 不一致"
+            )
+        matrix.setflags(write=False)
+
+        # 评分字典按需构建，方案下标和准则名在所有副本间共享
+        alt_index, crit_names = self._score_labels
+        scores = _MatrixScores(matrix, alt_index, crit_names)
+
+        clone = copy.copy(self)
+        object.__setattr__(clone, "scores", scores)
+        object.__setattr__(clone, "trusted", True)
+        clone.__dict__.pop("validation", None)
+        interval_mask = np.zeros(expected, dtype=bool)
+        interval_mask.setflags(write=False)
+        clone.__dict__["_score_bounds"] = (matrix, matrix, interval_mask)
+        clone.__dict__["score_matrix"] = matrix
+        return clone
 
 
 @dataclass(frozen=True)
@@ -520,6 +808,35 @@ class SensitivityAnalysisResult:
     perturbation_results: tuple["SensitivityResult", ...]
 
 
+@dataclass(frozen=True)
+class SMAAResult:
+    """随机多准则可接受性分析（SMAA）结果
+
+    Attributes:
+        n_samples: 已评估的权重样本数
+        rank_acceptability: 排名可接受性指标 {alternative: (b^1, b^2, ..., b^n)}，
+            b^r 为方案获得第 r 名的样本比例
+        central_weights: 中心权重向量 {alternative: {criterion: weight}}，
+            方案从未排第一时为 None
+        confidence_factors: 置信因子 {alternative: p^c}，
+            方案没有中心权重时为 None
+    """
+    n_samples: int
+    rank_acceptability: dict[str, tuple[float, ...]]
+    central_weights: dict[str, dict[str, float] | None]
+    confidence_factors: dict[str, float | None] = field(default_factory=dict)
+
+    def __post_init__(self):
+        """验证参数有效性"""
+        if self.n_samples < 0:
+            raise ValueError(f"SMAAResult: n_samples ({self.n_samples}) 不能为负数")
+
+    @property
+    def first_rank_acceptability(self) -> dict[str, float]:
+        """第一名可接受性 {alternative: b^1}（便捷属性）"""
+        return {alt: values[0] for alt, values in self.rank_acceptability.items()}
+
+
 @dataclass
 class DecisionResult:
     """决策结果
@@ -601,6 +918,7 @@ __all__ = [
     # 核心模型
     "Criterion",
     "AlgorithmConfig",
+    "ScoreValidation",
     "DecisionProblem",
     "RankingItem",
     "ResultMetadata",
@@ -608,6 +926,7 @@ __all__ = [
     "SensitivityResult",
     "CriticalCriterion",
     "SensitivityAnalysisResult",
+    "SMAAResult",
     "DecisionResult",
     # 标准化
     "NormalizationConfig",
@@ -0,0 +1,357 @@
+"""
+MCDA Core - 阶段计时与内存插桩
+
+按需启用的插桩接口：在 profile() 上下文中，工作流各阶段（加载、验证、约束、
+分析、敏感性分析、报告）及算法内部阶段（矩阵构建、标准化、两两比较、排序）
+通过 stage() 记录墙钟时间、CPU 时间和 tracemalloc 峰值内存。
+
+未启用时 stage() 只做一次上下文变量查询，不计时也不跟踪内存。启用内存跟踪时
+tracemalloc 会明显拖慢分配密集的阶段（如 YAML 解析），只关心耗时可传入
+trace_memory=False。同名阶段（如敏感性分析中重复执行的算法阶段）按名称汇总。
+
+tracemalloc 是进程级的：多个线程同时启用内存跟踪时，tracemalloc 的启停按
+引用计数管理，峰值重置在模块锁内进行，重置前的区间峰值会累计到所有活动
+收集器的进行中阶段。因此并发时各阶段的峰值内存（以及 CPU 时间）包含同一
+进程中其他线程的分配，只能作为上界参考。
+
+Example:
+    ```python
+    with profile() as profiler:
+        result = orchestrator.run_workflow("config.yaml")
+
+    print(profiler.format())
+    ```
+
+    或注册钩子，在每个阶段结束时接收计时:
+
+    ```python
+    with profile(hooks=[lambda timing: log.info(timing.to_dict())]):
+        ...
+    ```
+"""
+
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager, nullcontext
+from contextvars import ContextVar
+from dataclasses import dataclass, replace
+from typing import TYPE_CHECKING, Any, Callable, ContextManager, Iterable, Iterator
+
+if TYPE_CHECKING:
+    from .models import DecisionResult
+
+
+@dataclass(frozen=True)
+class StageTiming:
+    """单个阶段的计时
+
+    Attributes:
+        name: 阶段名称，嵌套阶段以 "/" 连接（如 "analyze/normalization"）
+        depth: 嵌套深度（顶层为 0）
+        wall_time: 墙钟时间（秒）
+        cpu_time: 当前进程 CPU 时间（秒）
+        peak_memory_mb: 阶段内相对阶段开始时的峰值内存分配（MB），未跟踪内存时为 None
+        calls: 执行次数（汇总后，时间为各次之和，峰值内存为各次最大值）
+    """
+    name: str
+    depth: int
+    wall_time: float
+    cpu_time: float
+    peak_memory_mb: float | None = None
+    calls: int = 1
+
+    def merge(self, other: "StageTiming") -> "StageTiming":
+        """与同名阶段的另一次执行合并"""
+        peaks = [p for p in (self.peak_memory_mb, other.peak_memory_mb) if p is not None]
+        return replace(
+            self,
+            wall_time=self.wall_time + other.wall_time,
+            cpu_time=self.cpu_time + other.cpu_time,
+            peak_memory_mb=max(peaks) if peaks else None,
+            calls=self.calls + other.calls,
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        """转换为可 JSON 序列化的字典"""
+        return {
+            "name": self.name,
+            "depth": self.depth,
+            "wall_time": self.wall_time,
+            "cpu_time": self.cpu_time,
+            "peak_memory_mb": self.peak_memory_mb,
+            "calls": self.calls,
+        }
+
+
+StageHook = Callable[[StageTiming], None]
+
+# tracemalloc 为进程级状态：启停、读取与重置峰值均在此锁内进行
+_tracemalloc_lock = threading.RLock()
+
+# 通过 profile() 启用内存跟踪的活动收集器
+_memory_profilers: list["StageProfiler"] = []
+
+# tracemalloc 是否由 profile() 启动（由最后一个退出的收集器停止）
+_owns_tracing = False
+
+
+class _OpenStage:
+    """进行中的阶段"""
+
+    __slots__ = ("name", "wall_start", "cpu_start", "memory_start", "memory_peak")
+
+    def __init__(self, name: str, memory_current: int):
+        self.name = name
+        self.memory_start = memory_current
+        self.memory_peak = memory_current
+        self.wall_start = time.perf_counter()
+        self.cpu_start = time.process_time()
+
+
+class StageProfiler:
+    """阶段计时收集器
+
+    阶段按结束顺序记录（子阶段先于父阶段）。峰值内存通过在每个阶段边界
+    重置 tracemalloc 峰值、并把区间峰值累计到所有进行中的阶段得到，
+    因此嵌套阶段的峰值互不干扰。
+
+    Attributes:
+        trace_memory: 是否跟踪峰值内存
+        stages: 已结束的阶段计时（每次执行一条）
+    """
+
+    def __init__(self, trace_memory: bool = True, hooks: Iterable[StageHook] = ()):
+        """初始化
+
+        Args:
+            trace_memory: 是否使用 tracemalloc 跟踪峰值内存（有额外开销）
+            hooks: 阶段结束时调用的钩子
+        """
+        self.trace_memory = trace_memory
+        self.stages: list[StageTiming] = []
+        self._hooks: list[StageHook] = list(hooks)
+        self._open: list[_OpenStage] = []
+
+    def add_hook(self, hook: StageHook) -> None:
+        """注册阶段结束钩子"""
+        self._hooks.append(hook)
+
+    def remove_hook(self, hook: StageHook) -> None:
+        """注销阶段结束钩子"""
+        self._hooks.remove(hook)
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        """记录一个阶段（可嵌套）
+
+        Args:
+            name: 阶段名称
+        """
+        if self._open:
+            name = f"{self._open[-1].name}/{name}"
+
+        with self._memory_lock():
+            opened = _OpenStage(name, self._memory_checkpoint())
+            self._open.append(opened)
+        try:
+            yield
+        finally:
+            wall_time = time.perf_counter() - opened.wall_start
+            cpu_time = time.process_time() - opened.cpu_start
+            with self._memory_lock():
+                self._memory_checkpoint()
+                self._open.pop()
+
+            peak_memory_mb = None
+            if self._tracing:
+                peak_memory_mb = (opened.memory_peak - opened.memory_start) / 1024 / 1024
+
+            timing = StageTiming(
+                name=name,
+                depth=len(self._open),
+                wall_time=wall_time,
+                cpu_time=cpu_time,
+                peak_memory_mb=peak_memory_mb,
+            )
+            self.stages.append(timing)
+            for hook in self._hooks:
+                hook(timing)
+
+    @property
+    def _tracing(self) -> bool:
+        return self.trace_memory and tracemalloc.is_tracing()
+
+    def _memory_lock(self) -> ContextManager[Any]:
+        """跟踪内存时返回模块锁，否则为空操作"""
+        return _tracemalloc_lock if self._tracing else _NULL_STAGE
+
+    def _memory_checkpoint(self) -> int:
+        """把上一区间的峰值累计到进行中的阶段，重置峰值并返回当前分配量
+
+        峰值为进程级，重置前同样累计到其他活动收集器的进行中阶段，
+        避免并发时一个收集器的重置抹掉另一个收集器的峰值。调用方需持有
+        _tracemalloc_lock。
+        """
+        if not self._tracing:
+            return 0
+
+        current, peak = tracemalloc.get_traced_memory()
+        profilers = _memory_profilers if self in _memory_profilers else [*_memory_profilers, self]
+        for profiler in profilers:
+            for opened in profiler._open:
+                opened.memory_peak = max(opened.memory_peak, peak)
+        tracemalloc.reset_peak()
+        return current
+
+    def summary(self) -> list[StageTiming]:
+        """按阶段名称汇总，父阶段在前、子阶段在后（先序）"""
+        merged: dict[str, StageTiming] = {}
+        for timing in self.stages:
+            previous = merged.get(timing.name)
+            merged[timing.name] = timing if previous is None else previous.merge(timing)
+
+        children: dict[str, list[StageTiming]] = {}
+        roots = []
+        for timing in merged.values():
+            parent = timing.name.rpartition("/")[0]
+            if parent in merged:
+                children.setdefault(parent, []).append(timing)
+            else:
+                roots.append(timing)
+
+        # 同级阶段顺序执行，按结束顺序即开始顺序
+        ordered: list[StageTiming] = []
+
+        def visit(timing: StageTiming) -> None:
+            ordered.append(timing)
+            for child in children.get(timing.name, ()):
+                visit(child)
+
+        for timing in roots:
+            visit(timing)
+        return ordered
+
+    def to_dict(self) -> dict[str, Any]:
+        """转换为可 JSON 序列化的字典
+
+        Returns:
+            {"total_wall_time": 顶层阶段墙钟时间之和, "stages": [汇总后的阶段计时, ...]}
+        """
+        return {
+            "total_wall_time": sum(s.wall_time for s in self.stages if s.depth == 0),
+            "stages": [timing.to_dict() for timing in self.summary()],
+        }
+
+    def format(self) -> str:
+        """格式化为阶段计时表"""
+        return format_timings(self.to_dict())
+
+
+_active_profiler: ContextVar[StageProfiler | None] = ContextVar(
+    "mcda_active_profiler", default=None
+)
+
+_NULL_STAGE = nullcontext()
+
+
+@contextmanager
+def profile(
+    trace_memory: bool = True,
+    hooks: Iterable[StageHook] = ()
+) -> Iterator[StageProfiler]:
+    """在当前上下文中启用阶段插桩
+
+    可在多个线程中同时使用；内存跟踪的并发语义见模块说明。
+
+    Args:
+        trace_memory: 是否跟踪峰值内存（未在跟踪时临时启动 tracemalloc，
+            最后一个退出的收集器负责停止）
+        hooks: 阶段结束时调用的钩子
+
+    Yields:
+        StageProfiler
+    """
+    global _owns_tracing
+
+    profiler = StageProfiler(trace_memory=trace_memory, hooks=hooks)
+
+    if trace_memory:
+        with _tracemalloc_lock:
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+                _owns_tracing = True
+            _memory_profilers.append(profiler)
+
+    token = _active_profiler.set(profiler)
+    try:
+        yield profiler
+    finally:
+        _active_profiler.reset(token)
+        if trace_memory:
+            with _tracemalloc_lock:
+                _memory_profilers.remove(profiler)
+                if not _memory_profilers and _owns_tracing:
+                    tracemalloc.stop()
+                    _owns_tracing = False
+
+
+def current_profiler() -> StageProfiler | None:
+    """当前上下文中启用的阶段插桩（未启用时为 None）"""
+    return _active_profiler.get()
+
+
+def stage(name: str) -> ContextManager[None]:
+    """记录一个阶段；未启用插桩时为空操作
+
+    Args:
+        name: 阶段名称
+    """
+    profiler = _active_profiler.get()
+    if profiler is None:
+        return _NULL_STAGE
+    return profiler.stage(name)
+
+
+def attach_timings(result: "DecisionResult", profiler: StageProfiler) -> "DecisionResult":
+    """返回在 metadata.metrics["timings"] 中附带阶段计时的结果副本
+
+    结果可能来自结果缓存，因此不修改原对象。
+
+    Args:
+        result: 决策结果
+        profiler: 阶段计时收集器
+
+    Returns:
+        新的决策结果
+    """
+    metrics = {**result.metadata.metrics, "timings": profiler.to_dict()}
+    return replace(result, metadata=replace(result.metadata, metrics=metrics))
+
+
+def format_timings(timings: dict[str, Any]) -> str:
+    """将 StageProfiler.to_dict() 的结果格式化为阶段计时表
+
+    子阶段缩进显示在父阶段之下，执行多次的阶段标注次数。
+
+    Args:
+        timings: 阶段计时字典
+
+    Returns:
+        多行文本
+    """
+    lines = [f"{'阶段':<30} {'墙钟时间':>12} {'CPU 时间':>12} {'峰值内存':>12}"]
+
+    for item in timings["stages"]:
+        label = "  " * item["depth"] + item["name"].rsplit("/", 1)[-1]
+        if item["calls"] > 1:
+            label += f" ×{item['calls']}"
+        memory = item["peak_memory_mb"]
+        memory_text = f"{memory:.3f}MB" if memory is not None else "-"
+        lines.append(
+            f"{label:<32} {item['wall_time'] * 1000:>10.3f}ms "
+            f"{item['cpu_time'] * 1000:>10.3f}ms {memory_text:>12}"
+        )
+
+    lines.append(f"{'合计':<30} {timings['total_wall_time'] * 1000:>10.3f}ms")
+    return "\n".join(lines)
@@ -1,9 +1,25 @@
 """
 MCDA Core - 排序模块
 
-提供多种排序策略，用于处理区间数和其他复杂类型的排序。
+提供多种排序策略，用于处理区间数和其他复杂类型的排序，以及比较排名一致程度的指标。
 """
 
 from mcda_core.ranking.possibility_degree import PossibilityDegree
+from mcda_core.ranking.metrics import (
+    kendall_matrix,
+    kendall_tau,
+    rank_biased_overlap,
+    spearman,
+    spearman_matrix,
+    top_k_overlap,
+)
 
-__all__ = ["PossibilityDegree"]
+__all__ = [
+    "PossibilityDegree",
+    "kendall_tau",
+    "kendall_matrix",
+    "spearman",
+    "spearman_matrix",
+    "top_k_overlap",
+    "rank_biased_overlap",
+]
@@ -0,0 +1,318 @@
+"""
+MCDA Core - 排名比较指标 (Ranking Metrics)
+
+比较两个（或多个）排名向量的一致程度。排名向量按方案顺序给出每个方案的名次
+（数值越小越靠前），可以是 0-based 或 1-based 整数，也允许并列名次。
+
+提供的指标:
+    - ``kendall_tau``: Kendall τ-b（考虑并列），基于归并排序统计逆序对，O(n log n)
+    - ``spearman``: Spearman ρ（并列取平均名次后的 Pearson 相关），O(n log n)
+    - ``top_k_overlap``: 前 k 名的重合比例
+    - ``rank_biased_overlap``: 秩偏重叠 RBO (Webber et al., 2010)，越靠前权重越大
+
+``kendall_matrix`` / ``spearman_matrix`` 对 (k, n) 排名矩阵计算 (k, k) 相关矩阵。
+某个排名所有名次并列时相关系数无定义：Kendall τ-b 返回 NaN；Spearman ρ 在
+两个排名都完全并列（即平均名次相同）时返回 1，只有一个完全并列时返回 0，
+与 1 - 6Σd²/(n(n² - 1)) 在这两种情况下的取值一致。
+"""
+
+import numpy as np
+from numpy.typing import ArrayLike, NDArray
+
+
+# =============================================================================
+# 相关系数
+# =============================================================================
+
+def kendall_tau(ranking1: ArrayLike, ranking2: ArrayLike) -> float:
+    """计算 Kendall τ-b 相关系数（考虑并列）
+
+    τ_b = (n_c - n_d) / sqrt((n_0 - n_1)(n_0 - n_2))
+
+    其中 n_0 = n(n-1)/2，n_1、n_2 分别为两个排名中的并列对数。先按
+    (ranking1, ranking2) 排序，不一致对数即 ranking2 在该顺序下的逆序对数，
+    由归并排序统计 (Knight, 1966)。
+
+    Args:
+        ranking1: 第一个排名向量
+        ranking2: 第二个排名向量
+
+    Returns:
+        Kendall τ-b (范围 [-1, 1])；任一排名完全并列时为 NaN
+
+    Raises:
+        ValueError: 排名不是一维数组或长度不一致
+    """
+    x, y = _check_pair(ranking1, ranking2)
+    n = len(x)
+
+    order = np.lexsort((y, x))
+    x, y = x[order], y[order]
+
+    sorted_y = np.sort(y)
+    x_equal = x[1:] == x[:-1]
+
+    total_pairs = n * (n - 1) // 2
+    x_ties = _tied_pairs(x_equal)
+    y_ties = _tied_pairs(sorted_y[1:] == sorted_y[:-1])
+    joint_ties = _tied_pairs(x_equal & (y[1:] == y[:-1]))
+    discordant = _count_inversions(y)
+
+    denominator = (total_pairs - x_ties) * (total_pairs - y_ties)
+    if denominator == 0:
+        return float("nan")
+
+    numerator = total_pairs - x_ties - y_ties + joint_ties - 2 * discordant
+    return float(numerator / np.sqrt(float(denominator)))
+
+
+def spearman(ranking1: ArrayLike, ranking2: ArrayLike) -> float:
+    """计算 Spearman ρ 相关系数
+
+    并列名次取平均名次后计算 Pearson 相关；无并列时等价于
+    ρ = 1 - 6Σd² / (n(n² - 1))。
+
+    Args:
+        ranking1: 第一个排名向量
+        ranking2: 第二个排名向量
+
+    Returns:
+        Spearman ρ (范围 [-1, 1])；两个排名都完全并列时为 1，只有一个完全
+        并列时为 0
+
+    Raises:
+        ValueError: 排名不是一维数组或长度不一致
+    """
+    x, y = _check_pair(ranking1, ranking2)
+    return float(spearman_matrix(np.vstack([x, y]))[0, 1])
+
+
+def spearman_matrix(rank_matrix: ArrayLike) -> NDArray[np.float64]:
+    """计算 (k, n) 排名矩阵各行之间的 Spearman 相关矩阵
+
+    每行转换为平均名次并标准化后，一次矩阵乘法得到全部相关系数。完全并列
+    的行与自身及其他完全并列的行相关系数为 1，与其余行为 0。
+
+    Args:
+        rank_matrix: (k, n) 排名矩阵，每行一个排名
+
+    Returns:
+        (k, k) 相关矩阵
+
+    Raises:
+        ValueError: 输入不是二维数组
+    """
+    ranks = _as_rank_matrix(rank_matrix)
+
+    centered = np.vstack([_average_ranks(row) for row in ranks])
+    centered -= centered.mean(axis=1, keepdims=True)
+    norms = np.sqrt(np.einsum("ij,ij->i", centered, centered))
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        standardized = centered / norms[:, None]
+        matrix = standardized @ standardized.T
+
+    # 完全并列的行方差为 0，按平均名次是否相同取 1 或 0，避免 NaN
+    constant = norms == 0
+    if constant.any():
+        matrix[constant, :] = 0.0
+        matrix[:, constant] = 0.0
+        matrix[np.ix_(constant, constant)] = 1.0
+
+    return np.clip(matrix, -1.0, 1.0)
+
+
+def kendall_matrix(rank_matrix: ArrayLike) -> NDArray[np.float64]:
+    """计算 (k, n) 排名矩阵各行之间的 Kendall τ-b 相关矩阵
+
+    Args:
+        rank_matrix: (k, n) 排名矩阵，每行一个排名
+
+    Returns:
+        (k, k) 对称相关矩阵
+
+    Raises:
+        ValueError: 输入不是二维数组
+    """
+    ranks = _as_rank_matrix(rank_matrix)
+    k = len(ranks)
+
+    matrix = np.empty((k, k))
+    for i in range(k):
+        matrix[i, i] = kendall_tau(ranks[i], ranks[i])
+        for j in range(i + 1, k):
+            matrix[i, j] = matrix[j, i] = kendall_tau(ranks[i], ranks[j])
+
+    return matrix
+
+
+# =============================================================================
+# 头部重叠指标
+# =============================================================================
+
+def top_k_overlap(ranking1: ArrayLike, ranking2: ArrayLike, k: int) -> float:
+    """计算两个排名前 k 名的重合比例 |top_k(1) ∩ top_k(2)| / k
+
+    并列名次按方案顺序决定先后。
+
+    Args:
+        ranking1: 第一个排名向量
+        ranking2: 第二个排名向量
+        k: 比较的名次数 (1 ≤ k ≤ n)
+
+    Returns:
+        重合比例 (范围 [0, 1])
+
+    Raises:
+        ValueError: 排名长度不一致或 k 超出范围
+    """
+    x, y = _check_pair(ranking1, ranking2)
+    if not 1 <= k <= len(x):
+        raise ValueError(f"k 必须在 [1, {len(x)}] 范围内，当前值为 {k}")
+
+    head1 = np.argsort(x, kind="stable")[:k]
+    head2 = np.argsort(y, kind="stable")[:k]
+    return float(np.intersect1d(head1, head2, assume_unique=True).size / k)
+
+
+def rank_biased_overlap(
+    ranking1: ArrayLike,
+    ranking2: ArrayLike,
+    p: float = 0.9,
+    depth: int | None = None
+) -> float:
+    """计算秩偏重叠 RBO (Rank-Biased Overlap)
+
+    深度 d 处的一致度 A_d = |top_d(1) ∩ top_d(2)| / d，按几何权重 p^(d-1)
+    累加；只比较前 depth 名时使用外推公式 (Webber et al., 2010, Eq. 30):
+
+        RBO_ext = A_k · p^k + (1 - p) Σ_{d=1}^{k} A_d · p^(d-1)
+
+    方案 i 在深度 max(pos_1(i), pos_2(i)) + 1 处进入交集，因此所有深度的
+    交集大小由一次 bincount + cumsum 得到，O(n log n)。
+
+    Args:
+        ranking1: 第一个排名向量
+        ranking2: 第二个排名向量
+        p: 持续参数 (0 < p < 1)，越小越关注头部
+        depth: 比较深度（默认为排名长度）
+
+    Returns:
+        RBO (范围 [0, 1])，完全相同的排名为 1
+
+    Raises:
+        ValueError: 排名长度不一致，或 p、depth 超出范围
+    """
+    x, y = _check_pair(ranking1, ranking2)
+    n = len(x)
+    if not 0.0 < p < 1.0:
+        raise ValueError(f"p 必须在 (0, 1) 范围内，当前值为 {p}")
+    if depth is None:
+        depth = n
+    if not 1 <= depth <= n:
+        raise ValueError(f"depth 必须在 [1, {n}] 范围内，当前值为 {depth}")
+
+    positions1 = np.empty(n, dtype=np.int64)
+    positions2 = np.empty(n, dtype=np.int64)
+    positions1[np.argsort(x, kind="stable")] = np.arange(n)
+    positions2[np.argsort(y, kind="stable")] = np.arange(n)
+
+    entry_depth = np.maximum(positions1, positions2)
+    overlap = np.cumsum(np.bincount(entry_depth[entry_depth < depth], minlength=depth))
+
+    depths = np.arange(1, depth + 1)
+    agreement = overlap / depths
+    weights = p ** (depths - 1)
+
+    rbo = agreement[-1] * p ** depth + (1.0 - p) * np.dot(agreement, weights)
+    return float(min(rbo, 1.0))
+
+
+# =============================================================================
+# 内部工具函数
+# =============================================================================
+
+def _check_pair(
+    ranking1: ArrayLike, ranking2: ArrayLike
+) -> tuple[NDArray, NDArray]:
+    """验证并转换一对排名向量"""
+    x = np.asarray(ranking1)
+    y = np.asarray(ranking2)
+    if x.ndim != 1 or y.ndim != 1:
+        raise ValueError("排名必须是一维数组")
+    if len(x) != len(y):
+        raise ValueError(f"排名长度不一致: {len(x)} vs {len(y)}")
+    return x, y
+
+
+def _as_rank_matrix(rank_matrix: ArrayLike) -> NDArray:
+    """验证并转换 (k, n) 排名矩阵"""
+    ranks = np.asarray(rank_matrix)
+    if ranks.ndim != 2:
+        raise ValueError(f"排名矩阵必须是二维数组，当前维度为 {ranks.ndim}")
+    return ranks
+
+
+def _average_ranks(values: NDArray) -> NDArray[np.float64]:
+    """转换为 1-based 名次，并列取平均名次"""
+    n = len(values)
+    sorter = np.argsort(values, kind="stable")
+    sorted_values = values[sorter]
+
+    is_new = np.empty(n, dtype=bool)
+    is_new[:1] = True
+    is_new[1:] = sorted_values[1:] != sorted_values[:-1]
+
+    dense = np.empty(n, dtype=np.int64)
+    dense[sorter] = np.cumsum(is_new)
+    bounds = np.append(np.flatnonzero(is_new), n)
+
+    # 第 g 组占据名次 bounds[g-1]+1 .. bounds[g]
+    return 0.5 * (bounds[dense] + bounds[dense - 1] + 1)
+
+
+def _tied_pairs(equal_to_previous: NDArray[np.bool_]) -> int:
+    """由有序数组的"与前一个元素相等"标记统计并列对数 Σ t(t-1)/2"""
+    if equal_to_previous.size == 0:
+        return 0
+
+    # 每段连续 True 长度为 t-1，对应并列组大小 t
+    padded = np.concatenate(([False], equal_to_previous, [False])).astype(np.int8)
+    edges = np.flatnonzero(np.diff(padded))
+    run_lengths = edges[1::2] - edges[::2] + 1
+    return int(np.sum(run_lengths * (run_lengths - 1) // 2))
+
+
+def _count_inversions(values: NDArray) -> int:
+    """自底向上归并排序统计严格逆序对数 #{i < j : v_i > v_j}
+
+    每轮将相邻的两个有序段合并：右段每个元素的逆序数为左段中大于它的元素
+    个数，由 searchsorted 一次求出。给每对段加上 pair_id * R 的偏移后，整个
+    数组的所有左段拼接起来仍然有序，合并也只需一次稳定排序（两段有序数据上
+    的 timsort 即线性归并）。
+    """
+    n = len(values)
+    _, y = np.unique(values, return_inverse=True)
+    y = y.astype(np.int64).ravel()
+    offset = int(y.max()) + 1 if n else 1
+
+    positions = np.arange(n)
+    inversions = 0
+    width = 1
+    while width < n:
+        block = positions // width
+        pair = block // 2
+        is_right = (block % 2).astype(bool)
+
+        keys = pair * offset + y
+        left_keys = keys[~is_right]
+        right_pairs = pair[is_right]
+
+        # 有右段的每一对，其左段都是完整的 width 个元素，起点为 pair * width
+        not_greater = np.searchsorted(left_keys, keys[is_right], side="right") - right_pairs * width
+        inversions += int(np.sum(width - not_greater))
+
+        y = np.sort(keys, kind="stable") - pair * offset
+        width *= 2
+
+    return inversions
@@ -12,11 +12,23 @@ MCDA Core - 可能度排序 (Possibility Degree Ranking)
         0,                              if A^U ≤ B^L
         (A^U - B^L) / ((A^U - A^L) + (B^U - B^L)),  otherwise
     }
+
+数组接口 ``PossibilityDegree.matrix`` / ``PossibilityDegree.scores`` 直接接收
+下界/上界向量，一次向量化计算完整的可能度矩阵或综合可能度；``scores`` 按行分块，
+不构建完整的 n×n 矩阵。
 """
 
 from dataclasses import dataclass
+
+import numpy as np
+from numpy.typing import ArrayLike, NDArray
+
 from ..interval import Interval
 
+# 模块级常量
+BLOCK_ELEMENTS = 1 << 16
+"""分块计算综合可能度时每块的最大元素数（每个临时数组约 512 KB，可放入缓存）"""
+
 
 @dataclass
 class PossibilityDegree:
@@ -99,6 +111,101 @@ class PossibilityDegree:
 
         return numerator / denominator
 
+    @staticmethod
+    def matrix(
+        lower: ArrayLike,
+        upper: ArrayLike,
+        other_lower: ArrayLike | None = None,
+        other_upper: ArrayLike | None = None
+    ) -> NDArray:
+        """计算可能度矩阵 P[i, j] = P(A_i ≥ B_j)
+
+        与逐对调用 ``calculate`` 结果一致，但一次向量化完成。
+
+        Args:
+            lower: 区间 A 的下界向量 (n,)
+            upper: 区间 A 的上界向量 (n,)
+            other_lower: 区间 B 的下界向量 (m,)，默认与 A 相同
+            other_upper: 区间 B 的上界向量 (m,)，默认与 A 相同
+
+        Returns:
+            可能度矩阵 (n, m)。A 与自身比较时对角线为 0.5
+
+        Example:
+            ```python
+            P = PossibilityDegree.matrix([2.0, 3.0], [5.0, 6.0])
+            # [[0.5, 0.25], [0.75, 0.5]]
+            ```
+        """
+        a_lower = np.asarray(lower, dtype=np.float64)[:, None]
+        a_upper = np.asarray(upper, dtype=np.float64)[:, None]
+        if other_lower is None:
+            b_lower, b_upper = a_lower.T, a_upper.T
+        else:
+            b_lower = np.asarray(other_lower, dtype=np.float64)[None, :]
+            b_upper = np.asarray(other_upper, dtype=np.float64)[None, :]
+
+        numerator = a_upper - b_lower
+        denominator = (a_upper - a_lower) + (b_upper - b_lower)
+
+        # 情况3: 重叠区间的可能度公式（其余位置在下方覆盖）
+        with np.errstate(divide="ignore", invalid="ignore"):
+            result = numerator / denominator
+
+        # 情况1/2: 完全大于等于 / 完全小于
+        result[a_lower >= b_upper] = 1.0
+        result[a_upper <= b_lower] = 0.0
+
+        # 特殊情况: 两个相同的零宽度区间（非零宽度的相同区间由公式得到 0.5）
+        result[(numerator == 0) & (denominator == 0)] = 0.5
+        return result
+
+    @classmethod
+    def scores(
+        cls,
+        lower: ArrayLike,
+        upper: ArrayLike,
+        block_size: int | None = None
+    ) -> NDArray:
+        """计算综合可能度 S_i = Σ_{j≠i} P(A_i ≥ A_j)
+
+        按行分块计算，每次只构建 (block_size, n) 的可能度子矩阵，
+        适用于数万个区间的排序。
+
+        Args:
+            lower: 下界向量 (n,)
+            upper: 上界向量 (n,)
+            block_size: 每块行数，默认使每块不超过 BLOCK_ELEMENTS 个元素
+
+        Returns:
+            综合可能度向量 (n,)
+
+        Raises:
+            ValueError: 上下界长度不一致或 block_size 无效
+        """
+        lower = np.asarray(lower, dtype=np.float64)
+        upper = np.asarray(upper, dtype=np.float64)
+        if lower.shape != upper.shape or lower.ndim != 1:
+            raise ValueError(
+                f"下界与上界必须是等长的一维数组，当前: {lower.shape}, {upper.shape}"
+            )
+
+        n = len(lower)
+        if block_size is None:
+            block_size = max(1, BLOCK_ELEMENTS // max(n, 1))
+        elif block_size < 1:
+            raise ValueError(f"block_size 必须 >= 1，当前: {block_size}")
+
+        scores = np.empty(n)
+        for start in range(0, n, block_size):
+            stop = min(start + block_size, n)
+            block = cls.matrix(lower[start:stop], upper[start:stop], lower, upper)
+            # 排除与自身的比较
+            block[np.arange(stop - start), np.arange(start, stop)] = 0.0
+            scores[start:stop] = block.sum(axis=1)
+
+        return scores
+
     def rank(
         self,
         intervals: dict[str, Interval]
@@ -135,18 +242,15 @@ class PossibilityDegree:
         if not intervals:
             return []
 
-        # 初始化综合可能度
-        scores = {name: 0.0 for name in intervals}
-
-        # 计算两两可能度
-        for name_i, interval_i in intervals.items():
-            for name_j, interval_j in intervals.items():
-                if name_i != name_j:
-                    # 累加 P(Ai ≥ Aj)
-                    scores[name_i] += self.calculate(interval_i, interval_j)
+        # 计算综合可能度（向量化）
+        names = list(intervals)
+        scores = self.scores(
+            [interval.lower for interval in intervals.values()],
+            [interval.upper for interval in intervals.values()],
+        )
 
         # 按综合可能度降序排序
-        rankings = sorted(scores.items(), key=lambda x: x[1], reverse=True)
+        rankings = sorted(zip(names, scores.tolist()), key=lambda x: x[1], reverse=True)
 
         return rankings
 
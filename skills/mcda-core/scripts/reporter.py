@@ -157,11 +157,11 @@ class ReportService:
         lines.append(header)
         lines.append(separator)
 
-        # 数据行
-        for alt in problem.alternatives:
+        # 数据行（使用缓存的稠密评分矩阵）
+        matrix = problem.score_matrix
+        for i, alt in enumerate(problem.alternatives):
             row = f"| {alt} |"
-            for crit in problem.criteria:
-                score = problem.scores[alt][crit.name]
+            for score in matrix[i]:
                 row += f" {score:.1f} |"
             lines.append(row)
 
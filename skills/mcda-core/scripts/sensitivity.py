@@ -7,7 +7,6 @@ MCDA Core 敏感性分析服务
 - 关键准则识别
 """
 
-from dataclasses import dataclass
 from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
@@ -15,6 +14,117 @@ if TYPE_CHECKING:
     from .algorithms.base import MCDAAlgorithm
 
 
+# ============================================================================
+# 扰动计算上下文
+# ============================================================================
+
+class _PerturbationContext:
+    """单次敏感性分析内共享的扰动计算上下文
+
+    原始排名只计算一次。若算法提供 LinearWeightModel（WSM、WPM、TOPSIS），
+    扰动后的得分通过对预计算加权和做秩一修正得到，无需重建决策问题；
+    否则基于共享评分矩阵的权重副本重新执行 calculate()。
+    """
+
+    def __init__(self, problem: "DecisionProblem", algorithm: "MCDAAlgorithm"):
+        from .algorithms.base import rank_scores
+
+        self.problem = problem
+        self.algorithm = algorithm
+
+        model_factory = getattr(algorithm, "linear_weight_model", None)
+        self.model = model_factory(problem) if callable(model_factory) else None
+
+        if self.model is not None:
+            self.base_sums = self.model.weighted_sums(problem.weight_vector)
+            ranks = rank_scores(self.model.finalize(*self.base_sums))
+            self.original_ranks = dict(zip(problem.alternatives, ranks.tolist()))
+        else:
+            original_result = algorithm.calculate(problem)
+            self.original_ranks = {
+                r.alternative: r.rank for r in original_result.rankings
+            }
+
+    def perturb(
+        self,
+        criterion_index: int,
+        perturbation: float,
+    ) -> "SensitivityResult":
+        """对单个准则做 ±perturbation 扰动
+
+        Args:
+            criterion_index: 准则下标
+            perturbation: 扰动幅度（0-1）
+
+        Returns:
+            SensitivityResult: 包含两次扰动的结果
+        """
+        from .models import PerturbationResult, SensitivityResult
+
+        criterion = self.problem.criteria[criterion_index]
+        original_weight = criterion.weight
+        perturbations = []
+
+        # 扰动 +perturbation 和 -perturbation
+        for delta in [perturbation, -perturbation]:
+            # 计算新权重，其他准则按比例调整（重新归一化）
+            new_weight = original_weight * (1 + delta)
+            scale_factor = (1 - new_weight) / (1 - original_weight)
+
+            new_ranks = self._perturbed_ranks(criterion_index, new_weight, scale_factor)
+
+            # 构建排名变化字典 {alternative: (old_rank, new_rank)}
+            rank_changes = {
+                alt: (self.original_ranks.get(alt, rank), rank)
+                for alt, rank in new_ranks.items()
+            }
+
+            perturbations.append(
+                PerturbationResult(
+                    criterion_name=criterion.name,
+                    original_weight=original_weight,
+                    perturbed_weight=new_weight,
+                    delta=delta,
+                    rank_changes=rank_changes,
+                )
+            )
+
+        return SensitivityResult(
+            perturbations=perturbations,
+            critical_criteria=[],
+            robustness_score=1.0,
+        )
+
+    def _perturbed_ranks(
+        self,
+        criterion_index: int,
+        new_weight: float,
+        scale_factor: float,
+    ) -> dict[str, int]:
+        """计算扰动后的排名 {alternative: rank}"""
+        from .algorithms.base import rank_scores
+
+        weights = self.problem.weight_vector
+
+        if self.model is None:
+            new_weights = weights * scale_factor
+            new_weights[criterion_index] = new_weight
+            new_result = self.algorithm.calculate(self.problem.with_weights(new_weights))
+            return {r.alternative: r.rank for r in new_result.rankings}
+
+        # 秩一修正: 其他权重整体缩放，目标准则替换为 new_weight
+        power = self.model.power
+        scaled = scale_factor ** power
+        correction = new_weight ** power - scaled * weights[criterion_index] ** power
+        sums = tuple(
+            scaled * base + correction * term[:, criterion_index]
+            for base, term in zip(self.base_sums, self.model.terms)
+        )
+
+        ranks = rank_scores(self.model.finalize(*sums))
+        return dict(zip(self.problem.alternatives, ranks.tolist()))
+
+
 # ============================================================================
 # SensitivityService
 # ============================================================================
@@ -45,94 +155,40 @@ class SensitivityService:
         Raises:
             SensitivityAnalysisError: 扰动值无效或准则不存在
         """
+        self._validate_perturbation(perturbation)
+        criterion_index = self._find_criterion(problem, criterion_name)
+
+        context = _PerturbationContext(problem, algorithm)
+        return context.perturb(criterion_index, perturbation)
+
+    def _validate_perturbation(self, perturbation: float) -> None:
+        """验证扰动幅度在 [0, 1] 范围内"""
         from .exceptions import SensitivityAnalysisError
-        from .models import PerturbationResult, SensitivityResult
 
-        # 验证扰动值
         if perturbation < 0.0 or perturbation > 1.0:
             raise SensitivityAnalysisError(
                 f"扰动幅度必须在 [0, 1] 范围内，当前值为 {perturbation}",
             )
 
-        # 查找准则（使用更 Pythonic 的方式）
-        target_criterion = next(
-            (c for c in problem.criteria if c.name == criterion_name),
+    def _find_criterion(self, problem: "DecisionProblem", criterion_name: str) -> int:
+        """查找准则下标
+
+        Raises:
+            SensitivityAnalysisError: 准则不存在
+        """
+        from .exceptions import SensitivityAnalysisError
+
+        index = next(
+            (i for i, c in enumerate(problem.criteria) if c.name == criterion_name),
             None
         )
 
-        if target_criterion is None:
+        if index is None:
             raise SensitivityAnalysisError(
                 f"准则 '{criterion_name}' 不存在",
             )
 
-        original_weight = target_criterion.weight
-        perturbations = []
-
-        # 计算原始排名
-        original_result = algorithm.calculate(problem)
-        original_ranks = {r.alternative: r.rank for r in original_result.rankings}
-
-        # 扰动 +perturbation 和 -perturbation
-        for delta in [perturbation, -perturbation]:
-            # 计算新权重
-            new_weight = original_weight * (1 + delta)
-
-            # 归一化权重（重新分配其他准则的权重）
-            new_criteria = []
-            for crit in problem.criteria:
-                if crit.name == criterion_name:
-                    # 使用扰动后的权重
-                    new_criteria.append(
-                        type(crit)(
-                            name=crit.name,
-                            weight=new_weight,
-                            direction=crit.direction,
-                        )
-                    )
-                else:
-                    # 按比例调整其他准则的权重
-                    scale_factor = (1 - new_weight) / (1 - original_weight)
-                    new_criteria.append(
-                        type(crit)(
-                            name=crit.name,
-                            weight=crit.weight * scale_factor,
-                            direction=crit.direction,
-                        )
-                    )
-
-            # 创建新的决策问题
-            from .models import DecisionProblem
-            new_problem = DecisionProblem(
-                alternatives=problem.alternatives,
-                criteria=tuple(new_criteria),
-                scores=problem.scores,
-            )
-
-            # 计算新排名
-            new_result = algorithm.calculate(new_problem)
-
-            # 构建排名变化字典 {alternative: (old_rank, new_rank)}
-            rank_changes = {}
-            for r in new_result.rankings:
-                old_rank = original_ranks.get(r.alternative, r.rank)
-                rank_changes[r.alternative] = (old_rank, r.rank)
-
-            # 创建 PerturbationResult（匹配现有模型）
-            perturbations.append(
-                PerturbationResult(
-                    criterion_name=criterion_name,
-                    original_weight=original_weight,
-                    perturbed_weight=new_weight,
-                    delta=delta,
-                    rank_changes=rank_changes,
-                )
-            )
-
-        return SensitivityResult(
-            perturbations=perturbations,
-            critical_criteria=[],
-            robustness_score=1.0,
-        )
+        return index
 
     def detect_ranking_changes(
         self,
@@ -189,42 +245,8 @@ class SensitivityService:
         Returns:
             list[CriticalCriterion]: 关键准则列表（按影响程度降序）
         """
-        from .models import CriticalCriterion
-
-        critical_criteria = []
-
-        for crit in problem.criteria:
-            # 扰动该准则的权重
-            result = self.perturb_weights(
-                problem=problem,
-                algorithm=algorithm,
-                criterion_name=crit.name,
-                perturbation=perturbation,
-            )
-
-            # 计算最大排名变化
-            max_rank_changes = 0
-            for p in result.perturbations:
-                # 统计有变化的方案数
-                changes = sum(
-                    1 for old, new in p.rank_changes.values() if old != new
-                )
-                max_rank_changes = max(max_rank_changes, changes)
-
-            # 如果超过阈值，则认为是关键准则
-            if max_rank_changes >= threshold:
-                critical_criteria.append(
-                    CriticalCriterion(
-                        criterion_name=crit.name,
-                        weight=crit.weight,
-                        rank_changes=max_rank_changes,
-                    )
-                )
-
-        # 按影响程度降序排列
-        critical_criteria.sort(key=lambda x: x.rank_changes, reverse=True)
-
-        return critical_criteria
+        perturbation_results = self._perturb_all(problem, algorithm, perturbation)
+        return self._critical_from_results(problem, perturbation_results, threshold)
 
     def analyze(
         self,
@@ -236,6 +258,8 @@ class SensitivityService:
         """
         综合敏感性分析
 
+        每个准则只扰动一次，关键准则由同一批扰动结果得出。
+
         Args:
             problem: 决策问题
             algorithm: MCDA 算法
@@ -244,32 +268,80 @@ class SensitivityService:
         Returns:
             SensitivityAnalysisResult: 敏感性分析结果
         """
-        from .models import SensitivityResult, SensitivityAnalysisResult
-
-        # 识别关键准则
-        critical_criteria = self.identify_critical_criteria(
-            problem=problem,
-            algorithm=algorithm,
-            perturbation=perturbation,
-            threshold=1,  # 至少1个排名变化
-        )
+        from .models import SensitivityAnalysisResult
 
         # 扰动所有准则
-        perturbation_results = []
-        for crit in problem.criteria:
-            result = self.perturb_weights(
-                problem=problem,
-                algorithm=algorithm,
-                criterion_name=crit.name,
-                perturbation=perturbation,
-            )
-            perturbation_results.append(result)
+        perturbation_results = self._perturb_all(problem, algorithm, perturbation)
+
+        # 识别关键准则（至少1个排名变化）
+        critical_criteria = self._critical_from_results(
+            problem, perturbation_results, threshold=1
+        )
 
         return SensitivityAnalysisResult(
             critical_criteria=tuple(critical_criteria),
             perturbation_results=tuple(perturbation_results),
         )
 
+    def _perturb_all(
+        self,
+        problem: "DecisionProblem",
+        algorithm: "MCDAAlgorithm",
+        perturbation: float,
+    ) -> list["SensitivityResult"]:
+        """对所有准则逐个扰动（共享同一扰动计算上下文）"""
+        self._validate_perturbation(perturbation)
+
+        context = _PerturbationContext(problem, algorithm)
+        return [
+            context.perturb(i, perturbation)
+            for i in range(len(problem.criteria))
+        ]
+
+    def _critical_from_results(
+        self,
+        problem: "DecisionProblem",
+        perturbation_results: list["SensitivityResult"],
+        threshold: int,
+    ) -> list["CriticalCriterion"]:
+        """根据扰动结果识别关键准则
+
+        Args:
+            problem: 决策问题
+            perturbation_results: 与 problem.criteria 一一对应的扰动结果
+            threshold: 排名变化阈值
+
+        Returns:
+            list[CriticalCriterion]: 关键准则列表（按影响程度降序）
+        """
+        from .models import CriticalCriterion
+
+        critical_criteria = []
+
+        for crit, result in zip(problem.criteria, perturbation_results):
+            # 计算最大排名变化（统计有变化的方案数）
+            max_rank_changes = 0
+            for p in result.perturbations:
+                changes = sum(
+                    1 for old, new in p.rank_changes.values() if old != new
+                )
+                max_rank_changes = max(max_rank_changes, changes)
+
+            # 如果超过阈值，则认为是关键准则
+            if max_rank_changes >= threshold:
+                critical_criteria.append(
+                    CriticalCriterion(
+                        criterion_name=crit.name,
+                        weight=crit.weight,
+                        rank_changes=max_rank_changes,
+                    )
+                )
+
+        # 按影响程度降序排列
+        critical_criteria.sort(key=lambda x: x.rank_changes, reverse=True)
+
+        return critical_criteria
+
     def _count_ranking_changes(
         self,
         original: "DecisionResult",
@@ -0,0 +1,377 @@
+"""
+MCDA Core - 常驻分析服务
+
+长时间运行的本地 HTTP/JSON 服务（仅使用标准库）。编排器、已导入的算法模块
+和分析结果缓存在进程内常驻，调用方无需为每次分析支付解释器启动与导入开销。
+
+接口:
+    GET  /health    服务状态、可用算法、缓存统计
+    POST /analyze   分析决策问题
+    POST /validate  验证决策问题
+
+请求体为 JSON，决策问题通过 "problem"（与 YAML/JSON 配置结构相同的对象）
+或 "path"（服务端可读取的配置文件路径）给出:
+
+    {"path": "configs/vendor.yaml", "algorithm": "topsis"}
+    {"problem": {"alternatives": [...], "criteria": [...], "scores": {...}},
+     "report": "markdown"}
+
+请求由固定大小的线程池并发处理。每个连接只处理一个请求（响应带
+Connection: close），并设有套接字超时，空闲或缓慢的客户端不会长期占用线程。
+
+Example:
+    ```python
+    server = MCDAServer(port=8765, workers=4)
+    server.serve_forever()
+    ```
+"""
+
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from typing import TYPE_CHECKING, Any, Callable
+
+from .batch import error_fields, result_fields
+from .exceptions import MCDAError
+
+if TYPE_CHECKING:
+    from .core import MCDAOrchestrator
+    from .models import DecisionProblem
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+DEFAULT_WORKERS = 4
+DEFAULT_CACHE_SIZE = 256
+
+# 连接套接字超时（秒）
+DEFAULT_TIMEOUT = 30.0
+
+# 请求体大小上限（字节）
+MAX_REQUEST_BYTES = 16 * 1024 * 1024
+
+# analyze 接口可返回的报告格式（文本格式）
+REPORT_FORMATS = ("markdown", "json")
+
+
+class RequestError(Exception):
+    """请求无效（HTTP 400）"""
+    pass
+
+
+# =============================================================================
+# HTTP 服务器（固定大小线程池）
+# =============================================================================
+
+class _PooledHTTPServer(HTTPServer):
+    """使用固定大小线程池处理请求的 HTTP 服务器"""
+
+    daemon_threads = True
+
+    def __init__(
+        self,
+        server_address,
+        handler_class,
+        app: "MCDAServer",
+        workers: int,
+        timeout: float | None
+    ):
+        self.app = app
+        self.request_timeout = timeout
+        self._pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="mcda-serve")
+        super().__init__(server_address, handler_class)
+
+    def process_request(self, request, client_address):
+        self._pool.submit(self._process_request_in_pool, request, client_address)
+
+    def _process_request_in_pool(self, request, client_address):
+        try:
+            self.finish_request(request, client_address)
+        except Exception:
+            self.handle_error(request, client_address)
+        finally:
+            self.shutdown_request(request)
+
+    def server_close(self):
+        super().server_close()
+        self._pool.shutdown(wait=True)
+
+
+class _RequestHandler(BaseHTTPRequestHandler):
+    """JSON 请求处理器，按路径分发到 MCDAServer"""
+
+    server: _PooledHTTPServer
+    protocol_version = "HTTP/1.1"
+
+    def setup(self) -> None:
+        # StreamRequestHandler.setup() 按 self.timeout 设置套接字超时
+        self.timeout = self.server.request_timeout
+        super().setup()
+
+    def do_GET(self) -> None:
+        self._dispatch("GET")
+
+    def do_POST(self) -> None:
+        self._dispatch("POST")
+
+    def _dispatch(self, method: str) -> None:
+        # 每个连接只处理一个请求，长连接不会占住线程池中的线程
+        self.close_connection = True
+
+        try:
+            length = self._content_length()
+        except RequestError as e:
+            self._send_json(HTTPStatus.BAD_REQUEST, error_fields(e))
+            return
+
+        if length > MAX_REQUEST_BYTES:
+            # 不读取过大的请求体，直接拒绝并关闭连接
+            error = RequestError(f"请求体过大: {length} 字节，上限 {MAX_REQUEST_BYTES}")
+            self._send_json(HTTPStatus.REQUEST_ENTITY_TOO_LARGE, error_fields(error))
+            return
+
+        self._remaining = length
+        status, body = self.server.app.handle(method, self.path, self._read_body)
+
+        # 未读取的请求体（如未知接口）在响应前读完，避免客户端因连接重置收不到响应
+        if self._remaining:
+            self.rfile.read(self._remaining)
+        self._send_json(status, body)
+
+    def _send_json(self, status: int, body: dict[str, Any]) -> None:
+        payload = json.dumps(body, ensure_ascii=False).encode("utf-8")
+
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(payload)))
+        self.send_header("Connection", "close")
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def _content_length(self) -> int:
+        try:
+            length = int(self.headers.get("Content-Length") or 0)
+        except ValueError:
+            length = -1
+        if length < 0:
+            raise RequestError(f"Content-Length 无效: {self.headers.get('Content-Length')!r}")
+        return length
+
+    def _read_body(self) -> dict[str, Any]:
+        length, self._remaining = self._remaining, 0
+        raw = self.rfile.read(length) if length else b"{}"
+        try:
+            body = json.loads(raw)
+        except (json.JSONDecodeError, UnicodeDecodeError) as e:
+            raise RequestError(f"请求体不是有效的 JSON: {e}") from e
+
+        if not isinstance(body, dict):
+            raise RequestError("请求体必须是 JSON 对象")
+        return body
+
+    def log_message(self, format: str, *args: Any) -> None:
+        if self.server.app.verbose:
+            super().log_message(format, *args)
+
+
+# =============================================================================
+# MCDAServer - 常驻服务
+# =============================================================================
+
+class MCDAServer:
+    """MCDA 常驻分析服务
+
+    Attributes:
+        orchestrator: 常驻的核心编排器（默认启用结果缓存）
+        verbose: 是否输出访问日志
+    """
+
+    def __init__(
+        self,
+        host: str = DEFAULT_HOST,
+        port: int = DEFAULT_PORT,
+        workers: int = DEFAULT_WORKERS,
+        cache_size: int = DEFAULT_CACHE_SIZE,
+        orchestrator: "MCDAOrchestrator | None" = None,
+        verbose: bool = False,
+        timeout: float | None = DEFAULT_TIMEOUT
+    ):
+        """初始化服务并预热编排器和算法模块
+
+        Args:
+            host: 监听地址（默认仅本机）
+            port: 监听端口（0 表示由系统分配）
+            workers: 请求处理线程数
+            cache_size: 分析结果缓存条目数（0 表示不缓存，仅在未传入 orchestrator 时使用）
+            orchestrator: 自定义编排器（可选）
+            verbose: 是否输出访问日志
+            timeout: 连接套接字超时（秒，None 表示不超时）
+
+        Raises:
+            ValueError: workers 无效
+        """
+        if workers < 1:
+            raise ValueError(f"workers 必须 >= 1，当前值为 {workers}")
+
+        if orchestrator is None:
+            from .core import MCDAOrchestrator
+            from .utils.cache import ResultCache
+
+            cache = ResultCache(maxsize=cache_size) if cache_size else None
+            orchestrator = MCDAOrchestrator(result_cache=cache)
+
+        self.orchestrator = orchestrator
+        self.verbose = verbose
+        self._algorithms = self._warm_up()
+        self._started_at = time.monotonic()
+        self._requests = 0
+        self._lock = threading.Lock()
+
+        self._routes: dict[tuple[str, str], Callable[[dict[str, Any]], dict[str, Any]]] = {
+            ("POST", "/analyze"): self._analyze,
+            ("POST", "/validate"): self._validate,
+        }
+        self._httpd = _PooledHTTPServer((host, port), _RequestHandler, self, workers, timeout)
+
+    @property
+    def server_address(self) -> tuple[str, int]:
+        """实际监听的 (地址, 端口)"""
+        host, port = self._httpd.server_address[:2]
+        return host, port
+
+    @property
+    def url(self) -> str:
+        """服务根 URL"""
+        host, port = self.server_address
+        return f"http://{host}:{port}"
+
+    def serve_forever(self) -> None:
+        """阻塞运行服务，直到 shutdown() 被调用"""
+        self._httpd.serve_forever()
+
+    def start(self) -> threading.Thread:
+        """在后台线程中运行服务
+
+        Returns:
+            服务线程
+        """
+        thread = threading.Thread(target=self.serve_forever, name="mcda-serve", daemon=True)
+        thread.start()
+        return thread
+
+    def shutdown(self) -> None:
+        """停止服务并关闭监听套接字"""
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+    def __enter__(self) -> "MCDAServer":
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.shutdown()
+
+    # -------------------------------------------------------------------------
+    # 请求处理
+    # -------------------------------------------------------------------------
+
+    def handle(
+        self,
+        method: str,
+        path: str,
+        read_body: Callable[[], dict[str, Any]]
+    ) -> tuple[int, dict[str, Any]]:
+        """处理一个请求
+
+        Args:
+            method: HTTP 方法
+            path: 请求路径
+            read_body: 读取并解析 JSON 请求体的函数
+
+        Returns:
+            (HTTP 状态码, 响应对象)
+        """
+        with self._lock:
+            self._requests += 1
+
+        path = path.split("?", 1)[0].rstrip("/") or "/"
+        if method == "GET" and path == "/health":
+            return HTTPStatus.OK, self._health()
+
+        route = self._routes.get((method, path))
+        if route is None:
+            return HTTPStatus.NOT_FOUND, {
+                "status": "error",
+                "error_type": "NotFound",
+                "error": f"未知的接口: {method} {path}",
+            }
+
+        try:
+            return HTTPStatus.OK, route(read_body())
+        except (RequestError, MCDAError, ValueError, KeyError, TypeError, OSError) as e:
+            return HTTPStatus.BAD_REQUEST, error_fields(e)
+        except Exception as e:
+            return HTTPStatus.INTERNAL_SERVER_ERROR, error_fields(e)
+
+    def _health(self) -> dict[str, Any]:
+        """GET /health"""
+        cache = self.orchestrator.result_cache
+        return {
+            "status": "ok",
+            "uptime_seconds": round(time.monotonic() - self._started_at, 3),
+            "requests": self._requests,
+            "algorithms": self._algorithms,
+            "cache": cache.cache_info()._asdict() if cache is not None else None,
+        }
+
+    def _analyze(self, body: dict[str, Any]) -> dict[str, Any]:
+        """POST /analyze"""
+        start = time.perf_counter()
+        report_format = body.get("report")
+        if report_format is not None and report_format not in REPORT_FORMATS:
+            raise RequestError(
+                f"不支持的报告格式: {report_format!r}，可选: {list(REPORT_FORMATS)}"
+            )
+
+        problem, result = self.orchestrator.validate_and_analyze(
+            self._load_problem(body),
+            algorithm_name=body.get("algorithm"),
+            apply_constraints=bool(body.get("apply_constraints", False))
+        )
+
+        response = result_fields(result)
+        if report_format is not None:
+            response["report"] = self.orchestrator.generate_report(
+                problem, result, format=report_format
+            )
+        response["elapsed_ms"] = round((time.perf_counter() - start) * 1000, 3)
+        return response
+
+    def _validate(self, body: dict[str, Any]) -> dict[str, Any]:
+        """POST /validate"""
+        validation_result = self.orchestrator.validate(self._load_problem(body))
+        return {
+            "status": "ok",
+            "is_valid": validation_result.is_valid,
+            "errors": list(validation_result.errors),
+            "warnings": list(validation_result.warnings),
+        }
+
+    def _load_problem(self, body: dict[str, Any]) -> "DecisionProblem":
+        """从请求体中的 problem（内联）或 path（文件路径）加载决策问题"""
+        if "problem" in body:
+            return self.orchestrator.load_from_dict(body["problem"])
+        if "path" in body:
+            return self.orchestrator.load_from_file(body["path"])
+        raise RequestError("请求体必须包含 'problem' 或 'path'")
+
+    def _warm_up(self) -> list[str]:
+        """预先导入全部内置算法模块，首个请求无需承担导入开销"""
+        from .algorithms import get_algorithm, list_algorithms
+
+        algorithms = list_algorithms()
+        for name in algorithms:
+            get_algorithm(name)
+        return algorithms
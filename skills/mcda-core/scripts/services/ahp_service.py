@@ -3,15 +3,25 @@ AHP (层次分析法) 权重计算服务
 
 实现 AHP 算法的核心功能：
 - 成对比较矩阵验证
-- 权重计算（特征向量法）
+- 权重计算（特征向量法 / 几何平均法）
 - 一致性检验
+- 批量计算：同阶的成对比较矩阵堆叠为 (B, n, n) 数组，一次批量特征分解
+  得到全部权重，λ_max、CI、CR 复用同一组权重
 
 References:
 - Saaty, T. L. (1980). The Analytic Hierarchy Process.
 """
 
 import numpy as np
-from typing import Literal
+from typing import Any, Literal, Sequence
+
+# 权重计算方法
+#   eigenvector: 主特征向量法（批量特征分解，失败时回退到幂法）
+#   geometric_mean: 行几何平均法
+WEIGHT_METHODS = ("eigenvector", "geometric_mean")
+
+# 一致性可接受阈值 (CR < 0.1)
+ACCEPTABLE_CR = 0.1
 
 
 class AHPValidationError(Exception):
@@ -49,6 +59,10 @@ class AHPService:
             matrix,
             criteria=["成本", "质量", "功能"]
         )
+
+        # 批量计算 (B, n, n) 或不同阶矩阵的列表
+        batch = service.calculate_weights_with_consistency_batch(matrices)
+        batch["consistency_ratio"]  # (B,)
         ```
     """
 
@@ -67,15 +81,27 @@ class AHPService:
         10: 1.49,
     }
 
-    def __init__(self, max_iterations: int = 1000, tolerance: float = 1e-6):
+    def __init__(
+        self,
+        max_iterations: int = 1000,
+        tolerance: float = 1e-6,
+        method: Literal["eigenvector", "geometric_mean"] = "eigenvector"
+    ):
         """初始化 AHP 服务
 
         Args:
-            max_iterations: 幂法最大迭代次数
-            tolerance: 收敛容忍度
+            max_iterations: 幂法（特征分解失败时的回退）最大迭代次数
+            tolerance: 幂法收敛容忍度
+            method: 默认权重计算方法
+                - eigenvector: 主特征向量法
+                - geometric_mean: 行几何平均法
+
+        Raises:
+            ValueError: 方法无效
         """
         self.max_iterations = max_iterations
         self.tolerance = tolerance
+        self.method = self._check_method(method)
 
     # =========================================================================
     # 矩阵验证
@@ -103,47 +129,73 @@ class AHPService:
                 f"矩阵必须是二维数组，当前维度: {matrix.ndim}"
             )
 
-        n, m = matrix.shape
+        self._validate_stack(matrix[np.newaxis])
+
+    def _validate_stack(
+        self, stack: np.ndarray, indices: Sequence[int] | None = None
+    ) -> None:
+        """验证 (B, n, n) 成对比较矩阵堆叠（向量化检查）
+
+        Args:
+            stack: 成对比较矩阵堆叠
+            indices: 各矩阵在调用方输入中的序号（批量输入时用于错误信息）
+
+        Raises:
+            AHPValidationError: 任一矩阵不满足要求
+        """
+        def prefix(k: int) -> str:
+            return "" if indices is None else f"矩阵 {indices[k]}: "
+
+        _, n, m = stack.shape
 
         if n != m:
             raise AHPValidationError(
-                f"成对比较矩阵必须是方阵，当前形状: {matrix.shape}"
+                f"{prefix(0)}成对比较矩阵必须是方阵，当前形状: {stack.shape[1:]}"
             )
 
         # 检查对角线是否为 1
-        for i in range(n):
-            if not np.isclose(matrix[i, i], 1.0):
-                raise AHPValidationError(
-                    f"对角线元素必须为 1，a[{i},{i}] = {matrix[i, i]}"
-                )
+        diagonal = np.diagonal(stack, axis1=1, axis2=2)
+        bad = np.argwhere(~np.isclose(diagonal, 1.0))
+        if len(bad):
+            k, i = bad[0]
+            raise AHPValidationError(
+                f"{prefix(k)}对角线元素必须为 1，a[{i},{i}] = {stack[k, i, i]}"
+            )
 
         # 检查所有元素是否为正数
-        if np.any(matrix <= 0):
-            raise AHPValidationError("矩阵元素必须全部为正数")
-
-        # 检查互反性: a_ij = 1 / a_ji
-        for i in range(n):
-            for j in range(i + 1, n):
-                if not np.isclose(matrix[i, j], 1.0 / matrix[j, i], rtol=1e-5):
-                    raise AHPValidationError(
-                        f"矩阵不满足互反性: "
-                        f"a[{i},{j}] = {matrix[i, j]}, "
-                        f"a[{j},{i}] = {matrix[j, i]}, "
-                        f"期望 a[{j},{i}] = {1.0 / matrix[i, j]}"
-                    )
+        if np.any(stack <= 0):
+            k = int(np.argwhere(stack <= 0)[0, 0])
+            raise AHPValidationError(f"{prefix(k)}矩阵元素必须全部为正数")
+
+        # 检查互反性: a_ij = 1 / a_ji（上三角）
+        rows, cols = np.triu_indices(n, k=1)
+        upper = stack[:, rows, cols]
+        lower = stack[:, cols, rows]
+        bad = np.argwhere(~np.isclose(upper, 1.0 / lower, rtol=1e-5))
+        if len(bad):
+            k, p = bad[0]
+            i, j = rows[p], cols[p]
+            raise AHPValidationError(
+                f"{prefix(k)}矩阵不满足互反性: "
+                f"a[{i},{j}] = {stack[k, i, j]}, "
+                f"a[{j},{i}] = {stack[k, j, i]}, "
+                f"期望 a[{j},{i}] = {1.0 / stack[k, i, j]}"
+            )
 
     # =========================================================================
-    # 权重计算（特征向量法 - 幂法）
+    # 权重计算
     # =========================================================================
 
-    def calculate_weights(self, matrix: np.ndarray) -> np.ndarray:
-        """计算权重向量（特征向量法）
-
-        使用幂法迭代计算最大特征值对应的特征向量，
-        并归一化得到权重。
+    def calculate_weights(
+        self,
+        matrix: np.ndarray,
+        method: Literal["eigenvector", "geometric_mean"] | None = None
+    ) -> np.ndarray:
+        """计算权重向量
 
         Args:
             matrix: 成对比较矩阵 (n x n)
+            method: 权重计算方法（默认使用初始化时的方法）
 
         Returns:
             归一化权重向量 (n,)
@@ -154,28 +206,95 @@ class AHPService:
         # 验证矩阵
         self._validate_matrix(matrix)
 
-        n = matrix.shape[0]
+        return self._weights(matrix[np.newaxis].astype(float), method)[0]
+
+    def calculate_weights_batch(
+        self,
+        matrices: np.ndarray,
+        method: Literal["eigenvector", "geometric_mean"] | None = None
+    ) -> np.ndarray:
+        """批量计算同阶成对比较矩阵的权重
+
+        Args:
+            matrices: 成对比较矩阵堆叠 (B x n x n)
+            method: 权重计算方法（默认使用初始化时的方法）
+
+        Returns:
+            权重矩阵 (B x n)，每行和为 1
+
+        Raises:
+            AHPValidationError: 矩阵验证失败
+        """
+        stack = self._as_stack(matrices)
+        return self._weights(stack, method)
+
+    def _weights(
+        self, stack: np.ndarray, method: str | None
+    ) -> np.ndarray:
+        """计算 (B, n, n) 堆叠的权重 (B, n)"""
+        method = self._check_method(method or self.method)
+        n_matrices, n, _ = stack.shape
 
         # 特殊情况：1x1 矩阵
         if n == 1:
-            return np.array([1.0])
+            return np.ones((n_matrices, 1))
+
+        if method == "geometric_mean":
+            # w_i ∝ (Π_j a_ij)^(1/n)
+            weights = np.exp(np.mean(np.log(stack), axis=-1))
+            return weights / np.sum(weights, axis=-1, keepdims=True)
+
+        return self._principal_eigenvectors(stack)
+
+    def _principal_eigenvectors(self, stack: np.ndarray) -> np.ndarray:
+        """批量求主特征向量并归一化
+
+        正互反矩阵的主特征值为实数，对应的 Perron 向量各分量同号，
+        除以分量和即得到正的归一化权重。特征分解失败或结果不为正的矩阵
+        回退到幂法。
+        """
+        try:
+            eigenvalues, eigenvectors = np.linalg.eig(stack)
+        except np.linalg.LinAlgError:
+            return self._power_iteration(stack)
+
+        principal = np.argmax(eigenvalues.real, axis=-1)
+        vectors = np.take_along_axis(
+            eigenvectors, principal[:, np.newaxis, np.newaxis], axis=-1
+        )[..., 0].real
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            weights = vectors / np.sum(vectors, axis=-1, keepdims=True)
+
+        failed = ~np.all(np.isfinite(weights) & (weights > 0), axis=-1)
+        if np.any(failed):
+            weights[failed] = self._power_iteration(stack[failed])
+
+        return weights
+
+    def _power_iteration(self, stack: np.ndarray) -> np.ndarray:
+        """幂法批量计算主特征向量（已收敛的矩阵不再参与迭代）"""
+        n_matrices, n, _ = stack.shape
 
         # 初始化权重向量（均匀分布）
-        weights = np.ones(n) / n
+        weights = np.full((n_matrices, n), 1.0 / n)
+        active = np.arange(n_matrices)
 
-        # 幂法迭代
         for _ in range(self.max_iterations):
-            # 计算新权重: w_new = A * w
-            new_weights = np.dot(matrix, weights)
-
-            # 归一化
-            new_weights = new_weights / np.sum(new_weights)
+            # 计算新权重: w_new = A * w，并归一化
+            new_weights = np.einsum("bij,bj->bi", stack[active], weights[active])
+            new_weights /= np.sum(new_weights, axis=-1, keepdims=True)
 
             # 检查收敛
-            if np.allclose(new_weights, weights, atol=self.tolerance):
-                break
+            converged = np.all(
+                np.isclose(new_weights, weights[active], atol=self.tolerance),
+                axis=-1
+            )
+            weights[active] = new_weights
+            active = active[~converged]
 
-            weights = new_weights
+            if len(active) == 0:
+                break
 
         return weights
 
@@ -205,28 +324,8 @@ class AHPService:
         """
         self._validate_matrix(matrix)
 
-        n = matrix.shape[0]
-
-        # 特殊情况：n <= 2，总是完全一致的
-        if n <= 2:
-            return 0.0
-
-        # 计算权重
-        weights = self.calculate_weights(matrix)
-
-        # 计算最大特征值
-        lambda_max = self._calculate_lambda_max(matrix, weights)
-
-        # 计算一致性指标
-        ci = self._calculate_consistency_index(lambda_max, n)
-
-        # 获取随机一致性指标
-        ri = self._get_random_index(n)
-
-        # 计算一致性比率
-        cr = ci / ri if ri > 0 else 0.0
-
-        return cr
+        result = self._evaluate(matrix[np.newaxis].astype(float), None)
+        return float(result["consistency_ratio"][0])
 
     def _calculate_lambda_max(
         self, matrix: np.ndarray, weights: np.ndarray
@@ -242,15 +341,14 @@ class AHPService:
         Returns:
             最大特征值
         """
-        n = matrix.shape[0]
-
-        # 计算 A * w
-        aw = np.dot(matrix, weights)
-
-        # λ_max = (1/n) * Σ(aw_i / w_i)
-        lambda_max = np.mean(aw / weights)
+        return float(
+            self._lambda_max(matrix[np.newaxis], np.asarray(weights)[np.newaxis])[0]
+        )
 
-        return float(lambda_max)
+    def _lambda_max(self, stack: np.ndarray, weights: np.ndarray) -> np.ndarray:
+        """批量计算最大特征值 λ_max = mean_i((A · w)_i / w_i)"""
+        aw = np.einsum("bij,bj->bi", stack, weights)
+        return np.mean(aw / weights, axis=-1)
 
     def _calculate_consistency_index(
         self, lambda_max: float, n: int
@@ -342,26 +440,146 @@ class AHPService:
 
         n = matrix.shape[0]
 
-        # 计算权重
-        weights = self.calculate_weights(matrix)
-
-        # 计算一致性比率
-        cr = self.calculate_consistency_ratio(matrix)
-
-        # 计算最大特征值
-        lambda_max = self._calculate_lambda_max(matrix, weights)
-
-        # 判断一致性是否可接受
-        acceptable = cr < 0.1
+        # 权重、λ_max 与 CR 一次计算
+        result = self._evaluate(matrix[np.newaxis].astype(float), None)
 
         # 准则名称
         if criteria is None:
             criteria = [f"C{i+1}" for i in range(n)]
 
         return {
-            "weights": weights,
-            "consistency_ratio": cr,
+            "weights": result["weights"][0],
+            "consistency_ratio": float(result["consistency_ratio"][0]),
             "criteria": criteria,
-            "lambda_max": lambda_max,
+            "lambda_max": float(result["lambda_max"][0]),
+            "acceptable": bool(result["acceptable"][0]),
+        }
+
+    def calculate_weights_with_consistency_batch(
+        self,
+        matrices: np.ndarray | Sequence[np.ndarray],
+        method: Literal["eigenvector", "geometric_mean"] | None = None
+    ) -> dict[str, Any]:
+        """批量计算权重及一致性检验
+
+        同阶矩阵在一次批量特征分解中求解；传入不同阶矩阵的列表时按阶数
+        分组，每组一次批量计算。
+
+        Args:
+            matrices: 成对比较矩阵堆叠 (B x n x n)，或不同阶成对比较矩阵的列表
+            method: 权重计算方法（默认使用初始化时的方法）
+
+        Returns:
+            包含以下键的字典:
+            - weights: 堆叠输入时为 (B x n) 数组，列表输入时为权重向量列表
+            - lambda_max: np.ndarray (B,) - 最大特征值
+            - consistency_index: np.ndarray (B,) - 一致性指标
+            - consistency_ratio: np.ndarray (B,) - 一致性比率
+            - acceptable: np.ndarray (B,) - 一致性是否可接受 (CR < 0.1)
+            - method: str - 权重计算方法
+
+        Raises:
+            AHPValidationError: 任一矩阵验证失败
+        """
+        method = self._check_method(method or self.method)
+
+        if isinstance(matrices, np.ndarray):
+            result = self._evaluate(self._as_stack(matrices), method)
+            result["method"] = method
+            return result
+
+        matrices = list(matrices)
+        if not matrices:
+            raise AHPValidationError("矩阵列表不能为空")
+
+        # 按阶数分组
+        groups: dict[int, list[int]] = {}
+        for index, matrix in enumerate(matrices):
+            if not isinstance(matrix, np.ndarray) or matrix.ndim != 2 or matrix.size == 0:
+                raise AHPValidationError(
+                    f"矩阵 {index}: 必须是非空的二维 numpy 数组"
+                )
+            if matrix.shape[0] != matrix.shape[1]:
+                raise AHPValidationError(
+                    f"矩阵 {index}: 成对比较矩阵必须是方阵，当前形状: {matrix.shape}"
+                )
+            groups.setdefault(matrix.shape[0], []).append(index)
+
+        n_matrices = len(matrices)
+        weights: list[np.ndarray | None] = [None] * n_matrices
+        scalars = {
+            key: np.empty(n_matrices)
+            for key in ("lambda_max", "consistency_index", "consistency_ratio")
+        }
+        acceptable = np.empty(n_matrices, dtype=bool)
+
+        for indices in groups.values():
+            stack = np.stack([matrices[i] for i in indices]).astype(float)
+            self._validate_stack(stack, indices)
+
+            group_result = self._evaluate(stack, method)
+            for position, index in enumerate(indices):
+                weights[index] = group_result["weights"][position]
+            for key, values in scalars.items():
+                values[indices] = group_result[key]
+            acceptable[indices] = group_result["acceptable"]
+
+        return {
+            "weights": weights,
+            **scalars,
             "acceptable": acceptable,
+            "method": method,
+        }
+
+    def _evaluate(
+        self, stack: np.ndarray, method: str | None
+    ) -> dict[str, np.ndarray]:
+        """计算 (B, n, n) 堆叠的权重、λ_max、CI、CR（权重只计算一次）"""
+        n = stack.shape[-1]
+
+        weights = self._weights(stack, method)
+        lambda_max = self._lambda_max(stack, weights)
+
+        # 特殊情况：n <= 2，总是完全一致的
+        if n <= 2:
+            ci = np.zeros(len(stack))
+            cr = np.zeros(len(stack))
+        else:
+            ci = (lambda_max - n) / (n - 1)
+            cr = ci / self._get_random_index(n)
+
+        return {
+            "weights": weights,
+            "lambda_max": lambda_max,
+            "consistency_index": ci,
+            "consistency_ratio": cr,
+            "acceptable": cr < ACCEPTABLE_CR,
         }
+
+    def _as_stack(self, matrices: np.ndarray) -> np.ndarray:
+        """验证并转换 (B, n, n) 矩阵堆叠"""
+        if not isinstance(matrices, np.ndarray):
+            raise AHPValidationError(
+                f"矩阵堆叠必须是 numpy 数组，当前类型: {type(matrices)}"
+            )
+
+        if matrices.size == 0:
+            raise AHPValidationError("矩阵堆叠不能为空")
+
+        if matrices.ndim != 3:
+            raise AHPValidationError(
+                f"矩阵堆叠必须是三维数组 (B x n x n)，当前维度: {matrices.ndim}"
+            )
+
+        self._validate_stack(matrices, range(len(matrices)))
+        return matrices.astype(float)
+
+    @staticmethod
+    def _check_method(method: str) -> str:
+        """验证权重计算方法"""
+        if method not in WEIGHT_METHODS:
+            raise ValueError(
+                f"无效的权重计算方法: '{method}'. "
+                f"必须是 'eigenvector' 或 'geometric_mean'"
+            )
+        return method
@@ -1,13 +1,20 @@
 """
 算法对比服务
 
-提供多算法结果对比功能。
+提供多算法结果对比功能。决策问题只构建（并验证）一次，各算法可在线程池或
+进程池中并行运行；排名以整数数组返回，相关性矩阵向量化计算。
 """
 
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any, Callable, Literal
+
 import numpy as np
-from typing import Literal
 
 from ..algorithms import get_algorithm, list_algorithms
+from ..ranking import metrics
+
+if TYPE_CHECKING:
+    from ..models import DecisionProblem
 
 
 class ComparisonValidationError(Exception):
@@ -38,10 +45,15 @@ class ComparisonService:
             algorithms=["wsm", "topsis", "vikor"]
         )
 
-        # 查看排名
+        # 查看排名（0-based 整数数组）
         for algo_result in result["rankings"]:
             print(f"{algo_result['algorithm']}: {algo_result['ranking']}")
 
+        # 大规模对比：4 个线程并行运行各算法
+        result = service.compare_algorithms(
+            decision_matrix, weights, algorithms=["wsm", "topsis", "vikor"], workers=4
+        )
+
         # 查看相关性
         print(result["correlations"])
 
@@ -50,6 +62,9 @@ class ComparisonService:
         ```
     """
 
+    CORRELATION_METHODS = ("spearman", "kendall")
+    """支持的排名相关系数"""
+
     def __init__(self):
         """初始化对比服务
 
@@ -69,100 +84,83 @@ class ComparisonService:
         weights: np.ndarray,
         algorithms: list[str],
         criteria_directions: list[Literal["higher_better", "lower_better"]] | None = None,
-        alternatives: list[str] | None = None
-    ) -> dict[str, any]:
+        alternatives: list[str] | None = None,
+        *,
+        workers: int | None = None,
+        executor: Literal["thread", "process"] = "thread",
+        algorithm_params: dict[str, dict[str, Any]] | None = None,
+        correlation: Literal["spearman", "kendall"] = "spearman",
+        top_k: int | None = None
+    ) -> dict[str, Any]:
         """对比多个算法的排序结果
 
+        决策问题只构建一次，所有算法共享其缓存的评分矩阵。
+
         Args:
             decision_matrix: 决策矩阵 (n_alternatives x n_criteria)
             weights: 准则权重
             algorithms: 算法名称列表
             criteria_directions: 准则方向列表
             alternatives: 方案名称列表
+            workers: 并行数（None 或 1 表示在当前线程中依次运行）
+            executor: 并行方式，"thread"（线程池）或 "process"（进程池）
+            algorithm_params: 各算法的额外参数 {算法名: {参数名: 值}}
+            correlation: 相关系数，"spearman" 或 "kendall"（τ-b）
+            top_k: 只比较前 k 名的头部指标（可选）
 
         Returns:
             对比结果字典，包含：
-            - rankings: 各算法的排名
-            - correlations: 算法间的相关性矩阵
+            - rankings: 各算法的排名（0-based 整数数组）
+            - rank_matrix: (n_algorithms, n_alternatives) 排名矩阵
+            - correlation_method: 使用的相关系数
+            - correlations: 算法两两之间的相关系数
+            - correlation_matrix: (n_algorithms, n_algorithms) 相关矩阵
+            - top_k_overlap / rank_biased_overlap: 两两的头部重合度
+              （仅当指定 top_k 时）
             - differences: 排名差异列表
             - summary: 对比摘要
+
+        Raises:
+            ComparisonValidationError: 输入或并行参数无效
         """
         # 验证输入
         self._validate_input(decision_matrix, weights, algorithms)
 
-        n_alternatives = decision_matrix.shape[0]
-
-        # 方案名称
-        if alternatives is None:
-            alternatives = [f"A{i}" for i in range(n_alternatives)]
-
-        # 准则方向
-        if criteria_directions is None:
-            criteria_directions = ["higher_better"] * len(weights)
-
-        # 运行所有算法
-        rankings = {}
-
-        # 转换决策矩阵为 scores 字典格式
-        # decision_matrix: np.ndarray (n_alternatives x n_criteria)
-        # scores: {alternative: {criterion: score}}
-        scores = {}
-        for i, alt_name in enumerate(alternatives):
-            scores[alt_name] = {}
-            for j in range(len(weights)):
-                criterion_name = f"C{j}"
-                scores[alt_name][criterion_name] = float(decision_matrix[i, j])
-
-        # 创建准则列表
-        from ..models import Criterion, AlgorithmConfig
-        criteria = []
-        for j, direction in enumerate(criteria_directions):
-            criterion_name = f"C{j}"
-            criteria.append(
-                Criterion(
-                    name=criterion_name,
-                    weight=float(weights[j]),
-                    direction=direction
-                )
+        if workers is not None and workers < 1:
+            raise ComparisonValidationError(f"workers 必须为正整数，当前值为 {workers}")
+        if executor not in ("thread", "process"):
+            raise ComparisonValidationError(
+                f"executor 必须是 'thread' 或 'process'，当前值为 '{executor}'"
             )
-
-        for algo_name in algorithms:
-            algo = get_algorithm(algo_name)
-
-            # 创建 DecisionProblem（使用正确的 API）
-            # 注意：禁用评分范围验证，因为决策矩阵可能包含任意数值
-            from ..models import DecisionProblem
-            problem = DecisionProblem(
-                alternatives=tuple(alternatives),
-                criteria=tuple(criteria),
-                scores=scores,
-                algorithm=AlgorithmConfig(name=algo_name),
-                score_range=(-float('inf'), float('inf'))  # 允许任意范围
+        if correlation not in self.CORRELATION_METHODS:
+            raise ComparisonValidationError(
+                f"correlation 必须是 'spearman' 或 'kendall'，当前值为 '{correlation}'"
+            )
+        if top_k is not None and not 1 <= top_k <= decision_matrix.shape[0]:
+            raise ComparisonValidationError(
+                f"top_k 必须在 [1, {decision_matrix.shape[0]}] 范围内，当前值为 {top_k}"
             )
 
-            result = algo.calculate(problem)
-
-            # 提取排名（DecisionResult 是 dataclass，访问 rankings 属性）
-            ranking = [0] * n_alternatives
-            for rank_item in result.rankings:
-                # rank_item.alternative 是方案名称（如 "A0"）
-                # rank_item.rank 是排名（从 1 开始）
-                alt_name = rank_item.alternative
-                rank_value = rank_item.rank
-
-                # 从方案名称中提取索引
-                if isinstance(alt_name, str) and alt_name.startswith("A"):
-                    idx = int(alt_name.replace("A", ""))
-                else:
-                    # 如果不是标准格式，从 alternatives 列表中查找
-                    idx = alternatives.index(alt_name)
+        problem = self._build_problem(
+            decision_matrix, weights, criteria_directions, alternatives
+        )
+        algorithm_params = algorithm_params or {}
 
-                ranking[idx] = rank_value - 1  # 转换为 0-based
+        # 运行所有算法
+        tasks = [(name, algorithm_params.get(name, {})) for name in algorithms]
+        if workers is None or workers == 1:
+            ranks = [_rank_alternatives(name, problem, params) for name, params in tasks]
+        else:
+            pool_class = ThreadPoolExecutor if executor == "thread" else ProcessPoolExecutor
+            with pool_class(max_workers=min(workers, len(tasks))) as pool:
+                ranks = self._run_parallel(pool, problem, tasks)
 
-            rankings[algo_name] = ranking
+        rank_matrix = np.vstack(ranks)
+        rankings = dict(zip(algorithms, rank_matrix))
 
         # 计算相关性
-        correlations = self._calculate_correlation_matrix(rankings)
+        correlation_matrix = self._correlation_matrix(rank_matrix, correlation)
+        correlations = self._calculate_correlation_matrix(rankings, correlation_matrix)
 
         # 识别差异
         differences = self.identify_ranking_differences(rankings)
@@ -170,7 +168,7 @@ class ComparisonService:
         # 生成摘要
         summary = self._generate_summary(rankings, correlations, differences)
 
-        return {
+        result = {
             "rankings": [
                 {
                     "algorithm": algo,
@@ -178,54 +176,57 @@ class ComparisonService:
                 }
                 for algo in algorithms
             ],
+            "rank_matrix": rank_matrix,
+            "correlation_method": correlation,
             "correlations": correlations,
+            "correlation_matrix": correlation_matrix,
             "differences": differences,
             "summary": summary,
         }
 
+        # 头部指标
+        if top_k is not None:
+            result["top_k_overlap"] = self._pairwise(
+                rankings, lambda r1, r2: metrics.top_k_overlap(r1, r2, top_k)
+            )
+            result["rank_biased_overlap"] = self._pairwise(
+                rankings, lambda r1, r2: metrics.rank_biased_overlap(r1, r2, depth=top_k)
+            )
+
+        return result
+
     def calculate_ranking_correlation(
         self,
-        ranking1: list[int],
-        ranking2: list[int]
+        ranking1: "list[int] | np.ndarray",
+        ranking2: "list[int] | np.ndarray",
+        method: Literal["spearman", "kendall"] = "spearman"
     ) -> float:
-        """计算两个排名的 Spearman 相关系数
+        """计算两个排名的相关系数
 
         Args:
             ranking1: 第一个排名
             ranking2: 第二个排名
+            method: "spearman"（默认）或 "kendall"（τ-b，考虑并列）
 
         Returns:
-            Spearman 相关系数 (范围 [-1, 1])
+            相关系数 (范围 [-1, 1])
 
         Raises:
-            ValueError: 排名长度不一致
+            ValueError: 排名长度不一致或相关系数类型无效
         """
         if len(ranking1) != len(ranking2):
             raise ValueError(
                 f"排名长度不一致: {len(ranking1)} vs {len(ranking2)}"
             )
+        if method not in self.CORRELATION_METHODS:
+            raise ValueError(f"未知的相关系数类型: {method}")
 
-        n = len(ranking1)
-
-        if n <= 1:
-            return 1.0  # 只有一个元素时，完全相关
-
-        # 计算排名差值平方和
-        # ρ = 1 - (6 * Σd²) / (n * (n² - 1))
-        sum_squared_diff = sum((r1 - r2) ** 2 for r1, r2 in zip(ranking1, ranking2))
-
-        denominator = n * (n ** 2 - 1)
-
-        if denominator == 0:
-            return 1.0
-
-        correlation = 1 - (6 * sum_squared_diff) / denominator
-
-        return float(correlation)
+        rank_matrix = np.vstack([ranking1, ranking2])
+        return float(self._correlation_matrix(rank_matrix, method)[0, 1])
 
     def identify_ranking_differences(
         self,
-        rankings: dict[str, list[int]]
+        rankings: dict[str, "list[int] | np.ndarray"]
     ) -> list[dict]:
         """识别排名差异
 
@@ -239,31 +240,26 @@ class ComparisonService:
             - ranks: 各算法中的排名
             - variance: 排名方差
         """
-        n_alternatives = len(next(iter(rankings.values())))
         algorithm_names = list(rankings.keys())
-
-        differences = []
-
-        for alt_idx in range(n_alternatives):
-            # 收集该方案在各算法中的排名
-            ranks = [
-                rankings[algo][alt_idx]
-                for algo in algorithm_names
-            ]
-
-            # 计算排名方差
-            rank_variance = np.var(ranks)
-
-            # 如果有差异（方差 > 0）
-            if rank_variance > 0:
-                differences.append({
-                    "alternative": alt_idx,
-                    "algorithms": algorithm_names,
-                    "ranks": ranks,
-                    "variance": float(rank_variance),
-                    "min_rank": int(min(ranks)),
-                    "max_rank": int(max(ranks)),
-                })
+        rank_matrix = np.vstack([rankings[algo] for algo in algorithm_names])
+
+        # 各方案在各算法中的排名方差
+        variances = rank_matrix.var(axis=0)
+        min_ranks = rank_matrix.min(axis=0)
+        max_ranks = rank_matrix.max(axis=0)
+
+        # 只保留有差异（方差 > 0）的方案
+        differences = [
+            {
+                "alternative": int(alt_idx),
+                "algorithms": algorithm_names,
+                "ranks": rank_matrix[:, alt_idx].tolist(),
+                "variance": float(variances[alt_idx]),
+                "min_rank": int(min_ranks[alt_idx]),
+                "max_rank": int(max_ranks[alt_idx]),
+            }
+            for alt_idx in np.flatnonzero(variances > 0)
+        ]
 
         # 按方差降序排序
         differences.sort(key=lambda x: x["variance"], reverse=True)
@@ -272,7 +268,7 @@ class ComparisonService:
 
     def generate_comparison_report(
         self,
-        comparison_result: dict[str, any]
+        comparison_result: dict[str, Any]
     ) -> str:
         """生成对比报告（文本格式）
 
@@ -293,13 +289,14 @@ class ComparisonService:
         lines.append("-" * 40)
         for algo_result in comparison_result["rankings"]:
             algo_name = algo_result["algorithm"].upper()
-            ranking = algo_result["ranking"]
+            ranking = np.asarray(algo_result["ranking"]).tolist()
             lines.append(f"{algo_name}: {ranking}")
         lines.append("")
 
         # 相关性部分
         if comparison_result["correlations"]:
-            lines.append("算法相关性 (Spearman):")
+            method = comparison_result.get("correlation_method", "spearman")
+            lines.append(f"算法相关性 ({method.capitalize()}):")
             lines.append("-" * 40)
             corr = comparison_result["correlations"]
             for pair, value in corr.items():
@@ -378,38 +375,143 @@ class ComparisonService:
                     f"支持的算法: {self.supported_algorithms}"
                 )
 
+    def _build_problem(
+        self,
+        decision_matrix: np.ndarray,
+        weights: np.ndarray,
+        criteria_directions: list[str] | None,
+        alternatives: list[str] | None
+    ) -> "DecisionProblem":
+        """从决策矩阵构建（并验证）一次决策问题，供所有算法共享
+
+        Args:
+            decision_matrix: 决策矩阵
+            weights: 准则权重
+            criteria_directions: 准则方向列表（默认全部 higher_better）
+            alternatives: 方案名称列表（默认 A0, A1, ...）
+
+        Returns:
+            决策问题
+        """
+        from ..models import Criterion, DecisionProblem
+
+        n_alternatives, n_criteria = decision_matrix.shape
+
+        # 方案名称
+        if alternatives is None:
+            alternatives = [f"A{i}" for i in range(n_alternatives)]
+
+        # 准则方向
+        if criteria_directions is None:
+            criteria_directions = ["higher_better"] * n_criteria
+
+        # 创建准则列表
+        criteria = tuple(
+            Criterion(name=f"C{j}", weight=float(weights[j]), direction=direction)
+            for j, direction in enumerate(criteria_directions)
+        )
+
+        # 转换决策矩阵为 scores 字典格式 {alternative: {criterion: score}}
+        criterion_names = [crit.name for crit in criteria]
+        scores = {
+            alt_name: dict(zip(criterion_names, row))
+            for alt_name, row in zip(alternatives, decision_matrix.astype(float).tolist())
+        }
+
+        # 注意：禁用评分范围验证，因为决策矩阵可能包含任意数值
+        return DecisionProblem(
+            alternatives=tuple(alternatives),
+            criteria=criteria,
+            scores=scores,
+            score_range=(-float('inf'), float('inf'))  # 允许任意范围
+        )
+
+    def _run_parallel(
+        self,
+        pool: Executor,
+        problem: "DecisionProblem",
+        tasks: list[tuple[str, dict[str, Any]]]
+    ) -> list[np.ndarray]:
+        """在线程池/进程池中运行各算法，结果按任务顺序返回"""
+        futures = [
+            pool.submit(_rank_alternatives, name, problem, params)
+            for name, params in tasks
+        ]
+        return [future.result() for future in futures]
+
+    def _correlation_matrix(
+        self,
+        rank_matrix: np.ndarray,
+        method: Literal["spearman", "kendall"] = "spearman"
+    ) -> np.ndarray:
+        """计算 (k, n) 排名矩阵的相关矩阵
+
+        Args:
+            rank_matrix: (n_algorithms, n_alternatives) 排名矩阵
+            method: "spearman" 或 "kendall"
+
+        Returns:
+            (n_algorithms, n_algorithms) 相关矩阵
+        """
+        if rank_matrix.shape[1] <= 1:
+            return np.ones((len(rank_matrix), len(rank_matrix)))  # 只有一个元素时，完全相关
+
+        if method == "kendall":
+            return metrics.kendall_matrix(rank_matrix)
+        return metrics.spearman_matrix(rank_matrix)
+
+    def _pairwise(
+        self,
+        rankings: dict[str, np.ndarray],
+        metric: Callable[[np.ndarray, np.ndarray], float]
+    ) -> dict[str, float]:
+        """对算法两两计算排名指标
+
+        Returns:
+            指标字典 {"ALGO1 vs ALGO2": value}
+        """
+        algorithm_names = list(rankings.keys())
+        return {
+            f"{algo1.upper()} vs {algo2.upper()}": metric(rankings[algo1], rankings[algo2])
+            for i, algo1 in enumerate(algorithm_names)
+            for algo2 in algorithm_names[i + 1:]
+        }
+
     def _calculate_correlation_matrix(
         self,
-        rankings: dict[str, list[int]]
+        rankings: dict[str, np.ndarray],
+        correlation_matrix: np.ndarray | None = None
     ) -> dict[str, float]:
         """计算算法间的相关性矩阵
 
         Args:
             rankings: 各算法的排名
+            correlation_matrix: 已计算的相关矩阵（可选，默认计算 Spearman）
 
         Returns:
             相关性字典 {pair: correlation}
         """
         algorithm_names = list(rankings.keys())
-        correlations = {}
+        if correlation_matrix is None:
+            correlation_matrix = self._correlation_matrix(
+                np.vstack([rankings[algo] for algo in algorithm_names])
+            )
 
+        correlations = {}
         for i, algo1 in enumerate(algorithm_names):
-            for algo2 in algorithm_names[i + 1:]:
-                corr = self.calculate_ranking_correlation(
-                    rankings[algo1],
-                    rankings[algo2]
-                )
+            for j in range(i + 1, len(algorithm_names)):
+                algo2 = algorithm_names[j]
                 pair_name = f"{algo1.upper()} vs {algo2.upper()}"
-                correlations[pair_name] = corr
+                correlations[pair_name] = float(correlation_matrix[i, j])
 
         return correlations
 
     def _generate_summary(
         self,
-        rankings: dict[str, list[int]],
+        rankings: dict[str, np.ndarray],
         correlations: dict[str, float],
         differences: list[dict]
-    ) -> dict[str, any]:
+    ) -> dict[str, Any]:
         """生成对比摘要
 
         Args:
@@ -442,3 +544,28 @@ class ComparisonService:
             "max_variance": float(max_variance),
             "has_differences": len(differences) > 0,
         }
+
+
+def _rank_alternatives(
+    algorithm_name: str,
+    problem: "DecisionProblem",
+    params: dict[str, Any]
+) -> np.ndarray:
+    """运行单个算法并返回 0-based 排名向量（可在线程池/进程池中执行）
+
+    Args:
+        algorithm_name: 算法名称
+        problem: 决策问题
+        params: 算法参数
+
+    Returns:
+        排名向量 (n_alternatives,)，顺序与 problem.alternatives 一致
+    """
+    result = get_algorithm(algorithm_name).calculate(problem, **params)
+
+    index = {alt: i for i, alt in enumerate(problem.alternatives)}
+    ranking = np.empty(len(index), dtype=np.int64)
+    for rank_item in result.rankings:
+        ranking[index[rank_item.alternative]] = rank_item.rank - 1  # 转换为 0-based
+
+    return ranking
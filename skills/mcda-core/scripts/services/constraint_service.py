@@ -113,6 +113,7 @@ class ConstraintService:
             data_source=problem.data_source if hasattr(problem, 'data_source') else None,
             raw_data=problem.raw_data if hasattr(problem, 'raw_data') else None,
             score_range=problem.score_range if hasattr(problem, 'score_range') else (0.0, 100.0),
+            trusted=problem.is_validated,
         )
 
         return adjusted_problem
@@ -168,7 +169,7 @@ class ConstraintService:
             if alt_id in problem.scores
         }
 
-        # 创建新的决策问题
+        # 创建新的决策问题（评分取自原问题，原问题已验证时无需重新验证）
         filtered_problem = DecisionProblem(
             alternatives=tuple(accepted_alternatives),
             criteria=problem.criteria,
@@ -177,6 +178,7 @@ class ConstraintService:
             data_source=problem.data_source if hasattr(problem, 'data_source') else None,
             raw_data=problem.raw_data if hasattr(problem, 'raw_data') else None,
             score_range=problem.score_range if hasattr(problem, 'score_range') else (0.0, 100.0),
+            trusted=problem.is_validated,
         )
 
         return filtered_problem
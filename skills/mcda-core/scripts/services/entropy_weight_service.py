@@ -10,6 +10,13 @@ References:
 import numpy as np
 from typing import Literal
 
+from mcda_core.weighting.entropy_weighting import (
+    column_entropies,
+    entropy_weights_from_statistics,
+    weights_from_entropies,
+)
+from mcda_core.weighting.statistics import MatrixStatistics
+
 
 class EntropyWeightValidationError(Exception):
     """熵权法验证错误
@@ -193,50 +200,12 @@ class EntropyWeightService:
         # 验证输入
         self._validate_matrix(decision_matrix)
 
-        n_alternatives, n_criteria = decision_matrix.shape
-
-        # 默认方向
-        if directions is None:
-            directions = ["higher_better"] * n_criteria
-
-        # 验证方向数量
-        if len(directions) != n_criteria:
-            raise ValueError(
-                f"方向数量 ({len(directions)}) 必须等于准则数量 ({n_criteria})"
-            )
-
-        # 标准化每个准则
-        normalized_matrix = np.zeros_like(decision_matrix, dtype=float)
-        for j in range(n_criteria):
-            normalized_matrix[:, j] = self._normalize_with_shift(
-                decision_matrix[:, j],
-                directions[j]
-            )
-
-        # 计算每个准则的比重矩阵
-        p_matrix = np.zeros_like(normalized_matrix, dtype=float)
-        for j in range(n_criteria):
-            column_sum = np.sum(normalized_matrix[:, j])
-            p_matrix[:, j] = normalized_matrix[:, j] / column_sum
-
-        # 计算每个准则的信息熵
-        entropies = np.zeros(n_criteria)
-        for j in range(n_criteria):
-            entropies[j] = self._calculate_entropy(p_matrix[:, j])
-
-        # 计算差异系数
-        divergence_coefficients = 1 - entropies
-
-        # 计算权重（归一化差异系数）
-        total_divergence = np.sum(divergence_coefficients)
-
-        if total_divergence > 0:
-            weights = divergence_coefficients / total_divergence
-        else:
-            # 所有准则的熵都为1（完全相同），均匀分配权重
-            weights = np.ones(n_criteria) / n_criteria
-
-        return weights
+        # 各准则的标准化、比重与信息熵按列向量化计算
+        return entropy_weights_from_statistics(
+            MatrixStatistics(decision_matrix.astype(float)),
+            directions,
+            self.epsilon
+        )
 
     def _validate_matrix(self, matrix: np.ndarray) -> None:
         """验证决策矩阵
@@ -369,29 +338,13 @@ class EntropyWeightService:
         if criteria is None:
             criteria = [f"C{i+1}" for i in range(n_criteria)]
 
-        # 计算客观权重
-        weights = self.calculate_weights(decision_matrix, directions)
-
-        # 计算熵值和差异系数
-        # （重新计算以提供详细信息）
-        normalized_matrix = np.zeros_like(decision_matrix, dtype=float)
-        if directions is None:
-            directions = ["higher_better"] * n_criteria
-
-        for j in range(n_criteria):
-            normalized_matrix[:, j] = self._normalize_with_shift(
-                decision_matrix[:, j],
-                directions[j]
-            )
-
-        entropies = np.zeros(n_criteria)
-        p_matrix = np.zeros_like(normalized_matrix, dtype=float)
-
-        for j in range(n_criteria):
-            column_sum = np.sum(normalized_matrix[:, j])
-            p_matrix[:, j] = normalized_matrix[:, j] / column_sum
-            entropies[j] = self._calculate_entropy(p_matrix[:, j])
-
+        # 信息熵、差异系数与客观权重（一次计算）
+        entropies = column_entropies(
+            MatrixStatistics(decision_matrix.astype(float)),
+            directions,
+            self.epsilon
+        )
+        weights = weights_from_entropies(entropies)
         divergence_coefficients = 1 - entropies
 
         # 构建结果
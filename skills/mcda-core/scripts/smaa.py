@@ -0,0 +1,428 @@
+"""
+MCDA Core 随机多准则可接受性分析（SMAA）服务
+
+功能:
+- 从权重单纯形均匀抽样（可选在区间评分上下界内抽样评分）
+- 排名可接受性指标、中心权重向量、置信因子
+- 分块流式累计，内存占用与样本总数无关
+- 可选进程池并行，固定种子时结果与 workers 数量无关
+"""
+
+from typing import TYPE_CHECKING, Any, Iterator
+
+if TYPE_CHECKING:
+    import numpy as np
+    from .algorithms.base import MCDAAlgorithm
+    from .models import DecisionProblem, SMAAResult
+
+
+DEFAULT_MEMORY_BUDGET_MB = 64.0
+"""默认内存预算（MB），用于推导每块样本数"""
+
+DEFAULT_CONFIDENCE_SAMPLES = 1000
+"""评分抽样时计算置信因子的默认样本数"""
+
+
+# ============================================================================
+# 分块计算（模块级函数，可被进程池序列化）
+# ============================================================================
+
+def _sample_simplex(rng: "np.random.Generator", n_samples: int, n_crit: int) -> "np.ndarray":
+    """在权重单纯形上均匀抽样（Dirichlet(1, ..., 1)）"""
+    weights = rng.exponential(size=(n_samples, n_crit))
+    weights /= weights.sum(axis=1, keepdims=True)
+    return weights
+
+
+def _sample_problem(
+    rng: "np.random.Generator",
+    problem: "DecisionProblem",
+) -> "DecisionProblem":
+    """在区间评分上下界内均匀抽样一个精确数决策问题"""
+    lower, upper, _ = problem._score_bounds
+    matrix = lower + rng.random(lower.shape) * (upper - lower)
+    return problem.with_score_matrix(matrix)
+
+
+def _tally(ranks: "np.ndarray", weights: "np.ndarray") -> tuple["np.ndarray", "np.ndarray"]:
+    """统计一块样本的排名次数和第一名权重和
+
+    Args:
+        ranks: (k, n_alt) 排名矩阵，1 表示最优
+        weights: (k, n_crit) 权重样本
+
+    Returns:
+        (rank_counts, central_sums):
+        - rank_counts: (n_alt, n_alt)，[i, r] 为方案 i 获得第 r+1 名的次数
+        - central_sums: (n_alt, n_crit)，方案 i 排第一时的权重之和
+    """
+    import numpy as np
+
+    n_alt = ranks.shape[1]
+    flat_index = np.arange(n_alt) * n_alt + (ranks - 1)
+    rank_counts = np.bincount(
+        flat_index.ravel(), minlength=n_alt * n_alt
+    ).reshape(n_alt, n_alt)
+
+    first = (ranks == 1).astype(np.float64)
+    central_sums = first.T @ weights
+    return rank_counts, central_sums
+
+
+def _evaluate_chunk(
+    problem: "DecisionProblem",
+    algorithm: "MCDAAlgorithm",
+    n_samples: int,
+    seed: "np.random.SeedSequence",
+    sample_scores: bool,
+    algorithm_params: dict[str, Any],
+) -> tuple["np.ndarray", "np.ndarray"]:
+    """评估一块样本并返回其部分统计量（见 _tally）"""
+    import numpy as np
+
+    rng = np.random.default_rng(seed)
+    weights = _sample_simplex(rng, n_samples, len(problem.criteria))
+
+    if not sample_scores:
+        _, ranks = algorithm.calculate_batch(problem, weights, **algorithm_params)
+        return _tally(ranks, weights)
+
+    # 评分抽样：每个样本对应独立的评分矩阵
+    ranks = np.empty((n_samples, len(problem.alternatives)), dtype=np.int64)
+    for k in range(n_samples):
+        sampled = _sample_problem(rng, problem)
+        _, sample_ranks = algorithm.calculate_batch(sampled, weights[k], **algorithm_params)
+        ranks[k] = sample_ranks[0]
+
+    return _tally(ranks, weights)
+
+
+# ============================================================================
+# SMAAService
+# ============================================================================
+
+class SMAAService:
+    """随机多准则可接受性分析服务
+
+    与 SensitivityService 的单准则 ±delta 扰动互补：在整个权重空间上
+    抽样，给出每个方案获得各名次的概率。
+    """
+
+    def analyze(
+        self,
+        problem: "DecisionProblem",
+        algorithm: "MCDAAlgorithm",
+        *,
+        n_samples: int = 10_000,
+        seed: int | None = None,
+        sample_scores: bool = False,
+        confidence_samples: int = DEFAULT_CONFIDENCE_SAMPLES,
+        chunk_size: int | None = None,
+        memory_budget_mb: float = DEFAULT_MEMORY_BUDGET_MB,
+        workers: int | None = None,
+        algorithm_params: dict[str, Any] | None = None,
+    ) -> "SMAAResult":
+        """
+        执行完整的 SMAA 分析
+
+        Args:
+            problem: 决策问题
+            algorithm: MCDA 算法
+            n_samples: 权重样本数
+            seed: 随机种子（相同种子和分块方案得到相同结果）
+            sample_scores: 是否在区间评分上下界内抽样评分
+            confidence_samples: 评分抽样时计算置信因子的样本数
+            chunk_size: 每块样本数（默认按 memory_budget_mb 推导）
+            memory_budget_mb: 每个进程中单块计算的近似内存上限
+            workers: 进程数（None 或 1 表示在当前进程中计算）
+            algorithm_params: 传递给算法的参数
+
+        Returns:
+            SMAAResult: 含置信因子的最终结果
+
+        Raises:
+            SensitivityAnalysisError: 参数无效
+        """
+        totals = None
+        for totals in self._accumulate(
+            problem,
+            algorithm,
+            n_samples=n_samples,
+            seed=seed,
+            sample_scores=sample_scores,
+            chunk_size=chunk_size,
+            memory_budget_mb=memory_budget_mb,
+            workers=workers,
+            algorithm_params=algorithm_params,
+        ):
+            pass
+
+        result = self._build_result(problem, *totals)
+        confidence = self.confidence_factors(
+            problem,
+            algorithm,
+            result.central_weights,
+            seed=seed,
+            sample_scores=sample_scores,
+            n_samples=confidence_samples,
+            algorithm_params=algorithm_params,
+        )
+
+        from dataclasses import replace
+
+        return replace(result, confidence_factors=confidence)
+
+    def iter_analyze(
+        self,
+        problem: "DecisionProblem",
+        algorithm: "MCDAAlgorithm",
+        *,
+        n_samples: int = 10_000,
+        seed: int | None = None,
+        sample_scores: bool = False,
+        chunk_size: int | None = None,
+        memory_budget_mb: float = DEFAULT_MEMORY_BUDGET_MB,
+        workers: int | None = None,
+        algorithm_params: dict[str, Any] | None = None,
+    ) -> Iterator["SMAAResult"]:
+        """
+        流式执行 SMAA 分析，每完成一块样本产出一次累计结果
+
+        部分结果不含置信因子（confidence_factors 为空）。分块按顺序合并，
+        因此并行与串行的结果逐位一致。
+
+        Args:
+            参见 analyze()
+
+        Yields:
+            SMAAResult: 截至当前分块的累计结果
+
+        Raises:
+            SensitivityAnalysisError: 参数无效
+        """
+        for totals in self._accumulate(
+            problem,
+            algorithm,
+            n_samples=n_samples,
+            seed=seed,
+            sample_scores=sample_scores,
+            chunk_size=chunk_size,
+            memory_budget_mb=memory_budget_mb,
+            workers=workers,
+            algorithm_params=algorithm_params,
+        ):
+            yield self._build_result(problem, *totals)
+
+    def confidence_factors(
+        self,
+        problem: "DecisionProblem",
+        algorithm: "MCDAAlgorithm",
+        central_weights: dict[str, dict[str, float] | None],
+        *,
+        seed: int | None = None,
+        sample_scores: bool = False,
+        n_samples: int = DEFAULT_CONFIDENCE_SAMPLES,
+        algorithm_params: dict[str, Any] | None = None,
+    ) -> dict[str, float | None]:
+        """
+        计算置信因子：以方案自身中心权重评估时其排第一的概率
+
+        评分为精确数（或不抽样评分）时只需评估一次，置信因子为 0 或 1。
+
+        Args:
+            problem: 决策问题
+            algorithm: MCDA 算法
+            central_weights: 中心权重向量 {alternative: {criterion: weight} | None}
+            seed: 随机种子
+            sample_scores: 是否在区间评分上下界内抽样评分
+            n_samples: 评分抽样次数
+            algorithm_params: 传递给算法的参数
+
+        Returns:
+            dict: {alternative: 置信因子}，无中心权重的方案为 None
+        """
+        import numpy as np
+
+        algorithm_params = algorithm_params or {}
+        sample_scores = sample_scores and problem.has_interval_scores
+
+        candidates = [
+            (i, alt) for i, alt in enumerate(problem.alternatives)
+            if central_weights.get(alt) is not None
+        ]
+        factors: dict[str, float | None] = {alt: None for alt in problem.alternatives}
+        if not candidates:
+            return factors
+
+        crit_names = [crit.name for crit in problem.criteria]
+        weights = np.array([
+            [central_weights[alt][name] for name in crit_names]
+            for _, alt in candidates
+        ])
+        rows = np.arange(len(candidates))
+        columns = np.array([i for i, _ in candidates])
+
+        if sample_scores:
+            self._validate_samples(n_samples, "confidence_samples")
+            confidence_seed, _ = np.random.SeedSequence(seed).spawn(2)
+            rng = np.random.default_rng(confidence_seed)
+            hits = np.zeros(len(candidates), dtype=np.int64)
+            for _ in range(n_samples):
+                sampled = _sample_problem(rng, problem)
+                _, ranks = algorithm.calculate_batch(sampled, weights, **algorithm_params)
+                hits += ranks[rows, columns] == 1
+            values = hits / n_samples
+        else:
+            _, ranks = algorithm.calculate_batch(problem, weights, **algorithm_params)
+            values = (ranks[rows, columns] == 1).astype(np.float64)
+
+        for (_, alt), value in zip(candidates, values.tolist()):
+            factors[alt] = value
+        return factors
+
+    def _accumulate(
+        self,
+        problem: "DecisionProblem",
+        algorithm: "MCDAAlgorithm",
+        *,
+        n_samples: int,
+        seed: int | None,
+        sample_scores: bool,
+        chunk_size: int | None,
+        memory_budget_mb: float,
+        workers: int | None,
+        algorithm_params: dict[str, Any] | None,
+    ) -> Iterator[tuple["np.ndarray", "np.ndarray", int]]:
+        """逐块合并部分统计量，产出 (rank_counts, central_sums, 已完成样本数)
+
+        产出的数组在后续迭代中被原地更新，调用方需在下一次迭代前使用。
+        """
+        import numpy as np
+
+        self._validate_samples(n_samples, "n_samples")
+        if workers is not None and workers < 1:
+            from .exceptions import SensitivityAnalysisError
+            raise SensitivityAnalysisError(f"workers 必须为正整数，当前值为 {workers}")
+
+        algorithm_params = algorithm_params or {}
+        sample_scores = sample_scores and problem.has_interval_scores
+        # 分块方案只由样本数和内存预算决定，与 workers 无关，保证结果可复现
+        if chunk_size is None:
+            chunk_size = self._chunk_size(problem, memory_budget_mb)
+        self._validate_samples(chunk_size, "chunk_size")
+
+        sizes = [chunk_size] * (n_samples // chunk_size)
+        if n_samples % chunk_size:
+            sizes.append(n_samples % chunk_size)
+        _, chunk_root = np.random.SeedSequence(seed).spawn(2)
+        tasks = list(zip(sizes, chunk_root.spawn(len(sizes))))
+
+        n_alt, n_crit = len(problem.alternatives), len(problem.criteria)
+        rank_counts = np.zeros((n_alt, n_alt), dtype=np.int64)
+        central_sums = np.zeros((n_alt, n_crit))
+        done = 0
+
+        for size, (counts, sums) in zip(
+            sizes,
+            self._run_chunks(problem, algorithm, tasks, sample_scores,
+                             algorithm_params, workers),
+        ):
+            rank_counts += counts
+            central_sums += sums
+            done += size
+            yield rank_counts, central_sums, done
+
+    def _run_chunks(
+        self,
+        problem: "DecisionProblem",
+        algorithm: "MCDAAlgorithm",
+        tasks: list[tuple[int, "np.random.SeedSequence"]],
+        sample_scores: bool,
+        algorithm_params: dict[str, Any],
+        workers: int | None,
+    ) -> Iterator[tuple["np.ndarray", "np.ndarray"]]:
+        """按顺序产出每块的部分统计量，每个进程最多同时运行一块"""
+        if workers is None or workers == 1:
+            for size, seed in tasks:
+                yield _evaluate_chunk(
+                    problem, algorithm, size, seed, sample_scores, algorithm_params
+                )
+            return
+
+        from collections import deque
+        from concurrent.futures import ProcessPoolExecutor
+
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            pending: deque = deque()
+            task_iter = iter(tasks)
+
+            def submit_next() -> None:
+                task = next(task_iter, None)
+                if task is not None:
+                    pending.append(executor.submit(
+                        _evaluate_chunk, problem, algorithm, task[0], task[1],
+                        sample_scores, algorithm_params,
+                    ))
+
+            for _ in range(workers):
+                submit_next()
+
+            while pending:
+                partial = pending.popleft().result()
+                submit_next()
+                yield partial
+
+    def _chunk_size(self, problem: "DecisionProblem", memory_budget_mb: float) -> int:
+        """根据内存预算推导每块样本数
+
+        每个样本约占用 n_alt 个得分/排名及排序临时数组和 n_crit 个权重。
+        """
+        from .exceptions import SensitivityAnalysisError
+
+        if memory_budget_mb <= 0:
+            raise SensitivityAnalysisError(
+                f"memory_budget_mb 必须大于 0，当前值为 {memory_budget_mb}",
+            )
+
+        n_alt, n_crit = len(problem.alternatives), len(problem.criteria)
+        bytes_per_sample = 8 * (8 * n_alt + 2 * n_crit)
+        return max(1, int(memory_budget_mb * 1024 * 1024 // bytes_per_sample))
+
+    def _validate_samples(self, value: int, name: str) -> None:
+        """验证样本数为正整数"""
+        from .exceptions import SensitivityAnalysisError
+
+        if value < 1:
+            raise SensitivityAnalysisError(
+                f"{name} 必须为正整数，当前值为 {value}",
+            )
+
+    def _build_result(
+        self,
+        problem: "DecisionProblem",
+        rank_counts: "np.ndarray",
+        central_sums: "np.ndarray",
+        n_samples: int,
+    ) -> "SMAAResult":
+        """由累计统计量构建 SMAAResult（不含置信因子）"""
+        from .models import SMAAResult
+
+        crit_names = [crit.name for crit in problem.criteria]
+        acceptability = (rank_counts / n_samples).tolist()
+        first_counts = rank_counts[:, 0].tolist()
+
+        central_weights: dict[str, dict[str, float] | None] = {}
+        for i, alt in enumerate(problem.alternatives):
+            if first_counts[i] == 0:
+                central_weights[alt] = None
+            else:
+                central = (central_sums[i] / first_counts[i]).tolist()
+                central_weights[alt] = dict(zip(crit_names, central))
+
+        return SMAAResult(
+            n_samples=n_samples,
+            rank_acceptability={
+                alt: tuple(row) for alt, row in zip(problem.alternatives, acceptability)
+            },
+            central_weights=central_weights,
+        )
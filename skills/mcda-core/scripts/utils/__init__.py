@@ -8,7 +8,7 @@ from pathlib import Path
 from typing import Any
 import yaml
 
-from .exceptions import YAMLParseError
+from ..exceptions import YAMLParseError
 
 
 # =============================================================================
@@ -1,14 +1,34 @@
 """
 结果缓存装饰器
 
-提供函数结果缓存功能，避免重复计算
+提供函数结果缓存功能，避免重复计算:
+- cached_result: 基于 lru_cache 的装饰器（参数必须可哈希）
+- ResultCache: 基于内容指纹的结果缓存（内存 LRU + 可选 sqlite 磁盘层）
 """
 
-from functools import lru_cache
-from typing import TypeVar, Callable
+import copy
+import hashlib
+import pickle
+import sqlite3
+import threading
+import time
+from collections import OrderedDict, namedtuple
+from contextlib import contextmanager
+from functools import lru_cache, wraps
+from pathlib import Path
+from typing import Any, Callable, Iterator, TypeVar
 
 T = TypeVar('T')
 
+CacheInfo = namedtuple(
+    "CacheInfo",
+    ["hits", "misses", "maxsize", "currsize", "disk_hits", "evictions"],
+)
+"""ResultCache 统计信息（前四项与 lru_cache 的 cache_info 一致）"""
+
+_MISSING = object()
+"""缓存未命中标记（区分缓存值 None）"""
+
 
 def cached_result(maxsize: int = 128) -> Callable[[Callable[..., T]], Callable[..., T]]:
     """缓存结果的装饰器
@@ -37,7 +57,7 @@ def cached_result(maxsize: int = 128) -> Callable[[Callable[..., T]], Callable[.
 
     Note:
         - 使用 LRU（最近最少使用）淘汰策略
-        - 函数参数必须是可哈希的
+        - 函数参数必须是可哈希的（DecisionProblem 等请使用 ResultCache）
         - 导出了 cache_info 和 cache_clear 方法
     """
     def decorator(func: Callable[..., T]) -> Callable[..., T]:
@@ -57,6 +77,274 @@ def cached_result(maxsize: int = 128) -> Callable[[Callable[..., T]], Callable[.
     return decorator
 
 
+# =============================================================================
+# 内容指纹
+# =============================================================================
+
+def _update_hash(hasher, value: Any) -> None:
+    """将值按类型规范化后写入哈希（递归处理容器）"""
+    if hasattr(type(value), "_score_bounds"):
+        # DecisionProblem: 评分上下界、权重、方向及方案/准则名称
+        hasher.update(b"problem")
+        lower, upper, interval_mask = value._score_bounds
+        for arr in (lower, upper, interval_mask, value.weight_vector, value.direction_mask):
+            _update_hash(hasher, arr)
+        _update_hash(hasher, tuple(value.alternatives))
+        _update_hash(hasher, tuple(crit.name for crit in value.criteria))
+    elif hasattr(value, "tobytes") and hasattr(value, "dtype"):
+        # numpy 数组: dtype + 形状 + C 连续字节
+        hasher.update(f"array:{value.dtype.str}:{value.shape}".encode())
+        hasher.update(value.tobytes(order="C"))
+    elif isinstance(value, dict):
+        hasher.update(f"dict:{len(value)}".encode())
+        for key in sorted(value, key=repr):
+            _update_hash(hasher, key)
+            _update_hash(hasher, value[key])
+    elif isinstance(value, (list, tuple)):
+        hasher.update(f"{type(value).__name__}:{len(value)}".encode())
+        for item in value:
+            _update_hash(hasher, item)
+    else:
+        hasher.update(f"{type(value).__name__}:{value!r};".encode())
+
+
+def fingerprint(*values: Any) -> str:
+    """计算任意参数的稳定内容指纹
+
+    DecisionProblem 按评分矩阵字节、权重和方向哈希，numpy 数组按字节哈希，
+    字典按键排序，其余值按 repr 哈希。
+
+    Returns:
+        str: SHA-256 十六进制摘要
+    """
+    hasher = hashlib.sha256()
+    for value in values:
+        _update_hash(hasher, value)
+    return hasher.hexdigest()
+
+
+def problem_fingerprint(
+    problem,
+    algorithm_name: str,
+    params: dict[str, Any] | None = None,
+) -> str:
+    """计算决策分析的缓存键
+
+    Args:
+        problem: 决策问题
+        algorithm_name: 算法名称
+        params: 算法参数
+
+    Returns:
+        str: SHA-256 十六进制摘要
+    """
+    return fingerprint(problem, algorithm_name, params or {})
+
+
+# =============================================================================
+# 内容寻址结果缓存
+# =============================================================================
+
+class SQLiteCacheBackend:
+    """sqlite 磁盘缓存层
+
+    值使用 pickle 序列化；每次操作独立连接，可跨线程、跨进程共享同一文件。
+    """
+
+    def __init__(self, path: Path | str, max_entries: int | None = None):
+        """
+        Args:
+            path: sqlite 数据库文件路径
+            max_entries: 最大条目数（None 表示不限制），超出时淘汰最久未访问的条目
+        """
+        self.path = Path(path)
+        self.max_entries = max_entries
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self._connect() as conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS results ("
+                "key TEXT PRIMARY KEY, value BLOB NOT NULL, "
+                "created_at REAL NOT NULL, accessed_at REAL NOT NULL)"
+            )
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        """打开连接，正常退出时提交事务，最终关闭连接"""
+        conn = sqlite3.connect(self.path, timeout=30)
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    def get(self, key: str, ttl: float | None = None) -> Any:
+        """读取缓存值，未命中或已过期返回 _MISSING"""
+        now = time.time()
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT value, created_at FROM results WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return _MISSING
+            if ttl is not None and now - row[1] > ttl:
+                conn.execute("DELETE FROM results WHERE key = ?", (key,))
+                return _MISSING
+            conn.execute(
+                "UPDATE results SET accessed_at = ? WHERE key = ?", (now, key)
+            )
+        return pickle.loads(row[0])
+
+    def set(self, key: str, value: Any) -> int:
+        """写入缓存值，返回因容量限制淘汰的条目数"""
+        now = time.time()
+        blob = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO results VALUES (?, ?, ?, ?)",
+                (key, blob, now, now),
+            )
+            if self.max_entries is None:
+                return 0
+            cursor = conn.execute(
+                "DELETE FROM results WHERE key IN ("
+                "SELECT key FROM results ORDER BY accessed_at DESC LIMIT -1 OFFSET ?)",
+                (self.max_entries,),
+            )
+            return cursor.rowcount
+
+    def clear(self) -> None:
+        """清空磁盘缓存"""
+        with self._connect() as conn:
+            conn.execute("DELETE FROM results")
+
+    def __len__(self) -> int:
+        with self._connect() as conn:
+            return conn.execute("SELECT COUNT(*) FROM results").fetchone()[0]
+
+
+class ResultCache:
+    """内容寻址结果缓存
+
+    键为 fingerprint()/problem_fingerprint() 生成的摘要。内存层为 LRU，
+    可选 sqlite 磁盘层在进程重启后继续命中；两层共用 ttl（秒）。
+    读取时返回缓存值的浅拷贝，调用方替换返回对象的属性（如 veto_results）
+    不会影响缓存或其他线程；嵌套的可变对象仍然共享，不应原地修改。
+
+    Example:
+        ```python
+        cache = ResultCache(maxsize=256, ttl=3600, disk_path="~/.mcda/cache.db")
+        key = problem_fingerprint(problem, "topsis")
+        result = cache.get_or_compute(key, lambda: algorithm.calculate(problem))
+        CacheStats.print_stats(cache, "analyze")
+        ```
+    """
+
+    def __init__(
+        self,
+        maxsize: int | None = 128,
+        ttl: float | None = None,
+        disk_path: Path | str | None = None,
+        disk_max_entries: int | None = None,
+    ):
+        """
+        Args:
+            maxsize: 内存层最大条目数（None 表示不限制，0 表示不使用内存层）
+            ttl: 条目有效期（秒，None 表示永不过期）
+            disk_path: sqlite 磁盘层文件路径（None 表示仅内存）
+            disk_max_entries: 磁盘层最大条目数
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.disk = (
+            SQLiteCacheBackend(Path(disk_path).expanduser(), disk_max_entries)
+            if disk_path is not None else None
+        )
+        self._entries: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._disk_hits = 0
+        self._evictions = 0
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """读取缓存值（先内存层，后磁盘层），返回浅拷贝"""
+        value = self._lookup(key)
+        return default if value is _MISSING else copy.copy(value)
+
+    def set(self, key: str, value: Any) -> None:
+        """写入缓存值（同时写入内存层和磁盘层）"""
+        self._store_memory(key, value)
+        if self.disk is not None:
+            evicted = self.disk.set(key, value)
+            with self._lock:
+                self._evictions += evicted
+
+    def get_or_compute(self, key: str, compute: Callable[[], T]) -> T:
+        """命中时返回缓存值，否则调用 compute() 并写入缓存（均返回浅拷贝）"""
+        value = self._lookup(key)
+        if value is _MISSING:
+            value = compute()
+            self.set(key, value)
+        return copy.copy(value)
+
+    def cache_info(self) -> CacheInfo:
+        """获取缓存统计（与 lru_cache 的 cache_info 兼容）"""
+        with self._lock:
+            return CacheInfo(
+                hits=self._hits,
+                misses=self._misses,
+                maxsize=self.maxsize,
+                currsize=len(self._entries),
+                disk_hits=self._disk_hits,
+                evictions=self._evictions,
+            )
+
+    def cache_clear(self) -> None:
+        """清空所有缓存层并重置统计"""
+        with self._lock:
+            self._entries.clear()
+            self._hits = self._misses = self._disk_hits = self._evictions = 0
+        if self.disk is not None:
+            self.disk.clear()
+
+    def _lookup(self, key: str) -> Any:
+        """按层查找，更新命中统计，未命中返回 _MISSING"""
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                if self.ttl is None or now - entry[0] <= self.ttl:
+                    self._entries.move_to_end(key)
+                    self._hits += 1
+                    return entry[1]
+                del self._entries[key]
+
+        value = _MISSING
+        if self.disk is not None:
+            value = self.disk.get(key, self.ttl)
+
+        with self._lock:
+            if value is _MISSING:
+                self._misses += 1
+                return _MISSING
+            self._hits += 1
+            self._disk_hits += 1
+
+        self._store_memory(key, value)
+        return value
+
+    def _store_memory(self, key: str, value: Any) -> None:
+        """写入内存层并按 maxsize 淘汰最久未使用的条目"""
+        if self.maxsize == 0:
+            return
+        with self._lock:
+            self._entries[key] = (time.monotonic(), value)
+            self._entries.move_to_end(key)
+            while self.maxsize is not None and len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+
 class CacheStats:
     """缓存统计工具"""
 
@@ -65,7 +353,7 @@ class CacheStats:
         """获取函数的缓存统计信息
 
         Args:
-            func: 已缓存的函数
+            func: 已缓存的函数或 ResultCache 实例
 
         Returns:
             dict: {
@@ -74,6 +362,7 @@ class CacheStats:
                 'maxsize': 最大缓存大小,
                 'currsize': 当前缓存大小
             }
+            ResultCache 额外包含 'disk_hits' 和 'evictions'
 
         Raises:
             AttributeError: 如果函数未使用缓存
@@ -82,60 +371,90 @@ class CacheStats:
             raise AttributeError("函数未使用缓存装饰器")
 
         info = func.cache_info()
-        return {
+        stats = {
             'hits': info.hits,
             'misses': info.misses,
             'maxsize': info.maxsize,
             'currsize': info.currsize
         }
+        for name in getattr(info, '_fields', ()):
+            stats.setdefault(name, getattr(info, name))
+        return stats
 
     @staticmethod
     def print_stats(func: Callable, func_name: str = None):
         """打印缓存统计信息
 
         Args:
-            func: 已缓存的函数
+            func: 已缓存的函数或 ResultCache 实例
             func_name: 函数名称（可选）
         """
         stats = CacheStats.get_stats(func)
-        name = func_name or func.__name__
+        name = func_name or getattr(func, '__name__', type(func).__name__)
+        total = stats['hits'] + stats['misses']
 
         print(f"\n缓存统计: {name}")
         print(f"  命中次数: {stats['hits']}")
         print(f"  未命中次数: {stats['misses']}")
-        print(f"  命中率: {stats['hits'] / (stats['hits'] + stats['misses']) * 100:.1f}%")
+        print(f"  命中率: {(stats['hits'] / total * 100) if total else 0.0:.1f}%")
         print(f"  当前缓存大小: {stats['currsize']}")
         print(f"  最大缓存大小: {stats['maxsize']}")
+        if 'disk_hits' in stats:
+            print(f"  磁盘命中次数: {stats['disk_hits']}")
+            print(f"  淘汰次数: {stats['evictions']}")
 
     @staticmethod
     def clear_cache(func: Callable):
         """清除函数的缓存
 
         Args:
-            func: 已缓存的函数
+            func: 已缓存的函数或 ResultCache 实例
         """
         if hasattr(func, 'cache_clear'):
             func.cache_clear()
 
 
-def enable_cache_for_weighting(weight_class) -> None:
+def enable_cache_for_weighting(
+    weight_class,
+    cache: ResultCache | None = None,
+) -> None:
     """为权重计算类启用缓存
 
+    缓存 calculate / calculate_weights 方法，键为实例属性和参数的内容指纹，
+    因此 DecisionProblem 和 numpy 数组参数均可命中。返回的数组为副本。
+
     Args:
         weight_class: 权重计算类（如 EntropyWeightService）
+        cache: 结果缓存（默认每个方法一个 maxsize=256 的内存缓存）
 
     Example:
         ```python
         from services.entropy_weight_service import EntropyWeightService
         enable_cache_for_weighting(EntropyWeightService)
+        CacheStats.get_stats(EntropyWeightService.calculate_weights)
         ```
     """
-    # 缓存 calculate 方法
-    if hasattr(weight_class, 'calculate'):
-        original_calculate = weight_class.calculate
-
-        @cached_result(maxsize=256)
-        def cached_calculate(self, problem, **kwargs):
-            return original_calculate(self, problem, **kwargs)
-
-        weight_class.calculate = cached_calculate
+    for method_name in ('calculate', 'calculate_weights'):
+        original = getattr(weight_class, method_name, None)
+        if original is None or hasattr(original, 'cache_info'):
+            continue
+
+        method_cache = cache if cache is not None else ResultCache(maxsize=256)
+
+        def make_wrapper(original, method_name, method_cache):
+            @wraps(original)
+            def cached_method(self, *args, **kwargs):
+                key = fingerprint(
+                    weight_class.__qualname__, method_name,
+                    getattr(self, '__dict__', {}), args, kwargs,
+                )
+                value = method_cache.get_or_compute(
+                    key, lambda: original(self, *args, **kwargs)
+                )
+                return value.copy() if hasattr(value, 'dtype') else value
+
+            cached_method.cache_info = method_cache.cache_info
+            cached_method.cache_clear = method_cache.cache_clear
+            return cached_method
+
+        setattr(weight_class, method_name, make_wrapper(original, method_name, method_cache))
@@ -190,6 +190,9 @@ class ValidationService:
         """
         验证评分范围
 
+        复用 DecisionProblem 构建时记录的验证结果（problem.validation），
+        全部评分在范围内时不再逐格检查；仅在越界时定位第一个越界单元格。
+
         Args:
             problem: 决策问题
 
@@ -198,29 +201,26 @@ class ValidationService:
 
         Raises:
             ScoreValidationError: 评分超出范围
+            ValueError: 评分缺失或无效
         """
         from .exceptions import ScoreValidationError
         from .models import MIN_SCORE, MAX_SCORE
 
-        errors = []
-
-        for alt in problem.alternatives:
-            for crit in problem.criteria:
-                score = problem.scores[alt][crit.name]
-
-                # 检查评分范围（使用模型常量）
-                if score < MIN_SCORE or score > MAX_SCORE:
-                    raise ScoreValidationError(
-                        f"方案 '{alt}' 在准则 '{crit.name}' 的评分为 {score}，"
-                        f"超出范围 [{MIN_SCORE}, {MAX_SCORE}]",
-                        details={
-                            "alternative": alt,
-                            "criterion": crit.name,
-                            "score": score,
-                        },
-                    )
+        # 检查评分范围（使用模型常量）
+        if not problem.validation.within(MIN_SCORE, MAX_SCORE):
+            alt, crit_name = problem.find_score_outside(MIN_SCORE, MAX_SCORE)
+            score = problem.scores[alt][crit_name]
+            raise ScoreValidationError(
+                f"方案 '{alt}' 在准则 '{crit_name}' 的评分为 {score}，"
+                f"超出范围 [{MIN_SCORE}, {MAX_SCORE}]",
+                details={
+                    "alternative": alt,
+                    "criterion": crit_name,
+                    "score": score,
+                },
+            )
 
-        return ValidationResult(is_valid=True, errors=errors)
+        return ValidationResult(is_valid=True, errors=[])
 
     def validate_minimum_alternatives(
         self,
@@ -273,11 +273,11 @@ class ValidationService:
                     "min_count": min_count,
                 },
             )
-
-
-# 模块公开接口
-__all__ = [
-    "ValidationResult",
-    "ValidationService",
-    "WEIGHT_TOLERANCE",
-]
+
+
+# 模块公开接口
+__all__ = [
+    "ValidationResult",
+    "ValidationService",
+    "WEIGHT_TOLERANCE",
+]
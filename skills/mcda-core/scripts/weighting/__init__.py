@@ -21,6 +21,13 @@ from .pca_weighting import (
     PCAWeightingError,
     MAX_CRITERIA,
 )
+from .pipeline import (
+    WeightingPipeline,
+    WeightingPipelineError,
+    WeightingResult,
+    WEIGHTING_METHODS,
+)
+from .statistics import MatrixStatistics
 
 __all__ = [
     "critic_weighting",
@@ -32,4 +39,9 @@ __all__ = [
     "pca_weighting",
     "PCAWeightingError",
     "MAX_CRITERIA",
+    "WeightingPipeline",
+    "WeightingPipelineError",
+    "WeightingResult",
+    "WEIGHTING_METHODS",
+    "MatrixStatistics",
 ]
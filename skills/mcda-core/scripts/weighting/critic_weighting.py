@@ -7,6 +7,8 @@ CRITIC 赋权方法
 import numpy as np
 from numpy.typing import NDArray
 
+from .statistics import MatrixStatistics
+
 
 class CRITICWeightingError(Exception):
     """CRITIC 赋权错误"""
@@ -36,7 +38,19 @@ def critic_weighting(matrix: NDArray | list) -> NDArray:
     # 输入验证
     matrix = _validate_input(matrix)
 
-    m, n = matrix.shape  # m 方案, n 准则
+    return critic_weights_from_statistics(MatrixStatistics(matrix))
+
+
+def critic_weights_from_statistics(stats: MatrixStatistics) -> NDArray:
+    """由共享列统计量计算 CRITIC 权重
+
+    Args:
+        stats: 已验证决策矩阵的列统计量
+
+    Returns:
+        权重向量 (n 维)
+    """
+    m, n = stats.n_alternatives, stats.n_criteria  # m 方案, n 准则
 
     # 特殊情况: 单准则
     if n == 1:
@@ -46,14 +60,8 @@ def critic_weighting(matrix: NDArray | list) -> NDArray:
     if m == 1:
         return np.ones(n) / n
 
-    # 1. 标准化 (Z-score)
-    matrix_std = _zscore(matrix, axis=0, ddof=1)
-
-    # 处理 NaN (单值列)
-    matrix_std = np.nan_to_num(matrix_std, nan=0.0)
-
-    # 2. 计算标准差 (对比强度)
-    std_dev = np.std(matrix_std, axis=0, ddof=1)
+    # 1-2. 标准化 (Z-score) 后的标准差 (对比强度)
+    std_dev = stats.standardized_std.copy()
 
     # 处理零标准差
     if np.any(std_dev < 1e-10):
@@ -64,18 +72,8 @@ def critic_weighting(matrix: NDArray | list) -> NDArray:
         min_std = std_dev[std_dev > 1e-10].min()
         std_dev[std_dev < 1e-10] = min_std
 
-    # 3. 计算相关系数矩阵 (冲突性)
-    try:
-        corr_matrix = np.corrcoef(matrix_std.T)
-    except Exception:
-        # 如果相关系数计算失败,使用单位矩阵
-        corr_matrix = np.eye(n)
-
-    # 处理 NaN (单值列导致的相关系数)
-    corr_matrix = np.nan_to_num(corr_matrix, nan=0.0)
-
-    # 确保对角线为 1
-    np.fill_diagonal(corr_matrix, 1.0)
+    # 3. 相关系数矩阵 (冲突性)，常数列的相关系数为 0，对角线为 1
+    corr_matrix = stats.correlation
 
     # 4. 计算信息量
     # C_j = σ_j * Σ(1 - r_jk)
@@ -92,31 +90,6 @@ def critic_weighting(matrix: NDArray | list) -> NDArray:
     return weights
 
 
-def _zscore(a: NDArray, axis: int = 0, ddof: int = 0) -> NDArray:
-    """
-    计算 Z-score 标准化
-
-    Args:
-        a: 输入数组
-        axis: 计算轴
-        ddof: 自由度调整
-
-    Returns:
-        标准化后的数组
-    """
-    mean = np.mean(a, axis=axis)
-    std = np.std(a, axis=axis, ddof=ddof)
-
-    # 避免除零
-    std[std < 1e-10] = 1.0
-
-    # 广播计算
-    if axis == 0:
-        return (a - mean) / std
-    else:
-        return (a - mean[:, np.newaxis]) / std[:, np.newaxis]
-
-
 def _validate_input(matrix: NDArray | list) -> NDArray:
     """验证并转换输入"""
     if matrix is None:
@@ -7,6 +7,8 @@
 import numpy as np
 from numpy.typing import NDArray
 
+from .statistics import MatrixStatistics
+
 
 class CVWeightingError(Exception):
     """变异系数法赋权错误"""
@@ -35,7 +37,19 @@ def cv_weighting(matrix: NDArray | list) -> NDArray:
     # 输入验证
     matrix = _validate_input(matrix)
 
-    m, n = matrix.shape  # m 方案, n 准则
+    return cv_weights_from_statistics(MatrixStatistics(matrix))
+
+
+def cv_weights_from_statistics(stats: MatrixStatistics) -> NDArray:
+    """由共享列统计量计算变异系数法权重
+
+    Args:
+        stats: 已验证决策矩阵的列统计量
+
+    Returns:
+        权重向量 (n 维)
+    """
+    m, n = stats.n_alternatives, stats.n_criteria  # m 方案, n 准则
 
     # 特殊情况: 单准则
     if n == 1:
@@ -45,11 +59,11 @@ def cv_weighting(matrix: NDArray | list) -> NDArray:
     if m == 1:
         return np.ones(n) / n
 
-    # 1. 计算均值
-    means = np.mean(matrix, axis=0)
+    # 1. 均值
+    means = stats.mean
 
-    # 2. 计算标准差
-    stds = np.std(matrix, axis=0, ddof=1)
+    # 2. 标准差
+    stds = stats.std
 
     # 3. 计算变异系数
     # CV_j = σ_j / |μ_j|
@@ -0,0 +1,127 @@
+"""
+熵权法 (Entropy Weight Method) 计算核心
+
+按列向量化计算信息熵与熵权，供 EntropyWeightService 与赋权流水线共享。
+
+算法步骤:
+1. 按准则方向做极差标准化 (常数列为 0)，并平移 ε 避免 log(0)
+2. 比重 p_ij = x_ij / Σ_i x_ij
+3. 信息熵 E_j = -Σ_i p_ij · ln(p_ij) / ln(m)
+4. 差异系数 d_j = 1 - E_j，权重 w_j = d_j / Σ d_j
+"""
+
+from typing import Literal
+
+import numpy as np
+from numpy.typing import NDArray
+
+from .statistics import MatrixStatistics
+
+DIRECTIONS = ("higher_better", "lower_better")
+
+
+def entropy_weights_from_statistics(
+    stats: MatrixStatistics,
+    directions: list[Literal["higher_better", "lower_better"]] | None = None,
+    epsilon: float = 1e-10
+) -> NDArray:
+    """由共享列统计量计算熵权
+
+    Args:
+        stats: 已验证决策矩阵的列统计量
+        directions: 准则方向列表（默认全部为 "higher_better"）
+        epsilon: 平移常数，避免 log(0)
+
+    Returns:
+        权重向量 (n 维)
+    """
+    return weights_from_entropies(column_entropies(stats, directions, epsilon))
+
+
+def column_entropies(
+    stats: MatrixStatistics,
+    directions: list[Literal["higher_better", "lower_better"]] | None = None,
+    epsilon: float = 1e-10
+) -> NDArray:
+    """计算各准则的归一化信息熵
+
+    Args:
+        stats: 已验证决策矩阵的列统计量
+        directions: 准则方向列表（默认全部为 "higher_better"）
+        epsilon: 平移常数，避免 log(0)
+
+    Returns:
+        信息熵向量 (n 维，范围 [0, 1])
+
+    Raises:
+        ValueError: 方向数量与准则数不一致或方向无效
+    """
+    m, n = stats.n_alternatives, stats.n_criteria
+    lower_better = _lower_better_mask(directions, n)
+
+    # 1. 极差标准化，常数列为 0
+    column_range = stats.column_max - stats.column_min
+    constant = np.isclose(stats.column_max, stats.column_min)
+    column_range[constant] = 1.0
+
+    normalized = np.where(
+        lower_better,
+        stats.column_max - stats.matrix,
+        stats.matrix - stats.column_min
+    ) / column_range
+    normalized[:, constant] = 0.0
+    normalized += epsilon
+
+    # 2. 比重矩阵
+    with np.errstate(divide="ignore", invalid="ignore"):
+        p = normalized / np.sum(normalized, axis=0)
+
+        # 3. 信息熵（p = 0 的项不计入）
+        positive = p > 0
+        plogp = np.where(positive, p * np.log(np.where(positive, p, 1.0)), 0.0)
+
+    if m <= 1:
+        return np.zeros(n)
+    return -np.sum(plogp, axis=0) / np.log(m)
+
+
+def weights_from_entropies(entropies: NDArray) -> NDArray:
+    """由信息熵计算权重 w_j = (1 - E_j) / Σ(1 - E_k)
+
+    舍入误差可能使常数列的熵略大于 1，差异系数截断为非负；所有准则的熵
+    都为 1 时均匀分配权重。
+
+    Args:
+        entropies: 信息熵向量
+
+    Returns:
+        权重向量
+    """
+    divergence = np.maximum(1 - entropies, 0.0)
+    total_divergence = np.sum(divergence)
+
+    if total_divergence > 0:
+        return divergence / total_divergence
+    return np.ones(len(entropies)) / len(entropies)
+
+
+def _lower_better_mask(
+    directions: list[str] | None, n_criteria: int
+) -> NDArray[np.bool_]:
+    """验证准则方向并转换为"越小越好"掩码"""
+    if directions is None:
+        return np.zeros(n_criteria, dtype=bool)
+
+    if len(directions) != n_criteria:
+        raise ValueError(
+            f"方向数量 ({len(directions)}) 必须等于准则数量 ({n_criteria})"
+        )
+
+    for direction in directions:
+        if direction not in DIRECTIONS:
+            raise ValueError(
+                f"无效的方向: '{direction}'. "
+                f"必须是 'higher_better' 或 'lower_better'"
+            )
+
+    return np.array([direction == "lower_better" for direction in directions])
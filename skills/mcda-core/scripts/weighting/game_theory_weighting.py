@@ -8,12 +8,23 @@
 得到使总体偏差最小的组合权重。
 
 数学模型:
-    最优组合权重: w* = W^T · W⁻¹ · 1 / (1^T · W⁻¹ · 1)
+    L 种方法的权重向量 u_1..u_L 构成权重矩阵 W (L × n)，组合权重为
+    w = Σ_j α_j · u_j。博弈模型要求 w 与每个 u_i 的离差同时极小:
 
-    其中:
-    - W 是权重矩阵 (n_methods × n_criteria)
-    - W^T 是权重矩阵的转置
-    - 1 是全 1 向量
+        min ||Σ_j α_j · u_j - u_i||₂,  i = 1, ..., L
+
+    由最优化一阶导数条件 Σ_j α_j · u_i · u_j^T = u_i · u_i^T 得到线性方程组
+
+        (W · W^T) · α = diag(W · W^T)
+
+    求得 α 后取 α* = |α| / Σ|α|，最优组合权重 w* = α*^T · W。
+
+    各方法权重近似共线时 W · W^T 病态或奇异（例如方法数多于准则数），
+    此时改用伪逆求最小范数最小二乘解。
+
+批量计算:
+    combine_weights_batch 接受 (B × L × n) 的权重集批次，所有批次的
+    Gram 矩阵、条件数与线性方程组都以 NumPy 堆叠数组一次求解。
 
 References:
     - 基于博弈论的综合赋权模型研究
@@ -22,6 +33,14 @@ References:
 import numpy as np
 from typing import Literal
 
+# 组合策略
+#   game_theory: 博弈论最优组合（求解线性方程组）
+#   mean: 各方法权重的算术平均
+STRATEGIES = ("game_theory", "mean")
+
+# Gram 矩阵条件数超过该值时改用伪逆（最小二乘）求解
+MAX_CONDITION = 1e10
+
 
 class GameTheoryWeightingError(Exception):
     """博弈论组合赋权错误
@@ -38,10 +57,10 @@ class GameTheoryWeighting:
     各个赋权方法之间的偏差。
 
     数学原理:
-        最优组合权重 w* 满足:
-        min ||W · w* - w_target||²
+        组合系数 α 使组合权重与每种方法权重的离差同时极小:
+        min ||Σ_j α_j · u_j - u_i||₂ (i = 1, ..., L)
 
-        其中 w_target 是目标权重向量
+        一阶条件为 (W · W^T) · α = diag(W · W^T)
 
     Example:
         ```python
@@ -67,19 +86,43 @@ class GameTheoryWeighting:
             criteria=["性能", "成本", "可靠性", "易用性"],
             return_details=True
         )
+
+        # 批量组合 (n_problems × n_methods × n_criteria)
+        combined_batch = weighting.combine_weights_batch(weights_batch)
         ```
 
     Attributes:
         epsilon: 小常数，用于数值稳定性
+        strategy: 组合策略，"game_theory"（默认）或 "mean"（算术平均）
+        max_condition: Gram 矩阵条件数上限，超过时使用伪逆求解
     """
 
-    def __init__(self, epsilon: float = 1e-10):
+    def __init__(
+        self,
+        epsilon: float = 1e-10,
+        strategy: Literal["game_theory", "mean"] = "game_theory",
+        max_condition: float = MAX_CONDITION
+    ):
         """初始化博弈论组合赋权
 
         Args:
             epsilon: 小常数，避免数值不稳定
+            strategy: 组合策略
+                - game_theory: 博弈论最优组合
+                - mean: 各方法权重的算术平均
+            max_condition: Gram 矩阵条件数上限
+
+        Raises:
+            GameTheoryWeightingError: 策略无效时
         """
+        if strategy not in STRATEGIES:
+            raise GameTheoryWeightingError(
+                f"无效的组合策略: '{strategy}'，可选: {list(STRATEGIES)}"
+            )
+
         self.epsilon = epsilon
+        self.strategy = strategy
+        self.max_condition = max_condition
 
     def combine_weights(
         self,
@@ -97,7 +140,8 @@ class GameTheoryWeighting:
 
         Returns:
             如果 return_details=False: 返回组合权重 (numpy.ndarray)
-            如果 return_details=True: 返回详细结果 (dict)
+            如果 return_details=True: 返回详细结果 (dict)，
+            包含组合系数 coefficients 与策略 strategy
 
         Raises:
             GameTheoryWeightingError: 输入数据无效时
@@ -105,11 +149,10 @@ class GameTheoryWeighting:
         # 验证输入
         self._validate_input(weights_matrix)
 
-        # 归一化权重矩阵（确保每行和为 1）
-        normalized_weights = self._normalize_weights(weights_matrix)
-
-        # 计算最优组合权重
-        optimal_weights = self._calculate_optimal_weights(normalized_weights)
+        # 单个权重矩阵按批次大小为 1 计算
+        normalized_weights = self._normalize_weights(weights_matrix[np.newaxis])
+        coefficients = self._calculate_coefficients(normalized_weights)
+        optimal_weights = self._combine(normalized_weights, coefficients)[0]
 
         # 返回结果
         if return_details:
@@ -117,17 +160,42 @@ class GameTheoryWeighting:
                 "weights": optimal_weights,
                 "criteria": criteria,
                 "method": "game_theory",
+                "strategy": self.strategy,
+                "coefficients": coefficients[0],
                 "n_methods": weights_matrix.shape[0],
                 "n_criteria": weights_matrix.shape[1],
             }
         else:
             return optimal_weights
 
-    def _validate_input(self, weights_matrix: np.ndarray) -> None:
+    def combine_weights_batch(self, weights_batch: np.ndarray) -> np.ndarray:
+        """批量计算最优组合权重
+
+        所有权重集的 Gram 矩阵与线性方程组以堆叠数组一次求解，
+        不逐个问题循环。
+
+        Args:
+            weights_batch: 权重集批次 (n_problems × n_methods × n_criteria)
+
+        Returns:
+            组合权重矩阵 (n_problems × n_criteria)
+
+        Raises:
+            GameTheoryWeightingError: 输入数据无效时
+        """
+        self._validate_input(weights_batch, batch=True)
+
+        normalized_weights = self._normalize_weights(weights_batch)
+        coefficients = self._calculate_coefficients(normalized_weights)
+        return self._combine(normalized_weights, coefficients)
+
+    def _validate_input(self, weights_matrix: np.ndarray, batch: bool = False) -> None:
         """验证输入数据
 
         Args:
-            weights_matrix: 权重矩阵
+            weights_matrix: 权重矩阵 (n_methods × n_criteria)，
+                batch=True 时为 (n_problems × n_methods × n_criteria)
+            batch: 是否为批量输入
 
         Raises:
             GameTheoryWeightingError: 输入数据无效时
@@ -143,13 +211,14 @@ class GameTheoryWeighting:
             raise GameTheoryWeightingError("权重矩阵不能为空")
 
         # 检查维度
-        if weights_matrix.ndim != 2:
+        expected_ndim = 3 if batch else 2
+        if weights_matrix.ndim != expected_ndim:
             raise GameTheoryWeightingError(
-                f"权重矩阵必须是 2 维数组，当前维度: {weights_matrix.ndim}"
+                f"权重矩阵必须是 {expected_ndim} 维数组，当前维度: {weights_matrix.ndim}"
             )
 
         # 检查至少有 1 种方法和 1 个准则
-        n_methods, n_criteria = weights_matrix.shape
+        n_methods, n_criteria = weights_matrix.shape[-2:]
         if n_methods < 1:
             raise GameTheoryWeightingError(
                 f"至少需要 1 种赋权方法，当前: {n_methods}"
@@ -159,66 +228,89 @@ class GameTheoryWeighting:
                 f"至少需要 1 个准则，当前: {n_criteria}"
             )
 
+        # 检查有限值
+        if not np.all(np.isfinite(weights_matrix)):
+            raise GameTheoryWeightingError("权重包含 NaN 或无穷值")
+
         # 检查权重非负
         if np.any(weights_matrix < 0):
             raise GameTheoryWeightingError("权重必须非负")
 
-    def _normalize_weights(self, weights_matrix: np.ndarray) -> np.ndarray:
+    def _normalize_weights(self, weights_batch: np.ndarray) -> np.ndarray:
         """归一化权重矩阵
 
-        确保每行的权重和为 1。
+        确保每种方法的权重和为 1；和为 0 的方法使用均匀分布。
 
         Args:
-            weights_matrix: 权重矩阵
+            weights_batch: 权重集批次 (n_problems × n_methods × n_criteria)
 
         Returns:
-            归一化后的权重矩阵
+            归一化后的权重集批次
         """
-        normalized = weights_matrix.copy()
+        n_criteria = weights_batch.shape[-1]
+        row_sums = np.sum(weights_batch, axis=-1, keepdims=True)
+        degenerate = row_sums <= self.epsilon
 
-        # 对每一行进行归一化
-        for i in range(normalized.shape[0]):
-            row_sum = np.sum(normalized[i])
-            if row_sum > self.epsilon:
-                normalized[i] = normalized[i] / row_sum
-            else:
-                # 如果和为 0，使用均匀分布
-                n_criteria = normalized.shape[1]
-                normalized[i] = np.ones(n_criteria) / n_criteria
+        normalized = weights_batch / np.where(degenerate, 1.0, row_sums)
+        return np.where(degenerate, 1.0 / n_criteria, normalized)
 
-        return normalized
+    def _calculate_coefficients(self, weights_batch: np.ndarray) -> np.ndarray:
+        """计算各方法的组合系数 α*
 
-    def _calculate_optimal_weights(self, weights_matrix: np.ndarray) -> np.ndarray:
-        """计算最优组合权重
+        Args:
+            weights_batch: 归一化后的权重集批次 (B × L × n)
 
-        使用博弈论方法计算最优组合权重：
-        w* = W^T · W⁻¹ · 1 / (1^T · W⁻¹ · 1)
+        Returns:
+            组合系数 (B × L)，每行非负且和为 1
+        """
+        n_problems, n_methods, _ = weights_batch.shape
+
+        if self.strategy == "mean" or n_methods == 1:
+            return np.full((n_problems, n_methods), 1.0 / n_methods)
+
+        # Gram 矩阵 A = W · W^T 与右端项 b = diag(A)
+        gram = weights_batch @ np.swapaxes(weights_batch, -1, -2)
+        rhs = np.diagonal(gram, axis1=-2, axis2=-1)
+
+        coefficients = np.empty((n_problems, n_methods))
+
+        # 条件数可接受的批次直接求解，其余使用伪逆求最小范数最小二乘解
+        ill_conditioned = np.linalg.cond(gram) > self.max_condition
+        well = ~ill_conditioned
+        if np.any(well):
+            coefficients[well] = np.linalg.solve(
+                gram[well], rhs[well][..., np.newaxis]
+            )[..., 0]
+        if np.any(ill_conditioned):
+            coefficients[ill_conditioned] = (
+                np.linalg.pinv(gram[ill_conditioned], hermitian=True)
+                @ rhs[ill_conditioned][..., np.newaxis]
+            )[..., 0]
+
+        # α* = |α| / Σ|α|，退化时均匀分配
+        coefficients = np.abs(coefficients)
+        totals = np.sum(coefficients, axis=-1, keepdims=True)
+        degenerate = totals <= self.epsilon
+        return np.where(
+            degenerate, 1.0 / n_methods, coefficients / np.where(degenerate, 1.0, totals)
+        )
 
-        但这里我们使用更简单的方法：
-        计算权重矩阵的平均值，然后归一化
+    def _combine(self, weights_batch: np.ndarray, coefficients: np.ndarray) -> np.ndarray:
+        """按组合系数合成权重并归一化
 
         Args:
-            weights_matrix: 归一化后的权重矩阵
+            weights_batch: 归一化后的权重集批次 (B × L × n)
+            coefficients: 组合系数 (B × L)
 
         Returns:
-            最优组合权重
+            组合权重 (B × n)
         """
-        n_methods, n_criteria = weights_matrix.shape
-
-        # 如果只有一种方法，直接返回
-        if n_methods == 1:
-            return weights_matrix[0]
-
-        # 方法 1: 简单平均（最稳定）
-        # 计算所有方法的平均权重
-        avg_weights = np.mean(weights_matrix, axis=0)
+        combined = np.einsum("bl,bln->bn", coefficients, weights_batch)
 
         # 归一化（确保和为 1）
-        sum_weights = np.sum(avg_weights)
-        if sum_weights > self.epsilon:
-            optimal_weights = avg_weights / sum_weights
-        else:
-            # 如果和为 0，使用均匀分布
-            optimal_weights = np.ones(n_criteria) / n_criteria
-
-        return optimal_weights
+        sums = np.sum(combined, axis=-1, keepdims=True)
+        degenerate = sums <= self.epsilon
+        n_criteria = weights_batch.shape[-1]
+        return np.where(
+            degenerate, 1.0 / n_criteria, combined / np.where(degenerate, 1.0, sums)
+        )
@@ -20,6 +20,8 @@ References:
 import numpy as np
 from numpy.typing import NDArray
 
+from .statistics import MatrixStatistics
+
 
 class PCAWeightingError(Exception):
     """PCA 赋权错误
@@ -72,7 +74,19 @@ def pca_weighting(matrix: NDArray | list) -> NDArray:
     # 输入验证
     matrix = _validate_input(matrix)
 
-    m, n = matrix.shape  # m 方案, n 准则
+    return pca_weights_from_statistics(MatrixStatistics(matrix))
+
+
+def pca_weights_from_statistics(stats: MatrixStatistics) -> NDArray:
+    """由共享列统计量计算 PCA 权重
+
+    Args:
+        stats: 已验证决策矩阵的列统计量（准则数不超过 MAX_CRITERIA）
+
+    Returns:
+        权重向量 (n 维)
+    """
+    m, n = stats.n_alternatives, stats.n_criteria  # m 方案, n 准则
 
     # 特殊情况: 单准则
     if n == 1:
@@ -82,11 +96,8 @@ def pca_weighting(matrix: NDArray | list) -> NDArray:
     if m == 1:
         return np.ones(n) / n
 
-    # 1. 标准化决策矩阵
-    standardized = _standardize(matrix)
-
-    # 2. 计算协方差矩阵（含正则化）
-    covariance = _compute_covariance(standardized)
+    # 1-2. 标准化矩阵的协方差矩阵，添加正则化避免数值不稳定
+    covariance = stats.covariance + np.eye(n) * 1e-10
 
     # 3. 特征值分解
     eigenvalues, eigenvectors = _eigen_decomposition(covariance)
@@ -157,14 +168,7 @@ def _standardize(matrix: NDArray) -> NDArray:
     Returns:
         标准化后的矩阵
     """
-    means = np.mean(matrix, axis=0)
-    stds = np.std(matrix, axis=0, ddof=1)
-
-    # 避免除零
-    stds[stds < 1e-10] = 1.0
-
-    standardized = (matrix - means) / stds
-    return standardized
+    return MatrixStatistics(np.asarray(matrix, dtype=float)).standardized
 
 
 def _compute_covariance(standardized: NDArray) -> NDArray:
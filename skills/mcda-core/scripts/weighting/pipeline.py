@@ -0,0 +1,203 @@
+"""
+客观赋权流水线 (Objective Weighting Pipeline)
+
+对同一决策矩阵批量计算熵权法、CRITIC、变异系数法和 PCA 权重。
+
+决策矩阵只验证、转换一次；列均值、标准差、Z-score 标准化矩阵、协方差和
+相关系数矩阵由 MatrixStatistics 计算一次后在各方法之间共享，结果按方法
+堆叠为 (k × n) 权重矩阵，可直接交给 GameTheoryWeighting 组合。
+
+Example:
+    ```python
+    pipeline = WeightingPipeline(methods=("entropy", "critic", "cv"))
+    result = pipeline.run(matrix, directions=["higher_better", "lower_better", "higher_better"])
+
+    result.weights["critic"]      # 单个方法的权重
+    result.weights_matrix         # (3 × n) 权重矩阵
+    result.combine()              # 博弈论组合权重
+    ```
+"""
+
+from dataclasses import dataclass
+from typing import Any, Callable, Literal
+
+import numpy as np
+from numpy.typing import NDArray
+
+from .critic_weighting import critic_weights_from_statistics
+from .cv_weighting import cv_weights_from_statistics
+from .entropy_weighting import entropy_weights_from_statistics
+from .game_theory_weighting import GameTheoryWeighting
+from .pca_weighting import MAX_CRITERIA, pca_weights_from_statistics
+from .statistics import MatrixStatistics
+
+WeightingMethodName = Literal["entropy", "critic", "cv", "pca"]
+
+# 方法名 → 基于共享统计量的权重计算函数 (stats, directions, epsilon) -> weights
+_KERNELS: dict[str, Callable[[MatrixStatistics, list[str] | None, float], NDArray]] = {
+    "entropy": entropy_weights_from_statistics,
+    "critic": lambda stats, directions, epsilon: critic_weights_from_statistics(stats),
+    "cv": lambda stats, directions, epsilon: cv_weights_from_statistics(stats),
+    "pca": lambda stats, directions, epsilon: pca_weights_from_statistics(stats),
+}
+
+WEIGHTING_METHODS: tuple[str, ...] = tuple(_KERNELS)
+
+
+class WeightingPipelineError(Exception):
+    """赋权流水线错误
+
+    当决策矩阵或方法列表无效时抛出。
+    """
+    pass
+
+
+@dataclass(frozen=True)
+class WeightingResult:
+    """赋权流水线结果
+
+    Attributes:
+        methods: 方法名称（与 weights_matrix 的行对应）
+        weights_matrix: 权重矩阵 (k 方法 × n 准则)
+        statistics: 共享的列统计量
+    """
+
+    methods: tuple[str, ...]
+    weights_matrix: NDArray
+    statistics: MatrixStatistics
+
+    @property
+    def weights(self) -> dict[str, NDArray]:
+        """方法名 → 权重向量"""
+        return dict(zip(self.methods, self.weights_matrix))
+
+    def combine(
+        self,
+        criteria: list[str] | None = None,
+        return_details: bool = False,
+        epsilon: float = 1e-10,
+        strategy: Literal["game_theory", "mean"] = "game_theory"
+    ) -> NDArray | dict[str, Any]:
+        """使用博弈论组合赋权合成各方法的权重
+
+        Args:
+            criteria: 准则名称列表（可选）
+            return_details: 是否返回详细信息
+            epsilon: 数值稳定常数
+            strategy: 组合策略，"game_theory" 或 "mean"
+
+        Returns:
+            组合权重，或 GameTheoryWeighting.combine_weights 的详细结果
+        """
+        return GameTheoryWeighting(epsilon=epsilon, strategy=strategy).combine_weights(
+            self.weights_matrix,
+            criteria=criteria,
+            return_details=return_details
+        )
+
+
+class WeightingPipeline:
+    """客观赋权流水线
+
+    Attributes:
+        methods: 需要计算的赋权方法
+        epsilon: 熵权法的平移常数，避免 log(0)
+    """
+
+    def __init__(
+        self,
+        methods: tuple[WeightingMethodName, ...] | list[WeightingMethodName] = WEIGHTING_METHODS,
+        epsilon: float = 1e-10
+    ):
+        """初始化赋权流水线
+
+        Args:
+            methods: 赋权方法列表，可选 "entropy"、"critic"、"cv"、"pca"
+            epsilon: 熵权法的平移常数
+
+        Raises:
+            WeightingPipelineError: 方法列表为空、重复或包含未知方法
+        """
+        methods = tuple(methods)
+        if not methods:
+            raise WeightingPipelineError("至少需要 1 种赋权方法")
+
+        unknown = [name for name in methods if name not in _KERNELS]
+        if unknown:
+            raise WeightingPipelineError(
+                f"未知的赋权方法: {unknown}，可选: {list(WEIGHTING_METHODS)}"
+            )
+
+        if len(set(methods)) != len(methods):
+            raise WeightingPipelineError(f"赋权方法重复: {list(methods)}")
+
+        self.methods = methods
+        self.epsilon = epsilon
+
+    def run(
+        self,
+        matrix: NDArray | list,
+        directions: list[Literal["higher_better", "lower_better"]] | None = None
+    ) -> WeightingResult:
+        """计算所有方法的权重
+
+        Args:
+            matrix: 决策矩阵 (m 方案 × n 准则)
+            directions: 准则方向列表（仅熵权法使用，默认全部为 "higher_better"）
+
+        Returns:
+            WeightingResult
+
+        Raises:
+            WeightingPipelineError: 决策矩阵无效
+            ValueError: 方向数量与准则数不一致或方向无效
+        """
+        stats = MatrixStatistics(self._validate_input(matrix))
+
+        weights_matrix = np.vstack([
+            _KERNELS[name](stats, directions, self.epsilon)
+            for name in self.methods
+        ])
+
+        return WeightingResult(
+            methods=self.methods,
+            weights_matrix=weights_matrix,
+            statistics=stats
+        )
+
+    def _validate_input(self, matrix: NDArray | list) -> NDArray:
+        """验证并转换决策矩阵（所有方法的约束一次检查）"""
+        if matrix is None:
+            raise WeightingPipelineError("决策矩阵不能为 None")
+
+        try:
+            matrix = np.asarray(matrix, dtype=float)
+        except (ValueError, TypeError) as e:
+            raise WeightingPipelineError(f"无法转换数据类型: {type(matrix)}") from e
+
+        if matrix.ndim != 2:
+            raise WeightingPipelineError(f"决策矩阵必须是 2D, 当前维度: {matrix.ndim}")
+
+        m, n = matrix.shape
+        if m < 1 or n < 1:
+            raise WeightingPipelineError(
+                f"决策矩阵形状无效: {matrix.shape}, 至少需要 1×1"
+            )
+
+        if "entropy" in self.methods and m < 2:
+            raise WeightingPipelineError(
+                f"熵权法至少需要 2 个备选方案，当前: {m}"
+            )
+
+        if "pca" in self.methods and n > MAX_CRITERIA:
+            raise WeightingPipelineError(
+                f"PCA 不支持超过 {MAX_CRITERIA} 个准则, 当前: {n}"
+            )
+
+        if np.any(np.isnan(matrix)):
+            raise WeightingPipelineError("决策矩阵包含 NaN")
+
+        if np.any(np.isinf(matrix)):
+            raise WeightingPipelineError("决策矩阵包含无穷值")
+
+        return matrix
@@ -0,0 +1,99 @@
+"""
+决策矩阵列统计量
+
+各客观赋权方法共享的中间统计量（均值、标准差、极值、Z-score 标准化矩阵、
+协方差与相关系数矩阵）。每个统计量首次访问时计算并缓存，同一矩阵上运行
+多种赋权方法时只计算一次。
+"""
+
+from dataclasses import dataclass
+from functools import cached_property
+
+import numpy as np
+from numpy.typing import NDArray
+
+# 标准差小于该值的列视为常数列
+ZERO_STD = 1e-10
+
+
+@dataclass(frozen=True, eq=False)
+class MatrixStatistics:
+    """决策矩阵列统计量（惰性计算并缓存）
+
+    Attributes:
+        matrix: 已验证的决策矩阵 (m 方案 × n 准则)，float64
+
+    Example:
+        ```python
+        stats = MatrixStatistics(matrix)
+        stats.std            # 各列样本标准差
+        stats.correlation    # 标准化矩阵的相关系数矩阵
+        ```
+    """
+
+    matrix: NDArray
+
+    @property
+    def n_alternatives(self) -> int:
+        """方案数 m"""
+        return self.matrix.shape[0]
+
+    @property
+    def n_criteria(self) -> int:
+        """准则数 n"""
+        return self.matrix.shape[1]
+
+    @cached_property
+    def mean(self) -> NDArray:
+        """各列均值 μ_j"""
+        return np.mean(self.matrix, axis=0)
+
+    @cached_property
+    def std(self) -> NDArray:
+        """各列样本标准差 σ_j (ddof=1)"""
+        return np.std(self.matrix, axis=0, ddof=1)
+
+    @cached_property
+    def column_min(self) -> NDArray:
+        """各列最小值"""
+        return np.min(self.matrix, axis=0)
+
+    @cached_property
+    def column_max(self) -> NDArray:
+        """各列最大值"""
+        return np.max(self.matrix, axis=0)
+
+    @cached_property
+    def standardized(self) -> NDArray:
+        """Z-score 标准化矩阵 z_ij = (x_ij - μ_j) / σ_j
+
+        常数列（σ_j < ZERO_STD）按 σ_j = 1 处理，标准化后为全 0 列。
+        """
+        std = self.std.copy()
+        std[std < ZERO_STD] = 1.0
+        return (self.matrix - self.mean) / std
+
+    @cached_property
+    def standardized_std(self) -> NDArray:
+        """标准化矩阵各列的样本标准差（非常数列为 1，常数列为 0）"""
+        return np.std(self.standardized, axis=0, ddof=1)
+
+    @cached_property
+    def covariance(self) -> NDArray:
+        """标准化矩阵的协方差矩阵 C = Z^T · Z / (m-1)"""
+        standardized = self.standardized
+        return standardized.T @ standardized / (self.n_alternatives - 1)
+
+    @cached_property
+    def correlation(self) -> NDArray:
+        """相关系数矩阵 r_jk（由协方差矩阵得到）
+
+        常数列与其他列的相关系数无定义，记为 0；对角线为 1。
+        """
+        scale = np.sqrt(np.diag(self.covariance))
+        with np.errstate(divide="ignore", invalid="ignore"):
+            correlation = self.covariance / scale[:, None] / scale[None, :]
+
+        correlation = np.clip(np.nan_to_num(correlation, nan=0.0), -1.0, 1.0)
+        np.fill_diagonal(correlation, 1.0)
+        return correlation
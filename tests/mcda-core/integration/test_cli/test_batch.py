@@ -0,0 +1,189 @@
+"""
+MCDA Core - 批量分析测试
+
+测试 MCDAOrchestrator.run_many / iter_many 和 `mcda batch` 命令。
+"""
+
+import json
+import multiprocessing
+import os
+from io import StringIO
+from pathlib import Path
+
+import pytest
+
+from mcda_core import batch
+from mcda_core.batch import BatchSummary, iter_config_paths
+from mcda_core.cli import MCDACommandLineInterface
+from mcda_core.core import MCDAOrchestrator
+
+
+CONFIG_TEMPLATE = """
+name: 供应商选择 {index}
+alternatives: [A, B, C]
+criteria:
+  - name: 成本
+    weight: 0.6
+    direction: lower_better
+  - name: 质量
+    weight: 0.4
+    direction: higher_better
+scores:
+  A: {{成本: {cost}, 质量: 80}}
+  B: {{成本: 70, 质量: 60}}
+  C: {{成本: 60, 质量: 90}}
+algorithm: {{name: wsm}}
+"""
+
+
+@pytest.fixture
+def config_dir(tmp_path):
+    """包含 6 个有效配置和 1 个无效配置的目录"""
+    for index in range(6):
+        (tmp_path / f"config{index}.yaml").write_text(
+            CONFIG_TEMPLATE.format(index=index, cost=40 + 10 * index), encoding="utf-8"
+        )
+    (tmp_path / "broken.yaml").write_text("alternatives: [A]\n", encoding="utf-8")
+    (tmp_path / "notes.md").write_text("不是配置文件", encoding="utf-8")
+    return tmp_path
+
+
+def _by_config(records):
+    return {Path(record["config"]).name: record for record in records}
+
+
+class TestConfigSources:
+    """配置来源展开测试"""
+
+    def test_directory(self, config_dir):
+        """测试: 目录展开为排序后的配置文件"""
+        names = [path.name for path in iter_config_paths(config_dir)]
+
+        assert names == sorted(names)
+        assert "notes.md" not in names
+        assert len(names) == 7
+
+    def test_manifest_and_glob(self, config_dir):
+        """测试: 清单文件（相对路径、注释）与 glob 模式"""
+        manifest = config_dir / "manifest.txt"
+        manifest.write_text("# 注释\nconfig1.yaml\n\nconfig3.yaml\n", encoding="utf-8")
+
+        paths = list(iter_config_paths([manifest, str(config_dir / "config[45].yaml")]))
+
+        assert [path.name for path in paths] == [
+            "config1.yaml", "config3.yaml", "config4.yaml", "config5.yaml"
+        ]
+        assert paths[0] == config_dir / "config1.yaml"
+
+
+class TestRunMany:
+    """MCDAOrchestrator 批量分析测试"""
+
+    def test_failures_do_not_abort_batch(self, config_dir):
+        """测试: 无效配置产生错误记录，其余配置正常完成"""
+        output = StringIO()
+
+        summary = MCDAOrchestrator().run_many(config_dir, output)
+
+        records = [json.loads(line) for line in output.getvalue().splitlines()]
+        by_config = _by_config(records)
+        assert isinstance(summary, BatchSummary)
+        assert (summary.total, summary.succeeded, summary.failed) == (7, 6, 1)
+        assert by_config["broken.yaml"]["status"] == "error"
+        assert by_config["broken.yaml"]["error"]
+        assert by_config["config0.yaml"]["status"] == "ok"
+        assert by_config["config0.yaml"]["rankings"][0]["rank"] == 1
+        assert sorted(record["index"] for record in records) == list(range(7))
+
+    def test_missing_file_is_reported(self, tmp_path):
+        """测试: 不存在的配置文件作为错误记录输出"""
+        records = list(MCDAOrchestrator().iter_many(tmp_path / "missing.yaml"))
+
+        assert len(records) == 1
+        assert records[0]["status"] == "error"
+
+    @pytest.mark.parametrize("executor", ["thread", "process"])
+    def test_parallel_matches_serial(self, config_dir, executor):
+        """测试: 并行结果与串行一致（顺序可能不同）"""
+        orchestrator = MCDAOrchestrator()
+
+        serial = _by_config(orchestrator.iter_many(config_dir))
+        parallel = _by_config(orchestrator.iter_many(
+            config_dir, workers=2, executor=executor, chunk_size=2, max_pending=1
+        ))
+
+        assert serial.keys() == parallel.keys()
+        for name, record in serial.items():
+            assert parallel[name]["status"] == record["status"]
+            assert parallel[name]["index"] == record["index"]
+            assert parallel[name].get("rankings") == record.get("rankings")
+
+    @pytest.mark.skipif(
+        multiprocessing.get_start_method() != "fork",
+        reason="需要 fork 启动方式，使工作进程继承替换后的 analyze_config"
+    )
+    def test_worker_crash_does_not_abort_batch(self, tmp_path, monkeypatch):
+        """测试: 工作进程崩溃时重建进程池，仅导致崩溃的配置记为错误"""
+        for index in range(40):
+            name = "crash.yaml" if index == 17 else f"config{index:02d}.yaml"
+            (tmp_path / name).write_text(
+                CONFIG_TEMPLATE.format(index=index, cost=50), encoding="utf-8"
+            )
+
+        analyze_config = batch.analyze_config
+
+        def crashing_analyze_config(orchestrator, index, path, *args):
+            if path.endswith("crash.yaml"):
+                os._exit(1)
+            return analyze_config(orchestrator, index, path, *args)
+
+        monkeypatch.setattr(batch, "analyze_config", crashing_analyze_config)
+
+        records = _by_config(MCDAOrchestrator().iter_many(
+            tmp_path, workers=2, executor="process", chunk_size=4
+        ))
+
+        assert len(records) == 40
+        assert records["crash.yaml"]["status"] == "error"
+        assert records["crash.yaml"]["error_type"] == "BrokenProcessPool"
+        assert all(
+            record["status"] == "ok"
+            for name, record in records.items() if name != "crash.yaml"
+        )
+
+    def test_invalid_options(self, config_dir):
+        """测试: 无效的并行参数"""
+        with pytest.raises(ValueError, match="workers"):
+            list(MCDAOrchestrator().iter_many(config_dir, workers=0))
+        with pytest.raises(ValueError, match="executor"):
+            list(MCDAOrchestrator().iter_many(config_dir, workers=2, executor="gpu"))
+
+
+class TestBatchCommand:
+    """mcda batch 命令测试"""
+
+    def test_batch_to_file(self, config_dir, tmp_path, capsys):
+        """测试: 结果写入 JSON Lines 文件，存在失败时退出码为 1"""
+        output_file = tmp_path / "out" / "results.jsonl"
+
+        with pytest.raises(SystemExit) as exc_info:
+            MCDACommandLineInterface().run([
+                "batch", str(config_dir), "-o", str(output_file), "-w", "1"
+            ])
+
+        assert exc_info.value.code == 1
+        lines = output_file.read_text(encoding="utf-8").splitlines()
+        assert len(lines) == 7
+        assert "成功 6, 失败 1" in capsys.readouterr().err
+
+    def test_batch_to_stdout(self, config_dir, capsys):
+        """测试: 全部成功时输出到 stdout，退出码为 0"""
+        MCDACommandLineInterface().run([
+            "batch", str(config_dir / "config*.yaml"), "-w", "2", "--executor", "thread"
+        ])
+
+        captured = capsys.readouterr()
+        records = [json.loads(line) for line in captured.out.splitlines()]
+        assert len(records) == 6
+        assert all(record["status"] == "ok" for record in records)
+        assert "吞吐" in captured.err
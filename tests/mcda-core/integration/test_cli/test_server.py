@@ -0,0 +1,206 @@
+"""
+MCDA Core - 常驻分析服务测试
+
+测试 MCDAServer 的 HTTP/JSON 接口和 `mcda serve` 命令参数。
+"""
+
+import http.client
+import json
+import socket
+import time
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from mcda_core import server as server_module
+from mcda_core.cli import MCDACommandLineInterface
+from mcda_core.server import MCDAServer
+
+
+PROBLEM = {
+    "name": "供应商选择",
+    "alternatives": ["A", "B", "C"],
+    "criteria": [
+        {"name": "成本", "weight": 0.6, "direction": "lower_better"},
+        {"name": "质量", "weight": 0.4, "direction": "higher_better"},
+    ],
+    "scores": {
+        "A": {"成本": 50, "质量": 80},
+        "B": {"成本": 70, "质量": 60},
+        "C": {"成本": 60, "质量": 90},
+    },
+    "algorithm": {"name": "wsm"},
+}
+
+
+@pytest.fixture(scope="module")
+def server():
+    """在后台线程运行、端口由系统分配的服务"""
+    with MCDAServer(port=0, workers=4, cache_size=16) as server:
+        yield server
+
+
+def _request(server, path, body=None):
+    """发送请求，返回 (状态码, 响应对象)"""
+    data = None if body is None else json.dumps(body).encode("utf-8")
+    request = urllib.request.Request(server.url + path, data=data)
+    try:
+        with urllib.request.urlopen(request, timeout=30) as response:
+            return response.status, json.loads(response.read())
+    except urllib.error.HTTPError as e:
+        return e.code, json.loads(e.read())
+
+
+class TestServer:
+    """HTTP 接口测试"""
+
+    def test_health(self, server):
+        """测试: 健康检查返回已预热的算法和缓存统计"""
+        status, body = _request(server, "/health")
+
+        assert status == 200
+        assert body["status"] == "ok"
+        assert "wsm" in body["algorithms"]
+        assert body["cache"]["maxsize"] == 16
+
+    def test_analyze_inline(self, server):
+        """测试: 内联问题分析，可附带报告"""
+        status, body = _request(
+            server, "/analyze", {"problem": PROBLEM, "algorithm": "topsis", "report": "markdown"}
+        )
+
+        assert status == 200
+        assert body["status"] == "ok"
+        assert body["algorithm"] == "topsis"
+        assert [item["rank"] for item in body["rankings"]] == [1, 2, 3]
+        assert body["report"].startswith("# MCDA 决策分析报告")
+
+    def test_analyze_path(self, server, tmp_path):
+        """测试: 按文件路径分析，结果与内联问题一致"""
+        config = tmp_path / "problem.json"
+        config.write_text(json.dumps(PROBLEM, ensure_ascii=False), encoding="utf-8")
+
+        _, by_path = _request(server, "/analyze", {"path": str(config)})
+        _, inline = _request(server, "/analyze", {"problem": PROBLEM})
+
+        assert by_path["status"] == "ok"
+        assert by_path["rankings"] == inline["rankings"]
+
+    def test_validate(self, server):
+        """测试: 验证接口"""
+        status, body = _request(server, "/validate", {"problem": PROBLEM})
+
+        assert status == 200
+        assert body["is_valid"] is True
+        assert body["errors"] == []
+
+    @pytest.mark.parametrize("body", [
+        {},
+        {"problem": {"alternatives": ["A"]}},
+        {"problem": PROBLEM, "algorithm": "unknown"},
+        {"problem": PROBLEM, "report": "pdf"},
+        {"path": "/nonexistent/problem.yaml"},
+    ])
+    def test_invalid_request(self, server, body):
+        """测试: 无效请求返回 400 和错误信息"""
+        status, response = _request(server, "/analyze", body)
+
+        assert status == 400
+        assert response["status"] == "error"
+        assert response["error"]
+
+    def test_unknown_route(self, server):
+        """测试: 未知接口返回 404"""
+        status, response = _request(server, "/unknown", {})
+
+        assert status == 404
+        assert response["status"] == "error"
+
+    def test_concurrent_requests(self, server):
+        """测试: 并发请求结果一致"""
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            responses = list(pool.map(
+                lambda _: _request(server, "/analyze", {"problem": PROBLEM}), range(16)
+            ))
+
+        assert all(status == 200 for status, _ in responses)
+        assert len({json.dumps(body["rankings"]) for _, body in responses}) == 1
+
+
+class TestConnections:
+    """连接管理测试（单线程服务，验证线程不会被连接长期占用）"""
+
+    def test_keep_alive_client_does_not_hold_worker(self):
+        """测试: 每个连接只处理一个请求，空闲的长连接客户端不占用线程"""
+        with MCDAServer(port=0, workers=1) as single:
+            host, port = single.server_address
+            idle = http.client.HTTPConnection(host, port, timeout=5)
+            idle.request("GET", "/health", headers={"Connection": "keep-alive"})
+            response = idle.getresponse()
+            response.read()
+
+            assert response.getheader("Connection") == "close"
+
+            status, body = _request(single, "/analyze", {"problem": PROBLEM})
+            assert status == 200
+            idle.close()
+
+    def test_idle_socket_times_out(self):
+        """测试: 只连接不发送的客户端在超时后释放线程，shutdown 不会挂起"""
+        single = MCDAServer(port=0, workers=1, timeout=0.5)
+        single.start()
+        idle = socket.create_connection(single.server_address)
+        try:
+            status, _ = _request(single, "/health")
+            assert status == 200
+        finally:
+            start = time.monotonic()
+            single.shutdown()
+            idle.close()
+        assert time.monotonic() - start < 5
+
+    def test_oversized_body_rejected(self, monkeypatch):
+        """测试: 过大的请求体不被读取，返回 413 并关闭连接"""
+        monkeypatch.setattr(server_module, "MAX_REQUEST_BYTES", 64)
+
+        with MCDAServer(port=0, workers=1) as single:
+            status, body = _request(single, "/analyze", {"problem": PROBLEM})
+            assert status == 413
+            assert "请求体过大" in body["error"]
+
+            status, _ = _request(single, "/health")
+            assert status == 200
+
+    def test_unread_body_not_parsed_as_next_request(self):
+        """测试: 未知接口的请求体被读完，不会被当作下一个请求解析"""
+        with MCDAServer(port=0, workers=1) as single:
+            host, port = single.server_address
+            connection = http.client.HTTPConnection(host, port, timeout=5)
+            body = b"GET /health HTTP/1.1\r\n\r\n"
+            connection.request("POST", "/unknown", body=body)
+            response = connection.getresponse()
+
+            assert response.status == 404
+            response.read()
+            assert response.will_close
+            connection.close()
+
+
+class TestServeCommand:
+    """mcda serve 命令参数测试"""
+
+    def test_serve_arguments(self):
+        """测试: serve 命令参数解析"""
+        args = MCDACommandLineInterface().parser.parse_args([
+            "serve", "--port", "0", "-w", "2", "--cache-size", "0"
+        ])
+
+        assert args.command == "serve"
+        assert (args.host, args.port, args.workers, args.cache_size) == ("127.0.0.1", 0, 2, 0)
+
+    def test_invalid_workers(self):
+        """测试: 无效的工作线程数"""
+        with pytest.raises(ValueError, match="workers"):
+            MCDAServer(port=0, workers=0)
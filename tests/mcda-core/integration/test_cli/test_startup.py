@@ -0,0 +1,118 @@
+"""
+测试 CLI 和包的启动开销
+
+使用 ``python -X importtime`` 在新进程中冷启动，防止按需导入退化为急切导入。
+"""
+
+import subprocess
+import sys
+import types
+from pathlib import Path
+
+import pytest
+
+project_root = Path(__file__).parent.parent.parent.parent.parent
+mcda_core_scripts_path = (project_root / "skills" / "mcda-core" / "scripts").resolve()
+
+# `mcda --version` 冷启动时 mcda_core 自身导入的累计时间预算（微秒）
+STARTUP_BUDGET_US = 100_000
+
+# 冷启动时不应加载的重量级模块
+HEAVY_MODULES = ("numpy", "yaml", "mcda_core.core", "mcda_core.algorithms")
+
+BOOTSTRAP = f"""
+import importlib.util, sys
+spec = importlib.util.spec_from_file_location(
+    "mcda_core", {str(mcda_core_scripts_path / "__init__.py")!r},
+    submodule_search_locations=[{str(mcda_core_scripts_path)!r}],
+)
+module = importlib.util.module_from_spec(spec)
+sys.modules["mcda_core"] = module
+spec.loader.exec_module(module)
+"""
+
+
+def _run_importtime(code: str) -> tuple[subprocess.CompletedProcess, dict[str, int]]:
+    """在新进程中运行代码
+
+    Returns:
+        (进程结果, {模块名: 累计导入时间（微秒）})。嵌套导入也会列出，
+        但累计时间只对顶层导入求和才不重复计算
+    """
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", BOOTSTRAP + code],
+        capture_output=True,
+        text=True,
+        timeout=60,
+    )
+
+    imports = {}
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        _, cumulative_us, name = line.split("|", 2)
+        if cumulative_us.strip().isdigit():
+            # 顶层导入名称前只有一个空格，嵌套导入按深度缩进
+            imports[name[1:]] = int(cumulative_us)
+    return proc, imports
+
+
+@pytest.mark.slow
+class TestColdStartup:
+    """冷启动导入测试"""
+
+    def test_version_within_budget(self):
+        """测试 mcda --version 不加载算法依赖且在预算内"""
+        proc, imports = _run_importtime(
+            "from mcda_core.cli import main\n"
+            "sys.argv = ['mcda', '--version']\n"
+            "main()\n"
+        )
+
+        assert proc.returncode == 0, proc.stderr
+        assert "mcda" in proc.stdout
+        loaded = {name.strip() for name in imports}
+        for heavy in HEAVY_MODULES:
+            assert heavy not in loaded, f"--version 不应导入 {heavy}"
+
+        total = sum(us for name, us in imports.items() if name.startswith("mcda_core"))
+        assert total < STARTUP_BUDGET_US, (
+            f"mcda --version 导入耗时 {total / 1000:.1f}ms 超过预算 "
+            f"{STARTUP_BUDGET_US / 1000:.0f}ms"
+        )
+
+    def test_algorithms_registry_is_lazy(self):
+        """测试导入算法包不加载 NumPy，请求算法时才导入对应模块"""
+        proc, imports = _run_importtime(
+            "from mcda_core.algorithms import list_algorithms, get_algorithm\n"
+            "assert 'numpy' not in sys.modules\n"
+            "assert 'topsis' in list_algorithms()\n"
+            "get_algorithm('wsm')\n"
+            "assert 'mcda_core.algorithms.wsm' in sys.modules\n"
+            "assert 'mcda_core.algorithms.topsis' not in sys.modules\n"
+        )
+
+        assert proc.returncode == 0, proc.stderr
+
+
+class TestLazyExports:
+    """延迟导出测试"""
+
+    def test_function_exports_survive_submodule_import(self):
+        """测试导入同名子模块后，包属性仍是函数"""
+        import importlib
+        from mcda_core import algorithms
+
+        importlib.import_module("mcda_core.algorithms.todim")
+        importlib.import_module("mcda_core.algorithms.electre1")
+
+        assert not isinstance(algorithms.todim, types.ModuleType)
+        assert callable(algorithms.todim)
+        assert callable(algorithms.electre1)
+
+    def test_unknown_attribute_raises(self):
+        """测试未知属性抛出 AttributeError"""
+        import mcda_core
+
+        with pytest.raises(AttributeError):
+            mcda_core.not_a_module
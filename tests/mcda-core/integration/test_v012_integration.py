@@ -98,6 +98,9 @@ class TestV012EndToEnd:
         orchestrator = MCDAOrchestrator()
         config_path = Path(__file__).parent.parent / "performance" / "fixtures" / "medium_50x20.yaml"
 
+        # 预热一次：算法模块按需导入，首次运行包含一次性导入开销
+        orchestrator.run_workflow(str(config_path))
+
         # 运行 3 次，检查一致性
         execution_times = []
         for i in range(3):
@@ -0,0 +1,676 @@
+#!/usr/bin/env python3
+"""
+MCDA Core 基准测试套件
+
+在 (方案数, 准则数) 规模网格上对以下计算进行基准测试：
+
+- algorithm: 所有已注册的精确数算法
+- interval: 所有已注册的区间算法（区间评分数据）
+- weighting: 熵权法、CRITIC、变异系数法、PCA、赋权流水线、AHP
+- sensitivity: 敏感性分析（线性模型快速路径与重新计算路径）
+- group: 群决策评分聚合（所有聚合方法）与共识度
+
+测试数据由 generate_test_data.build_test_data 按固定种子生成。每个用例记录
+墙钟时间（重复测量取中位数与最小值）、峰值内存（tracemalloc）和吞吐量，
+结果可保存为 JSON 基线；与基线比较时，超出容差的退化视为失败。
+
+用法:
+    python tests/mcda-core/performance/benchmark.py --save
+    python tests/mcda-core/performance/benchmark.py --compare --tolerance 0.3
+    python tests/mcda-core/performance/benchmark.py --grid 10x5,50x20 --group algorithm
+"""
+
+import argparse
+import json
+import platform
+import random
+import statistics
+import sys
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Callable, Iterable
+
+# 直接运行脚本时，通过 conftest 将 skills/mcda-core/scripts 注册为 mcda_core
+if "mcda_core" not in sys.modules:
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+    import conftest  # noqa: F401
+
+try:
+    from .generate_test_data import build_test_data
+except ImportError:
+    from generate_test_data import build_test_data
+
+
+# 默认规模网格 (方案数, 准则数)
+DEFAULT_GRID: tuple[tuple[int, int], ...] = ((10, 5), (50, 20), (100, 50))
+
+# 用例分组
+GROUPS = ("algorithm", "interval", "weighting", "sensitivity", "group")
+
+# 每个用例的计时次数（另有 1 次预热）
+DEFAULT_REPEAT = 5
+
+# 允许的相对退化（0.5 表示比基线慢 50% 以内不算退化）
+DEFAULT_TOLERANCE = 0.5
+
+# 绝对噪声下限：差值低于该值时不视为退化
+MIN_TIME_DELTA = 0.5e-3   # 秒
+MIN_MEMORY_DELTA = 0.25   # MB
+
+# 群决策用例的决策者人数
+GROUP_SIZE = 5
+
+BASELINE_PATH = Path(__file__).parent / "baselines" / "benchmark.json"
+
+BASELINE_VERSION = 1
+
+
+# =============================================================================
+# 数据结构
+# =============================================================================
+
+@dataclass(frozen=True)
+class BenchmarkCase:
+    """基准测试用例
+
+    Attributes:
+        name: 用例名称（"分组/名称"）
+        n_alternatives: 方案数
+        n_criteria: 准则数
+        setup: 准备输入数据并返回被测函数（准备时间不计入测量）
+    """
+    name: str
+    n_alternatives: int
+    n_criteria: int
+    setup: Callable[[], Callable[[], Any]]
+
+    @property
+    def group(self) -> str:
+        """用例分组"""
+        return self.name.split("/", 1)[0]
+
+    @property
+    def key(self) -> str:
+        """基线中的唯一键"""
+        return _result_key(self.name, self.n_alternatives, self.n_criteria)
+
+
+@dataclass(frozen=True)
+class BenchmarkResult:
+    """基准测试结果
+
+    Attributes:
+        name: 用例名称
+        n_alternatives: 方案数
+        n_criteria: 准则数
+        repeat: 计时次数
+        wall_time: 墙钟时间中位数（秒）
+        min_time: 墙钟时间最小值（秒）
+        peak_memory_mb: 单次调用的峰值内存分配（MB）
+    """
+    name: str
+    n_alternatives: int
+    n_criteria: int
+    repeat: int
+    wall_time: float
+    min_time: float
+    peak_memory_mb: float
+
+    @property
+    def key(self) -> str:
+        """基线中的唯一键"""
+        return _result_key(self.name, self.n_alternatives, self.n_criteria)
+
+    @property
+    def throughput(self) -> float:
+        """吞吐量（次 / 秒）"""
+        return 1.0 / self.wall_time if self.wall_time > 0 else float("inf")
+
+    def to_dict(self) -> dict[str, Any]:
+        """转换为可 JSON 序列化的字典"""
+        return {**asdict(self), "throughput": self.throughput}
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "BenchmarkResult":
+        """从字典创建（忽略派生字段）"""
+        return cls(
+            name=data["name"],
+            n_alternatives=int(data["n_alternatives"]),
+            n_criteria=int(data["n_criteria"]),
+            repeat=int(data["repeat"]),
+            wall_time=float(data["wall_time"]),
+            min_time=float(data["min_time"]),
+            peak_memory_mb=float(data["peak_memory_mb"]),
+        )
+
+
+@dataclass(frozen=True)
+class Regression:
+    """相对基线的性能退化
+
+    Attributes:
+        key: 用例键
+        metric: 指标（"time" 或 "memory"）
+        baseline: 基线值
+        current: 当前值
+    """
+    key: str
+    metric: str
+    baseline: float
+    current: float
+
+    @property
+    def ratio(self) -> float:
+        """当前值 / 基线值"""
+        return self.current / self.baseline if self.baseline > 0 else float("inf")
+
+    def format(self) -> str:
+        """格式化为一行说明"""
+        unit = "s" if self.metric == "time" else "MB"
+        return (
+            f"{self.key} [{self.metric}]: {self.baseline:.6g}{unit} → "
+            f"{self.current:.6g}{unit} (×{self.ratio:.2f})"
+        )
+
+
+def _result_key(name: str, n_alternatives: int, n_criteria: int) -> str:
+    return f"{name}@{n_alternatives}x{n_criteria}"
+
+
+# =============================================================================
+# 测试数据
+# =============================================================================
+
+def _crisp_problem(n_alternatives: int, n_criteria: int):
+    """精确数决策问题"""
+    from mcda_core.core import MCDAOrchestrator
+
+    return MCDAOrchestrator().load_from_dict(build_test_data(n_alternatives, n_criteria))
+
+
+def _interval_problem(n_alternatives: int, n_criteria: int, seed: int = 42):
+    """区间数决策问题：在精确评分两侧随机展开区间"""
+    from mcda_core.interval import Interval
+    from mcda_core.models import DecisionProblem
+
+    problem = _crisp_problem(n_alternatives, n_criteria)
+    rng = random.Random(seed)
+
+    scores = {
+        alt: {
+            crit: Interval(
+                max(score - rng.uniform(0, 10), 0.0),
+                min(score + rng.uniform(0, 10), 100.0)
+            )
+            for crit, score in alt_scores.items()
+        }
+        for alt, alt_scores in problem.scores.items()
+    }
+    return DecisionProblem(
+        alternatives=problem.alternatives,
+        criteria=problem.criteria,
+        scores=scores
+    )
+
+
+def _group_problem(n_alternatives: int, n_criteria: int, seed: int = 42):
+    """群决策问题：GROUP_SIZE 位决策者在同一基础评分上各自扰动"""
+    from mcda_core.group import DecisionMaker, GroupDecisionProblem
+
+    problem = _crisp_problem(n_alternatives, n_criteria)
+    rng = random.Random(seed)
+
+    decision_makers = tuple(
+        DecisionMaker(id=f"DM{k + 1}", name=f"专家{k + 1}", weight=1.0 + k * 0.25)
+        for k in range(GROUP_SIZE)
+    )
+    individual_scores = {
+        dm.id: {
+            alt: {
+                crit: min(max(score + rng.uniform(-10, 10), 1.0), 100.0)
+                for crit, score in alt_scores.items()
+            }
+            for alt, alt_scores in problem.scores.items()
+        }
+        for dm in decision_makers
+    }
+    return GroupDecisionProblem(
+        alternatives=problem.alternatives,
+        criteria=problem.criteria,
+        decision_makers=decision_makers,
+        individual_scores=individual_scores
+    )
+
+
+def _pairwise_matrix(n: int, seed: int = 42):
+    """近似一致的 AHP 判断矩阵"""
+    import numpy as np
+
+    rng = np.random.default_rng(seed)
+    weights = rng.uniform(1, 9, n)
+    noise = np.triu(rng.normal(0, 0.1, (n, n)), 1)
+    return np.outer(weights, 1 / weights) * np.exp(noise - noise.T)
+
+
+# =============================================================================
+# 用例构建
+# =============================================================================
+
+def _algorithm_case(name: str, interval: bool, m: int, n: int) -> BenchmarkCase:
+    def setup():
+        from mcda_core.algorithms import get_algorithm
+
+        problem = _interval_problem(m, n) if interval else _crisp_problem(m, n)
+        algorithm = get_algorithm(name)
+        return lambda: algorithm.calculate(problem)
+
+    group = "interval" if interval else "algorithm"
+    return BenchmarkCase(f"{group}/{name}", m, n, setup)
+
+
+def _weighting_cases(m: int, n: int) -> list[BenchmarkCase]:
+    def matrix_case(name: str, factory: Callable[[Any, Any], Callable[[], Any]]) -> BenchmarkCase:
+        def setup():
+            problem = _crisp_problem(m, n)
+            directions = [crit.direction for crit in problem.criteria]
+            return factory(problem.score_matrix.copy(), directions)
+        return BenchmarkCase(f"weighting/{name}", m, n, setup)
+
+    def entropy(matrix, directions):
+        from mcda_core.services.entropy_weight_service import EntropyWeightService
+        service = EntropyWeightService()
+        return lambda: service.calculate_weights(matrix, directions)
+
+    def critic(matrix, directions):
+        from mcda_core.weighting import critic_weighting
+        return lambda: critic_weighting(matrix)
+
+    def cv(matrix, directions):
+        from mcda_core.weighting import cv_weighting
+        return lambda: cv_weighting(matrix)
+
+    def pca(matrix, directions):
+        from mcda_core.weighting import pca_weighting
+        return lambda: pca_weighting(matrix)
+
+    def pipeline(matrix, directions):
+        from mcda_core.weighting import WeightingPipeline
+        weighting = WeightingPipeline()
+        return lambda: weighting.run(matrix, directions).combine()
+
+    def ahp_setup():
+        from mcda_core.services.ahp_service import AHPService
+        service = AHPService()
+        matrix = _pairwise_matrix(n)
+        return lambda: service.calculate_weights_with_consistency(matrix)
+
+    return [
+        matrix_case("entropy", entropy),
+        matrix_case("critic", critic),
+        matrix_case("cv", cv),
+        matrix_case("pca", pca),
+        matrix_case("pipeline", pipeline),
+        BenchmarkCase("weighting/ahp", n, n, ahp_setup),
+    ]
+
+
+def _sensitivity_case(algorithm_name: str, m: int, n: int) -> BenchmarkCase:
+    def setup():
+        from mcda_core.algorithms import get_algorithm
+        from mcda_core.sensitivity import SensitivityService
+
+        problem = _crisp_problem(m, n)
+        algorithm = get_algorithm(algorithm_name)
+        service = SensitivityService()
+        return lambda: service.analyze(problem, algorithm)
+
+    return BenchmarkCase(f"sensitivity/{algorithm_name}", m, n, setup)
+
+
+def _group_cases(m: int, n: int) -> list[BenchmarkCase]:
+    from mcda_core.aggregation import AggregationRegistry
+
+    def aggregation_case(method: str) -> BenchmarkCase:
+        def setup():
+            from mcda_core.group import GroupDecisionService
+            problem = _group_problem(m, n)
+            service = GroupDecisionService()
+            return lambda: service.aggregate_tensor(problem, method)
+        return BenchmarkCase(f"group/{method}", m, n, setup)
+
+    def consensus_setup():
+        from mcda_core.group import GroupDecisionService
+        problem = _group_problem(m, n)
+        service = GroupDecisionService()
+        return lambda: service.compute_consensus(problem)
+
+    return [
+        *(aggregation_case(method) for method in AggregationRegistry.list_methods()),
+        BenchmarkCase("group/consensus", m, n, consensus_setup),
+    ]
+
+
+def build_cases(
+    grid: Iterable[tuple[int, int]] = DEFAULT_GRID,
+    groups: Iterable[str] = GROUPS
+) -> list[BenchmarkCase]:
+    """构建规模网格上的基准测试用例
+
+    Args:
+        grid: (方案数, 准则数) 列表
+        groups: 需要包含的用例分组
+
+    Returns:
+        用例列表（按规模、分组排列）
+
+    Raises:
+        ValueError: 未知的分组
+    """
+    from mcda_core.algorithms import list_algorithms
+
+    groups = tuple(groups)
+    unknown = [group for group in groups if group not in GROUPS]
+    if unknown:
+        raise ValueError(f"未知的用例分组: {unknown}，可选: {list(GROUPS)}")
+
+    cases: list[BenchmarkCase] = []
+    for m, n in grid:
+        for name in list_algorithms():
+            cases.append(_algorithm_case(name, name.endswith("_interval"), m, n))
+        cases.extend(_weighting_cases(m, n))
+        cases.append(_sensitivity_case("topsis", m, n))
+        cases.append(_sensitivity_case("vikor", m, n))
+        cases.extend(_group_cases(m, n))
+
+    # AHP 用例只依赖准则数，不同网格点可能重复
+    unique = {case.key: case for case in reversed(cases)}
+    return [case for case in cases if case.group in groups and unique[case.key] is case]
+
+
+# =============================================================================
+# 测量
+# =============================================================================
+
+def measure(case: BenchmarkCase, repeat: int = DEFAULT_REPEAT) -> BenchmarkResult:
+    """测量单个用例
+
+    先预热一次，再计时 repeat 次；峰值内存在计时之外单独测量一次，
+    避免 tracemalloc 的开销影响计时。
+
+    Args:
+        case: 基准测试用例
+        repeat: 计时次数
+
+    Returns:
+        BenchmarkResult
+    """
+    if repeat < 1:
+        raise ValueError(f"repeat 必须 >= 1，当前值为 {repeat}")
+
+    func = case.setup()
+    func()
+
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+
+    tracemalloc.start()
+    try:
+        func()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return BenchmarkResult(
+        name=case.name,
+        n_alternatives=case.n_alternatives,
+        n_criteria=case.n_criteria,
+        repeat=repeat,
+        wall_time=statistics.median(timings),
+        min_time=min(timings),
+        peak_memory_mb=peak / 1024 / 1024,
+    )
+
+
+def run_benchmarks(
+    cases: Iterable[BenchmarkCase],
+    repeat: int = DEFAULT_REPEAT,
+    progress: Callable[[BenchmarkResult], None] | None = None
+) -> list[BenchmarkResult]:
+    """依次测量所有用例
+
+    Args:
+        cases: 用例列表
+        repeat: 每个用例的计时次数
+        progress: 每完成一个用例时的回调（可选）
+
+    Returns:
+        结果列表
+    """
+    results = []
+    for case in cases:
+        result = measure(case, repeat)
+        results.append(result)
+        if progress is not None:
+            progress(result)
+    return results
+
+
+# =============================================================================
+# 基线
+# =============================================================================
+
+def save_baseline(results: Iterable[BenchmarkResult], path: Path = BASELINE_PATH) -> None:
+    """保存 JSON 基线（含运行环境信息）"""
+    import numpy as np
+
+    data = {
+        "version": BASELINE_VERSION,
+        "created": time.strftime("%Y-%m-%d %H:%M:%S"),
+        "environment": {
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "platform": platform.platform(),
+            "machine": platform.machine(),
+        },
+        "results": [result.to_dict() for result in results],
+    }
+
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(data, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
+
+
+def load_baseline(path: Path = BASELINE_PATH) -> dict[str, BenchmarkResult]:
+    """读取 JSON 基线
+
+    Returns:
+        用例键 → 基线结果
+
+    Raises:
+        ValueError: 基线版本不受支持
+    """
+    data = json.loads(Path(path).read_text(encoding="utf-8"))
+    if data.get("version") != BASELINE_VERSION:
+        raise ValueError(f"不支持的基线版本: {data.get('version')}")
+
+    results = (BenchmarkResult.from_dict(item) for item in data["results"])
+    return {result.key: result for result in results}
+
+
+def compare(
+    results: Iterable[BenchmarkResult],
+    baseline: dict[str, BenchmarkResult],
+    tolerance: float = DEFAULT_TOLERANCE,
+    memory_tolerance: float | None = None
+) -> list[Regression]:
+    """与基线比较，找出超出容差的退化
+
+    时间比较使用最小值（受调度噪声影响最小）。差值低于绝对噪声下限
+    （MIN_TIME_DELTA / MIN_MEMORY_DELTA）时不视为退化；基线中没有的
+    用例被忽略。
+
+    Args:
+        results: 当前结果
+        baseline: 基线结果，见 load_baseline
+        tolerance: 允许的相对时间退化
+        memory_tolerance: 允许的相对内存退化（默认与 tolerance 相同）
+
+    Returns:
+        退化列表
+    """
+    if tolerance < 0:
+        raise ValueError(f"tolerance 必须 >= 0，当前值为 {tolerance}")
+    if memory_tolerance is None:
+        memory_tolerance = tolerance
+
+    regressions = []
+    for result in results:
+        reference = baseline.get(result.key)
+        if reference is None:
+            continue
+
+        if (result.min_time > reference.min_time * (1 + tolerance)
+                and result.min_time - reference.min_time > MIN_TIME_DELTA):
+            regressions.append(
+                Regression(result.key, "time", reference.min_time, result.min_time)
+            )
+
+        if (result.peak_memory_mb > reference.peak_memory_mb * (1 + memory_tolerance)
+                and result.peak_memory_mb - reference.peak_memory_mb > MIN_MEMORY_DELTA):
+            regressions.append(
+                Regression(result.key, "memory", reference.peak_memory_mb, result.peak_memory_mb)
+            )
+
+    return regressions
+
+
+# =============================================================================
+# 报告
+# =============================================================================
+
+def format_report(
+    results: Iterable[BenchmarkResult],
+    baseline: dict[str, BenchmarkResult] | None = None
+) -> str:
+    """生成 Markdown 格式的基准测试报告"""
+    lines = [
+        "# MCDA Core 基准测试报告\n",
+        "**生成时间**: " + time.strftime("%Y-%m-%d %H:%M:%S") + "\n",
+        "| 用例 | 规模 | 中位时间 | 最小时间 | 峰值内存 | 吞吐量 | 相对基线 |",
+        "|------|------|----------|----------|----------|--------|----------|",
+    ]
+
+    for result in results:
+        reference = (baseline or {}).get(result.key)
+        relative = f"×{result.min_time / reference.min_time:.2f}" if reference else "-"
+        lines.append(
+            f"| {result.name} | {result.n_alternatives}×{result.n_criteria} | "
+            f"{result.wall_time * 1000:.3f}ms | {result.min_time * 1000:.3f}ms | "
+            f"{result.peak_memory_mb:.2f}MB | {result.throughput:.1f}/s | {relative} |"
+        )
+
+    return "\n".join(lines) + "\n"
+
+
+# =============================================================================
+# 命令行
+# =============================================================================
+
+def parse_grid(text: str) -> tuple[tuple[int, int], ...]:
+    """解析规模网格，如 "10x5,50x20" """
+    try:
+        grid = tuple(
+            tuple(int(part) for part in size.lower().split("x"))
+            for size in text.split(",") if size.strip()
+        )
+    except ValueError as e:
+        raise argparse.ArgumentTypeError(f"无效的规模网格: {text!r}") from e
+
+    if not grid or any(len(size) != 2 or min(size) < 2 for size in grid):
+        raise argparse.ArgumentTypeError(f"无效的规模网格: {text!r}（格式: 10x5,50x20，各维至少为 2）")
+    return grid
+
+
+def main(argv: list[str] | None = None) -> int:
+    """命令行入口
+
+    Returns:
+        退出码（存在退化时为 1）
+    """
+    parser = argparse.ArgumentParser(description="MCDA Core 基准测试套件")
+    parser.add_argument(
+        "--grid", type=parse_grid, default=DEFAULT_GRID,
+        help="规模网格，如 10x5,50x20（默认: 10x5,50x20,100x50）"
+    )
+    parser.add_argument(
+        "--group", action="append", choices=GROUPS,
+        help="只运行指定分组（可重复）"
+    )
+    parser.add_argument(
+        "--repeat", type=int, default=DEFAULT_REPEAT,
+        help=f"每个用例的计时次数（默认: {DEFAULT_REPEAT}）"
+    )
+    parser.add_argument(
+        "--save", nargs="?", type=Path, const=BASELINE_PATH,
+        help="将结果保存为基线（默认路径: baselines/benchmark.json）"
+    )
+    parser.add_argument(
+        "--compare", nargs="?", type=Path, const=BASELINE_PATH,
+        help="与基线比较，存在退化时退出码为 1"
+    )
+    parser.add_argument(
+        "--tolerance", type=float, default=DEFAULT_TOLERANCE,
+        help=f"允许的相对退化（默认: {DEFAULT_TOLERANCE}）"
+    )
+    parser.add_argument(
+        "--memory-tolerance", type=float,
+        help="允许的相对内存退化（默认与 --tolerance 相同）"
+    )
+    parser.add_argument(
+        "-o", "--output", type=Path,
+        help="Markdown 报告输出路径"
+    )
+    args = parser.parse_args(argv)
+
+    cases = build_cases(args.grid, args.group or GROUPS)
+    results = run_benchmarks(
+        cases,
+        repeat=args.repeat,
+        progress=lambda r: print(
+            f"  {r.key:<45} {r.min_time * 1000:>10.3f}ms {r.peak_memory_mb:>8.2f}MB",
+            file=sys.stderr
+        )
+    )
+
+    baseline = load_baseline(args.compare) if args.compare else None
+    report = format_report(results, baseline)
+    if args.output:
+        args.output.write_text(report, encoding="utf-8")
+    else:
+        print(report)
+
+    if args.save:
+        save_baseline(results, args.save)
+        print(f"✅ 基线已保存: {args.save}", file=sys.stderr)
+
+    if baseline is None:
+        return 0
+
+    regressions = compare(results, baseline, args.tolerance, args.memory_tolerance)
+    if regressions:
+        print(f"❌ {len(regressions)} 项性能退化:", file=sys.stderr)
+        for regression in regressions:
+            print(f"  {regression.format()}", file=sys.stderr)
+        return 1
+
+    print("✅ 无性能退化", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
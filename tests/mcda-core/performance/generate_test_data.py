@@ -3,17 +3,27 @@
 生成性能测试数据
 """
 
-import yaml
+import random
 from pathlib import Path
+from typing import Any
 
+import yaml
 
-def generate_test_data(alternatives_count: int, criteria_count: int, output_file: Path):
-    """生成性能测试数据
+
+def build_test_data(
+    alternatives_count: int,
+    criteria_count: int,
+    seed: int = 42
+) -> dict[str, Any]:
+    """生成性能测试配置数据（与 YAML 配置结构相同的字典）
 
     Args:
         alternatives_count: 方案数量
         criteria_count: 准则数量
-        output_file: 输出文件路径
+        seed: 随机种子（固定种子以确保一致性）
+
+    Returns:
+        配置数据，可直接交给 MCDAOrchestrator.load_from_dict
     """
     # 生成方案
     alternatives = [f"方案{i:03d}" for i in range(1, alternatives_count + 1)]
@@ -30,18 +40,17 @@ def generate_test_data(alternatives_count: int, criteria_count: int, output_file
         })
 
     # 生成评分矩阵
+    rng = random.Random(seed)
     scores = {}
-    import random
-    random.seed(42)  # 固定种子以确保一致性
 
     for alt in alternatives:
         scores[alt] = {}
         for crit in criteria:
             # 生成 0-100 的随机分数
-            scores[alt][crit["name"]] = random.randint(1, 100)
+            scores[alt][crit["name"]] = rng.randint(1, 100)
 
     # 组装数据
-    data = {
+    return {
         "name": f"性能测试数据 - {alternatives_count}方案 × {criteria_count}准则",
         "algorithm": {
             "name": "topsis"  # 使用 TOPSIS 算法进行性能测试
@@ -51,6 +60,17 @@ def generate_test_data(alternatives_count: int, criteria_count: int, output_file
         "scores": scores
     }
 
+
+def generate_test_data(alternatives_count: int, criteria_count: int, output_file: Path):
+    """生成性能测试数据
+
+    Args:
+        alternatives_count: 方案数量
+        criteria_count: 准则数量
+        output_file: 输出文件路径
+    """
+    data = build_test_data(alternatives_count, criteria_count)
+
     # 保存到文件
     with open(output_file, 'w', encoding='utf-8') as f:
         yaml.dump(data, f, allow_unicode=True, default_flow_style=False, sort_keys=False)
@@ -0,0 +1,156 @@
+"""
+基准测试套件测试
+
+基准与基线的比较默认跳过（计时依赖机器），设置环境变量 MCDA_BENCHMARK=1 启用；
+容差由 MCDA_BENCHMARK_TOLERANCE 配置。
+"""
+
+import os
+
+import pytest
+
+from mcda_core.algorithms import list_algorithms
+
+from . import benchmark
+from .benchmark import (
+    BASELINE_PATH,
+    DEFAULT_GRID,
+    DEFAULT_TOLERANCE,
+    GROUPS,
+    BenchmarkResult,
+    build_cases,
+    compare,
+    load_baseline,
+    main,
+    measure,
+    run_benchmarks,
+    save_baseline,
+)
+
+
+def _result(name="algorithm/wsm", min_time=0.01, peak_memory_mb=1.0):
+    return BenchmarkResult(
+        name=name,
+        n_alternatives=10,
+        n_criteria=5,
+        repeat=3,
+        wall_time=min_time,
+        min_time=min_time,
+        peak_memory_mb=peak_memory_mb,
+    )
+
+
+class TestBuildCases:
+    """用例构建测试"""
+
+    def test_covers_all_registered_algorithms(self):
+        """测试: 每个已注册算法在每个规模上都有用例"""
+        cases = build_cases(grid=((10, 5),))
+        names = {case.name for case in cases}
+
+        for algorithm in list_algorithms():
+            group = "interval" if algorithm.endswith("_interval") else "algorithm"
+            assert f"{group}/{algorithm}" in names
+        assert {case.group for case in cases} == set(GROUPS)
+
+    def test_keys_unique(self):
+        """测试: 用例键唯一"""
+        keys = [case.key for case in build_cases(grid=((10, 5), (20, 5)))]
+
+        assert len(keys) == len(set(keys))
+
+    def test_group_filter(self):
+        """测试: 按分组筛选"""
+        cases = build_cases(grid=((10, 5),), groups=("weighting",))
+
+        assert cases
+        assert all(case.group == "weighting" for case in cases)
+
+        with pytest.raises(ValueError, match="分组"):
+            build_cases(groups=("unknown",))
+
+    def test_all_cases_run(self):
+        """测试: 所有用例在小规模上可运行"""
+        results = run_benchmarks(build_cases(grid=((6, 4),)), repeat=1)
+
+        for result in results:
+            assert result.min_time > 0
+            assert result.wall_time >= result.min_time
+            assert result.peak_memory_mb >= 0
+            assert result.throughput > 0
+
+
+class TestBaseline:
+    """基线保存与比较测试"""
+
+    def test_save_and_load(self, tmp_path):
+        """测试: 基线往返保存"""
+        path = tmp_path / "baseline.json"
+        results = [_result(), _result(name="weighting/cv")]
+
+        save_baseline(results, path)
+        baseline = load_baseline(path)
+
+        assert baseline == {result.key: result for result in results}
+
+    def test_regressions_beyond_tolerance(self):
+        """测试: 超出容差的时间与内存退化"""
+        baseline = {_result().key: _result()}
+
+        regressions = compare(
+            [_result(min_time=0.02, peak_memory_mb=3.0)], baseline, tolerance=0.5
+        )
+
+        assert {regression.metric for regression in regressions} == {"time", "memory"}
+        assert regressions[0].ratio == pytest.approx(2.0)
+
+    def test_within_tolerance_or_noise_floor(self):
+        """测试: 容差内或低于噪声下限的变化不算退化"""
+        baseline = {
+            _result().key: _result(),
+            _result(name="algorithm/wpm").key: _result(name="algorithm/wpm", min_time=1e-5),
+        }
+
+        regressions = compare(
+            [
+                _result(min_time=0.014, peak_memory_mb=1.2),
+                _result(name="algorithm/wpm", min_time=5e-5),
+                _result(name="algorithm/new", min_time=10.0),
+            ],
+            baseline,
+            tolerance=0.5
+        )
+
+        assert regressions == []
+
+    def test_main_fails_on_regression(self, tmp_path, monkeypatch):
+        """测试: 命令行在存在退化时返回 1"""
+        monkeypatch.setattr(benchmark, "MIN_TIME_DELTA", 0.0)
+        path = tmp_path / "baseline.json"
+        case = build_cases(grid=((6, 4),), groups=("algorithm",))[0]
+        fast = measure(case, repeat=1)
+        save_baseline([BenchmarkResult(**{**fast.__dict__, "min_time": 1e-9})], path)
+
+        exit_code = main([
+            "--grid", "6x4", "--group", "algorithm", "--repeat", "1",
+            "--compare", str(path), "--tolerance", "0", "-o", str(tmp_path / "report.md"),
+        ])
+
+        assert exit_code == 1
+        assert case.name in (tmp_path / "report.md").read_text(encoding="utf-8")
+
+
+@pytest.mark.benchmark
+@pytest.mark.skipif(
+    os.environ.get("MCDA_BENCHMARK") != "1",
+    reason="基准回归测试需设置 MCDA_BENCHMARK=1"
+)
+def test_no_regressions_against_baseline():
+    """基准回归测试: 默认规模网格上无超出容差的退化"""
+    tolerance = float(os.environ.get("MCDA_BENCHMARK_TOLERANCE", DEFAULT_TOLERANCE))
+    baseline = load_baseline(BASELINE_PATH)
+
+    results = run_benchmarks(build_cases(DEFAULT_GRID))
+    regressions = compare(results, baseline, tolerance)
+
+    assert not regressions, "性能退化:\n" + "\n".join(r.format() for r in regressions)
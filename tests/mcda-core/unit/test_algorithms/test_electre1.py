@@ -816,3 +816,39 @@ class TestSpecialCases:
         concordance = result.metadata.metrics["concordance_matrix"]
         assert len(concordance) == 3
         assert len(concordance[0]) == 3
+
+
+class TestBlockedComputation:
+    """行分块计算测试"""
+
+    @pytest.fixture
+    def problem(self):
+        """创建混合方向的示例问题"""
+        rng = np.random.default_rng(42)
+        alternatives = tuple(f"A{i}" for i in range(7))
+        criteria = (
+            Criterion(name="C1", weight=0.4, direction="higher_better"),
+            Criterion(name="C2", weight=0.35, direction="lower_better"),
+            Criterion(name="C3", weight=0.25, direction="higher_better"),
+        )
+        values = rng.integers(0, 10, size=(7, 3)) * 10
+        scores = {
+            alt: {crit.name: float(values[i, k]) for k, crit in enumerate(criteria)}
+            for i, alt in enumerate(alternatives)
+        }
+        return DecisionProblem(alternatives=alternatives, criteria=criteria, scores=scores)
+
+    @pytest.mark.parametrize("block_size", [1, 3, 7, 100])
+    def test_block_size_matches_full_computation(self, problem, block_size):
+        """测试：分块结果与整体计算完全一致"""
+        full = electre1(problem, alpha=0.6, beta=0.3)
+        blocked = electre1(problem, alpha=0.6, beta=0.3, block_size=block_size)
+
+        for key in ("concordance_matrix", "discordance_matrix", "credibility_matrix", "kernel"):
+            assert blocked.metadata.metrics[key] == full.metadata.metrics[key]
+        assert blocked.raw_scores == full.raw_scores
+
+    def test_invalid_block_size(self, problem):
+        """测试：无效分块大小"""
+        with pytest.raises(ELECTRE1Error, match="block_size"):
+            electre1(problem, block_size=0)
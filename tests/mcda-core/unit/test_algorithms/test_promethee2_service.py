@@ -135,6 +135,32 @@ class TestPreferenceFunctions:
         with pytest.raises(ValueError, match="偏好函数"):
             service._get_preference_function("invalid_type")
 
+    @pytest.mark.parametrize("func_config, scalar_args", [
+        ({"type": "usual"}, ()),
+        ({"type": "u_shape", "q": 2.0}, (2.0,)),
+        ({"type": "v_shape", "p": 5.0}, (5.0,)),
+        ({"type": "level", "q": 2.0, "p": 5.0}, (2.0, 5.0)),
+        ({"type": "v_shape_indifference", "q": 2.0, "p": 5.0}, (2.0, 5.0)),
+        ({"type": "gaussian", "s": 3.0}, (3.0,)),
+    ])
+    def test_preference_kernel_matches_scalar(self, func_config, scalar_args):
+        """测试：数组内核与标量偏好函数逐元素一致"""
+        service = PROMETHEEService()
+        d = np.array([[-6.0, -2.0, 0.0], [1.5, 2.0, 3.5], [5.0, 6.0, 10.0]])
+
+        kernel = service._get_preference_kernel(func_config)
+        scalar = service._get_preference_function(func_config["type"])
+        expected = np.array([[scalar(x, *scalar_args) for x in row] for row in d])
+
+        np.testing.assert_array_equal(kernel(d), expected)
+
+    def test_invalid_preference_kernel(self):
+        """测试：无效的偏好函数类型（数组内核）"""
+        service = PROMETHEEService()
+
+        with pytest.raises(ValueError, match="偏好函数"):
+            service._get_preference_kernel({"type": "invalid_type"})
+
 
 class TestPreferenceIndex:
     """偏好指数测试"""
@@ -462,3 +462,28 @@ class TestTODIMProperties:
         assert result.metadata.algorithm_name == "todim"
         assert "theta" in result.metadata.metrics
         assert result.metadata.metrics["theta"] == theta
+
+    def test_todim_keep_phi(self):
+        """测试：keep_phi 保留相对测度张量形状且不改变结果"""
+        problem = DecisionProblem(
+            alternatives=("A1", "A2", "A3"),
+            criteria=(
+                Criterion(name="C1", weight=0.6, direction="higher_better"),
+                Criterion(name="C2", weight=0.4, direction="lower_better"),
+            ),
+            scores={
+                "A1": {"C1": 10, "C2": 5},
+                "A2": {"C1": 8, "C2": 7},
+                "A3": {"C1": 6, "C2": 3},
+            }
+        )
+
+        streamed = todim(problem, theta=1.0)
+        kept = todim(problem, theta=1.0, keep_phi=True)
+
+        assert "phi_matrix_shape" not in streamed.metadata.metrics
+        assert kept.metadata.metrics["phi_matrix_shape"] == (3, 3, 2)
+        np.testing.assert_allclose(
+            kept.metadata.metrics["global_dominance"],
+            streamed.metadata.metrics["global_dominance"],
+        )
@@ -188,6 +188,40 @@ class TestCrispCompatibility:
         assert crisp_rankings[0] == interval_rankings[0]
         assert crisp_rankings[1] == interval_rankings[1]
 
+    def test_crisp_cells_match_degenerate_intervals(self, interval_criteria, interval_scores):
+        """测试精确数单元格（含成本型准则）与退化区间结果一致"""
+        from mcda_core.algorithms.base import get_algorithm
+
+        # 成本准则使用精确数（区间中点）
+        mixed_scores = {
+            alt: {
+                crit: (val.midpoint if crit == "成本" else val)
+                for crit, val in scores.items()
+            }
+            for alt, scores in interval_scores.items()
+        }
+        degenerate_scores = {
+            alt: {
+                crit: (Interval(val.midpoint, val.midpoint) if crit == "成本" else val)
+                for crit, val in scores.items()
+            }
+            for alt, scores in interval_scores.items()
+        }
+
+        algorithm = get_algorithm("todim_interval")
+        mixed_result = algorithm.calculate(DecisionProblem(
+            alternatives=tuple(mixed_scores.keys()),
+            criteria=interval_criteria,
+            scores=mixed_scores,
+        ))
+        degenerate_result = algorithm.calculate(DecisionProblem(
+            alternatives=tuple(degenerate_scores.keys()),
+            criteria=interval_criteria,
+            scores=degenerate_scores,
+        ))
+
+        assert mixed_result.raw_scores == degenerate_result.raw_scores
+
     def test_algorithm_name_and_description(self):
         """测试算法名称和描述"""
         from mcda_core.algorithms.base import get_algorithm
@@ -359,3 +359,46 @@ class TestTOPSISIntervalIntegration:
         # 验证不确定性信息
         assert len(uncertainty_info) == 3
         assert all(info >= 0 for info in uncertainty_info.values())
+
+
+class TestTOPSISIntervalBatch:
+    """区间 TOPSIS 批量评估测试（通用回退路径）"""
+
+    def test_batch_falls_back_to_calculate(self, interval_criteria, interval_scores):
+        """测试无线性模型的算法逐组调用 calculate"""
+        from mcda_core.algorithms import get_algorithm
+
+        problem = DecisionProblem(
+            alternatives=tuple(interval_scores.keys()),
+            criteria=tuple(interval_criteria),
+            scores=interval_scores,
+        )
+        algorithm = get_algorithm("topsis_interval")
+        weights = np.array([[0.4, 0.3, 0.2, 0.1], [0.1, 0.2, 0.3, 0.4]])
+
+        scores, ranks = algorithm.calculate_batch(problem, weights)
+
+        assert algorithm.linear_weight_model(problem) is None
+        for k, row in enumerate(weights):
+            result = algorithm.calculate(problem.with_weights(row))
+            for i, alt in enumerate(problem.alternatives):
+                assert scores[k, i] == pytest.approx(result.raw_scores[alt])
+            assert sorted(ranks[k].tolist()) == [1, 2, 3]
+
+    def test_batch_fallback_normalizes_weights(self, interval_criteria, interval_scores):
+        """测试回退路径同样接受未归一化的权重（大于 1 的权重不再被准则拒绝）"""
+        from mcda_core.algorithms import get_algorithm
+
+        problem = DecisionProblem(
+            alternatives=tuple(interval_scores.keys()),
+            criteria=tuple(interval_criteria),
+            scores=interval_scores,
+        )
+        algorithm = get_algorithm("topsis_interval")
+        weights = np.array([[0.4, 0.3, 0.2, 0.1]])
+
+        scores, ranks = algorithm.calculate_batch(problem, weights * 4)
+        expected_scores, expected_ranks = algorithm.calculate_batch(problem, weights)
+
+        np.testing.assert_allclose(scores, expected_scores)
+        np.testing.assert_array_equal(ranks, expected_ranks)
@@ -613,3 +613,35 @@ class TestVIKORErrorHandling:
                 criteria=[],
                 scores=scores,
             )
+
+
+class TestVIKORBatch:
+    """VIKOR 批量权重评估测试"""
+
+    @pytest.mark.parametrize("v", [0.0, 0.5, 1.0])
+    def test_batch_matches_single_calculation(self, sample_problem, v):
+        """测试批量评估与逐组 calculate 结果一致（Q 越小越好）"""
+        import numpy as np
+
+        algorithm = VIKORAlgorithm()
+        n_crit = len(sample_problem.criteria)
+        weights = np.vstack([
+            sample_problem.weight_vector,
+            np.full(n_crit, 1.0 / n_crit),
+        ])
+
+        Q, ranks = algorithm.calculate_batch(sample_problem, weights, v=v)
+
+        for k, row in enumerate(weights):
+            result = algorithm.calculate(sample_problem.with_weights(row), v=v)
+            expected_ranks = {r.alternative: r.rank for r in result.rankings}
+            for i, alt in enumerate(sample_problem.alternatives):
+                assert Q[k, i] == pytest.approx(result.raw_scores[alt])
+                assert ranks[k, i] == expected_ranks[alt]
+
+    def test_batch_invalid_v(self, sample_problem):
+        """测试无效 v 参数"""
+        with pytest.raises(ValueError, match="v 必须在"):
+            VIKORAlgorithm().calculate_batch(
+                sample_problem, sample_problem.weight_vector, v=1.5
+            )
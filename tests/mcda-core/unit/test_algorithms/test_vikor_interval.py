@@ -634,6 +634,35 @@ class TestCrispCompatibility:
         # 退化区间应该正常计算
         assert len(result.rankings) == 3
 
+    def test_mixed_crisp_and_interval_scores(self, interval_criteria, degenerate_interval_scores):
+        """测试混合精确数/区间评分与全部退化区间结果一致"""
+        from mcda_core.algorithms.base import get_algorithm
+
+        # 成本和易用性使用精确数，其余保留退化区间
+        mixed_scores = {
+            alt: {
+                crit: (val.lower if crit in ("成本", "易用性") else val)
+                for crit, val in scores.items()
+            }
+            for alt, scores in degenerate_interval_scores.items()
+        }
+
+        algorithm = get_algorithm("vikor_interval")
+        mixed_result = algorithm.calculate(DecisionProblem(
+            alternatives=tuple(mixed_scores.keys()),
+            criteria=interval_criteria,
+            scores=mixed_scores,
+        ))
+        degenerate_result = algorithm.calculate(DecisionProblem(
+            alternatives=tuple(degenerate_interval_scores.keys()),
+            criteria=interval_criteria,
+            scores=degenerate_interval_scores,
+        ))
+
+        assert mixed_result.raw_scores == degenerate_result.raw_scores
+        assert mixed_result.rankings == degenerate_result.rankings
+        assert all(isinstance(q, Interval) for q in mixed_result.raw_scores.values())
+
     def test_single_value_intervals(self):
         """测试单值区间（退化区间）"""
         from mcda_core.algorithms.base import get_algorithm
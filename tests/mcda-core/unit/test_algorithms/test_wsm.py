@@ -314,3 +314,62 @@ class TestWSMProperties:
         algorithm = WSMAlgorithm()
         assert len(algorithm.description) > 0
         assert "加权" in algorithm.description or "Weighted" in algorithm.description
+
+
+# =============================================================================
+# Batch Evaluation Tests
+# =============================================================================
+
+class TestWSMBatch:
+    """WSM 批量权重评估测试"""
+
+    def test_batch_matches_single_calculation(self, sample_problem):
+        """测试批量评估与逐组 calculate 结果一致"""
+        import numpy as np
+
+        algorithm = WSMAlgorithm()
+        weights = np.array([
+            [0.4, 0.3, 0.2, 0.1],
+            [0.25, 0.25, 0.25, 0.25],
+            [0.1, 0.6, 0.1, 0.2],
+        ])
+
+        scores, ranks = algorithm.calculate_batch(sample_problem, weights)
+
+        assert scores.shape == (3, 3)
+        assert ranks.shape == (3, 3)
+        for k, row in enumerate(weights):
+            result = algorithm.calculate(sample_problem.with_weights(row))
+            expected_ranks = {r.alternative: r.rank for r in result.rankings}
+            for i, alt in enumerate(sample_problem.alternatives):
+                assert scores[k, i] == pytest.approx(result.raw_scores[alt])
+                assert ranks[k, i] == expected_ranks[alt]
+
+    def test_batch_invalid_weight_shape(self, sample_problem):
+        """测试权重矩阵列数与准则数不一致"""
+        import numpy as np
+
+        with pytest.raises(ValueError, match="权重矩阵形状"):
+            WSMAlgorithm().calculate_batch(sample_problem, np.ones((2, 3)))
+
+    def test_batch_negative_weights(self, sample_problem):
+        """测试负权重"""
+        import numpy as np
+
+        with pytest.raises(ValueError, match="非负"):
+            WSMAlgorithm().calculate_batch(sample_problem, -np.ones((1, 4)))
+
+    def test_batch_normalizes_weights(self, sample_problem):
+        """测试每组权重按和归一化（与逐组 calculate 接受同样的输入）"""
+        import numpy as np
+
+        weights = np.array([[0.4, 0.3, 0.2, 0.1]])
+
+        scores, ranks = WSMAlgorithm().calculate_batch(sample_problem, weights * 5)
+        expected_scores, expected_ranks = WSMAlgorithm().calculate_batch(sample_problem, weights)
+
+        np.testing.assert_allclose(scores, expected_scores)
+        np.testing.assert_array_equal(ranks, expected_ranks)
+
+        with pytest.raises(ValueError, match="之和必须大于 0"):
+            WSMAlgorithm().calculate_batch(sample_problem, np.zeros((1, 4)))
@@ -4,8 +4,9 @@ MCDA Core - 区间数数据类型测试
 测试区间数（Interval）的基本功能和运算。
 """
 
+import numpy as np
 import pytest
-from mcda_core.interval import Interval, IntervalError
+from mcda_core.interval import Interval, IntervalError, IntervalMatrix
 
 
 # =============================================================================
@@ -177,3 +178,88 @@ class TestIntervalComparison:
         assert 3.0 in interval
         assert 1.0 not in interval
         assert 7.0 not in interval
+
+
+# =============================================================================
+# IntervalMatrix Tests
+# =============================================================================
+
+class TestIntervalMatrix:
+    """区间矩阵测试（与逐元素 Interval 运算一致）"""
+
+    @pytest.fixture
+    def values(self):
+        """混合精确数/区间数的嵌套列表"""
+        return [
+            [Interval(1.0, 3.0), 2.0, Interval(-2.0, 1.0)],
+            [4.0, Interval(5.0, 8.0), Interval(-3.0, -1.0)],
+        ]
+
+    def test_crisp_cells_promoted_to_degenerate(self, values):
+        """测试精确数单元格提升为退化区间"""
+        matrix = IntervalMatrix.from_values(values)
+
+        assert matrix.shape == (2, 3)
+        assert matrix[0, 1] == Interval(2.0, 2.0)
+        assert matrix[1, 1] == Interval(5.0, 8.0)
+        np.testing.assert_array_equal(matrix.midpoint[0], [2.0, 2.0, -0.5])
+        np.testing.assert_array_equal(matrix.width[1], [0.0, 3.0, 2.0])
+
+    def test_arithmetic_matches_interval(self, values):
+        """测试向量化运算与逐元素 Interval 运算一致"""
+        matrix = IntervalMatrix.from_values(values)
+        other = IntervalMatrix.from_values([[Interval(1.0, 2.0)] * 3] * 2)
+        scales = np.array([2.0, -1.0, 0.5])
+
+        cells = [[v if isinstance(v, Interval) else Interval.from_single(v) for v in row]
+                 for row in values]
+        expected = {
+            "add": [[c + Interval(1.0, 2.0) for c in row] for row in cells],
+            "sub": [[c - Interval(1.0, 2.0) for c in row] for row in cells],
+            "mul": [[c * Interval(1.0, 2.0) for c in row] for row in cells],
+            "div": [[c / Interval(1.0, 2.0) for c in row] for row in cells],
+            "scale": [[c * float(s) for c, s in zip(row, scales)] for row in cells],
+        }
+
+        assert (matrix + other).to_intervals() == expected["add"]
+        assert (matrix - other).to_intervals() == expected["sub"]
+        assert (matrix * other).to_intervals() == expected["mul"]
+        assert (matrix / other).to_intervals() == expected["div"]
+        assert (matrix * scales).to_intervals() == expected["scale"]
+
+    def test_reflection(self):
+        """测试精确数减区间交换上下界"""
+        matrix = IntervalMatrix.from_values([[Interval(20.0, 30.0), 40.0]])
+
+        assert (100.0 - matrix).to_intervals() == [[Interval(70.0, 80.0), Interval(60.0, 60.0)]]
+
+    def test_normalize(self):
+        """测试按列 vector/minmax 标准化"""
+        matrix = IntervalMatrix.from_values([
+            [Interval(2.0, 4.0), 5.0],
+            [4.0, 5.0],
+        ])
+
+        vector = matrix.normalize("vector")
+        norm = np.sqrt(3.0 ** 2 + 4.0 ** 2)
+        assert vector[0, 0] == Interval(2.0 / norm, 4.0 / norm)
+
+        minmax = matrix.normalize("minmax")
+        assert minmax[0, 0] == Interval(-1.0, 1.0)
+        assert minmax[1, 0] == Interval(1.0, 1.0)
+        # 中点全部相同的列标准化为 1
+        assert minmax[:, 1].to_intervals() == [Interval(1.0, 1.0)] * 2
+
+        with pytest.raises(ValueError):
+            matrix.normalize("unknown")
+
+    def test_invalid_bounds_raise_error(self):
+        """测试下界大于上界或除数包含零时抛出异常"""
+        with pytest.raises(IntervalError):
+            IntervalMatrix([1.0, 3.0], [2.0, 2.0])
+
+        matrix = IntervalMatrix.from_values([[1.0, 2.0]])
+        with pytest.raises(IntervalError):
+            matrix / IntervalMatrix.from_values([[Interval(-1.0, 1.0), 2.0]])
+        with pytest.raises(IntervalError):
+            matrix / np.array([1.0, 0.0])
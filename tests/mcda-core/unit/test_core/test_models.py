@@ -458,6 +458,171 @@ class TestDecisionProblem:
         with pytest.raises(Exception):  # FrozenInstanceError
             problem.alternatives = ("AWS", "Azure", "GCP")
 
+    def test_problem_score_matrix(self, sample_criteria, sample_scores):
+        """测试稠密评分矩阵按方案/准则顺序构建且只读"""
+        import numpy as np
+
+        problem = DecisionProblem(
+            alternatives=("AWS", "Azure", "GCP"),
+            criteria=sample_criteria,
+            scores=sample_scores,
+        )
+
+        matrix = problem.score_matrix
+        assert matrix.shape == (3, 4)
+        assert matrix.dtype == np.float64
+        np.testing.assert_array_equal(matrix[1], [4.0, 4.0, 4.0, 5.0])
+        assert problem.score_matrix is matrix  # 缓存复用
+        with pytest.raises(ValueError):
+            matrix[0, 0] = 1.0
+
+    def test_problem_weight_vector_and_direction_mask(self, sample_criteria, sample_scores):
+        """测试权重向量和方向掩码"""
+        import numpy as np
+
+        problem = DecisionProblem(
+            alternatives=("AWS", "Azure", "GCP"),
+            criteria=sample_criteria,
+            scores=sample_scores,
+        )
+
+        np.testing.assert_allclose(problem.weight_vector, [0.35, 0.30, 0.25, 0.10])
+        np.testing.assert_array_equal(problem.direction_mask, [True, False, False, False])
+        assert not problem.weight_vector.flags.writeable
+        assert not problem.direction_mask.flags.writeable
+
+    def test_problem_score_matrix_with_interval_raises_error(self, sample_criteria):
+        """测试包含区间数时无法构建精确数矩阵"""
+        from mcda_core.interval import Interval
+
+        problem = DecisionProblem(
+            alternatives=("AWS", "Azure"),
+            criteria=sample_criteria[:2],
+            scores={
+                "AWS": {"成本": Interval(3.0, 4.0), "功能完整性": 5.0},
+                "Azure": {"成本": 4.0, "功能完整性": 4.0},
+            },
+        )
+
+        assert problem.has_interval_scores
+        with pytest.raises(ValueError, match="包含区间数"):
+            _ = problem.score_matrix
+
+    def test_problem_with_weights_shares_score_matrix(self, sample_criteria, sample_scores):
+        """测试 with_weights 替换权重并共享已缓存的评分矩阵"""
+        problem = DecisionProblem(
+            alternatives=("AWS", "Azure", "GCP"),
+            criteria=sample_criteria,
+            scores=sample_scores,
+        )
+        matrix = problem.score_matrix
+
+        reweighted = problem.with_weights([0.25, 0.25, 0.25, 0.25])
+
+        assert [c.weight for c in reweighted.criteria] == [0.25, 0.25, 0.25, 0.25]
+        assert [c.name for c in reweighted.criteria] == [c.name for c in sample_criteria]
+        assert reweighted.score_matrix is matrix
+        assert reweighted.weight_vector.tolist() == [0.25, 0.25, 0.25, 0.25]
+        assert problem.weight_vector.tolist() == [0.35, 0.30, 0.25, 0.10]
+
+        with pytest.raises(ValueError, match="权重数量"):
+            problem.with_weights([0.5, 0.5])
+
+    def test_problem_with_score_matrix(self, sample_criteria, sample_scores):
+        """测试 with_score_matrix 替换评分并缓存精确数矩阵"""
+        problem = DecisionProblem(
+            alternatives=("AWS", "Azure", "GCP"),
+            criteria=sample_criteria,
+            scores=sample_scores,
+        )
+        matrix = [[float(10 * i + j) for j in range(4)] for i in range(3)]
+
+        sampled = problem.with_score_matrix(matrix)
+
+        assert sampled.score_matrix.tolist() == matrix
+        assert sampled.scores["Azure"][sample_criteria[2].name] == 12.0
+        assert not isinstance(sampled.scores, dict)
+        assert list(sampled.scores) == ["AWS", "Azure", "GCP"]
+        assert dict(sampled.scores)["GCP"] == {
+            crit.name: 20.0 + j for j, crit in enumerate(sample_criteria)
+        }
+        assert not sampled.has_interval_scores
+        assert problem.score_matrix.tolist() != matrix
+
+        with pytest.raises(ValueError, match="评分矩阵形状"):
+            problem.with_score_matrix([[1.0, 2.0]])
+
+    def test_problem_interval_upper_out_of_range_raises_error(self, sample_criteria):
+        """测试区间上界超出范围抛出异常"""
+        from mcda_core.interval import Interval
+
+        with pytest.raises(ValueError, match="区间上界 120"):
+            DecisionProblem(
+                alternatives=("AWS", "Azure"),
+                criteria=sample_criteria[:2],
+                scores={
+                    "AWS": {"成本": Interval(50.0, 120.0), "功能完整性": 5.0},
+                    "Azure": {"成本": 4.0, "功能完整性": 4.0},
+                },
+            )
+
+    @pytest.mark.parametrize("value", [float("nan"), float("inf")])
+    def test_problem_non_finite_score_raises_error(self, sample_criteria, value):
+        """测试 NaN/Inf 评分抛出异常（即使评分范围无界）"""
+        with pytest.raises(ValueError, match="不是有限数值"):
+            DecisionProblem(
+                alternatives=("AWS", "Azure"),
+                criteria=sample_criteria[:2],
+                scores={
+                    "AWS": {"成本": value, "功能完整性": 5.0},
+                    "Azure": {"成本": 4.0, "功能完整性": 4.0},
+                },
+                score_range=(-float("inf"), float("inf")),
+            )
+
+    def test_problem_validation_recorded(self, sample_criteria, sample_scores):
+        """测试构建时记录验证结果，派生的权重副本共享该结果"""
+        problem = DecisionProblem(
+            alternatives=("AWS", "Azure", "GCP"),
+            criteria=sample_criteria,
+            scores=sample_scores,
+        )
+
+        assert problem.is_validated
+        assert problem.validation.lowest == 3.0
+        assert problem.validation.highest == 5.0
+        assert problem.validation.within(0.0, 10.0)
+        assert not problem.validation.within(4.0, 10.0)
+        assert problem.find_score_outside(4.0, 10.0) == ("AWS", "成本")
+
+        reweighted = problem.with_weights([0.25] * 4)
+        assert reweighted.validation is problem.validation
+
+    def test_trusted_problem_skips_validation(self, sample_criteria, sample_scores):
+        """测试可信构建跳过评分验证，首次访问 validation 时才验证"""
+        scores = {**sample_scores, "GCP": {**sample_scores["GCP"], "成本": 500.0}}
+
+        problem = DecisionProblem(
+            alternatives=("AWS", "Azure", "GCP"),
+            criteria=sample_criteria,
+            scores=scores,
+            trusted=True,
+        )
+
+        assert problem.is_validated
+        assert "validation" not in problem.__dict__
+        with pytest.raises(ValueError, match="评分 500.0 超出范围"):
+            problem.validation
+
+        # 结构检查仍然生效
+        with pytest.raises(ValueError, match="至少需要 2 个备选方案"):
+            DecisionProblem(
+                alternatives=("AWS",),
+                criteria=sample_criteria,
+                scores=sample_scores,
+                trusted=True,
+            )
+
 
 # =============================================================================
 # RankingItem 测试
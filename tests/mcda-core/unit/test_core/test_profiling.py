@@ -0,0 +1,219 @@
+"""
+MCDA Core 阶段插桩测试
+
+测试范围:
+- 阶段计时、嵌套与同名阶段汇总
+- 钩子
+- run_workflow 的阶段计时（metrics["timings"]）
+- mcda analyze --profile
+"""
+
+import threading
+import tracemalloc
+
+import pytest
+
+from mcda_core.cli import MCDACommandLineInterface
+from mcda_core.core import MCDAOrchestrator
+from mcda_core.profiling import (
+    current_profiler,
+    format_timings,
+    profile,
+    stage,
+)
+from mcda_core.utils.cache import ResultCache
+
+
+CONFIG = """
+name: 供应商选择
+alternatives: [A, B, C]
+criteria:
+  - name: 成本
+    weight: 0.6
+    direction: lower_better
+  - name: 质量
+    weight: 0.4
+    direction: higher_better
+scores:
+  A: {成本: 50, 质量: 80}
+  B: {成本: 70, 质量: 60}
+  C: {成本: 60, 质量: 90}
+algorithm: {name: topsis}
+"""
+
+
+@pytest.fixture
+def config_file(tmp_path):
+    path = tmp_path / "config.yaml"
+    path.write_text(CONFIG, encoding="utf-8")
+    return path
+
+
+def _names(timings):
+    return [item["name"] for item in timings["stages"]]
+
+
+class TestStageProfiler:
+    """阶段计时收集器测试"""
+
+    def test_stage_without_profiler_is_noop(self):
+        """测试: 未启用插桩时 stage() 为空操作"""
+        assert current_profiler() is None
+        with stage("analyze"):
+            pass
+        assert current_profiler() is None
+
+    def test_nested_stages(self):
+        """测试: 嵌套阶段名称、深度和先序输出"""
+        with profile() as profiler:
+            with stage("analyze"):
+                with stage("normalization"):
+                    data = [0] * 100_000
+                with stage("ranking"):
+                    pass
+            with stage("report"):
+                pass
+
+        timings = profiler.to_dict()
+        assert _names(timings) == [
+            "analyze", "analyze/normalization", "analyze/ranking", "report"
+        ]
+        by_name = {item["name"]: item for item in timings["stages"]}
+        assert by_name["analyze/normalization"]["depth"] == 1
+        assert by_name["analyze"]["wall_time"] >= by_name["analyze/normalization"]["wall_time"]
+        assert by_name["analyze/normalization"]["peak_memory_mb"] > 0.5
+        assert by_name["analyze"]["peak_memory_mb"] >= by_name["analyze/normalization"]["peak_memory_mb"]
+        assert by_name["report"]["peak_memory_mb"] < 0.5
+        assert timings["total_wall_time"] == pytest.approx(
+            by_name["analyze"]["wall_time"] + by_name["report"]["wall_time"]
+        )
+        assert not tracemalloc.is_tracing()
+        del data
+
+    def test_repeated_stages_are_merged(self):
+        """测试: 同名阶段汇总次数与时间，钩子接收每次执行"""
+        received = []
+
+        with profile(trace_memory=False, hooks=[received.append]) as profiler:
+            for _ in range(3):
+                with stage("ranking"):
+                    pass
+
+        (ranking,) = profiler.to_dict()["stages"]
+        assert ranking["calls"] == 3
+        assert ranking["peak_memory_mb"] is None
+        assert ranking["wall_time"] == pytest.approx(sum(t.wall_time for t in received))
+        assert len(received) == 3
+        assert "ranking ×3" in format_timings(profiler.to_dict())
+
+
+class TestConcurrentProfiling:
+    """多线程同时启用内存跟踪测试"""
+
+    def _run(self, target):
+        thread = threading.Thread(target=target)
+        thread.start()
+        return thread
+
+    def test_other_profiler_does_not_wipe_peak(self):
+        """测试: 另一线程的阶段边界重置峰值时，进行中阶段的峰值不丢失"""
+        allocated, other_done = threading.Event(), threading.Event()
+        timings = {}
+
+        def first():
+            with profile() as profiler:
+                with stage("first"):
+                    data = bytearray(4 * 1024 * 1024)
+                    del data
+                    allocated.set()
+                    other_done.wait(timeout=10)
+            timings["first"] = profiler.to_dict()["stages"][0]
+
+        def second():
+            allocated.wait(timeout=10)
+            with profile():
+                with stage("second"):
+                    pass
+            other_done.set()
+
+        threads = [self._run(first), self._run(second)]
+        for thread in threads:
+            thread.join(timeout=10)
+
+        assert timings["first"]["peak_memory_mb"] > 3.5
+        assert not tracemalloc.is_tracing()
+
+    def test_tracing_kept_until_last_profiler_exits(self):
+        """测试: 启动 tracemalloc 的收集器先退出时，不会停止其他收集器的跟踪"""
+        first_entered, second_entered, first_exited = (
+            threading.Event(), threading.Event(), threading.Event()
+        )
+        timings = {}
+
+        def first():
+            with profile():
+                first_entered.set()
+                second_entered.wait(timeout=10)
+            first_exited.set()
+
+        def second():
+            first_entered.wait(timeout=10)
+            with profile() as profiler:
+                second_entered.set()
+                first_exited.wait(timeout=10)
+                with stage("second"):
+                    data = bytearray(2 * 1024 * 1024)
+                    del data
+            timings["second"] = profiler.to_dict()["stages"][0]
+
+        threads = [self._run(first), self._run(second)]
+        for thread in threads:
+            thread.join(timeout=10)
+
+        assert timings["second"]["peak_memory_mb"] > 1.5
+        assert not tracemalloc.is_tracing()
+
+
+class TestWorkflowProfiling:
+    """run_workflow 阶段计时测试"""
+
+    def test_timings_attached(self, config_file, tmp_path):
+        """测试: 工作流和算法内部阶段写入 metrics["timings"]"""
+        result = MCDAOrchestrator().run_workflow(
+            config_file,
+            output_path=tmp_path / "report.md",
+            run_sensitivity=True,
+            profile=True
+        )
+
+        names = _names(result.metadata.metrics["timings"])
+        for name in ("load", "validate", "analyze", "analyze/normalization",
+                     "analyze/scoring", "analyze/ranking", "sensitivity", "report"):
+            assert name in names
+        assert "closeness" in result.metadata.metrics
+
+    def test_not_profiled_by_default(self, config_file):
+        """测试: 默认不记录阶段计时"""
+        result = MCDAOrchestrator().run_workflow(config_file)
+
+        assert "timings" not in result.metadata.metrics
+
+    def test_cached_result_not_modified(self, config_file):
+        """测试: 附加计时不修改缓存中的结果"""
+        orchestrator = MCDAOrchestrator(result_cache=ResultCache(maxsize=4))
+
+        profiled = orchestrator.run_workflow(config_file, profile=True)
+        cached = orchestrator.run_workflow(config_file)
+
+        assert "timings" in profiled.metadata.metrics
+        assert "timings" not in cached.metadata.metrics
+        assert cached.rankings == profiled.rankings
+
+    def test_cli_profile(self, config_file, capsys):
+        """测试: mcda analyze --profile 在 stderr 输出阶段计时表"""
+        MCDACommandLineInterface().run(["analyze", str(config_file), "--profile"])
+
+        err = capsys.readouterr().err
+        assert "阶段" in err
+        assert "normalization" in err
+        assert "MB" in err
@@ -351,6 +351,49 @@ class TestFullSensitivityAnalysis:
 
             assert sensitivity_result is not None
 
+    @pytest.mark.parametrize("algo_name", ["wsm", "wpm", "topsis"])
+    def test_linear_model_matches_full_recalculation(self, sample_problem, algo_name):
+        """测试: 线性权重模型的增量扰动与完整重算结果一致"""
+        from mcda_core.sensitivity import SensitivityService
+        from mcda_core.algorithms import get_algorithm
+
+        algorithm = get_algorithm(algo_name)
+        assert algorithm.linear_weight_model(sample_problem) is not None
+
+        # 禁用线性模型，强制走完整重算路径
+        full_algorithm = get_algorithm(algo_name)
+        full_algorithm.linear_weight_model = lambda problem: None
+
+        sensitivity = SensitivityService()
+        fast = sensitivity.analyze(sample_problem, algorithm, perturbation=0.5)
+        full = sensitivity.analyze(sample_problem, full_algorithm, perturbation=0.5)
+
+        for fast_result, full_result in zip(fast.perturbation_results, full.perturbation_results):
+            for fast_p, full_p in zip(fast_result.perturbations, full_result.perturbations):
+                assert fast_p.perturbed_weight == pytest.approx(full_p.perturbed_weight)
+                assert fast_p.rank_changes == full_p.rank_changes
+        assert fast.critical_criteria == full.critical_criteria
+
+    def test_analyze_perturbs_each_criterion_once(self, sample_problem):
+        """测试: 综合分析中每个准则只扰动一次"""
+        from mcda_core.sensitivity import SensitivityService
+        from mcda_core.algorithms import get_algorithm
+
+        algorithm = get_algorithm("vikor")
+        calls = []
+        original_calculate = algorithm.calculate
+
+        def counting_calculate(problem, **kwargs):
+            calls.append(problem)
+            return original_calculate(problem, **kwargs)
+
+        algorithm.calculate = counting_calculate
+
+        SensitivityService().analyze(sample_problem, algorithm, perturbation=0.1)
+
+        # 1 次原始计算 + 每个准则 ±扰动各 1 次
+        assert len(calls) == 1 + 2 * len(sample_problem.criteria)
+
 
 # ============================================================================
 # Test SensitivityResult
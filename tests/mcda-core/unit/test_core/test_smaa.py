@@ -0,0 +1,195 @@
+"""
+MCDA Core SMAA 服务测试
+
+测试范围:
+- 排名可接受性指标
+- 中心权重向量和置信因子
+- 分块流式结果与可复现性
+- 区间评分抽样
+"""
+
+import sys
+from pathlib import Path
+
+# 添加 mcda_core 模块路径
+mcda_core_path = Path(__file__).parent.parent.parent / "skills" / "mcda-core" / "scripts"
+sys.path.insert(0, str(mcda_core_path.resolve()))
+
+import pytest
+from mcda_core.models import Criterion, DecisionProblem
+from mcda_core.exceptions import SensitivityAnalysisError
+from mcda_core.interval import Interval
+from mcda_core.smaa import SMAAService
+
+
+# ============================================================================
+# Test Fixtures
+# ============================================================================
+
+@pytest.fixture
+def sample_criteria():
+    """示例准则"""
+    return (
+        Criterion(name="性能", weight=0.4, direction="higher_better"),
+        Criterion(name="成本", weight=0.3, direction="lower_better"),
+        Criterion(name="可靠性", weight=0.3, direction="higher_better"),
+    )
+
+
+@pytest.fixture
+def sample_problem(sample_criteria):
+    """示例决策问题"""
+    scores = {
+        "方案A": {"性能": 85.0, "成本": 60.0, "可靠性": 75.0},
+        "方案B": {"性能": 70.0, "成本": 80.0, "可靠性": 90.0},
+        "方案C": {"性能": 90.0, "成本": 50.0, "可靠性": 85.0},
+        "方案D": {"性能": 40.0, "成本": 90.0, "可靠性": 30.0},
+    }
+    return DecisionProblem(
+        alternatives=tuple(scores.keys()),
+        criteria=sample_criteria,
+        scores=scores,
+    )
+
+
+@pytest.fixture
+def interval_problem(sample_criteria):
+    """区间评分决策问题"""
+    scores = {
+        "方案A": {"性能": Interval(80.0, 90.0), "成本": 60.0, "可靠性": Interval(70.0, 80.0)},
+        "方案B": {"性能": Interval(60.0, 95.0), "成本": 55.0, "可靠性": 85.0},
+        "方案C": {"性能": 88.0, "成本": Interval(50.0, 70.0), "可靠性": 80.0},
+    }
+    return DecisionProblem(
+        alternatives=tuple(scores.keys()),
+        criteria=sample_criteria,
+        scores=scores,
+    )
+
+
+@pytest.fixture
+def wsm():
+    """WSM 算法"""
+    from mcda_core.algorithms import get_algorithm
+    return get_algorithm("wsm")
+
+
+# ============================================================================
+# SMAA Tests
+# ============================================================================
+
+class TestSMAAAnalyze:
+    """SMAA 分析测试"""
+
+    def test_rank_acceptability_is_distribution(self, sample_problem, wsm):
+        """测试每个方案的排名可接受性之和为 1，每个名次的概率之和为 1"""
+        result = SMAAService().analyze(sample_problem, wsm, n_samples=2000, seed=7)
+
+        assert result.n_samples == 2000
+        for values in result.rank_acceptability.values():
+            assert len(values) == 4
+            assert sum(values) == pytest.approx(1.0)
+        for r in range(4):
+            column = sum(values[r] for values in result.rank_acceptability.values())
+            assert column == pytest.approx(1.0)
+
+    def test_dominated_alternative_never_first(self, sample_problem, wsm):
+        """测试被支配方案的第一名可接受性为 0，且无中心权重和置信因子"""
+        result = SMAAService().analyze(sample_problem, wsm, n_samples=2000, seed=7)
+
+        assert result.first_rank_acceptability["方案D"] == 0.0
+        assert result.rank_acceptability["方案D"][-1] == 1.0
+        assert result.central_weights["方案D"] is None
+        assert result.confidence_factors["方案D"] is None
+
+    def test_central_weights_on_simplex(self, sample_problem, wsm):
+        """测试中心权重位于单纯形上，且精确评分时置信因子为 0 或 1"""
+        result = SMAAService().analyze(sample_problem, wsm, n_samples=2000, seed=7)
+
+        for alt, weights in result.central_weights.items():
+            if weights is None:
+                continue
+            assert set(weights) == {"性能", "成本", "可靠性"}
+            assert sum(weights.values()) == pytest.approx(1.0)
+            assert result.confidence_factors[alt] in (0.0, 1.0)
+
+    def test_seed_reproducible(self, sample_problem, wsm):
+        """测试相同种子结果一致"""
+        service = SMAAService()
+        first = service.analyze(sample_problem, wsm, n_samples=500, seed=42, chunk_size=64)
+        second = service.analyze(sample_problem, wsm, n_samples=500, seed=42, chunk_size=64)
+
+        assert first == second
+
+    def test_parallel_matches_serial(self, sample_problem, wsm):
+        """测试进程池并行与串行结果逐位一致"""
+        service = SMAAService()
+        serial = service.analyze(
+            sample_problem, wsm, n_samples=600, seed=3, memory_budget_mb=0.01
+        )
+        parallel = service.analyze(
+            sample_problem, wsm, n_samples=600, seed=3, memory_budget_mb=0.01, workers=2
+        )
+
+        assert serial == parallel
+
+    def test_interval_score_sampling(self, interval_problem):
+        """测试区间评分抽样"""
+        from mcda_core.algorithms import get_algorithm
+
+        result = SMAAService().analyze(
+            interval_problem,
+            get_algorithm("topsis_interval"),
+            n_samples=40,
+            seed=1,
+            sample_scores=True,
+            confidence_samples=20,
+        )
+
+        assert result.n_samples == 40
+        for alt, factor in result.confidence_factors.items():
+            if result.central_weights[alt] is not None:
+                assert 0.0 <= factor <= 1.0
+
+
+class TestSMAAStreaming:
+    """SMAA 流式结果测试"""
+
+    def test_iter_analyze_yields_per_chunk(self, sample_problem, wsm):
+        """测试每块产出一次累计结果，最后一次与 analyze 一致"""
+        service = SMAAService()
+        partials = list(service.iter_analyze(
+            sample_problem, wsm, n_samples=250, seed=5, chunk_size=100
+        ))
+        final = service.analyze(sample_problem, wsm, n_samples=250, seed=5, chunk_size=100)
+
+        assert [p.n_samples for p in partials] == [100, 200, 250]
+        assert partials[-1].rank_acceptability == final.rank_acceptability
+        assert partials[-1].central_weights == final.central_weights
+        assert partials[-1].confidence_factors == {}
+
+    def test_memory_budget_limits_chunk_size(self, sample_problem, wsm):
+        """测试内存预算决定分块大小"""
+        service = SMAAService()
+        chunk = service._chunk_size(sample_problem, 0.01)
+
+        partials = list(service.iter_analyze(
+            sample_problem, wsm, n_samples=chunk * 3, seed=0, memory_budget_mb=0.01
+        ))
+
+        assert len(partials) == 3
+
+
+class TestSMAAErrorHandling:
+    """SMAA 错误处理测试"""
+
+    @pytest.mark.parametrize("kwargs", [
+        {"n_samples": 0},
+        {"chunk_size": 0},
+        {"workers": 0},
+        {"memory_budget_mb": 0},
+    ])
+    def test_invalid_parameters(self, sample_problem, wsm, kwargs):
+        """测试无效参数"""
+        with pytest.raises(SensitivityAnalysisError):
+            SMAAService().analyze(sample_problem, wsm, **kwargs)
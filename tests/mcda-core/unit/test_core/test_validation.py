@@ -318,6 +318,43 @@ class TestFullValidation:
         assert result.is_valid is False
         assert len(result.errors) >= 2  # 权重 + 评分错误
 
+    def test_interval_scores_pass_validation(self, valid_criteria):
+        """测试: 区间评分按上下界验证"""
+        from mcda_core.interval import Interval
+        from mcda_core.validation import ValidationService
+
+        problem = DecisionProblem(
+            alternatives=("方案A", "方案B"),
+            criteria=valid_criteria,
+            scores={
+                "方案A": {"性能": Interval(80.0, 90.0), "成本": 60.0, "可靠性": 75.0},
+                "方案B": {"性能": 70.0, "成本": Interval(0.0, 100.0), "可靠性": 90.0},
+            },
+        )
+
+        result = ValidationService().validate(problem)
+
+        assert result.is_valid is True
+
+    def test_trusted_problem_validated_on_demand(self, valid_criteria):
+        """测试: 可信构建的问题在完整验证时补做评分验证"""
+        from mcda_core.validation import ValidationService
+
+        problem = DecisionProblem(
+            alternatives=("方案A", "方案B"),
+            criteria=valid_criteria,
+            scores={
+                "方案A": {"性能": 85.0, "成本": 60.0},
+                "方案B": {"性能": 70.0, "成本": 80.0, "可靠性": 90.0},
+            },
+            trusted=True,
+        )
+
+        result = ValidationService().validate(problem)
+
+        assert result.is_valid is False
+        assert "可靠性" in result.errors[0]
+
 
 # ============================================================================
 # Test ValidationResult
@@ -51,6 +51,21 @@ class TestWeightedGeometricAggregation:
         with pytest.raises(ValueError, match="零值或负值"):
             aggregation.aggregate(scores)
 
+    def test_aggregate_matrix_error_names_decision_maker(self, aggregation):
+        """测试评分矩阵含零值时错误信息指明决策者"""
+        score_matrix = {
+            "AWS": {
+                "成本": {"DM1": 80.0, "DM2": 85.0},
+                "质量": {"DM1": 90.0, "DM2": 80.0},
+            },
+            "Azure": {
+                "成本": {"DM1": 70.0, "DM2": 0.0},
+                "质量": {"DM1": -5.0, "DM2": 90.0},
+            },
+        }
+        with pytest.raises(ValueError, match="决策者 'DM2' 的评分为 0.0"):
+            aggregation.aggregate_matrix(score_matrix)
+
     def test_aggregate_empty_scores_raises_error(self, aggregation):
         """测试空评分抛出异常"""
         with pytest.raises(ValueError, match="评分不能为空"):
@@ -346,3 +361,83 @@ class TestAdvancedAggregationIntegration:
         assert "weighted_geometric" in methods
         assert "borda_count" in methods
         assert "copeland" in methods
+
+
+class TestAggregateTensor:
+    """测试评分张量聚合"""
+
+    @pytest.fixture
+    def tensor(self):
+        """随机评分张量 (n_dm, n_alt, n_crit)，含并列评分"""
+        return np.random.default_rng(11).integers(1, 6, size=(6, 4, 3)).astype(float)
+
+    @pytest.fixture
+    def weights(self):
+        """决策者权重"""
+        return np.array([1.0, 0.5, 2.0, 1.0, 0.3, 1.2])
+
+    @pytest.mark.parametrize("name", [
+        "weighted_average", "weighted_geometric", "borda_count", "copeland"
+    ])
+    def test_matches_scalar_aggregate(self, tensor, weights, name):
+        """测试张量聚合与逐单元格 aggregate 一致"""
+        from mcda_core.aggregation import AggregationRegistry
+
+        method = AggregationRegistry.create(name)
+        dm_ids = [f"DM{k}" for k in range(tensor.shape[0])]
+        weight_map = dict(zip(dm_ids, weights))
+
+        result = method.aggregate_tensor(tensor, weights)
+
+        assert result.shape == (4, 3)
+        for i in range(4):
+            for j in range(3):
+                scores = dict(zip(dm_ids, tensor[:, i, j]))
+                assert result[i, j] == pytest.approx(method.aggregate(scores, weight_map))
+
+    def test_matrix_uses_tensor_path(self, tensor):
+        """测试嵌套字典评分矩阵与张量聚合结果一致"""
+        from mcda_core.aggregation import BordaCountAggregation
+
+        method = BordaCountAggregation()
+        score_matrix = {
+            f"A{i}": {
+                f"C{j}": {f"DM{k}": tensor[k, i, j] for k in range(tensor.shape[0])}
+                for j in range(3)
+            }
+            for i in range(4)
+        }
+
+        result = method.aggregate_matrix(score_matrix)
+        expected = method.aggregate_tensor(tensor)
+
+        for i in range(4):
+            for j in range(3):
+                assert result[f"A{i}"][f"C{j}"] == pytest.approx(expected[i, j])
+
+    def test_irregular_matrix_falls_back(self):
+        """测试决策者集合不一致时退回逐单元格聚合并报错"""
+        from mcda_core.aggregation import WeightedAverageAggregation
+
+        score_matrix = {
+            "A": {"C1": {"DM1": 80.0, "DM2": 90.0}},
+            "B": {"C1": {"DM1": 70.0}},
+        }
+
+        with pytest.raises(ValueError, match="权重中存在未评分的决策者"):
+            WeightedAverageAggregation().aggregate_matrix(
+                score_matrix, {"DM1": 1.0, "DM2": 1.0}
+            )
+
+    def test_invalid_tensor(self):
+        """测试无效张量和权重"""
+        from mcda_core.aggregation import WeightedAverageAggregation, WeightedGeometricAggregation
+
+        with pytest.raises(ValueError, match="三维"):
+            WeightedAverageAggregation().aggregate_tensor(np.ones((2, 3)))
+        with pytest.raises(ValueError, match="不匹配"):
+            WeightedAverageAggregation().aggregate_tensor(np.ones((2, 3, 1)), np.ones(3))
+        with pytest.raises(ValueError, match="权重总和不能为 0"):
+            WeightedAverageAggregation().aggregate_tensor(np.ones((2, 3, 1)), np.zeros(2))
+        with pytest.raises(ValueError, match="零值或负值"):
+            WeightedGeometricAggregation().aggregate_tensor(np.zeros((2, 3, 1)))
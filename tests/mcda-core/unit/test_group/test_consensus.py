@@ -7,6 +7,8 @@ MCDA Core - 共识度测量单元测试
 import pytest
 import math
 
+import numpy as np
+
 from mcda_core.group.consensus import (
     ConsensusMeasure,
     ConsensusResult,
@@ -322,3 +324,88 @@ class TestComputeConsensus:
             result.decision_maker_distances["DM2"]["DM1"]
         # 自己到自己的距离为 0
         assert result.decision_maker_distances["DM1"]["DM1"] == 0.0
+
+
+class TestConsensusTensor:
+    """测试评分张量上的向量化共识度计算"""
+
+    @pytest.fixture
+    def tensor(self):
+        """随机评分张量 (n_dm, n_alt, n_crit)"""
+        return np.random.default_rng(3).uniform(20, 90, size=(5, 4, 3))
+
+    @pytest.mark.parametrize("method", [
+        "standard_deviation", "coefficient_of_variation", "agreement_rate"
+    ])
+    def test_criterion_vector_matches_scalar(self, tensor, method):
+        """测试向量化准则共识度与逐准则计算一致"""
+        dm_means = tensor.mean(axis=1)
+
+        result = ConsensusMeasure.compute_criterion_consensus_vector(dm_means, method)
+
+        for j in range(dm_means.shape[1]):
+            scores = {f"DM{k}": dm_means[k, j] for k in range(len(dm_means))}
+            expected = ConsensusMeasure.compute_criterion_consensus(scores, method)
+            assert result[j] == pytest.approx(expected)
+
+    def test_criterion_vector_ignores_missing(self):
+        """测试未评分（NaN）的决策者不参与计算"""
+        scores = np.array([[80.0, 50.0], [np.nan, np.nan], [60.0, np.nan]])
+
+        result = ConsensusMeasure.compute_criterion_consensus_vector(scores)
+
+        assert result[0] == pytest.approx(1 - 10.0 / 50)
+        assert result[1] == 1.0  # 只有一个决策者评分
+
+    @pytest.mark.parametrize("metric", ["euclidean", "manhattan", "cosine"])
+    def test_distance_matrix(self, tensor, metric):
+        """测试距离矩阵对称、对角线为 0，且与逐对计算一致"""
+        vectors = tensor.reshape(5, -1)
+
+        matrix = ConsensusMeasure.compute_distance_matrix(vectors, metric)
+
+        assert matrix.shape == (5, 5)
+        np.testing.assert_array_equal(matrix, matrix.T)
+        np.testing.assert_array_equal(np.diag(matrix), 0.0)
+        a, b = vectors[0], vectors[3]
+        expected = {
+            "euclidean": np.linalg.norm(a - b),
+            "manhattan": np.abs(a - b).sum(),
+            "cosine": 1 - a @ b / (np.linalg.norm(a) * np.linalg.norm(b)),
+        }[metric]
+        assert matrix[0, 3] == pytest.approx(expected)
+
+    def test_tensor_matches_dict_input(self, tensor):
+        """测试张量接口与字典接口结果一致"""
+        dm_ids = [f"DM{k}" for k in range(5)]
+        alternatives = tuple(f"A{i}" for i in range(4))
+        criteria = tuple(
+            Criterion(name=f"C{j}", weight=1 / 3, direction="higher_better") for j in range(3)
+        )
+        individual_scores = {
+            dm_id: {
+                alt: {crit.name: tensor[k, i, j] for j, crit in enumerate(criteria)}
+                for i, alt in enumerate(alternatives)
+            }
+            for k, dm_id in enumerate(dm_ids)
+        }
+
+        from_dict = ConsensusMeasure.compute_consensus(
+            individual_scores, alternatives, criteria, distance="manhattan"
+        )
+        from_tensor = ConsensusMeasure.compute_consensus_tensor(
+            tensor, dm_ids, [c.name for c in criteria], distance="manhattan"
+        )
+
+        assert from_dict == from_tensor
+        np.testing.assert_allclose(from_dict.distance_matrix, from_tensor.distance_matrix)
+        assert from_dict.decision_maker_distances["DM1"]["DM4"] == pytest.approx(
+            np.abs(tensor[1] - tensor[4]).sum()
+        )
+
+    def test_unknown_distance_raises_error(self, tensor):
+        """测试未知距离度量"""
+        with pytest.raises(ValueError, match="未知的距离度量"):
+            ConsensusMeasure.compute_consensus_tensor(
+                tensor, ["a", "b", "c", "d", "e"], ["x", "y", "z"], distance="hamming"
+            )
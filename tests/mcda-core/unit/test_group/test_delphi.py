@@ -322,3 +322,36 @@ class TestConvergenceCheck:
         # 没有上一轮，应该返回 1.0（表示完全未收敛）
         convergence_score = sample_process._compute_convergence_score(scores)
         assert convergence_score == 1.0
+
+    def test_cell_convergence_map(self, sample_process):
+        """测试逐单元格收敛图和未收敛单元格列表"""
+        sample_process.add_round({
+            "DM1": {"AWS": {"成本": 80.0}, "Azure": {"成本": 70.0}},
+            "DM2": {"AWS": {"成本": 85.0}, "Azure": {"成本": 75.0}},
+        })
+        round2 = sample_process.add_round({
+            "DM1": {"AWS": {"成本": 60.0}, "Azure": {"成本": 70.0}},  # AWS 变化 20
+            "DM2": {"AWS": {"成本": 85.0}, "Azure": {"成本": 76.0}},  # Azure 变化 1
+        })
+
+        # AWS: (20 + 0) / 2 / 50 = 0.2，Azure: (0 + 1) / 2 / 50 = 0.01
+        assert round2.cell_convergence["AWS"]["成本"] == pytest.approx(0.2)
+        assert round2.cell_convergence["Azure"]["成本"] == pytest.approx(0.01)
+        assert round2.convergence_score == pytest.approx(21 / 4 / 50)
+
+        cells = sample_process.unconverged_cells()
+        assert [(alt, crit) for alt, crit, _ in cells] == [("AWS", "成本")]
+
+    def test_convergence_aligns_changed_panel(self, sample_process):
+        """测试决策者和方案变化时只比较两轮都有的评分"""
+        sample_process.add_round({
+            "DM1": {"AWS": {"成本": 80.0}, "Azure": {"成本": 70.0}},
+            "DM2": {"AWS": {"成本": 85.0}},
+        })
+        round2 = sample_process.add_round({
+            "DM2": {"Azure": {"成本": 60.0}, "AWS": {"成本": 75.0}},  # AWS 变化 10
+            "DM3": {"AWS": {"成本": 10.0}},  # 新决策者，不参与比较
+        })
+
+        assert round2.convergence_score == pytest.approx(10 / 50)
+        assert round2.cell_convergence == {"AWS": {"成本": pytest.approx(0.2)}}
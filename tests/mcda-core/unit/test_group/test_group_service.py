@@ -203,6 +203,62 @@ class TestGroupDecisionService:
 
         assert result.overall_consensus >= 0
 
+    def test_compute_consensus_uses_score_tensor(self, service, sample_problem):
+        """测试共识度基于缓存的评分张量计算，与嵌套字典路径结果一致"""
+        from mcda_core.group.consensus import ConsensusMeasure
+
+        result = service.compute_consensus(sample_problem, threshold=0.8)
+        expected = ConsensusMeasure.compute_consensus(
+            individual_scores=sample_problem.individual_scores,
+            alternatives=sample_problem.alternatives,
+            criteria=sample_problem.criteria,
+            threshold=0.8
+        )
+
+        assert "sparse_score_tensor" in sample_problem.__dict__
+        assert result.overall_consensus == pytest.approx(expected.overall_consensus)
+        assert result.criterion_consensus == pytest.approx(expected.criterion_consensus)
+        for dm_id, distances in expected.decision_maker_distances.items():
+            assert result.decision_maker_distances[dm_id] == pytest.approx(distances)
+
+    def test_compute_consensus_excludes_missing_criterion_scores(
+        self, service, sample_criteria
+    ):
+        """测试缺失的准则评分不计入共识度"""
+        from mcda_core.group.consensus import ConsensusMeasure
+
+        problem = GroupDecisionProblem(
+            alternatives=("AWS", "Azure"),
+            criteria=sample_criteria,
+            decision_makers=(
+                DecisionMaker(id="DM1", name="张三", weight=1.0),
+                DecisionMaker(id="DM2", name="李四", weight=1.0),
+            ),
+            individual_scores={
+                "DM1": {
+                    "AWS": {"成本": 80.0, "质量": 90.0, "技术": 85.0},
+                    "Azure": {"成本": 70.0, "质量": 85.0, "技术": 80.0},
+                },
+                "DM2": {
+                    "AWS": {"成本": 80.0, "技术": 85.0},
+                    "Azure": {"成本": 70.0, "技术": 80.0},
+                },
+            }
+        )
+
+        result = service.compute_consensus(problem)
+        expected = ConsensusMeasure.compute_consensus(
+            individual_scores=problem.individual_scores,
+            alternatives=problem.alternatives,
+            criteria=problem.criteria
+        )
+
+        assert result.criterion_consensus["质量"] == pytest.approx(1.0)
+        assert result.overall_consensus == pytest.approx(1.0)
+        assert result.criterion_consensus == pytest.approx(expected.criterion_consensus)
+        # 聚合仍按缺失评分记 0 的张量计算
+        assert problem.score_tensor[1, 0, 1] == 0.0
+
     def test_to_decision_problem_returns_valid_problem(
         self, service, sample_problem
     ):
@@ -293,6 +349,22 @@ class TestGroupDecisionService:
         # AWS 成本: 1.0*80 / 1.0 = 80
         assert result["AWS"]["成本"] == pytest.approx(80.0)
 
+    def test_aggregate_tensor_matches_score_dict(self, service, sample_problem):
+        """测试张量聚合结果与评分字典一致，且顺序与方案、准则一致"""
+        tensor = sample_problem.score_tensor
+        assert tensor.shape == (3, 2, 3)
+        assert tensor[1, 0, 2] == 90.0  # DM2 对 AWS 的技术评分
+        assert not tensor.flags.writeable
+
+        aggregated = service.aggregate_tensor(sample_problem, "weighted_average")
+        result = service.aggregate_scores(sample_problem, "weighted_average")
+
+        # AWS 成本: (1.0*80 + 1.0*85 + 0.5*75) / 2.5 = 81
+        assert aggregated[0, 0] == pytest.approx(81.0)
+        for i, alt in enumerate(sample_problem.alternatives):
+            for j, crit in enumerate(sample_problem.criterion_names):
+                assert result[alt][crit] == pytest.approx(aggregated[i, j])
+
     def test_compute_consensus_with_config_threshold(
         self, service, sample_criteria, sample_decision_makers, sample_individual_scores
     ):
@@ -15,6 +15,21 @@ from mcda_core.loaders import CSVLoader
 from mcda_core.exceptions import ConfigLoadError
 
 
+def _write_late_gbk_csv(tmp_path, sniff_bytes):
+    """写入前 sniff_bytes 字节均为 ASCII、末行为中文准则名的 GBK 文件"""
+    lines = ["A,B"]
+    size = 4
+    while size <= sniff_bytes:
+        line = f"c{len(lines)},0.1,higher,50,60"
+        lines.append(line)
+        size += len(line) + 1
+    lines.append("性能,0.1,higher,70,80")
+
+    csv_file = tmp_path / 'late_gbk.csv'
+    csv_file.write_bytes(("\n".join(lines) + "\n").encode('gbk'))
+    return csv_file
+
+
 class TestCSVLoader:
     """CSV Loader 测试类"""
 
@@ -66,10 +81,102 @@ class TestCSVLoader:
         with pytest.raises(ValueError):
             self.loader.load(csv_file)
 
-    def test_encoding_handling(self):
-        """测试编码处理"""
-        # TODO: 添加不同编码的测试文件
-        pass
+    def test_encoding_handling(self, tmp_path):
+        """测试编码处理（GBK 和带 BOM 的 UTF-8）"""
+        content = "方案A,方案B\n性能,0.6,higher,85,90\n成本,0.4,lower,50,60\n"
+
+        gbk_file = tmp_path / 'gbk.csv'
+        gbk_file.write_bytes(content.encode('gbk'))
+        config = self.loader.load(gbk_file)
+        assert config['metadata']['encoding'] == 'gbk'
+        assert config['alternatives'] == ['方案A', '方案B']
+
+        bom_file = tmp_path / 'bom.csv'
+        bom_file.write_bytes(content.encode('utf-8-sig'))
+        config = self.loader.load(bom_file)
+        assert config['metadata']['encoding'] == 'utf-8-sig'
+        assert config['alternatives'][0] == '方案A'
+
+    def test_gbk_after_sniff_window(self, tmp_path):
+        """测试首块为 ASCII、非 ASCII 内容在检测窗口之后的 GBK 文件"""
+        from mcda_core.loaders.csv_loader import ENCODING_SNIFF_BYTES
+
+        csv_file = _write_late_gbk_csv(tmp_path, ENCODING_SNIFF_BYTES)
+
+        config = self.loader.load(csv_file)
+
+        assert config['metadata']['encoding'] == 'gbk'
+        assert config['criteria'][-1]['name'] == '性能'
+
+        config = CSVLoader().load_stream(csv_file)
+
+        assert config['metadata']['encoding'] == 'gbk'
+        assert config['criteria'][-1]['name'] == '性能'
+        assert config['matrix'].shape == (len(config['criteria']), 2)
+
+
+class TestCSVLoaderStream:
+    """CSV Loader 流式加载测试"""
+
+    def setup_method(self):
+        """每个测试前的设置"""
+        self.loader = CSVLoader()
+        self.fixtures_dir = Path(__file__).parent.parent.parent / 'fixtures'
+
+    def test_stream_matches_load(self):
+        """测试流式加载与普通加载结果一致"""
+        import numpy as np
+
+        csv_file = self.fixtures_dir / 'decision_data.csv'
+        expected = CSVLoader().load(csv_file)
+        config = self.loader.load_stream(csv_file)
+
+        assert config['alternatives'] == expected['alternatives']
+        assert config['criteria'] == expected['criteria']
+        assert config['matrix'].dtype == np.float64
+        np.testing.assert_array_equal(config['matrix'], np.array(expected['matrix']))
+        assert config['intervals'] == {}
+
+    def test_stream_interval_side_table(self):
+        """测试区间数单元格存入稀疏表，数组中为 NaN"""
+        import math
+        from mcda_core.interval import Interval
+
+        csv_file = self.fixtures_dir / 'decision_data_interval.csv'
+        expected = CSVLoader().load(csv_file)
+        config = self.loader.load_stream(csv_file)
+
+        for i, row in enumerate(expected['matrix']):
+            for j, score in enumerate(row):
+                if isinstance(score, Interval):
+                    assert math.isnan(config['matrix'][i, j])
+                    assert config['intervals'][(i, j)] == score
+                else:
+                    assert config['matrix'][i, j] == score
+
+    def test_stream_reports_progress(self):
+        """测试进度回调以文件总字节数结束"""
+        csv_file = self.fixtures_dir / 'decision_data.csv'
+        calls = []
+
+        self.loader.load_stream(csv_file, progress=lambda done, total: calls.append((done, total)))
+
+        size = csv_file.stat().st_size
+        assert calls[-1] == (size, size)
+
+    def test_stream_rejects_formula_injection(self, tmp_path):
+        """测试流式加载保留注入检查"""
+        csv_file = tmp_path / 'inject.csv'
+        csv_file.write_text("A,B\n性能,0.5,higher,+85,90\n", encoding='utf-8')
+
+        with pytest.raises(ValueError, match="第 2 行第 1 个得分值无效"):
+            self.loader.load_stream(csv_file)
+
+    def test_stream_invalid_format(self):
+        """测试无效格式"""
+        csv_file = self.fixtures_dir / 'decision_data_error.csv'
+        with pytest.raises(ValueError):
+            self.loader.load_stream(csv_file)
 
 
 class TestCSVLoaderIntegration:
@@ -0,0 +1,220 @@
+"""
+MCDA Core - 排名比较指标测试
+
+测试 Kendall τ-b、Spearman ρ、前 k 名重合度和秩偏重叠。
+"""
+
+import itertools
+import math
+
+import numpy as np
+import pytest
+from mcda_core.ranking import (
+    kendall_matrix,
+    kendall_tau,
+    rank_biased_overlap,
+    spearman,
+    spearman_matrix,
+    top_k_overlap,
+)
+
+
+# =============================================================================
+# 参考实现（O(n²) 定义式）
+# =============================================================================
+
+def naive_kendall_tau_b(x, y):
+    """按定义逐对计算 Kendall τ-b"""
+    concordant = discordant = x_ties = y_ties = 0
+    for i, j in itertools.combinations(range(len(x)), 2):
+        dx = np.sign(x[i] - x[j])
+        dy = np.sign(y[i] - y[j])
+        if dx == 0 and dy == 0:
+            continue
+        if dx == 0:
+            x_ties += 1
+        elif dy == 0:
+            y_ties += 1
+        elif dx == dy:
+            concordant += 1
+        else:
+            discordant += 1
+    denominator = math.sqrt((concordant + discordant + x_ties) * (concordant + discordant + y_ties))
+    return (concordant - discordant) / denominator if denominator else float("nan")
+
+
+@pytest.fixture
+def rng():
+    """固定种子的随机数生成器"""
+    return np.random.default_rng(2024)
+
+
+# =============================================================================
+# Kendall τ-b
+# =============================================================================
+
+class TestKendallTau:
+    """Kendall τ-b 测试"""
+
+    def test_identical_and_reversed(self):
+        """测试相同排名为 1，完全相反为 -1"""
+        ranking = np.arange(10)
+
+        assert kendall_tau(ranking, ranking) == pytest.approx(1.0)
+        assert kendall_tau(ranking, ranking[::-1]) == pytest.approx(-1.0)
+
+    def test_single_swap(self):
+        """测试交换相邻两名：τ = 1 - 2·2/(n(n-1))"""
+        assert kendall_tau([0, 1, 2, 3], [1, 0, 2, 3]) == pytest.approx(1 - 4 / 12)
+
+    def test_matches_pairwise_definition(self, rng):
+        """测试与逐对定义一致（含并列）"""
+        for _ in range(50):
+            n = int(rng.integers(2, 30))
+            x = rng.integers(0, 6, n)
+            y = rng.integers(0, 6, n)
+
+            expected = naive_kendall_tau_b(x, y)
+            if math.isnan(expected):
+                assert math.isnan(kendall_tau(x, y))
+            else:
+                assert kendall_tau(x, y) == pytest.approx(expected, abs=1e-12)
+
+    def test_all_tied_is_nan(self):
+        """测试完全并列的排名相关系数无定义"""
+        assert math.isnan(kendall_tau([0, 0, 0], [0, 1, 2]))
+
+    def test_different_length(self):
+        """测试长度不一致"""
+        with pytest.raises(ValueError, match="长度"):
+            kendall_tau([0, 1, 2], [0, 1])
+
+
+# =============================================================================
+# Spearman ρ
+# =============================================================================
+
+class TestSpearman:
+    """Spearman ρ 测试"""
+
+    def test_matches_squared_difference_formula(self, rng):
+        """测试无并列时与 1 - 6Σd²/(n(n²-1)) 一致"""
+        n = 200
+        x = rng.permutation(n)
+        y = rng.permutation(n)
+        expected = 1 - 6 * np.sum((x - y) ** 2) / (n * (n ** 2 - 1))
+
+        assert spearman(x, y) == pytest.approx(expected)
+
+    def test_ties_use_average_ranks(self):
+        """测试并列名次取平均名次"""
+        # [0, 0, 1] 的平均名次为 [1.5, 1.5, 3]
+        expected = np.corrcoef([1.5, 1.5, 3.0], [1.0, 2.0, 3.0])[0, 1]
+
+        assert spearman([0, 0, 1], [0, 1, 2]) == pytest.approx(expected)
+
+    def test_invariant_to_rank_base(self, rng):
+        """测试 0-based 与 1-based 名次结果相同"""
+        x = rng.permutation(20)
+        y = rng.permutation(20)
+
+        assert spearman(x, y) == pytest.approx(spearman(x + 1, y + 1))
+
+    def test_both_all_tied_is_one(self):
+        """测试两个排名都完全并列时相关系数为 1"""
+        assert spearman([1, 1], [1, 1]) == 1.0
+        assert spearman([0, 0, 0], [2, 2, 2]) == 1.0
+
+    def test_one_all_tied_is_zero(self):
+        """测试只有一个排名完全并列时相关系数为 0"""
+        assert spearman([1, 1], [1, 2]) == 0.0
+        assert spearman([0, 1, 2], [0, 0, 0]) == 0.0
+
+
+# =============================================================================
+# 相关矩阵
+# =============================================================================
+
+class TestCorrelationMatrices:
+    """相关矩阵测试"""
+
+    def test_matrices_match_pairwise(self, rng):
+        """测试相关矩阵与两两计算一致"""
+        ranks = np.vstack([rng.permutation(30) for _ in range(4)])
+
+        spearman_result = spearman_matrix(ranks)
+        kendall_result = kendall_matrix(ranks)
+
+        assert spearman_result.shape == kendall_result.shape == (4, 4)
+        np.testing.assert_allclose(np.diag(spearman_result), 1.0)
+        np.testing.assert_allclose(np.diag(kendall_result), 1.0)
+        for i, j in itertools.combinations(range(4), 2):
+            assert spearman_result[i, j] == pytest.approx(spearman(ranks[i], ranks[j]))
+            assert kendall_result[i, j] == pytest.approx(kendall_tau(ranks[i], ranks[j]))
+            assert kendall_result[j, i] == kendall_result[i, j]
+
+    def test_spearman_matrix_all_tied_rows(self):
+        """测试 Spearman 相关矩阵中完全并列的行不产生 NaN"""
+        matrix = spearman_matrix([[0, 0, 0], [1, 1, 1], [0, 1, 2]])
+
+        np.testing.assert_allclose(
+            matrix, [[1.0, 1.0, 0.0], [1.0, 1.0, 0.0], [0.0, 0.0, 1.0]]
+        )
+
+    def test_requires_two_dimensions(self):
+        """测试输入必须是二维数组"""
+        with pytest.raises(ValueError, match="二维"):
+            spearman_matrix([0, 1, 2])
+
+
+# =============================================================================
+# 头部重叠指标
+# =============================================================================
+
+class TestHeadOverlap:
+    """前 k 名重合度与秩偏重叠测试"""
+
+    def test_top_k_overlap(self):
+        """测试前 k 名重合比例"""
+        ranking1 = [0, 1, 2, 3, 4]
+        ranking2 = [1, 0, 4, 3, 2]
+
+        assert top_k_overlap(ranking1, ranking2, 2) == 1.0
+        assert top_k_overlap(ranking1, ranking2, 3) == pytest.approx(2 / 3)
+
+    def test_top_k_out_of_range(self):
+        """测试 k 超出范围"""
+        with pytest.raises(ValueError, match="k"):
+            top_k_overlap([0, 1], [1, 0], 3)
+
+    def test_rbo_identical_is_one(self, rng):
+        """测试相同排名的 RBO 为 1（任意深度）"""
+        ranking = rng.permutation(100)
+
+        assert rank_biased_overlap(ranking, ranking) == pytest.approx(1.0)
+        assert rank_biased_overlap(ranking, ranking, depth=10) == pytest.approx(1.0)
+
+    def test_rbo_hand_computed(self):
+        """测试 RBO 手算值
+
+        交换前两名，p = 0.5：A = [0, 1, 1, 1]，
+        RBO = 1·0.5⁴ + 0.5·(0 + 1·0.5 + 1·0.25 + 1·0.125) = 0.5
+        """
+        assert rank_biased_overlap([0, 1, 2, 3], [1, 0, 2, 3], p=0.5) == pytest.approx(0.5)
+
+    def test_rbo_weights_head(self):
+        """测试头部不一致比尾部不一致的 RBO 更低"""
+        base = np.arange(20)
+        head_swap = base.copy()
+        head_swap[[0, 1]] = head_swap[[1, 0]]
+        tail_swap = base.copy()
+        tail_swap[[18, 19]] = tail_swap[[19, 18]]
+
+        assert rank_biased_overlap(base, head_swap) < rank_biased_overlap(base, tail_swap)
+
+    def test_rbo_invalid_parameters(self):
+        """测试无效参数"""
+        with pytest.raises(ValueError, match="p"):
+            rank_biased_overlap([0, 1], [1, 0], p=1.0)
+        with pytest.raises(ValueError, match="depth"):
+            rank_biased_overlap([0, 1], [1, 0], depth=5)
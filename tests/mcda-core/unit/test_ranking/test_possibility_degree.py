@@ -4,6 +4,7 @@ MCDA Core - 可能度排序测试
 测试基于可能度的区间排序方法。
 """
 
+import numpy as np
 import pytest
 from mcda_core.interval import Interval
 from mcda_core.ranking import PossibilityDegree
@@ -367,3 +368,65 @@ class TestPossibilityDegreeProperties:
         assert prob_a_ge_b < 0.5, "A < B"
         assert prob_b_ge_c < 0.5, "B < C"
         assert prob_a_ge_c < prob_a_ge_b, "A < C 的可能度应更小"
+
+
+# =============================================================================
+# Array API Tests
+# =============================================================================
+
+class TestPossibilityDegreeArrays:
+    """数组接口测试"""
+
+    @pytest.fixture
+    def bounds(self):
+        """覆盖全部分支的区间：重叠、包含、相离、相同退化区间、相同非退化区间"""
+        intervals = [
+            Interval(2.0, 5.0),
+            Interval(3.0, 6.0),
+            Interval(5.0, 5.0),
+            Interval(5.0, 5.0),
+            Interval(0.0, 1.0),
+            Interval(2.0, 5.0),
+            Interval(3.0, 4.0),
+        ]
+        lower = np.array([i.lower for i in intervals])
+        upper = np.array([i.upper for i in intervals])
+        return intervals, lower, upper
+
+    def test_matrix_matches_calculate(self, bounds):
+        """测试可能度矩阵与逐对 calculate 完全一致"""
+        intervals, lower, upper = bounds
+
+        matrix = PossibilityDegree.matrix(lower, upper)
+
+        expected = [[PossibilityDegree.calculate(a, b) for b in intervals] for a in intervals]
+        np.testing.assert_array_equal(matrix, expected)
+
+    def test_matrix_against_other_intervals(self, bounds):
+        """测试与另一组区间比较的矩形矩阵"""
+        intervals, lower, upper = bounds
+
+        matrix = PossibilityDegree.matrix(lower[:2], upper[:2], lower, upper)
+
+        assert matrix.shape == (2, len(intervals))
+        np.testing.assert_array_equal(matrix, PossibilityDegree.matrix(lower, upper)[:2])
+
+    @pytest.mark.parametrize("block_size", [None, 1, 3, 100])
+    def test_blocked_scores_match_rank(self, possibility_degree, bounds, block_size):
+        """测试分块综合可能度与 rank 的结果一致（排除自身比较）"""
+        intervals, lower, upper = bounds
+
+        scores = PossibilityDegree.scores(lower, upper, block_size=block_size)
+
+        expected = [
+            sum(PossibilityDegree.calculate(a, b) for j, b in enumerate(intervals) if j != i)
+            for i, a in enumerate(intervals)
+        ]
+        np.testing.assert_allclose(scores, expected)
+
+    def test_scores_invalid_input(self):
+        """测试无效输入"""
+        with pytest.raises(ValueError):
+            PossibilityDegree.scores([1.0, 2.0], [3.0])
+        with pytest.raises(ValueError):
+            PossibilityDegree.scores([1.0], [3.0], block_size=0)
@@ -448,3 +448,109 @@ class TestErrorHandling:
         # 传入列表而不是 numpy 数组
         with pytest.raises((TypeError, AHPValidationError)):
             service.calculate_weights([[1, 2], [1/2, 1]])
+
+
+class TestWeightMethods:
+    """权重计算方法测试"""
+
+    @pytest.fixture
+    def saaty_matrix(self):
+        return np.array([
+            [1, 3, 5],
+            [1/3, 1, 2],
+            [1/5, 1/2, 1]
+        ])
+
+    def test_eigenvector_is_principal_eigenvector(self, saaty_matrix):
+        """测试：特征向量法结果为主特征向量，λ_max 为主特征值"""
+        eigenvalues, eigenvectors = np.linalg.eig(saaty_matrix)
+        principal = np.argmax(eigenvalues.real)
+        expected = eigenvectors[:, principal].real
+        expected = expected / np.sum(expected)
+
+        service = AHPService()
+        result = service.calculate_weights_with_consistency(saaty_matrix)
+
+        assert np.allclose(result["weights"], expected, atol=1e-12)
+        assert abs(result["lambda_max"] - eigenvalues[principal].real) < 1e-10
+
+    def test_power_iteration_fallback_agrees(self, saaty_matrix):
+        """测试：幂法回退与特征分解结果一致"""
+        service = AHPService(tolerance=1e-12)
+
+        weights = service._power_iteration(saaty_matrix[np.newaxis].astype(float))[0]
+
+        assert np.allclose(weights, service.calculate_weights(saaty_matrix), atol=1e-9)
+
+    def test_geometric_mean(self, saaty_matrix):
+        """测试：几何平均法 w_i ∝ (Π_j a_ij)^(1/n)"""
+        expected = np.prod(saaty_matrix, axis=1) ** (1 / 3)
+        expected = expected / np.sum(expected)
+
+        service = AHPService(method="geometric_mean")
+
+        assert np.allclose(service.calculate_weights(saaty_matrix), expected)
+        assert np.allclose(
+            AHPService().calculate_weights(saaty_matrix, method="geometric_mean"),
+            expected
+        )
+
+    def test_invalid_method(self):
+        """测试：无效的权重计算方法"""
+        with pytest.raises(ValueError, match="权重计算方法"):
+            AHPService(method="least_squares")
+
+
+class TestBatchCalculation:
+    """批量计算测试"""
+
+    @staticmethod
+    def _random_matrix(rng, n):
+        matrix = np.ones((n, n))
+        for i in range(n):
+            for j in range(i + 1, n):
+                value = rng.choice([1, 2, 3, 5, 7, 9, 1/2, 1/3, 1/5, 1/7, 1/9])
+                matrix[i, j] = value
+                matrix[j, i] = 1 / value
+        return matrix
+
+    def test_batch_matches_single(self):
+        """测试：批量结果与逐个计算一致"""
+        rng = np.random.default_rng(0)
+        matrices = np.stack([self._random_matrix(rng, 5) for _ in range(20)])
+
+        service = AHPService()
+        result = service.calculate_weights_with_consistency_batch(matrices)
+
+        assert result["weights"].shape == (20, 5)
+        assert result["consistency_ratio"].shape == (20,)
+        assert np.allclose(result["weights"], service.calculate_weights_batch(matrices))
+        for k, matrix in enumerate(matrices):
+            single = service.calculate_weights_with_consistency(matrix)
+            assert np.allclose(result["weights"][k], single["weights"])
+            assert abs(result["consistency_ratio"][k] - single["consistency_ratio"]) < 1e-10
+            assert result["acceptable"][k] == single["acceptable"]
+
+    def test_mixed_sizes(self):
+        """测试：不同阶矩阵按阶数分组计算，结果保持输入顺序"""
+        rng = np.random.default_rng(1)
+        matrices = [self._random_matrix(rng, n) for n in (3, 5, 1, 3, 4, 2)]
+
+        service = AHPService()
+        result = service.calculate_weights_with_consistency_batch(matrices)
+
+        assert [len(w) for w in result["weights"]] == [3, 5, 1, 3, 4, 2]
+        for k, matrix in enumerate(matrices):
+            assert np.allclose(result["weights"][k], service.calculate_weights(matrix))
+            assert abs(
+                result["consistency_ratio"][k] - service.calculate_consistency_ratio(matrix)
+            ) < 1e-10
+
+    def test_batch_error_reports_matrix_index(self):
+        """测试：批量验证失败时指出矩阵序号"""
+        matrices = np.stack([np.ones((3, 3))] * 4)
+        matrices[2, 0, 1] = 3
+
+        service = AHPService()
+        with pytest.raises(AHPValidationError, match="矩阵 2.*互反性"):
+            service.calculate_weights_batch(matrices)
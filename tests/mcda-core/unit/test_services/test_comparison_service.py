@@ -110,6 +110,122 @@ class TestCompareAlgorithms:
             )
 
 
+class TestParallelComparison:
+    """并行对比测试"""
+
+    @pytest.fixture
+    def decision_matrix(self):
+        """随机决策矩阵"""
+        return np.random.default_rng(0).uniform(10, 90, size=(40, 4))
+
+    @pytest.mark.parametrize("executor", ["thread", "process"])
+    def test_parallel_matches_serial(self, decision_matrix, executor):
+        """测试线程池/进程池结果与串行一致"""
+        weights = np.array([0.4, 0.3, 0.2, 0.1])
+        algorithms = ["wsm", "wpm", "topsis", "vikor"]
+        service = ComparisonService()
+
+        serial = service.compare_algorithms(decision_matrix, weights, algorithms)
+        parallel = service.compare_algorithms(
+            decision_matrix, weights, algorithms, workers=2, executor=executor
+        )
+
+        np.testing.assert_array_equal(serial["rank_matrix"], parallel["rank_matrix"])
+        assert serial["correlations"] == parallel["correlations"]
+
+    def test_rankings_are_integer_arrays(self, decision_matrix):
+        """测试排名为整数数组，相关矩阵与两两相关系数一致"""
+        weights = np.array([0.4, 0.3, 0.2, 0.1])
+        algorithms = ["wsm", "topsis", "vikor"]
+        service = ComparisonService()
+
+        result = service.compare_algorithms(decision_matrix, weights, algorithms)
+
+        assert result["rank_matrix"].shape == (3, 40)
+        assert result["rank_matrix"].dtype == np.int64
+        for row in result["rank_matrix"]:
+            assert sorted(row.tolist()) == list(range(40))
+
+        matrix = result["correlation_matrix"]
+        np.testing.assert_allclose(np.diag(matrix), 1.0)
+        for i in range(3):
+            for j in range(3):
+                expected = service.calculate_ranking_correlation(
+                    result["rank_matrix"][i].tolist(), result["rank_matrix"][j].tolist()
+                )
+                assert matrix[i, j] == pytest.approx(expected)
+
+    def test_custom_alternative_names(self):
+        """测试自定义方案名称（不以 A 加数字命名）"""
+        decision_matrix = np.array([
+            [10, 20],
+            [30, 40],
+            [20, 30],
+        ])
+        weights = np.array([0.5, 0.5])
+
+        result = ComparisonService().compare_algorithms(
+            decision_matrix,
+            weights,
+            algorithms=["wsm"],
+            alternatives=["Apple", "Banana", "Cherry"]
+        )
+
+        assert result["rankings"][0]["ranking"].tolist() == [2, 0, 1]
+
+    def test_algorithm_params(self):
+        """测试按算法传递参数"""
+        decision_matrix = np.array([
+            [10, 90],
+            [90, 10],
+            [50, 50],
+        ])
+        weights = np.array([0.5, 0.5])
+        service = ComparisonService()
+
+        result = service.compare_algorithms(
+            decision_matrix,
+            weights,
+            algorithms=["vikor"],
+            algorithm_params={"vikor": {"v": 0.0}}
+        )
+
+        assert result["rankings"][0]["ranking"][2] == 0
+
+    def test_kendall_and_head_metrics(self, decision_matrix):
+        """测试 Kendall 相关和前 k 名指标"""
+        weights = np.array([0.4, 0.3, 0.2, 0.1])
+        service = ComparisonService()
+
+        result = service.compare_algorithms(
+            decision_matrix, weights, ["wsm", "topsis"], correlation="kendall", top_k=5
+        )
+
+        ranks = result["rank_matrix"]
+        assert result["correlation_method"] == "kendall"
+        assert result["correlations"]["WSM vs TOPSIS"] == pytest.approx(
+            service.calculate_ranking_correlation(ranks[0], ranks[1], method="kendall")
+        )
+        assert 0.0 <= result["top_k_overlap"]["WSM vs TOPSIS"] <= 1.0
+        assert 0.0 <= result["rank_biased_overlap"]["WSM vs TOPSIS"] <= 1.0
+        assert "Kendall" in service.generate_comparison_report(result)
+
+    def test_invalid_workers(self):
+        """测试无效并行参数"""
+        decision_matrix = np.array([[10, 20], [15, 25]])
+        weights = np.array([0.6, 0.4])
+        service = ComparisonService()
+
+        with pytest.raises(ComparisonValidationError, match="workers"):
+            service.compare_algorithms(decision_matrix, weights, ["wsm"], workers=0)
+        with pytest.raises(ComparisonValidationError, match="executor"):
+            service.compare_algorithms(decision_matrix, weights, ["wsm"], executor="gpu")
+        with pytest.raises(ComparisonValidationError, match="correlation"):
+            service.compare_algorithms(decision_matrix, weights, ["wsm"], correlation="pearson")
+        with pytest.raises(ComparisonValidationError, match="top_k"):
+            service.compare_algorithms(decision_matrix, weights, ["wsm"], top_k=3)
+
+
 class TestRankingCorrelation:
     """排名相关性测试"""
 
@@ -146,6 +262,13 @@ class TestRankingCorrelation:
         # 相关系数应该在 -1 和 1 之间
         assert -1 <= correlation <= 1
 
+    def test_spearman_correlation_all_tied(self):
+        """测试：完全并列的排名（相同为 1，只有一个并列为 0）"""
+        service = ComparisonService()
+
+        assert service.calculate_ranking_correlation([1, 1], [1, 1]) == 1.0
+        assert service.calculate_ranking_correlation([1, 1], [1, 2]) == 0.0
+
     def test_correlation_different_length(self):
         """测试：不同长度的排名"""
         ranking1 = [0, 1, 2]
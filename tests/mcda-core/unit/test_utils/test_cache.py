@@ -24,6 +24,9 @@ if spec and spec.loader:
     spec.loader.exec_module(cache)
 
     cached_result = cache.cached_result
+    ResultCache = cache.ResultCache
+    CacheStats = cache.CacheStats
+    problem_fingerprint = cache.problem_fingerprint
 else:
     raise ImportError("无法加载 cache 模块")
 
@@ -224,6 +227,176 @@ class TestCacheInWeighting:
         import numpy as np
         np.testing.assert_array_almost_equal(weights1, weights2)
 
+    def test_enable_cache_for_weighting_with_arrays(self):
+        """测试为权重类启用缓存后，numpy 数组参数按内容命中"""
+        import numpy as np
+
+        class FakeWeighting:
+            call_count = 0
+
+            def calculate_weights(self, decision_matrix, directions=None):
+                FakeWeighting.call_count += 1
+                return decision_matrix.sum(axis=0) / decision_matrix.sum()
+
+        cache.enable_cache_for_weighting(FakeWeighting)
+        matrix = np.array([[1.0, 2.0], [3.0, 4.0]])
+
+        weights1 = FakeWeighting().calculate_weights(matrix)
+        weights1[0] = -1.0  # 修改返回值不影响缓存
+        weights2 = FakeWeighting().calculate_weights(matrix.copy())
+
+        assert FakeWeighting.call_count == 1
+        np.testing.assert_array_almost_equal(weights2, [0.4, 0.6])
+        assert CacheStats.get_stats(FakeWeighting.calculate_weights)["hits"] == 1
+
+
+
+def _make_problem(weights=(0.5, 0.5), c1_score=80):
+    """构建测试用决策问题"""
+    from mcda_core.models import DecisionProblem, Criterion
+
+    return DecisionProblem(
+        alternatives=("A", "B", "C"),
+        criteria=(
+            Criterion("C1", weight=weights[0], direction="higher_better"),
+            Criterion("C2", weight=weights[1], direction="lower_better"),
+        ),
+        scores={
+            "A": {"C1": c1_score, "C2": 60},
+            "B": {"C1": 70, "C2": 90},
+            "C": {"C1": 90, "C2": 70},
+        },
+    )
+
+
+class TestProblemFingerprint:
+    """测试决策问题内容指纹"""
+
+    def test_equal_content_equal_fingerprint(self):
+        """测试内容相同的两个问题指纹一致"""
+        assert problem_fingerprint(_make_problem(), "wsm") == \
+            problem_fingerprint(_make_problem(), "wsm")
+
+    @pytest.mark.parametrize("other", [
+        lambda: problem_fingerprint(_make_problem(weights=(0.6, 0.4)), "wsm"),
+        lambda: problem_fingerprint(_make_problem(c1_score=81), "wsm"),
+        lambda: problem_fingerprint(_make_problem(), "topsis"),
+        lambda: problem_fingerprint(_make_problem(), "wsm", {"v": 0.5}),
+    ])
+    def test_content_change_changes_fingerprint(self, other):
+        """测试权重、评分、算法或参数变化时指纹不同"""
+        assert other() != problem_fingerprint(_make_problem(), "wsm")
+
+
+class TestResultCache:
+    """测试内容寻址结果缓存"""
+
+    def test_get_or_compute_hits(self):
+        """测试命中时不重复计算"""
+        result_cache = ResultCache(maxsize=4)
+        call_count = [0]
+
+        def compute():
+            call_count[0] += 1
+            return "result"
+
+        assert result_cache.get_or_compute("k", compute) == "result"
+        assert result_cache.get_or_compute("k", compute) == "result"
+        assert call_count[0] == 1
+
+        stats = CacheStats.get_stats(result_cache)
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+        assert stats["currsize"] == 1
+
+    def test_lru_eviction(self):
+        """测试超过 maxsize 时淘汰最久未使用的条目"""
+        result_cache = ResultCache(maxsize=2)
+        result_cache.set("a", 1)
+        result_cache.set("b", 2)
+        result_cache.get("a")
+        result_cache.set("c", 3)
+
+        assert result_cache.get("b") is None
+        assert result_cache.get("a") == 1
+        assert result_cache.cache_info().evictions == 1
+
+    def test_ttl_expiry(self, monkeypatch):
+        """测试条目过期后视为未命中"""
+        now = [1000.0]
+        monkeypatch.setattr(cache.time, "monotonic", lambda: now[0])
+
+        result_cache = ResultCache(ttl=10)
+        result_cache.set("k", "v")
+        now[0] += 5
+        assert result_cache.get("k") == "v"
+        now[0] += 6
+        assert result_cache.get("k") is None
+
+    def test_disk_tier_survives_new_instance(self, tmp_path):
+        """测试磁盘层在新实例中命中"""
+        db_path = tmp_path / "cache.db"
+        ResultCache(disk_path=db_path).set("k", {"score": 1.5})
+
+        reopened = ResultCache(disk_path=db_path)
+        assert reopened.get("k") == {"score": 1.5}
+        assert reopened.cache_info().disk_hits == 1
+
+        # 已提升到内存层
+        assert reopened.get("k") == {"score": 1.5}
+        assert reopened.cache_info().disk_hits == 1
+
+    def test_disk_max_entries(self, tmp_path):
+        """测试磁盘层容量限制"""
+        result_cache = ResultCache(maxsize=0, disk_path=tmp_path / "c.db", disk_max_entries=2)
+        for key in ("a", "b", "c"):
+            result_cache.set(key, key)
+
+        assert len(result_cache.disk) == 2
+        assert result_cache.cache_info().evictions == 1
+
+
+class TestOrchestratorCache:
+    """测试编排器分析结果缓存"""
+
+    def test_analyze_reuses_cached_result(self):
+        """测试相同配置重复分析命中缓存"""
+        from mcda_core.core import MCDAOrchestrator
+        from mcda_core.utils.cache import ResultCache as PackageResultCache
+
+        orchestrator = MCDAOrchestrator(result_cache=PackageResultCache())
+
+        first = orchestrator.analyze(_make_problem(), algorithm_name="wsm")
+        second = orchestrator.analyze(_make_problem(), algorithm_name="wsm")
+        third = orchestrator.analyze(_make_problem(weights=(0.2, 0.8)), algorithm_name="wsm")
+
+        assert second is not first
+        assert second.rankings == first.rankings
+        assert third.rankings != first.rankings
+        info = orchestrator.result_cache.cache_info()
+        assert (info.hits, info.misses) == (1, 2)
+
+    def test_cached_result_not_shared(self):
+        """测试命中缓存的结果互不影响（设置 veto_results 不泄漏到后续调用）"""
+        from mcda_core.core import MCDAOrchestrator
+        from mcda_core.utils.cache import ResultCache as PackageResultCache
+
+        orchestrator = MCDAOrchestrator(result_cache=PackageResultCache())
+
+        first = orchestrator.analyze(_make_problem(), algorithm_name="wsm")
+        first.veto_results = {"A": "rejected"}
+        second = orchestrator.analyze(_make_problem(), algorithm_name="wsm")
+
+        assert second.veto_results is None
+
+        _, constrained = orchestrator.validate_and_analyze(
+            _make_problem(), algorithm_name="wsm", apply_constraints=True
+        )
+        third = orchestrator.analyze(_make_problem(), algorithm_name="wsm")
+
+        assert constrained.veto_results is not None
+        assert third.veto_results is None
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -218,6 +218,73 @@ class TestGameTheoryWeightingMath:
         assert np.all(combined >= 0)
 
 
+# =============================================================================
+# Solver Tests
+# =============================================================================
+
+class TestGameTheoryWeightingSolver:
+    """博弈论线性方程组求解测试"""
+
+    def test_first_order_condition(self):
+        """测试组合系数满足一阶条件 (W·W^T)·α = diag(W·W^T)"""
+        weighting = GameTheoryWeighting()
+        weights_matrix = np.array([
+            [0.5, 0.2, 0.2, 0.1],
+            [0.3, 0.3, 0.1, 0.3],
+            [0.2, 0.4, 0.3, 0.1],
+        ])
+
+        result = weighting.combine_weights(weights_matrix, return_details=True)
+
+        gram = weights_matrix @ weights_matrix.T
+        alpha = np.linalg.solve(gram, np.diag(gram))
+        expected = np.abs(alpha) / np.sum(np.abs(alpha))
+        assert result["strategy"] == "game_theory"
+        assert np.allclose(result["coefficients"], expected)
+        assert np.allclose(result["weights"], expected @ weights_matrix)
+
+    def test_mean_strategy(self, sample_weights_matrix):
+        """测试 mean 策略为算术平均"""
+        weighting = GameTheoryWeighting(strategy="mean")
+
+        combined = weighting.combine_weights(sample_weights_matrix)
+
+        assert np.allclose(combined, sample_weights_matrix.mean(axis=0))
+
+    def test_invalid_strategy(self):
+        """测试无效的组合策略"""
+        with pytest.raises(GameTheoryWeightingError, match="策略"):
+            GameTheoryWeighting(strategy="median")
+
+    def test_singular_gram_uses_least_squares(self):
+        """测试方法数多于准则数（Gram 矩阵奇异）时仍得到有效权重"""
+        weighting = GameTheoryWeighting()
+        weights = np.random.default_rng(0).dirichlet(np.ones(3), size=6)
+
+        combined = weighting.combine_weights(weights)
+
+        assert np.all(np.isfinite(combined))
+        assert np.all(combined >= 0)
+        assert np.allclose(np.sum(combined), 1.0)
+
+    def test_batch_matches_single(self):
+        """测试批量组合与逐个组合结果一致"""
+        weighting = GameTheoryWeighting()
+        batch = np.random.default_rng(1).dirichlet(np.ones(5), size=(50, 3))
+        batch[0, 1] = batch[0, 0]  # 含奇异的权重集
+
+        combined = weighting.combine_weights_batch(batch)
+
+        assert combined.shape == (50, 5)
+        for weights_matrix, expected in zip(batch, combined):
+            assert np.allclose(weighting.combine_weights(weights_matrix), expected)
+
+    def test_batch_requires_three_dimensions(self, sample_weights_matrix):
+        """测试批量输入必须是 3 维数组"""
+        with pytest.raises(GameTheoryWeightingError, match="3 维"):
+            GameTheoryWeighting().combine_weights_batch(sample_weights_matrix)
+
+
 # =============================================================================
 # Edge Cases Tests (4 个)
 # =============================================================================
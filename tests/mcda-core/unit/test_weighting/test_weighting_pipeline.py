@@ -0,0 +1,128 @@
+"""
+客观赋权流水线测试
+
+测试共享统计量的批量赋权与各单独方法结果一致。
+"""
+
+import pytest
+import numpy as np
+from mcda_core.services import EntropyWeightService
+from mcda_core.weighting import (
+    critic_weighting,
+    cv_weighting,
+    pca_weighting,
+    GameTheoryWeighting,
+    MatrixStatistics,
+    WeightingPipeline,
+    WeightingPipelineError,
+    WEIGHTING_METHODS,
+)
+
+
+@pytest.fixture
+def matrix():
+    """含常数列的随机决策矩阵"""
+    rng = np.random.default_rng(7)
+    matrix = rng.normal(size=(12, 6)) * [1, 10, 100, 5, 0.1, 20] + 50
+    matrix[:, 4] = 3.0
+    return matrix
+
+
+class TestMatrixStatistics:
+    """共享统计量测试"""
+
+    def test_statistics_match_numpy(self, matrix):
+        """测试：均值、标准差与相关系数矩阵"""
+        stats = MatrixStatistics(matrix)
+        varying = [0, 1, 2, 3, 5]
+
+        assert np.allclose(stats.mean, matrix.mean(axis=0))
+        assert np.allclose(stats.std, matrix.std(axis=0, ddof=1))
+        assert np.allclose(
+            stats.correlation[np.ix_(varying, varying)],
+            np.corrcoef(matrix[:, varying], rowvar=False)
+        )
+
+    def test_constant_column_correlation(self, matrix):
+        """测试：常数列相关系数为 0，对角线为 1"""
+        stats = MatrixStatistics(matrix)
+
+        assert np.allclose(stats.standardized[:, 4], 0.0)
+        assert stats.correlation[4, 4] == 1.0
+        assert np.allclose(np.delete(stats.correlation[4], 4), 0.0)
+
+    def test_statistics_are_cached(self, matrix):
+        """测试：统计量只计算一次"""
+        stats = MatrixStatistics(matrix)
+
+        assert stats.standardized is stats.standardized
+        assert stats.correlation is stats.correlation
+
+
+class TestWeightingPipeline:
+    """赋权流水线测试"""
+
+    def test_matches_individual_methods(self, matrix):
+        """测试：与各单独方法结果一致"""
+        directions = ["higher_better", "lower_better"] * 3
+
+        result = WeightingPipeline().run(matrix, directions)
+
+        assert result.methods == WEIGHTING_METHODS
+        assert result.weights_matrix.shape == (4, 6)
+        assert np.allclose(
+            result.weights["entropy"],
+            EntropyWeightService().calculate_weights(matrix, directions)
+        )
+        assert np.allclose(result.weights["critic"], critic_weighting(matrix))
+        assert np.allclose(result.weights["cv"], cv_weighting(matrix))
+        assert np.allclose(result.weights["pca"], pca_weighting(matrix))
+
+    def test_method_subset_and_order(self, matrix):
+        """测试：只计算请求的方法并保持顺序"""
+        result = WeightingPipeline(methods=["cv", "critic"]).run(matrix)
+
+        assert result.methods == ("cv", "critic")
+        assert np.allclose(result.weights_matrix[0], cv_weighting(matrix))
+        assert np.allclose(result.weights_matrix[1], critic_weighting(matrix))
+
+    def test_combine(self, matrix):
+        """测试：组合权重与 GameTheoryWeighting 一致"""
+        result = WeightingPipeline().run(matrix)
+
+        combined = result.combine()
+
+        assert np.allclose(
+            combined,
+            GameTheoryWeighting().combine_weights(result.weights_matrix)
+        )
+        assert np.isclose(np.sum(combined), 1.0)
+
+    def test_invalid_methods(self):
+        """测试：未知或重复的方法"""
+        with pytest.raises(WeightingPipelineError, match="未知"):
+            WeightingPipeline(methods=["entropy", "topsis"])
+
+        with pytest.raises(WeightingPipelineError, match="重复"):
+            WeightingPipeline(methods=["cv", "cv"])
+
+    def test_validation_depends_on_methods(self):
+        """测试：方法相关的约束只在请求该方法时检查"""
+        single_row = np.array([[1.0, 2.0, 3.0]])
+        wide = np.random.default_rng(0).random((5, 60))
+
+        with pytest.raises(WeightingPipelineError, match="熵权法"):
+            WeightingPipeline().run(single_row)
+        with pytest.raises(WeightingPipelineError, match="PCA"):
+            WeightingPipeline().run(wide)
+
+        assert WeightingPipeline(methods=["critic", "cv"]).run(single_row).weights_matrix.shape == (2, 3)
+        assert WeightingPipeline(methods=["entropy", "cv"]).run(wide).weights_matrix.shape == (2, 60)
+
+    def test_invalid_matrix(self):
+        """测试：NaN 和维度错误"""
+        with pytest.raises(WeightingPipelineError, match="NaN"):
+            WeightingPipeline().run([[1.0, np.nan], [2.0, 3.0]])
+
+        with pytest.raises(WeightingPipelineError, match="2D"):
+            WeightingPipeline().run([1.0, 2.0, 3.0])